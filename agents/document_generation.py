@@ -16,6 +16,8 @@ import re
 
 from .base import Agent, AgentResult, AgentStatus
 
+from skills.utilities.atomic_write import atomic_save
+
 # Try to import python-docx, handle if not installed
 try:
     from docx import Document
@@ -319,9 +321,7 @@ class MarkdownToWordAgent(Agent):
             self._add_block(doc, block)
 
         # Save document
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        doc.save(str(output_path))
+        output_path = atomic_save(doc, output_path)
 
         return {
             "success": True,
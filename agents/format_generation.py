@@ -17,6 +17,8 @@ import shutil
 
 from .base import Agent, AgentResult, AgentStatus
 
+from skills.utilities.atomic_write import atomic_write_text
+
 # Try to import required libraries
 try:
     from weasyprint import HTML, CSS
@@ -580,10 +582,7 @@ class HTMLGeneratorAgent(Agent):
 
         # Save if output path provided
         if output_path:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_doc)
+            atomic_write_text(output_path, html_doc)
 
         return {
             "success": True,
@@ -20,6 +20,8 @@ import re
 
 from .base import Agent, AgentResult, AgentStatus
 
+from skills.utilities.atomic_write import atomic_save
+
 # Check for required libraries
 try:
     from pptx import Presentation
@@ -79,8 +81,17 @@ VALIDATION_CONFIG = {
     "min_slides_with_notes": 0.5,    # At least 50% of slides should have notes
     "min_total_word_count": 100,     # Minimum total words across all notes
     "warn_short_note_threshold": 20, # Warn if note is shorter than this
+    "max_kept_excerpts": 50,         # Offending excerpts kept when streaming
+    "excerpt_chars": 120,            # Characters kept per offending excerpt
 }
 
+_WORD_RE = re.compile(r'\S+')
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words without building a word list."""
+    return sum(1 for _ in _WORD_RE.finditer(text)) if text else 0
+
 
 # =============================================================================
 # DATA CLASSES
@@ -110,6 +121,52 @@ class ExtractionResult:
     errors: List[str]
 
 
+@dataclass
+class NotesStatistics:
+    """
+    Incrementally aggregated notes statistics.
+
+    Fed one slide at a time so whole decks (or directories of decks) can be
+    validated without keeping every note in memory. Only excerpts of
+    offending slides are retained.
+    """
+    total_slides: int = 0
+    slides_with_notes: int = 0
+    total_word_count: int = 0
+    short_notes_count: int = 0
+    short_note_excerpts: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    def add(self, notes: SlideNotes, source_file: str = None,
+            config: Dict[str, Any] = None) -> None:
+        """Fold one slide's notes into the running totals."""
+        config = config or VALIDATION_CONFIG
+        self.total_slides += 1
+        self.total_word_count += notes.word_count
+        if not notes.has_content:
+            return
+
+        self.slides_with_notes += 1
+        if notes.word_count < config["warn_short_note_threshold"]:
+            self.short_notes_count += 1
+            if len(self.short_note_excerpts) < config["max_kept_excerpts"]:
+                limit = config["excerpt_chars"]
+                text = notes.notes_text
+                self.short_note_excerpts.append({
+                    "source_file": source_file,
+                    "slide_number": notes.slide_number,
+                    "slide_title": notes.slide_title,
+                    "word_count": notes.word_count,
+                    "excerpt": text[:limit] + ("..." if len(text) > limit else ""),
+                })
+
+    @property
+    def coverage_ratio(self) -> float:
+        if self.total_slides == 0:
+            return 0
+        return self.slides_with_notes / self.total_slides
+
+
 # =============================================================================
 # PresenterNotesExtractorAgent
 # =============================================================================
@@ -157,14 +214,23 @@ class PresenterNotesExtractorAgent(Agent):
                 "error": f"Extraction failed: {str(e)}"
             }
 
-    def _extract_notes(self, pptx_path: Path) -> Dict[str, Any]:
-        """Perform the actual notes extraction."""
-        prs = Presentation(str(pptx_path))
+    def iter_slide_notes(self, pptx_path: Path, errors: List[str] = None):
+        """
+        Yield a SlideNotes record per slide, one at a time.
 
-        slide_notes_list = []
-        total_word_count = 0
-        slides_with_notes = 0
-        errors = []
+        Notes text is read lazily per slide so callers that validate on the
+        fly never hold the whole deck's notes.
+
+        Args:
+            pptx_path: PowerPoint file to read
+            errors: Optional list that receives per-slide read errors
+
+        Yields:
+            SlideNotes for each slide in order
+        """
+        prs = Presentation(str(pptx_path))
+        if errors is None:
+            errors = []
 
         for i, slide in enumerate(prs.slides, 1):
             # Get slide title
@@ -187,13 +253,10 @@ class PresenterNotesExtractorAgent(Agent):
                 notes_text = self._normalize_line_breaks(notes_text)
 
             # Calculate word count
-            word_count = len(notes_text.split()) if notes_text else 0
-            total_word_count += word_count
+            word_count = _count_words(notes_text)
 
             # Determine if slide has meaningful content
             has_content = len(notes_text) >= self.config["min_note_length"]
-            if has_content:
-                slides_with_notes += 1
 
             # Handle empty notes
             if not has_content and not self.config["remove_empty_slides"]:
@@ -201,7 +264,7 @@ class PresenterNotesExtractorAgent(Agent):
             else:
                 display_text = notes_text
 
-            slide_notes = SlideNotes(
+            yield SlideNotes(
                 slide_number=i,
                 slide_title=slide_title,
                 notes_text=display_text,
@@ -209,14 +272,21 @@ class PresenterNotesExtractorAgent(Agent):
                 has_content=has_content,
                 extraction_status="success" if has_content else "empty"
             )
-            slide_notes_list.append(slide_notes)
+
+    def _extract_notes(self, pptx_path: Path) -> Dict[str, Any]:
+        """Perform the actual notes extraction."""
+        errors = []
+        slide_notes_list = list(self.iter_slide_notes(pptx_path, errors))
+        total_word_count = sum(sn.word_count for sn in slide_notes_list)
+        slides_with_notes = sum(1 for sn in slide_notes_list if sn.has_content)
+        total_slides = len(slide_notes_list)
 
         # Build result
         result = ExtractionResult(
             source_file=str(pptx_path),
-            total_slides=len(prs.slides),
+            total_slides=total_slides,
             slides_with_notes=slides_with_notes,
-            slides_empty=len(prs.slides) - slides_with_notes,
+            slides_empty=total_slides - slides_with_notes,
             total_word_count=total_word_count,
             slide_notes=slide_notes_list,
             extraction_time=datetime.now(),
@@ -425,11 +495,8 @@ class NotesToWordGeneratorAgent(Agent):
             }
 
         try:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
             doc = self._create_document(formatted_document)
-            doc.save(str(output_path))
+            output_path = atomic_save(doc, output_path)
 
             return {
                 "success": True,
@@ -543,6 +610,11 @@ class NotesExtractionValidatorAgent(Agent):
 
     def _process(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Validate extraction results."""
+        # Streaming mode: validate records as they are produced
+        stream = context.get("slide_notes_stream")
+        if stream is not None:
+            return self.validate_stream(stream, context.get("source_file"))
+
         extraction_result = context.get("extraction_result")
 
         if not extraction_result:
@@ -559,44 +631,80 @@ class NotesExtractionValidatorAgent(Agent):
                 "warnings": []
             }
 
-        errors = []
-        warnings = []
+        # Check individual slide notes
+        slide_notes = extraction_result.get("slide_notes", [])
+        short_notes_count = 0
+        for slide in slide_notes:
+            if slide["has_content"] and slide["word_count"] < self.config["warn_short_note_threshold"]:
+                short_notes_count += 1
 
-        # Check coverage ratio
         total_slides = extraction_result.get("total_slides", 0)
         slides_with_notes = extraction_result.get("slides_with_notes", 0)
+        total_words = extraction_result.get("total_word_count", 0)
 
-        if total_slides > 0:
-            coverage_ratio = slides_with_notes / total_slides
-            if coverage_ratio < self.config["min_slides_with_notes"]:
-                warnings.append(
-                    f"Low notes coverage: {coverage_ratio:.1%} "
-                    f"(threshold: {self.config['min_slides_with_notes']:.1%})"
-                )
+        return self._build_report(
+            total_slides=total_slides,
+            slides_with_notes=slides_with_notes,
+            total_words=total_words,
+            short_notes_count=short_notes_count,
+            extraction_errors=extraction_result.get("errors", []),
+        )
+
+    def validate_stream(self, records, source_file: str = None,
+                        statistics: NotesStatistics = None) -> Dict[str, Any]:
+        """
+        Validate SlideNotes records as they are produced.
+
+        Args:
+            records: Iterable of SlideNotes (e.g. PresenterNotesExtractorAgent.iter_slide_notes)
+            source_file: Source label attached to kept excerpts
+            statistics: Existing accumulator to extend (for multi-file runs)
+
+        Returns:
+            Same report as _process plus excerpts of offending slides
+        """
+        stats = statistics if statistics is not None else NotesStatistics()
+        for notes in records:
+            stats.add(notes, source_file, self.config)
+
+        report = self._build_report(
+            total_slides=stats.total_slides,
+            slides_with_notes=stats.slides_with_notes,
+            total_words=stats.total_word_count,
+            short_notes_count=stats.short_notes_count,
+            extraction_errors=stats.errors,
+        )
+        report["short_note_excerpts"] = list(stats.short_note_excerpts)
+        return report
+
+    def _build_report(self, total_slides: int, slides_with_notes: int,
+                      total_words: int, short_notes_count: int,
+                      extraction_errors: List[str]) -> Dict[str, Any]:
+        """Apply thresholds to aggregate counts."""
+        errors = []
+        warnings = []
+
+        # Check coverage ratio
+        coverage_ratio = slides_with_notes / total_slides if total_slides > 0 else 0
+        if total_slides > 0 and coverage_ratio < self.config["min_slides_with_notes"]:
+            warnings.append(
+                f"Low notes coverage: {coverage_ratio:.1%} "
+                f"(threshold: {self.config['min_slides_with_notes']:.1%})"
+            )
 
         # Check total word count
-        total_words = extraction_result.get("total_word_count", 0)
         if total_words < self.config["min_total_word_count"]:
             warnings.append(
                 f"Low total word count: {total_words} "
                 f"(threshold: {self.config['min_total_word_count']})"
             )
 
-        # Check individual slide notes
-        slide_notes = extraction_result.get("slide_notes", [])
-        short_notes_count = 0
-        for slide in slide_notes:
-            if slide["has_content"] and slide["word_count"] < self.config["warn_short_note_threshold"]:
-                short_notes_count += 1
-
         if short_notes_count > 0:
             warnings.append(f"{short_notes_count} slides have very short notes")
 
         # Check for extraction errors
-        extraction_errors = extraction_result.get("errors", [])
-        if extraction_errors:
-            for err in extraction_errors:
-                warnings.append(f"Extraction warning: {err}")
+        for err in extraction_errors:
+            warnings.append(f"Extraction warning: {err}")
 
         return {
             "valid": len(errors) == 0,
@@ -605,7 +713,7 @@ class NotesExtractionValidatorAgent(Agent):
             "statistics": {
                 "total_slides": total_slides,
                 "slides_with_notes": slides_with_notes,
-                "coverage_ratio": coverage_ratio if total_slides > 0 else 0,
+                "coverage_ratio": coverage_ratio,
                 "total_word_count": total_words,
                 "short_notes_count": short_notes_count,
             }
@@ -706,6 +814,56 @@ class PresentationNotesOrchestratorAgent(Agent):
             }
         }
 
+    def validate_directory_streaming(self, directory: Path) -> Dict[str, Any]:
+        """
+        Validate notes for every PowerPoint in a directory without Word output.
+
+        Slides are streamed from each deck straight into the validator, so
+        memory stays bounded by one slide plus the kept excerpts regardless
+        of how many decks are scanned.
+        """
+        directory = Path(directory)
+        pptx_files = sorted(directory.glob("**/*.pptx"))
+        totals = NotesStatistics()
+        files = []
+
+        for pptx_file in pptx_files:
+            file_stats = NotesStatistics()
+            try:
+                records = self.extractor.iter_slide_notes(pptx_file, file_stats.errors)
+                report = self.validator.validate_stream(records, str(pptx_file), file_stats)
+            except Exception as e:
+                files.append({"source": str(pptx_file), "success": False, "error": str(e)})
+                continue
+
+            totals.total_slides += file_stats.total_slides
+            totals.slides_with_notes += file_stats.slides_with_notes
+            totals.total_word_count += file_stats.total_word_count
+            totals.short_notes_count += file_stats.short_notes_count
+            room = self.validator.config["max_kept_excerpts"] - len(totals.short_note_excerpts)
+            totals.short_note_excerpts.extend(file_stats.short_note_excerpts[:max(0, room)])
+
+            files.append({
+                "source": str(pptx_file),
+                "success": True,
+                "valid": report["valid"],
+                "warnings": report["warnings"],
+                "statistics": report["statistics"],
+            })
+
+        return {
+            "total_files": len(pptx_files),
+            "files": files,
+            "statistics": {
+                "total_slides": totals.total_slides,
+                "slides_with_notes": totals.slides_with_notes,
+                "coverage_ratio": totals.coverage_ratio,
+                "total_word_count": totals.total_word_count,
+                "short_notes_count": totals.short_notes_count,
+            },
+            "short_note_excerpts": totals.short_note_excerpts,
+        }
+
     def process_directory(self, directory: Path, output_dir: Path = None) -> Dict[str, Any]:
         """Process all PowerPoint files in a directory."""
         directory = Path(directory)
@@ -16,6 +16,8 @@ from dataclasses import dataclass, field
 import random
 import re
 
+from skills.utilities.keyword_matcher import get_matcher
+
 from .base import Agent, AgentResult, AgentStatus
 
 
@@ -498,24 +500,29 @@ class FunFactGeneratorAgent(Agent):
         """Determine which fact categories are relevant to the content."""
         categories = []
 
+        # One scan over every category vocabulary (plus the fallback term)
+        vocabularies = ("romeo_juliet", "language", "theater", "themes")
+        all_keywords = [kw for key in vocabularies for kw in SLIDE_CONTENT_KEYWORDS[key]]
+        found = get_matcher(all_keywords + ["shakespeare"]).matched(content)
+
         # Check for Romeo and Juliet content
-        if any(kw in content for kw in SLIDE_CONTENT_KEYWORDS["romeo_juliet"]):
+        if found.intersection(SLIDE_CONTENT_KEYWORDS["romeo_juliet"]):
             categories.append("romeo_juliet")
 
         # Check for language/poetry content
-        if any(kw in content for kw in SLIDE_CONTENT_KEYWORDS["language"]):
+        if found.intersection(SLIDE_CONTENT_KEYWORDS["language"]):
             categories.append("language_wordplay")
 
         # Check for theater content
-        if any(kw in content for kw in SLIDE_CONTENT_KEYWORDS["theater"]):
+        if found.intersection(SLIDE_CONTENT_KEYWORDS["theater"]):
             categories.extend(["elizabethan_theater", "general_theater"])
 
         # Check for themes
-        if any(kw in content for kw in SLIDE_CONTENT_KEYWORDS["themes"]):
+        if found.intersection(SLIDE_CONTENT_KEYWORDS["themes"]):
             categories.append("themes_symbols")
 
         # Always include Shakespeare general as fallback
-        if not categories or "shakespeare" in content:
+        if not categories or "shakespeare" in found:
             categories.append("shakespeare_general")
 
         return list(set(categories))  # Remove duplicates
@@ -9,6 +9,8 @@ These validators enforce non-negotiable quality standards.
 from typing import Any, Dict, List
 from pathlib import Path
 
+from skills.utilities.keyword_matcher import get_matcher
+
 from .base import Agent
 
 
@@ -178,7 +180,7 @@ class ElaborationValidatorAgent(Agent):
             "example", "for instance", "such as", "like when",
             "consider", "imagine", "suppose", "let's say"
         ]
-        count = sum(1 for ind in example_indicators if ind in content)
+        count = get_matcher(example_indicators).count_distinct(content)
         return min(100, count * 25)  # 4+ examples = 100
 
     def _score_procedure(self, content: str) -> float:
@@ -187,7 +189,7 @@ class ElaborationValidatorAgent(Agent):
             "first", "then", "next", "finally", "step",
             "begin by", "start with", "after that", "following this"
         ]
-        count = sum(1 for ind in procedure_indicators if ind in content)
+        count = get_matcher(procedure_indicators).count_distinct(content)
         return min(100, count * 20)  # 5+ = 100
 
     def _score_tone(self, content: str) -> float:
@@ -196,7 +198,7 @@ class ElaborationValidatorAgent(Agent):
             "gonna", "wanna", "kinda", "sorta", "gotta",
             "yeah", "nope", "ok", "okay cool"
         ]
-        informal_count = sum(1 for word in informal_words if word in content)
+        informal_count = get_matcher(informal_words).count_distinct(content)
         return max(0, 100 - (informal_count * 15))
 
     def _score_connections(self, content: str) -> float:
@@ -205,7 +207,7 @@ class ElaborationValidatorAgent(Agent):
             "because", "therefore", "thus", "consequently",
             "as a result", "this means", "in other words", "similarly"
         ]
-        count = sum(1 for word in connection_words if word in content)
+        count = get_matcher(connection_words).count_distinct(content)
         return min(100, count * 20)  # 5+ = 100
 
     def _generate_feedback(self, scores: Dict[str, float]) -> List[str]:
@@ -602,12 +604,12 @@ class CoherenceValidatorAgent(Agent):
 
         # Check for progression indicators
         progression_words = ["first", "next", "then", "finally", "building on", "now that"]
-        count = sum(1 for word in progression_words if word in content_lower)
+        count = get_matcher(progression_words).count_distinct(content_lower)
         score += min(25, count * 5)
 
         # Check for transitions
         transitions = ["this leads", "as a result", "therefore", "moving on", "let's now"]
-        trans_count = sum(1 for t in transitions if t in content_lower)
+        trans_count = get_matcher(transitions).count_distinct(content_lower)
         score += min(15, trans_count * 5)
 
         return min(100, score)
@@ -626,7 +628,7 @@ class CoherenceValidatorAgent(Agent):
 
         # Check for application language
         application_words = ["apply", "practice", "demonstrate", "create", "perform", "try"]
-        count = sum(1 for word in application_words if word in activity_lower)
+        count = get_matcher(application_words).count_distinct(activity_lower)
         score += min(25, count * 10)
 
         return min(100, score)
@@ -642,7 +644,7 @@ class CoherenceValidatorAgent(Agent):
         # Check for reflection language
         reflection_words = ["reflect", "think about", "consider", "what did you learn",
                            "how might", "why is", "what connections"]
-        count = sum(1 for word in reflection_words if word in journal_lower)
+        count = get_matcher(reflection_words).count_distinct(journal_lower)
         score += min(25, count * 10)
 
         # Topic connection
@@ -772,7 +774,7 @@ class PedagogyValidatorAgent(Agent):
             "collaborate", "explore", "investigate", "demonstrate", "perform",
             "pair", "group", "share", "present"
         ]
-        count = sum(1 for word in engagement_words if word in combined)
+        count = get_matcher(engagement_words).count_distinct(combined)
         score += min(40, count * 5)
 
         return min(100, score)
@@ -788,7 +790,7 @@ class PedagogyValidatorAgent(Agent):
             "ell", "support", "extension", "challenge", "struggling",
             "advanced", "visual", "auditory", "kinesthetic"
         ]
-        count = sum(1 for word in diff_words if word in content_lower)
+        count = get_matcher(diff_words).count_distinct(content_lower)
         score += min(40, count * 8)
 
         return min(100, score)
@@ -809,7 +811,7 @@ class PedagogyValidatorAgent(Agent):
         ]
 
         objectives_text = ' '.join(str(o) for o in obj_list).lower()
-        verb_count = sum(1 for verb in blooms_verbs if verb in objectives_text)
+        verb_count = get_matcher(blooms_verbs).count_distinct(objectives_text)
         score += min(40, verb_count * 10)
 
         return min(100, score)
@@ -825,7 +827,7 @@ class PedagogyValidatorAgent(Agent):
             "support", "check for understanding", "review", "preview",
             "remind", "recall", "remember when"
         ]
-        count = sum(1 for word in scaffold_words if word in content_lower)
+        count = get_matcher(scaffold_words).count_distinct(content_lower)
         score += min(40, count * 5)
 
         return min(100, score)
@@ -847,7 +849,7 @@ class PedagogyValidatorAgent(Agent):
         # Check for check-for-understanding indicators
         content = self._extract_all_content(context).lower()
         assessment_words = ["check", "assess", "ask", "question", "observe", "monitor"]
-        count = sum(1 for word in assessment_words if word in content)
+        count = get_matcher(assessment_words).count_distinct(content)
         score += min(20, count * 5)
 
         return min(100, score)
@@ -917,9 +919,10 @@ class ContentAccuracyValidatorAgent(Agent):
 
         issues = []
 
-        # Check for known inaccuracies
+        # Check for known inaccuracies (single scan over all phrases)
+        found = get_matcher(self.KNOWN_INACCURACIES).matched(content_lower)
         for inaccuracy, correction in self.KNOWN_INACCURACIES.items():
-            if inaccuracy in content_lower:
+            if inaccuracy in found:
                 issues.append({
                     "type": "factual_error",
                     "found": inaccuracy,
@@ -975,15 +978,23 @@ class ContentAccuracyValidatorAgent(Agent):
         correct_uses = 0
         total_terms = 0
 
+        term_positions = get_matcher(self.TERMINOLOGY_CHECKS).first_positions(content)
+        indicator_hits = None
+
         for term, indicators in self.TERMINOLOGY_CHECKS.items():
-            if term in content:
+            if term in term_positions:
                 total_terms += 1
-                # Check if any context indicators are nearby
-                term_pos = content.find(term)
-                context_window = content[max(0, term_pos - 100):term_pos + 100]
+                if indicator_hits is None:
+                    all_indicators = [ind for inds in self.TERMINOLOGY_CHECKS.values() for ind in inds]
+                    indicator_hits = get_matcher(all_indicators).find_all(content)
 
-                indicators_found = sum(1 for ind in indicators if ind in context_window)
-                if indicators_found >= 1:
+                # Check if any context indicators are nearby
+                term_pos = term_positions[term]
+                window_start = max(0, term_pos - 100)
+                window_end = term_pos + 100
+                if any(hit.keyword in indicators
+                       and hit.start >= window_start and hit.end <= window_end
+                       for hit in indicator_hits):
                     correct_uses += 1
 
         if total_terms == 0:
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Visual Identification Pass
+Times a full visual-identification pass over one section with the analyzer
+modules' precompiled patterns, versus the same pass routed through the
+module-level re.search/re.findall functions (the pre-registry behaviour).
+
+The legacy mode swaps every compiled pattern held by the analyzer modules
+for a proxy that calls re.<method>(pattern_string, ...), so each call pays
+the re module cache lookup. --thrash additionally purges that cache before
+each slide, matching a process where many other modules' patterns have
+evicted these ones. The feature cache is disabled so every pass really
+runs the analyzers.
+
+Usage:
+    python benchmark_visual_identification.py
+    python benchmark_visual_identification.py --slides 40 --rounds 20 --thrash
+"""
+
+import argparse
+import re
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from skills.generation import content_structure_analyzer
+from skills.generation import ml_visual_recommender
+from skills.generation import visual_pattern_matcher
+from skills.generation.content_structure_analyzer import analyze_slide_content
+from skills.generation.ml_visual_recommender import extract_features
+from skills.generation.visual_pattern_matcher import (
+    get_all_visual_scores,
+    rank_slides_for_visuals,
+)
+from skills.utilities.feature_cache import configure_feature_cache
+from skills.utilities.regex_registry import registry_size
+
+
+ANALYZER_MODULES = (content_structure_analyzer, visual_pattern_matcher, ml_visual_recommender)
+
+SAMPLE_SLIDES = [
+    {
+        "header": "Greek vs Roman Theater",
+        "body": "- Greek: outdoor amphitheaters, masks, chorus\n"
+                "- Roman: raised stage, spectacle, comedy\n"
+                "- Compared to Greek drama, Roman plays favored farce\n"
+                "- Both used stock characters",
+        "slide_type": "content",
+    },
+    {
+        "header": "Blocking a Scene",
+        "body": "1. Read the scene aloud\n2. Mark entrances and exits\n"
+                "3. Next, set levels and focus\n4. Finally, run it with cues\n"
+                "Step 5: note changes in the prompt book",
+        "slide_type": "content",
+    },
+    {
+        "header": "Types of Stage Configurations",
+        "body": "Classification of stages:\n- Proscenium\n  - Thrust\n  - Arena\n"
+                "- Black box (flexible)\n- Found space\nCategory: audience relationship",
+        "slide_type": "content",
+    },
+    {
+        "header": "History of Commedia dell'Arte",
+        "body": "- 1545: first professional troupe contract\n- 1570s: tours to France\n"
+                "- 1600s: Arlecchino becomes a stock type\n- 1750: Goldoni scripts the form",
+        "slide_type": "content",
+    },
+    {
+        "header": "Choosing an Objective",
+        "body": "If the character wants love, then the tactic is charm.\n"
+                "If the obstacle is a rival, then the stakes rise.\n"
+                "Otherwise: the scene loses tension (see Stanislavski, 1936)",
+        "slide_type": "content",
+    },
+]
+
+
+class _RawPattern:
+    """Proxy that re-resolves its pattern string through the re module cache."""
+
+    def __init__(self, compiled):
+        self.pattern = compiled.pattern
+        self.flags = compiled.flags
+
+    def search(self, string, *args):
+        return re.search(self.pattern, string, self.flags)
+
+    def match(self, string, *args):
+        return re.match(self.pattern, string, self.flags)
+
+    def findall(self, string, *args):
+        return re.findall(self.pattern, string, self.flags)
+
+    def finditer(self, string, *args):
+        return re.finditer(self.pattern, string, self.flags)
+
+    def sub(self, repl, string, count=0):
+        return re.sub(self.pattern, repl, string, count=count, flags=self.flags)
+
+
+@contextmanager
+def legacy_patterns():
+    """Temporarily replace the analyzers' compiled patterns with _RawPattern proxies."""
+    saved = []
+    for module in ANALYZER_MODULES:
+        for name, value in list(vars(module).items()):
+            if isinstance(value, re.Pattern):
+                saved.append((module, name, value))
+                setattr(module, name, _RawPattern(value))
+            elif isinstance(value, tuple) and value and all(isinstance(v, re.Pattern) for v in value):
+                saved.append((module, name, value))
+                setattr(module, name, tuple(_RawPattern(v) for v in value))
+    try:
+        yield len(saved)
+    finally:
+        for module, name, value in saved:
+            setattr(module, name, value)
+
+
+def build_section(slide_count):
+    """Repeat the sample slides to the requested section length."""
+    return [dict(SAMPLE_SLIDES[i % len(SAMPLE_SLIDES)]) for i in range(slide_count)]
+
+
+def identification_pass(slides, thrash=False):
+    """One visual-identification pass: analyze, feature-extract and rank every slide."""
+    total = len(slides)
+    for number, slide in enumerate(slides, 1):
+        if thrash:
+            re.purge()
+        analyze_slide_content(slide)
+        get_all_visual_scores(f"{slide['header']} {slide['body']}")
+        extract_features(slide, number, total)
+    rank_slides_for_visuals(slides)
+
+
+def time_passes(slides, rounds, thrash):
+    """Best-of-rounds wall time for one pass, in milliseconds."""
+    identification_pass(slides, thrash)  # warm-up
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        identification_pass(slides, thrash)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the visual-identification pass")
+    parser.add_argument("--slides", type=int, default=30, help="Slides per section")
+    parser.add_argument("--rounds", type=int, default=10, help="Timed rounds (best is reported)")
+    parser.add_argument("--thrash", action="store_true",
+                        help="Purge the re module cache before each slide")
+    args = parser.parse_args()
+
+    slides = build_section(args.slides)
+    configure_feature_cache(max_entries=0)
+
+    with legacy_patterns() as swapped:
+        before = time_passes(slides, args.rounds, args.thrash)
+    after = time_passes(slides, args.rounds, args.thrash)
+
+    print("=" * 60)
+    print("VISUAL IDENTIFICATION PASS")
+    print("=" * 60)
+    print(f"Slides per section:     {args.slides}")
+    print(f"Compiled patterns:      {registry_size()} in registry, {swapped} module attributes")
+    print(f"re cache purged:        {'per slide' if args.thrash else 'no'}")
+    print(f"Before (raw re.*):      {before:8.2f} ms")
+    print(f"After (precompiled):    {after:8.2f} ms")
+    if after > 0:
+        print(f"Speedup:                {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,12 +13,16 @@ Orchestrators:
 4. AssemblyOrchestrator - Phase 4: Assemble final outputs
 
 Each orchestrator manages agent sequencing, dependency handling,
-error recovery with retry logic, and context preservation.
+error recovery with retry logic, and context preservation. Retry budgets,
+back-off and agent/day deadlines come from a shared RetryScheduler
+(skills/utilities/retry_scheduler.py). Finished agents and failed gates
+are emitted as events on the EventBus (skills/utilities/event_bus.py).
 """
 
 import json
 import logging
 import re
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -26,6 +30,10 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from skills.utilities.event_bus import AGENT_FINISHED, GATE_FAILED, EventBus, get_event_bus
+from skills.utilities.keyword_matcher import get_matcher
+from skills.utilities.retry_scheduler import AgentTimeout, Deadline, DeadlineExceeded, RetryScheduler
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -70,6 +78,9 @@ class AgentContext:
     max_retries: int = 3
     previous_failures: List[Dict] = field(default_factory=list)
     start_time: datetime = field(default_factory=datetime.now)
+    # Per-agent / per-gate attempt counts ("agent:<name>", "gate:<name>")
+    retry_attempts: Dict[str, int] = field(default_factory=dict)
+    deadline: Optional[Deadline] = None  # wall-clock deadline for the day
 
 
 @dataclass
@@ -111,16 +122,28 @@ class BaseOrchestrator(ABC):
 
     MAX_RETRIES = 3
 
-    def __init__(self, config: Dict = None, agents: Dict[str, Callable] = None):
+    def __init__(
+        self,
+        config: Dict = None,
+        agents: Dict[str, Callable] = None,
+        scheduler: Optional[RetryScheduler] = None,
+        events: Optional[EventBus] = None
+    ):
         """
         Initialize orchestrator.
 
         Args:
             config: Configuration dictionary from pipeline.yaml
             agents: Dictionary mapping agent names to callable implementations
+            scheduler: Shared retry scheduler (default: built from config)
+            events: Event bus for progress events (default: the shared bus)
         """
         self.config = config or {}
         self.agents = agents or {}
+        self.scheduler = scheduler or RetryScheduler.from_config(
+            self.config, gate_retries=self.MAX_RETRIES
+        )
+        self.events = events or get_event_bus()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @abstractmethod
@@ -142,6 +165,10 @@ class BaseOrchestrator(ABC):
         """
         Execute a single agent.
 
+        The call is bounded by the scheduler's agent timeout and the day
+        deadline. Exceptions and timeouts are retried with back-off within
+        the agent's retry budget; a failed result is not.
+
         Args:
             agent_name: Name of the agent to execute
             context: Current agent context
@@ -151,58 +178,112 @@ class BaseOrchestrator(ABC):
             Tuple of (success, output_data)
         """
         self.logger.info(f"Executing agent: {agent_name}")
+        started = time.perf_counter()
+        success, output = self._execute_agent_with_retries(agent_name, context, input_data)
+        self.events.emit(
+            AGENT_FINISHED,
+            orchestrator=self.__class__.__name__,
+            agent=agent_name,
+            unit=context.unit_number,
+            day=context.day,
+            status="completed" if success else "failed",
+            attempts=1 + context.retry_attempts.get(f"agent:{agent_name}", 0),
+            timed_out=bool(output.get("timed_out")) if isinstance(output, dict) else False,
+            duration_seconds=round(time.perf_counter() - started, 6)
+        )
+        return success, output
 
+    def _execute_agent_with_retries(
+        self,
+        agent_name: str,
+        context: AgentContext,
+        input_data: Dict
+    ) -> Tuple[bool, Dict]:
+        """Run an agent, retrying exceptions and timeouts within its budget."""
+        while True:
+            try:
+                return self._execute_agent_once(agent_name, context, input_data)
+            except DeadlineExceeded as e:
+                self.logger.error(f"Agent {agent_name} not run: {e}")
+                return False, {"error": str(e), "timed_out": True}
+            except Exception as e:
+                self.logger.error(f"Agent {agent_name} failed: {str(e)}")
+                failure = {"error": str(e), "timed_out": isinstance(e, AgentTimeout)}
+
+            decision = self.scheduler.record_failure(
+                context.retry_attempts, "agent", agent_name, context.deadline
+            )
+            if not decision.retry:
+                return False, failure
+            context.retry_count += 1
+            self.logger.warning(
+                f"Retrying {agent_name} in {decision.delay:.1f}s (attempt {decision.attempt})"
+            )
+            if context.deadline is not None and not context.deadline.wait(decision.delay):
+                return False, failure
+            if context.deadline is None and decision.delay:
+                time.sleep(decision.delay)
+
+    def _execute_agent_once(
+        self,
+        agent_name: str,
+        context: AgentContext,
+        input_data: Dict
+    ) -> Tuple[bool, Dict]:
+        """Run an agent once; exceptions and timeouts propagate."""
         # First check for custom agent functions
         agent_func = self.agents.get(agent_name)
 
         # If no custom function, try to use agents package
         if not agent_func and AGENTS_AVAILABLE:
-            try:
-                agent = create_agent_impl(agent_name)
-                result = agent.execute(input_data)
-                context.accumulated_outputs[agent_name] = result.output
-                if result.status.value == "completed":
-                    self.logger.info(f"Agent {agent_name} completed successfully")
-                    return True, result.output
-                else:
-                    self.logger.error(f"Agent {agent_name} failed: {result.errors}")
-                    return False, {"error": result.errors}
-            except Exception as e:
-                self.logger.error(f"Agent {agent_name} error: {str(e)}")
-                return False, {"error": str(e)}
+            agent = create_agent_impl(agent_name)
+            result = self.scheduler.call(
+                agent.execute, input_data, deadline=context.deadline, name=agent_name
+            )
+            context.accumulated_outputs[agent_name] = result.output
+            if result.status.value == "completed":
+                self.logger.info(f"Agent {agent_name} completed successfully")
+                return True, result.output
+            else:
+                self.logger.error(f"Agent {agent_name} failed: {result.errors}")
+                return False, {"error": result.errors}
 
         if not agent_func:
             self.logger.warning(f"Agent not implemented: {agent_name}")
             # Return placeholder for stub agents
             return True, {"status": "stub", "message": f"{agent_name} not yet implemented"}
 
-        try:
-            output = agent_func(input_data, context)
-            context.accumulated_outputs[agent_name] = output
-            self.logger.info(f"Agent {agent_name} completed successfully")
-            return True, output
-        except Exception as e:
-            self.logger.error(f"Agent {agent_name} failed: {str(e)}")
-            return False, {"error": str(e)}
+        output = self.scheduler.call(
+            agent_func, input_data, context, deadline=context.deadline, name=agent_name
+        )
+        context.accumulated_outputs[agent_name] = output
+        self.logger.info(f"Agent {agent_name} completed successfully")
+        return True, output
 
     def handle_failure(
         self,
         agent_name: str,
         failure_details: Dict,
         context: AgentContext,
-        strategy: RetryStrategy
+        strategy: RetryStrategy,
+        kind: str = "gate"
     ) -> Dict:
         """
         Handle agent or gate failure with appropriate strategy.
 
+        Each agent/gate has its own retry budget for the day; the failure
+        escalates once that budget is spent or the day deadline would pass
+        before the back-off delay ends.
+
         Args:
             agent_name: Name of the failed agent
             failure_details: Details about the failure
             context: Current context
             strategy: Retry strategy to use
+            kind: "gate" or "agent" (selects the retry budget)
 
         Returns:
-            Instructions for retry or escalation
+            Instructions for retry (with delay_seconds) or escalation
         """
         context.retry_count += 1
         context.previous_failures.append({
@@ -211,46 +292,53 @@ class BaseOrchestrator(ABC):
             "timestamp": datetime.now().isoformat()
         })
 
-        if context.retry_count >= self.MAX_RETRIES:
+        decision = self.scheduler.record_failure(
+            context.retry_attempts, kind, agent_name, context.deadline
+        )
+        if not decision.retry:
             return {
                 "action": "ESCALATE",
-                "reason": f"Max retries ({self.MAX_RETRIES}) exceeded for {agent_name}",
+                "reason": decision.reason,
                 "details": failure_details
             }
 
         if strategy == RetryStrategy.TARGETED_FIX:
-            return {
+            instruction = {
                 "action": "FIX_SPECIFIC",
                 "targets": failure_details.get("items", []),
                 "instruction": "Complete these specific issues"
             }
         elif strategy == RetryStrategy.COMPONENT_REGEN:
-            return {
+            instruction = {
                 "action": "REGENERATE_COMPONENTS",
                 "components": failure_details.get("missing", []),
                 "preserve": failure_details.get("valid", [])
             }
         elif strategy == RetryStrategy.ENRICHMENT_PASS:
-            return {
+            instruction = {
                 "action": "ENRICH",
                 "weak_areas": failure_details.get("low_scores", []),
                 "suggestions": failure_details.get("suggestions", [])
             }
         elif strategy == RetryStrategy.ADJUSTMENT_PASS:
             if failure_details.get("issue") == "too_short":
-                return {
+                instruction = {
                     "action": "ELABORATE",
                     "target_words": failure_details.get("needed_words", 0),
                     "focus_slides": failure_details.get("under_elaborated", [])
                 }
             else:
-                return {
+                instruction = {
                     "action": "CONDENSE",
                     "target_words": failure_details.get("excess_words", 0),
                     "focus_slides": failure_details.get("verbose_slides", [])
                 }
+        else:
+            instruction = {"action": "RETRY"}
 
-        return {"action": "RETRY", "attempt": context.retry_count}
+        instruction["attempt"] = decision.attempt
+        instruction["delay_seconds"] = decision.delay
+        return instruction
 
 
 # =============================================================================
@@ -638,6 +726,7 @@ class ValidationGateOrchestrator(BaseOrchestrator):
         for gate_name in self.get_execution_order():
             self.logger.info(f"Running gate: {gate_name}")
 
+            gate_started = time.perf_counter()
             result = self._run_gate(gate_name, daily_output, context)
             validation_results[gate_name] = result
 
@@ -645,6 +734,17 @@ class ValidationGateOrchestrator(BaseOrchestrator):
                 all_passed = False
                 first_failure = result
                 self.logger.warning(f"Gate {gate_name} FAILED")
+                self.events.emit(
+                    GATE_FAILED,
+                    gate=gate_name,
+                    unit=context.unit_number,
+                    day=context.day,
+                    score=result.score,
+                    threshold=result.threshold,
+                    issues=len(result.issues),
+                    reason=result.fix_instructions,
+                    duration_seconds=round(time.perf_counter() - gate_started, 6)
+                )
                 break
             elif result.status == GateStatus.AUTO_FIXED:
                 self.logger.info(f"Gate {gate_name} PASSED (after auto-fix)")
@@ -976,10 +1076,7 @@ class ValidationGateOrchestrator(BaseOrchestrator):
             "in the context of", "this connects to"
         ]
 
-        text_lower = text.lower()
-        for indicator in depth_indicators:
-            if indicator in text_lower:
-                score += 3
+        score += 3 * get_matcher(depth_indicators).count_distinct(text)
 
         return min(30, score)
 
@@ -992,10 +1089,8 @@ class ValidationGateOrchestrator(BaseOrchestrator):
             "imagine", "picture", "consider", "think about"
         ]
 
-        text_lower = text.lower()
-        for indicator in example_indicators:
-            count = text_lower.count(indicator)
-            score += count * 2
+        counts = get_matcher(example_indicators).count(text)
+        score += 2 * sum(counts.values())
 
         return min(20, score)
 
@@ -1020,11 +1115,7 @@ class ValidationGateOrchestrator(BaseOrchestrator):
 
         # Check for direct address
         direct_indicators = ["you", "we", "let's", "our", "your"]
-        text_lower = text.lower()
-
-        for indicator in direct_indicators:
-            if indicator in text_lower:
-                score += 3
+        score += 3 * get_matcher(direct_indicators).count_distinct(text)
 
         return min(15, score)
 
@@ -1849,7 +1940,9 @@ class AssemblyOrchestrator(BaseOrchestrator):
 def create_orchestrator(
     orchestrator_type: str,
     config: Dict = None,
-    agents: Dict[str, Callable] = None
+    agents: Dict[str, Callable] = None,
+    scheduler: Optional[RetryScheduler] = None,
+    events: Optional[EventBus] = None
 ) -> BaseOrchestrator:
     """
     Factory function to create orchestrators.
@@ -1858,6 +1951,8 @@ def create_orchestrator(
         orchestrator_type: Type of orchestrator to create
         config: Optional configuration
         agents: Optional agent implementations
+        scheduler: Optional shared retry scheduler
+        events: Optional event bus
 
     Returns:
         Configured orchestrator instance
@@ -1873,4 +1968,4 @@ def create_orchestrator(
     if not orchestrator_class:
         raise ValueError(f"Unknown orchestrator type: {orchestrator_type}")
 
-    return orchestrator_class(config=config, agents=agents)
+    return orchestrator_class(config=config, agents=agents, scheduler=scheduler, events=events)
@@ -1,11 +1,30 @@
 """
 Slide Analysis and Graphic Organizer Identification
 Automatically analyzes PowerPoint slides to identify candidates for graphic organizers
+
+Two selection engines are available:
+- 'recommender' (default): MLVisualRecommender.recommend_deck (shared
+  structure analysis, ML + rule ensemble, quota-aware selection)
+- 'keywords': condition tests + composite scoring, with slides chosen by
+  the same quota/variety solver (skills.generation.visual_selection)
 """
-from pptx import Presentation
 import re
-import json
-from collections import defaultdict
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from skills.utilities.atomic_write import atomic_write_json
+from skills.utilities.feature_cache import cached_analysis
+from skills.utilities.pptx_text import read_deck_text
+from skills.generation.visual_selection import VisualCandidate, select_visuals
+
+# Precompiled patterns used by the condition tests (run once per slide)
+_NUMBERED_STEP_RE = re.compile(r'\d+\.\s+')
+_TIME_MARKER_RE = re.compile(r'\d+\s*(year|month|week|day|minute|hour)')
 
 # =============================================================================
 # CONDITION TESTING - Identifies which graphic organizer type fits best
@@ -61,7 +80,7 @@ def test_flowchart_condition(slide_content, notes):
             break  # Only count once
 
     # Numbered steps (worth 4 points)
-    if re.search(r'\d+\.\s+', text) or 'step 1' in text or 'stage 1' in text:
+    if _NUMBERED_STEP_RE.search(text) or 'step 1' in text or 'stage 1' in text:
         score += 4
 
     # Cause-effect or temporal (worth 3 points)
@@ -150,7 +169,7 @@ def test_timeline_condition(slide_content, notes):
             break
 
     # Time markers (worth 3 points)
-    if re.search(r'\d+\s*(year|month|week|day|minute|hour)', text):
+    if _TIME_MARKER_RE.search(text):
         score += 3
     if any(word in text for word in ['early', 'late', 'initial', 'final', 'onset']):
         score += 3
@@ -222,6 +241,9 @@ def test_key_differentiators_condition(slide_content, notes):
 # SLIDE SCORING AND RANKING
 # =============================================================================
 
+@cached_analysis('score_slide_for_visual_types', key=lambda slide_data: (
+    len(slide_data['content']), *slide_data['content'], slide_data['presenter_notes']
+))
 def score_slide_for_visual_types(slide_data):
     """Score a slide for all visual types and return ranked recommendations"""
     content = ' '.join(slide_data['content'])
@@ -251,44 +273,83 @@ def score_slide_for_visual_types(slide_data):
 # VARIETY ALGORITHM
 # =============================================================================
 
-def apply_variety_algorithm(candidates, min_quota=0.2, max_quota=0.4):
+def apply_variety_algorithm(candidates):
     """
     Apply variety algorithm to prevent repetition
-    Enforces 20-40% quota and maximum 2 of same type before switching
+    Allows at most 2 of the same type in a row, switching a slide to its
+    second-best type (or skipping it) where that is needed
+
+    Candidates are taken in the order given; no quota is applied here
+    (select_section_visuals applies the section quota in the same solve).
     """
     if not candidates:
         return []
 
-    selected = []
-    type_counts = defaultdict(int)
-    recent_types = []
-
-    for candidate in candidates:
-        visual_type = candidate['recommended_type']
-
-        # Check if we've used this type twice in a row
-        if len(recent_types) >= 2 and recent_types[-1] == recent_types[-2] == visual_type:
-            # Try to use second-best recommendation
-            alt_type = candidate['scores']['ranked_recommendations'][1][0]
-            if type_counts[alt_type] < 3:  # Max 3 of any type per section
-                visual_type = alt_type
-            else:
-                # Skip this slide to enforce variety
-                continue
+    options = [_visual_options(candidate, 'score') for candidate in candidates]
+    selection = select_visuals(
+        [VisualCandidate(i, opts) for i, opts in enumerate(options)],
+        minimum=0,
+        maximum=len(candidates)
+    )
+    return [
+        {**candidates[pick.slide_number], 'final_type': pick.visual_type}
+        for pick in selection.picks
+    ]
 
-        # Add to selection
-        selected.append({
-            **candidate,
-            'final_type': visual_type
-        })
-        type_counts[visual_type] += 1
-        recent_types.append(visual_type)
 
-        # Keep only last 2 types in memory
-        if len(recent_types) > 2:
-            recent_types.pop(0)
+def _visual_options(candidate, score_key):
+    """(type, score) options for a candidate: its recommended type, then the runner-up."""
+    options = [(candidate['recommended_type'], candidate[score_key])]
+    ranked = candidate['scores']['ranked_recommendations']
+    if len(ranked) > 1 and ranked[1][1] > 0:
+        alt_type = ranked[1][0]
+        # Score the runner-up as if it had been the recommendation
+        penalty = candidate['score'] - ranked[1][1]
+        if score_key == 'composite_score':
+            penalty = penalty / 15.0 * 100 * 0.6  # base quality weight in the composite
+        options.append((alt_type, candidate[score_key] - penalty))
+    return options
 
-    return selected
+
+def select_section_visuals(candidates, fallbacks, section_size, lead_in=()):
+    """
+    Choose the section's graphic organizer slides in one solve.
+
+    Candidates (slides at or above the threshold) are scored by composite
+    score; fallbacks (slides below it) are only used to reach the 20%
+    minimum. The 40% maximum and the variety rule (at most 2 of a type in
+    a row, continuing from lead_in, the previous sections' types) are
+    enforced by the solver rather than by truncating a greedy pass.
+
+    Returns:
+        (selected candidates with 'final_type' and 'selected_by', selection)
+    """
+    by_number = {}
+    solver_candidates = []
+    tagged = [(c, False) for c in candidates] + [(c, True) for c in fallbacks]
+    for candidate, is_fallback in sorted(tagged, key=lambda item: item[0]['slide_number']):
+        by_number[candidate['slide_number']] = candidate
+        solver_candidates.append(VisualCandidate(
+            candidate['slide_number'],
+            _visual_options(candidate, 'composite_score'),
+            fallback=is_fallback
+        ))
+
+    selection = select_visuals(
+        solver_candidates,
+        minimum=int(section_size * 0.2),
+        maximum=int(section_size * 0.4),
+        lead_in=list(lead_in)
+    )
+    selected = [
+        {
+            **by_number[pick.slide_number],
+            'final_type': pick.visual_type,
+            'selected_by': pick.selected_by
+        }
+        for pick in selection.picks
+    ]
+    return selected, selection
 
 
 # =============================================================================
@@ -473,34 +534,71 @@ def detect_sections(slides):
 
     return sections
 
-def analyze_powerpoint_for_graphic_organizers(pptx_path, threshold=6):
+def select_section_with_recommender(slides, section, lead_in=()):
     """
-    Main analysis function
-    Returns list of slides that should have graphic organizers
+    Select graphic organizer slides for one section with recommend_deck.
+
+    lead_in holds the previous sections' types, so the variety rule
+    continues across section boundaries.
+
+    Returns items shaped like the keyword engine's selections
+    (slide_number, recommended_type, final_type, content_preview, notes)
+    plus the ensemble confidence and how the slide was selected.
     """
-    prs = Presentation(pptx_path)
-
-    # Extract slide data
-    slides = []
-    for idx, slide in enumerate(prs.slides):
-        slide_data = {
-            'slide_number': idx + 1,
-            'content': [],
-            'presenter_notes': ''
-        }
+    from skills.generation.ml_visual_recommender import get_recommender
+
+    deck_slides = []
+    for slide_idx in section['slides']:
+        content = slides[slide_idx]['content']
+        deck_slides.append({
+            'slide_number': slide_idx + 1,
+            'header': content[0] if content else '',
+            'body': '\n'.join(content[1:]),
+        })
+
+    deck = get_recommender().recommend_deck(deck_slides, lead_in=list(lead_in))
+
+    selected = []
+    for slide_number in deck.selected:
+        rec = deck.recommendation_for(slide_number)
+        slide = slides[slide_number - 1]
+        final_type = rec['recommended_type']
+        if final_type == 'NONE':
+            final_type = rec['rule_prediction']['type'] or rec['ml_prediction']['type']
+        selected.append({
+            'slide_number': slide_number,
+            'recommended_type': rec['recommended_type'],
+            'final_type': final_type,
+            'confidence': rec['confidence'],
+            'selected_by': rec['selected_by'],
+            'content_preview': slide['content'][0][:80] if slide['content'] else '',
+            'notes': slide['presenter_notes']
+        })
+    return selected, deck.quota
 
-        for shape in slide.shapes:
-            if shape.has_text_frame:
-                text = shape.text.strip()
-                if text:
-                    slide_data['content'].append(text)
 
-        if slide.has_notes_slide:
-            notes_slide = slide.notes_slide
-            if notes_slide.notes_text_frame:
-                slide_data['presenter_notes'] = notes_slide.notes_text_frame.text.strip()
+def analyze_powerpoint_for_graphic_organizers(pptx_path, threshold=6, engine='recommender'):
+    """
+    Main analysis function
+    Returns list of slides that should have graphic organizers
 
-        slides.append(slide_data)
+    By default slides are selected with MLVisualRecommender.recommend_deck;
+    engine='keywords' uses the keyword condition tests and composite
+    scoring instead (threshold only applies to that engine).
+    """
+    if engine not in ('keywords', 'recommender'):
+        raise ValueError(f"Unknown engine: {engine}")
+
+    # Extract slide data (zip/XML read, cached by file digest for the apply pass)
+    deck = read_deck_text(pptx_path)
+    slides = [
+        {
+            'slide_number': slide.slide_number,
+            'content': slide.content,
+            'presenter_notes': slide.notes.strip()
+        }
+        for slide in deck.slides
+    ]
 
     # Detect sections
     sections = detect_sections(slides)
@@ -514,33 +612,53 @@ def analyze_powerpoint_for_graphic_organizers(pptx_path, threshold=6):
         print(f"Slides: {len(section['slides'])}")
         print(f"{'='*80}\n")
 
+        lead_in = [item['final_type'] for item in all_recommendations]
+
+        if engine == 'recommender':
+            selected, quota = select_section_with_recommender(slides, section, lead_in)
+            print(f"[OK] Selected {len(selected)} slides for graphic organizers "
+                  f"(quota {quota['minimum']}-{quota['maximum']}, "
+                  f"{quota['fallback_added']} from fallback ranking)")
+            for item in selected:
+                print(f"  Slide {item['slide_number']}: {item['final_type']} "
+                      f"(confidence: {item['confidence']:.2f}, {item['selected_by']})")
+                print(f"    Preview: {item['content_preview']}")
+            all_recommendations.extend(selected)
+            continue
+
         # Score slides in this section
         candidates = []
+        fallbacks = []
         section_size = len(section['slides'])
         total_slides = len(slides)
 
         for slide_idx in section['slides']:
             slide = slides[slide_idx]
             scoring = score_slide_for_visual_types(slide)
+            if scoring['top_score'] <= 0:
+                continue
 
-            # Only consider if top score meets threshold
+            candidate = {
+                'slide_number': slide_idx + 1,
+                'recommended_type': scoring['top_recommendation'],
+                'score': scoring['top_score'],
+                'scores': scoring,
+                'content_preview': slide['content'][0][:80] if slide['content'] else '',
+                'notes': slide['presenter_notes']  # Include notes for anchor density
+            }
+            # Only consider if top score meets threshold (others may fill the minimum)
             if scoring['top_score'] >= threshold:
-                candidate = {
-                    'slide_number': slide_idx + 1,
-                    'recommended_type': scoring['top_recommendation'],
-                    'score': scoring['top_score'],
-                    'scores': scoring,
-                    'content_preview': slide['content'][0][:80] if slide['content'] else '',
-                    'notes': slide['presenter_notes']  # Include notes for anchor density
-                }
                 candidates.append(candidate)
+            else:
+                fallbacks.append(candidate)
 
         # COMPOSITE SCORING: Calculate weighted score for each candidate
         print(f"\nCalculating composite scores (Base 60% + Anchor Density 30% + Position 10%)...")
-        for candidate in candidates:
+        for candidate in candidates + fallbacks:
             composite = calculate_composite_score(candidate, section_size, total_slides)
             candidate['composite_score'] = composite
 
+        for candidate in candidates:
             # Debug output
             base = candidate['score']
             anchor = calculate_anchor_point_density(
@@ -554,27 +672,18 @@ def analyze_powerpoint_for_graphic_organizers(pptx_path, threshold=6):
             )
             print(f"  Slide {candidate['slide_number']}: "
                   f"Base={base:.1f}/15 | Anchor={anchor:.1f}/10 | Position={position}/3 "
-                  f"-> Composite={composite:.1f}/100")
-
-        # SORT BY COMPOSITE SCORE (best slides first)
-        candidates.sort(key=lambda x: x['composite_score'], reverse=True)
-        print(f"\n[OK] Sorted {len(candidates)} candidates by composite score (highest first)")
+                  f"-> Composite={candidate['composite_score']:.1f}/100")
 
-        # Apply variety algorithm (now processes best candidates first)
-        selected = apply_variety_algorithm(candidates, min_quota=0.2, max_quota=0.4)
+        # Solve quota (20-40% of section) and variety together over the section
+        selected, selection = select_section_visuals(candidates, fallbacks, section_size, lead_in)
 
-        # Enforce quota (20-40% of section)
-        section_size = len(section['slides'])
-        min_required = int(section_size * 0.2)
-        max_allowed = int(section_size * 0.4)
-
-        if len(selected) < min_required:
-            print(f"WARNING: Only {len(selected)} slides selected, but minimum is {min_required}")
+        if not selection.meets_minimum:
+            print(f"WARNING: Only {len(selected)} slides selected, but minimum is {selection.minimum}")
             print(f"Lowering threshold or reviewing section content recommended.")
-
-        if len(selected) > max_allowed:
-            selected = selected[:max_allowed]
-            print(f"Limiting to {max_allowed} slides (40% quota)")
+        if selection.fallback_count:
+            print(f"Added {selection.fallback_count} below-threshold slides to reach the 20% minimum")
+        if len(candidates) > selection.maximum:
+            print(f"Limiting to {selection.maximum} slides (40% quota)")
 
         print(f"\n[OK] Selected {len(selected)} slides for graphic organizers ({len(selected)/section_size*100:.1f}%)")
 
@@ -603,8 +712,7 @@ def save_analysis_report(pptx_path, recommendations):
         'recommendations': recommendations
     }
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    atomic_write_json(output_path, report, indent=2, ensure_ascii=False)
 
     print(f"\n{'='*80}")
     print(f"Analysis report saved to:")
@@ -626,9 +734,10 @@ if __name__ == "__main__":
 
     for file_path in files:
         print(f"\n{'#'*80}")
-        print(f"ANALYZING: {file_path.split('\\')[-1]}")
+        file_name = file_path.split('\\')[-1]
+        print(f"ANALYZING: {file_name}")
         print(f"{'#'*80}")
 
-        recommendations, slides = analyze_powerpoint_for_graphic_organizers(file_path, threshold=6)
+        recommendations, slides = analyze_powerpoint_for_graphic_organizers(file_path)
 
         save_analysis_report(file_path, recommendations)
@@ -21,6 +21,16 @@ import json
 import copy
 import re
 import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from skills.utilities.atomic_write import atomic_save
+from skills.utilities.pptx_text import read_deck_text
 
 # =============================================================================
 # GLOBAL CONSTANTS
@@ -323,11 +333,22 @@ def extract_slide_content(slide):
     Excludes: titles, copyright, NCLEX boxes, tier labels, elements outside content area.
     Returns: List of individual lines/bullet points (not multi-line blocks)
     """
+    return select_content_lines(
+        shape for shape in slide.shapes if shape.has_text_frame
+    )
+
+
+def select_content_lines(shapes):
+    """
+    Content-area lines from text shapes (python-pptx shapes or the cached
+    ShapeText records of skills.utilities.pptx_text): anything with .text,
+    .left, .top, .width and .height in EMU.
+    """
     content = []
 
-    for shape in slide.shapes:
+    for shape in shapes:
         # Skip if no text
-        if not shape.has_text_frame or not shape.text or not shape.text.strip():
+        if not shape.text or not shape.text.strip():
             continue
 
         text = shape.text.strip()
@@ -1059,8 +1080,10 @@ def apply_graphic_organizers(pptx_path, recommendations_json, blueprints_dir=Non
 
     NEW: Checks for blueprints first, falls back to extraction
     """
-    # Load presentation
+    # Load presentation (slide text comes from the extraction cache the
+    # analysis pass filled, so it is not re-read from the object model)
     prs = Presentation(pptx_path)
+    deck = read_deck_text(pptx_path)
 
     # Load recommendations
     with open(recommendations_json, 'r', encoding='utf-8') as f:
@@ -1096,8 +1119,9 @@ def apply_graphic_organizers(pptx_path, recommendations_json, blueprints_dir=Non
 
         # OTHERWISE, USE EXTRACTION APPROACH
         print(f"Slide {slide_num}: Using extraction for {organizer_type}")
-        content = extract_slide_content(slide)
-        notes = slide.notes_slide.notes_text_frame.text if slide.has_notes_slide else ''
+        slide_text = deck.slides[slide_index]
+        content = select_content_lines(slide_text.shapes)
+        notes = slide_text.notes
 
         clear_slide_content_area(slide)
 
@@ -1124,7 +1148,7 @@ def apply_graphic_organizers(pptx_path, recommendations_json, blueprints_dir=Non
         base = os.path.splitext(pptx_path)[0]
         output_path = f"{base}_ENHANCED.pptx"
 
-    prs.save(output_path)
+    atomic_save(prs, output_path)
     print(f"\n[SUCCESS] Enhanced PowerPoint saved to: {output_path}")
     return output_path
 
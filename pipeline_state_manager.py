@@ -2,8 +2,11 @@
 Pipeline State Manager - Track and Update Pipeline Progress
 ============================================================
 
-This script manages the pipeline_state.json file to track progress
-of each section through the pipeline steps.
+This script tracks the progress of each section through the pipeline
+steps. State lives in pipeline_state.db (a SQLite StateStore): a status
+update changes one row, so several workers can update different sections
+at once. pipeline_state.json is imported on first use and can be
+regenerated from the database with the export command.
 
 Usage:
     # View current state
@@ -17,6 +20,9 @@ Usage:
 
     # Generate progress report
     python pipeline_state_manager.py report
+
+    # Write the current state back out as pipeline_state.json
+    python pipeline_state_manager.py export
 """
 
 import json
@@ -25,7 +31,21 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+# Add project root to path
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from skills.utilities.atomic_write import atomic_write_json
+from skills.utilities.state_store import StateStore
+
 STATE_FILE = Path(__file__).parent / "pipeline_state.json"
+STATE_DB = STATE_FILE.with_suffix('.db')
+
+# Meta key set once pipeline_state.json has been imported into STATE_DB
+_JSON_IMPORTED = 'pipeline_state_json_imported'
+
+_store: Optional[StateStore] = None
 
 # Import singleton for pre-validation (lazy import to avoid circular deps)
 _standards_loader = None
@@ -43,23 +63,43 @@ SECTION_STEPS = [
 ]
 
 
-def load_state() -> dict:
-    """Load pipeline state from JSON file."""
-    if not STATE_FILE.exists():
-        return create_default_state()
+def get_store() -> StateStore:
+    """Open the state database, seeding it from pipeline_state.json on first use."""
+    global _store
+    if _store is None:
+        store = StateStore(STATE_DB)
+        with store.transaction():
+            if store.get_meta(_JSON_IMPORTED) is None:
+                if not store.has_pipeline_state():
+                    if STATE_FILE.exists():
+                        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+                            store.save_pipeline_state(json.load(f))
+                    else:
+                        store.save_pipeline_state(create_default_state())
+                store.set_meta(_JSON_IMPORTED, datetime.now().isoformat())
+        _store = store
+    return _store
+
 
-    with open(STATE_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def load_state() -> dict:
+    """Load pipeline state from the state database."""
+    return get_store().load_pipeline_state()
 
 
 def save_state(state: dict):
-    """Save pipeline state to JSON file."""
+    """Save a full pipeline state dict (only changed rows are written)."""
     state['pipeline_info']['last_updated'] = datetime.now().strftime('%Y-%m-%d')
+    get_store().save_pipeline_state(state)
+
+    print(f"State saved to {STATE_DB}")
+
 
-    with open(STATE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2)
+def export_state(path: Optional[Path] = None) -> Path:
+    """Write the current state as pipeline_state.json (atomically)."""
+    path = atomic_write_json(path or STATE_FILE, load_state(), indent=2)
 
-    print(f"State saved to {STATE_FILE}")
+    print(f"State exported to {path}")
+    return path
 
 
 def create_default_state() -> dict:
@@ -131,23 +171,22 @@ def prevalidate_standards() -> Dict[str, Any]:
         result["status"] = validation_result.get("status", "UNKNOWN")
 
         # Update pipeline state
-        state = load_state()
-        if result["standards_valid"]:
-            state["global_steps"]["step0_standards_prevalidation"] = "completed"
-            state["pipeline_info"]["standards_prevalidation"] = {
-                "status": "PASS",
-                "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                "cached": True
-            }
-        else:
-            state["global_steps"]["step0_standards_prevalidation"] = "failed"
-            state["pipeline_info"]["standards_prevalidation"] = {
-                "status": "FAIL",
-                "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                "errors": result["errors"]
-            }
-
-        save_state(state)
+        store = get_store()
+        with store.transaction():
+            if result["standards_valid"]:
+                store.set_global_step("step0_standards_prevalidation", "completed")
+                store.set_pipeline_info("standards_prevalidation", {
+                    "status": "PASS",
+                    "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    "cached": True
+                })
+            else:
+                store.set_global_step("step0_standards_prevalidation", "failed")
+                store.set_pipeline_info("standards_prevalidation", {
+                    "status": "FAIL",
+                    "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    "errors": result["errors"]
+                })
 
     except ImportError as e:
         result["status"] = "ERROR"
@@ -179,21 +218,15 @@ def get_cached_standards():
 
 def add_section(section_name: str):
     """Add a new section to track."""
-    state = load_state()
-
-    if section_name in state['sections']:
+    if not get_store().add_section(section_name, SECTION_STEPS):
         print(f"Section '{section_name}' already exists")
         return
 
-    state['sections'][section_name] = {step: "pending" for step in SECTION_STEPS}
-    save_state(state)
     print(f"Added section: {section_name}")
 
 
 def update_status(section_name: str, step: str, status: str):
     """Update the status of a step for a section."""
-    state = load_state()
-
     # Normalize step name
     if not step.startswith("step"):
         step = f"step{step}"
@@ -216,20 +249,20 @@ def update_status(section_name: str, step: str, status: str):
         print(f"Valid statuses: {', '.join(VALID_STATUSES)}")
         return
 
+    store = get_store()
+
     # Check if section exists
-    if section_name not in state['sections']:
+    section_steps = store.section_steps(section_name)
+    if not section_steps:
         print(f"Section '{section_name}' not found. Adding it...")
-        state['sections'][section_name] = {s: "pending" for s in SECTION_STEPS}
 
     # Check if step is valid
-    if step not in state['sections'][section_name]:
+    if step not in (section_steps or SECTION_STEPS):
         print(f"Invalid step: {step}")
         print(f"Valid steps: {', '.join(SECTION_STEPS)}")
         return
 
-    old_status = state['sections'][section_name][step]
-    state['sections'][section_name][step] = status
-    save_state(state)
+    old_status = store.set_section_status(section_name, step, status, default_steps=SECTION_STEPS)
     print(f"Updated {section_name}/{step}: {old_status} -> {status}")
 
 
@@ -372,6 +405,7 @@ def main():
         print("  python pipeline_state_manager.py update <section> <step> <status>")
         print("  python pipeline_state_manager.py add <section>")
         print("  python pipeline_state_manager.py report")
+        print("  python pipeline_state_manager.py export")
         print("  python pipeline_state_manager.py prevalidate   # Run Step 0 standards pre-validation")
         return 1
 
@@ -381,6 +415,8 @@ def main():
         show_status()
     elif command == "report":
         generate_report()
+    elif command == "export":
+        export_state()
     elif command == "add" and len(sys.argv) >= 3:
         add_section(sys.argv[2])
     elif command == "update" and len(sys.argv) >= 5:
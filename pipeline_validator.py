@@ -27,6 +27,8 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 
+from skills.utilities.atomic_write import atomic_write_json
+
 # Ensure UTF-8 output
 if sys.stdout:
     try:
@@ -657,8 +659,7 @@ def main():
 
     # Save results to file
     report_path = pipeline_folder / f"validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_path, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2)
+    atomic_write_json(report_path, results, indent=2)
 
     print(f"\nReport saved to: {report_path}")
 
@@ -13,6 +13,7 @@ Usage:
     python run_notes_extraction.py --path /path/to/file.pptx # Process single file
     python run_notes_extraction.py --dir /path/to/folder     # Process directory
     python run_notes_extraction.py --unit 3                  # Process Unit 3 only
+    python run_notes_extraction.py --dir /path --validate-only  # Stream-validate, no Word output
 """
 
 import sys
@@ -140,6 +141,37 @@ class PresenterNotesProcessor:
 
         return results
 
+    def validate_directory(self, directory: Path) -> Dict[str, Any]:
+        """Stream-validate notes in all PowerPoint files without generating Word docs."""
+        report = self.orchestrator.validate_directory_streaming(directory)
+        stats = report["statistics"]
+
+        for entry in report["files"]:
+            self.stats["files_processed"] += 1
+            if not entry["success"]:
+                self.stats["files_failed"] += 1
+                print(f"  [FAIL] {Path(entry['source']).name}: {entry['error']}")
+                continue
+            self.stats["files_success"] += 1
+            self.stats["validation_warnings"] += len(entry["warnings"])
+            if self.verbose or entry["warnings"]:
+                print(f"  {Path(entry['source']).name}")
+                for warning in entry["warnings"]:
+                    print(f"       WARNING: {warning}")
+
+        self.stats["total_slides"] += stats["total_slides"]
+        self.stats["slides_with_notes"] += stats["slides_with_notes"]
+        self.stats["total_word_count"] += stats["total_word_count"]
+
+        if report["short_note_excerpts"]:
+            print()
+            print("Short notes (excerpts):")
+            for item in report["short_note_excerpts"]:
+                print(f"  {Path(item['source_file']).name} slide {item['slide_number']}: "
+                      f"{item['word_count']} words - {item['excerpt']}")
+
+        return report
+
     def process_unit(self, unit_number: int) -> List[Dict[str, Any]]:
         """Process all PowerPoint files for a specific unit."""
         # Find unit folder
@@ -196,6 +228,8 @@ Examples:
     parser.add_argument('--unit', type=int, choices=[1, 2, 3, 4],
                        help='Process specific unit (1-4)')
     parser.add_argument('--output', type=str, help='Output directory for Word files')
+    parser.add_argument('--validate-only', action='store_true',
+                       help='Stream-validate notes without generating Word files (requires --dir)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
 
     args = parser.parse_args()
@@ -227,7 +261,10 @@ Examples:
         if not directory.exists():
             print(f"ERROR: Directory not found: {directory}")
             return 1
-        processor.process_directory(directory, output_dir)
+        if args.validate_only:
+            processor.validate_directory(directory)
+        else:
+            processor.process_directory(directory, output_dir)
 
     elif args.unit:
         # Specific unit
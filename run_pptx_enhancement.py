@@ -22,6 +22,7 @@ from agents import (
     SlideEnhancementFormatterAgent,
     SlideEnhancementValidatorAgent,
 )
+from skills.utilities.atomic_write import atomic_save
 
 def get_slide_text(slide):
     """Extract all text from a slide."""
@@ -227,7 +228,7 @@ def enhance_presentation(pptx_path, output_path=None):
     if output_path is None:
         output_path = pptx_path
 
-    prs.save(output_path)
+    atomic_save(prs, output_path)
 
     print()
     print("=" * 60)
@@ -13,6 +13,14 @@ Usage:
     python run_rj_unit_generation.py --week 1           # Generate Week 1 only
     python run_rj_unit_generation.py --day 1            # Generate Day 1 only
     python run_rj_unit_generation.py --enhance-pptx     # Also add trivia banners
+    python run_rj_unit_generation.py --events-jsonl outputs/rj_events.jsonl
+    python run_rj_unit_generation.py --estimate         # Predict time and memory only
+
+Progress (days started/finished with ETA, files written, failed
+validations) is also emitted as events on the EventBus
+(skills/utilities/event_bus.py). Finished days are recorded in the
+timing history that --estimate predicts from
+(skills/utilities/cost_estimator.py).
 """
 
 import sys
@@ -66,6 +74,15 @@ from agents import (
 # Import content database for real educational content
 from rj_content_database import get_day_content, RJ_CONTENT_DATABASE
 
+from skills.utilities.atomic_write import atomic_save, atomic_write_json, atomic_write_text
+from skills.utilities.cost_estimator import (
+    RUNNER_RJ, BatchEstimate, CostEstimator, InputSize, TimingRecorder, WorkItem,
+    history_path, lesson_sizes
+)
+from skills.utilities.event_bus import (
+    GATE_FAILED, EventBus, Progress, configure_event_bus, get_event_bus
+)
+
 # Import agenda slide generator (HARDCODED skill)
 from skills.enforcement.agenda_slide_generator import (
     generate_agenda_slide,
@@ -308,10 +325,17 @@ class RomeoJulietUnitGenerator:
     Uses hardcoded agents for all generation, validation, and formatting.
     """
 
-    def __init__(self, enhance_pptx: bool = True, optimize_content: bool = True, verbose: bool = False):
+    def __init__(
+        self,
+        enhance_pptx: bool = True,
+        optimize_content: bool = True,
+        verbose: bool = False,
+        events: Optional[EventBus] = None
+    ):
         self.enhance_pptx = enhance_pptx
         self.optimize_content = optimize_content
         self.verbose = verbose
+        self.events = events or get_event_bus()
 
         # Initialize agents
         self.scene_cutter = SceneCutterAgent()
@@ -360,17 +384,7 @@ class RomeoJulietUnitGenerator:
         print(f"Content Optimization: {'Enabled (condensed slides, elaborated notes)' if self.optimize_content else 'Disabled'}")
         print()
 
-        # Determine what to generate
-        if days:
-            target_days = days
-        elif weeks:
-            target_days = []
-            for week in weeks:
-                if week in UNIT_STRUCTURE:
-                    for day_info in UNIT_STRUCTURE[week]["days"]:
-                        target_days.append(day_info["day"])
-        else:
-            target_days = list(range(1, 31))  # All 30 days
+        target_days = self._target_days(weeks, days)
 
         print(f"Generating {len(target_days)} days: {target_days}")
         print()
@@ -378,22 +392,56 @@ class RomeoJulietUnitGenerator:
         # Create production directory
         PRODUCTION_DIR.mkdir(parents=True, exist_ok=True)
 
-        # Generate each day
-        for day_num in target_days:
-            self._generate_day(day_num)
-
-        # Run unit validation
-        print()
-        print("-" * 70)
-        print("UNIT VALIDATION")
-        print("-" * 70)
-        self._validate_unit()
+        with self.events.span("unit", unit="Romeo and Juliet", days=len(target_days)) as finished:
+            # Generate each day
+            progress = Progress(total=len(target_days))
+            for day_num in target_days:
+                with self.events.span("day", day=day_num) as day_finished:
+                    self._generate_day(day_num)
+                    day_finished.update(progress.advance())
+                    if self.events.active:
+                        day_finished["sizes"] = self._day_sizes(day_num).to_dict()
+
+            # Run unit validation
+            print()
+            print("-" * 70)
+            print("UNIT VALIDATION")
+            print("-" * 70)
+            self._validate_unit()
+            finished.update(self.stats)
 
         # Print summary
         self._print_summary()
 
         return self.stats
 
+    def _target_days(self, weeks: List[int] = None, days: List[int] = None) -> List[int]:
+        """Days selected by --day / --week (all 30 by default)."""
+        if days:
+            return days
+        if weeks:
+            target_days = []
+            for week in weeks:
+                if week in UNIT_STRUCTURE:
+                    for day_info in UNIT_STRUCTURE[week]["days"]:
+                        target_days.append(day_info["day"])
+            return target_days
+        return list(range(1, 31))  # All 30 days
+
+    def _day_sizes(self, day_num: int) -> InputSize:
+        """Input size of a day (content points and their words)."""
+        day_info = self._get_day_info(day_num)
+        return lesson_sizes(self._create_day_input(day_info) if day_info else None)
+
+    def estimate_unit(self, weeks: List[int] = None, days: List[int] = None) -> BatchEstimate:
+        """
+        Predict wall clock and peak memory of generate_unit() from the timing history.
+
+        Days are generated one after another, so the estimate is for one worker.
+        """
+        items = [WorkItem(f"day {day}", self._day_sizes(day)) for day in self._target_days(weeks, days)]
+        return CostEstimator(history_path()).plan(RUNNER_RJ, items, workers=1)
+
     def _get_day_info(self, day_num: int) -> Optional[Dict]:
         """Get day info from unit structure."""
         for week_num, week_data in UNIT_STRUCTURE.items():
@@ -425,17 +473,19 @@ class RomeoJulietUnitGenerator:
 
         # Save input JSON
         input_path = day_dir / f"day{day_num:02d}_input.json"
-        with open(input_path, 'w', encoding='utf-8') as f:
-            json.dump(day_data, f, indent=2)
+        atomic_write_json(input_path, day_data, indent=2)
+        self.events.file_written(input_path, day=day_num)
 
         # Generate lesson plan markdown
         lesson_path = day_dir / f"Day{day_num:02d}_LessonPlan.md"
         self._generate_lesson_plan(day_data, lesson_path)
+        self.events.file_written(lesson_path, day=day_num)
         print(f"  [OK] Lesson plan: {lesson_path.name}")
 
         # Generate handout
         handout_path = day_dir / f"Day{day_num:02d}_Handout.md"
         self._generate_handout(day_data, handout_path)
+        self.events.file_written(handout_path, day=day_num)
         print(f"  [OK] Handout: {handout_path.name}")
         self.stats["handouts_generated"] += 1
 
@@ -443,6 +493,7 @@ class RomeoJulietUnitGenerator:
         if PPTX_AVAILABLE:
             pptx_path = day_dir / f"Unit3_Day{day_num:02d}_{day_info['topic'].replace(' ', '_').replace(':', '')[:30]}.pptx"
             self._generate_pptx(day_data, pptx_path)
+            self.events.file_written(pptx_path, day=day_num)
             print(f"  [OK] PowerPoint: {pptx_path.name}")
             self.stats["pptx_generated"] += 1
 
@@ -454,6 +505,8 @@ class RomeoJulietUnitGenerator:
         else:
             print(f"  [FAIL] Validation: {validation.get('errors', [])}")
             self.stats["validation_failed"] += 1
+            self.events.emit(GATE_FAILED, gate="day_validation", day=day_num,
+                             errors=validation.get('errors', []))
 
         self.stats["days_generated"] += 1
         print()
@@ -621,8 +674,7 @@ class RomeoJulietUnitGenerator:
 
         content += "\n---\n*Generated by Romeo and Juliet Unit Generator*\n"
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        atomic_write_text(output_path, content)
 
     def _generate_handout(self, day_data: Dict, output_path: Path):
         """Generate student handout markdown."""
@@ -672,8 +724,7 @@ _Use this space to take notes during class:_
 
         content += "\n---\n*Romeo and Juliet Unit - Theater Education*\n"
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        atomic_write_text(output_path, content)
 
     def _generate_pptx(self, day_data: Dict, output_path: Path):
         """Generate PowerPoint using step12 approach: duplicate template slide, populate shapes."""
@@ -1009,7 +1060,7 @@ _Use this space to take notes during class:_
             })
 
         # Save the presentation
-        prs.save(output_path)
+        atomic_save(prs, output_path)
 
     def _get_performance_tip(self, content: str, index: int) -> str:
         """Get a relevant performance tip based on content."""
@@ -1565,6 +1616,7 @@ Examples:
   %(prog)s --day 1 2 3          Generate Days 1, 2, and 3
   %(prog)s --no-enhance         Skip trivia banner enhancement
   %(prog)s --no-optimize        Skip content optimization (condensation)
+  %(prog)s --estimate           Predict time and memory from earlier runs
         """
     )
 
@@ -1578,6 +1630,14 @@ Examples:
                        help='Skip content optimization (slides will be verbose)')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Verbose output')
+    parser.add_argument('--events-jsonl', type=str,
+                       help='Append progress events to this JSON-lines file')
+    parser.add_argument('--events-port', type=int,
+                       help='Stream progress events as Server-Sent Events on '
+                            'http://127.0.0.1:PORT/events')
+    parser.add_argument('--estimate', action='store_true',
+                       help='Predict wall clock and peak memory from the timing history '
+                            'and exit without generating')
 
     args = parser.parse_args()
 
@@ -1588,13 +1648,23 @@ Examples:
                 parser.error(f"Day must be between 1 and 30, got {d}")
 
     # Run generator
+    events = get_event_bus()
+    if args.events_jsonl or args.events_port is not None:
+        events = configure_event_bus(jsonl=args.events_jsonl, sse_port=args.events_port)
     generator = RomeoJulietUnitGenerator(
         enhance_pptx=not args.no_enhance,
         optimize_content=not args.no_optimize,
-        verbose=args.verbose
+        verbose=args.verbose,
+        events=events
     )
 
+    if args.estimate:
+        print(generator.estimate_unit(weeks=args.week, days=args.day).summary())
+        return 0
+
+    events.subscribe(TimingRecorder(history_path(), RUNNER_RJ))
     generator.generate_unit(weeks=args.week, days=args.day)
+    events.close()
 
     return 0
 
@@ -9,11 +9,14 @@ Usage:
     # Generate a single day's lesson
     python run_theater_pipeline.py --unit 1 --day 1
 
-    # Generate entire unit
+    # Generate entire unit (days run in parallel, each with its own deadline)
     python run_theater_pipeline.py --unit 1 --all-days
 
-    # Resume from a specific step
-    python run_theater_pipeline.py --unit 1 --day 1 --resume-from step7
+    # Resume an interrupted run (replays only unfinished phases/agents)
+    python run_theater_pipeline.py --unit 1 --day 1 --resume-from auto
+
+    # Re-run from a specific phase, reusing the journaled earlier phases
+    python run_theater_pipeline.py --unit 1 --day 1 --resume-from validation
 
     # Dry run (validate only, no output)
     python run_theater_pipeline.py --unit 1 --day 1 --dry-run
@@ -30,19 +33,59 @@ Output:
             ├── handout.pdf
             ├── journal_prompts.md
             └── exit_ticket.md
+
+Every output file is written atomically (temp file + rename), and each
+completed phase and agent is recorded per unit/day in the run journal
+(production/run_journal.db), so an interrupted run never leaves partial
+files and --resume-from picks up where it stopped.
+
+Agent timeouts, retry budgets/back-off and the day and batch deadlines
+are set in config/pipeline.yaml (settings) and enforced by the
+RetryScheduler; a day that overruns is cancelled without stalling the
+rest of an --all-days batch.
+
+Progress is also emitted as structured events (run/phase/day started and
+finished, agent finished, gate failed, file written) on the EventBus:
+
+    # JSON-lines event log plus a live SSE stream for dashboards
+    python run_theater_pipeline.py --unit 1 --all-days \
+        --events-jsonl outputs/events.jsonl --events-port 8765
+
+Finished days and agents are recorded in the timing history
+(skills/utilities/cost_estimator.py). --estimate predicts the wall clock
+and peak memory of a request from it without running anything, and
+--all-days picks its worker count (up to batch_workers) from the same
+prediction unless --workers is given:
+
+    python run_theater_pipeline.py --unit 1 --all-days --estimate
 """
 
 import argparse
 import json
 import logging
 import sys
+import threading
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 
+from skills.utilities.atomic_write import atomic_write_text
+from skills.utilities.cost_estimator import (
+    RUNNER_THEATER, BatchEstimate, CostEstimator, TimingRecorder, WorkItem, history_path, lesson_sizes
+)
+from skills.utilities.event_bus import (
+    AGENT_FINISHED, DAY_FINISHED, RUN_FINISHED, RUN_STARTED,
+    EventBus, Progress, configure_event_bus, get_event_bus
+)
+from skills.utilities.retry_scheduler import BatchOutcome, Deadline, RetryScheduler
+from skills.utilities.state_store import StateStore
+from skills.utilities.work_queue import (
+    COMPLETED, Broker, Job, JobHandler, Worker, content_hash, open_broker
+)
+
 # Import orchestrators
 try:
     from orchestrators.orchestrators import (
@@ -51,6 +94,7 @@ try:
         ValidationGateOrchestrator,
         AssemblyOrchestrator,
         AgentContext,
+        OrchestratorResult,
         create_orchestrator
     )
     ORCHESTRATORS_AVAILABLE = True
@@ -93,6 +137,9 @@ except ImportError:
 # Pipeline root directory
 PIPELINE_ROOT = Path(__file__).parent
 
+# Work-queue job kind for one (unit, day)
+DAY_JOB = "day"
+
 
 class AgentStatus(Enum):
     """Status of agent execution."""
@@ -111,6 +158,16 @@ class PipelinePhase(Enum):
     ASSEMBLY = "assembly"
 
 
+# Journal phases in run order ("outputs" is file generation after assembly)
+PHASE_ORDER = [phase.value for phase in PipelinePhase] + ["outputs"]
+
+# --resume-from value that keeps every journaled phase and agent
+RESUME_AUTO = "auto"
+
+# Run journal database, kept in the output directory
+JOURNAL_DB_NAME = "run_journal.db"
+
+
 @dataclass
 class AgentResult:
     """Result from agent execution."""
@@ -550,10 +607,11 @@ class StructureValidatorAgent(Agent):
 class OrchestratorManager:
     """Manages agent orchestration and execution flow."""
 
-    def __init__(self, config: ConfigLoader):
+    def __init__(self, config: ConfigLoader, events: Optional[EventBus] = None):
         self.config = config
         self.agents_dir = PIPELINE_ROOT / "agents" / "prompts"
         self.results: List[AgentResult] = []
+        self.events = events or get_event_bus()
         self.logger = logging.getLogger("OrchestratorManager")
 
     def create_agent(self, agent_name: str):
@@ -578,10 +636,18 @@ class OrchestratorManager:
         agent_class = agent_classes.get(agent_name, Agent)
         return agent_class(agent_name, prompt_path)
 
-    def execute_phase(self, phase: PipelinePhase, context: Dict[str, Any]) -> List[AgentResult]:
-        """Execute all agents in a pipeline phase."""
-        phase_results = []
+    def execute_phase(
+        self,
+        phase: PipelinePhase,
+        context: Dict[str, Any],
+        journal: Optional['RunJournal'] = None
+    ) -> List[AgentResult]:
+        """
+        Execute all agents in a pipeline phase.
 
+        Agents completed in the journal are replayed from it instead of
+        being run again; newly completed agents are recorded.
+        """
         # Get agents for this phase
         if phase == PipelinePhase.UNIT_PLANNING:
             agents = ["unit_planner", "standards_mapper", "unit_scope_validator"]
@@ -608,12 +674,55 @@ class OrchestratorManager:
 
         self.logger.info(f"Executing phase: {phase.value} with {len(agents)} agents")
 
+        lesson = context.get("lesson_context")
+        where = {"unit": getattr(lesson, "unit_number", None), "day": getattr(lesson, "day", None)}
+        with self.events.span("phase", phase=phase.value, **where) as finished:
+            phase_results = self._execute_agents(phase, agents, context, journal, where)
+            finished["status"] = (
+                "failed" if any(r.status.value == AgentStatus.FAILED.value for r in phase_results)
+                else "completed"
+            )
+        return phase_results
+
+    def _execute_agents(
+        self,
+        phase: PipelinePhase,
+        agents: List[str],
+        context: Dict[str, Any],
+        journal: Optional['RunJournal'],
+        where: Dict[str, Any]
+    ) -> List[AgentResult]:
+        """Run (or replay) a phase's agents in order."""
+        phase_results = []
         for agent_name in agents:
-            self.logger.info(f"  Running agent: {agent_name}")
-            agent = self.create_agent(agent_name)
-            result = agent.execute(context)
+            journaled = journal.get(phase.value, agent_name) if journal else None
+            if journaled is not None:
+                self.logger.info(f"  Replaying agent from journal: {agent_name}")
+                result = AgentResult(
+                    agent_name=agent_name,
+                    status=AgentStatus(journaled['status']),
+                    output=journaled['output'],
+                    warnings=journaled['warnings'],
+                    duration_seconds=journaled['duration_seconds']
+                )
+            else:
+                self.logger.info(f"  Running agent: {agent_name}")
+                agent = self.create_agent(agent_name)
+                result = agent.execute(context)
+                if journal and result.status.value == AgentStatus.COMPLETED.value:
+                    journal.record(phase.value, {
+                        'status': result.status.value,
+                        'output': result.output,
+                        'warnings': result.warnings,
+                        'duration_seconds': result.duration_seconds
+                    }, agent=agent_name)
             phase_results.append(result)
             self.results.append(result)
+            self.events.emit(
+                AGENT_FINISHED, phase=phase.value, agent=agent_name, **where,
+                status=result.status.value, replayed=journaled is not None,
+                duration_seconds=result.duration_seconds
+            )
 
             # Update context with agent output
             context[f"{agent_name}_output"] = result.output
@@ -711,30 +820,83 @@ class OutputGenerator:
 *Generated by Theater Education Pipeline*
 """
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        return atomic_write_text(output_path, content)
+
+
+class RunJournal:
+    """
+    Completed phases and agents of one unit/day run.
 
-        return output_path
+    Entries live in the run_journal table of a StateStore and are committed
+    as each phase or agent finishes, so an interrupted run keeps them.
+    """
+
+    def __init__(self, store: StateStore, unit: int, day: int):
+        self.store = store
+        self.run_key = f"unit{unit}_day{day:02d}"
+        self._entries = {
+            (entry['phase'], entry['agent']): entry['outputs']
+            for entry in store.journal_entries(self.run_key)
+        }
+
+    def start(self, resume_from: Optional[str] = None) -> List[str]:
+        """
+        Forget the entries this run must redo.
+
+        Args:
+            resume_from: None for a fresh run (forget everything), RESUME_AUTO
+                to keep every entry, or a phase name to redo that phase and
+                all later ones
+
+        Returns:
+            Phases still complete in the journal
+        """
+        if resume_from != RESUME_AUTO:
+            redo = PHASE_ORDER if resume_from is None else PHASE_ORDER[PHASE_ORDER.index(resume_from):]
+            self.store.clear_journal(self.run_key, redo)
+            self._entries = {k: v for k, v in self._entries.items() if k[0] not in redo}
+        return [phase for phase in PHASE_ORDER if (phase, '') in self._entries]
+
+    def get(self, phase: str, agent: str = '') -> Optional[Dict[str, Any]]:
+        """Recorded outputs of a phase (agent='') or agent, None if not completed."""
+        return self._entries.get((phase, agent))
+
+    def record(self, phase: str, outputs: Dict[str, Any], agent: str = '') -> None:
+        self.store.record_journal(self.run_key, phase, outputs, agent=agent)
+        self._entries[(phase, agent)] = outputs
 
 
 class TheaterPipeline:
     """Main pipeline orchestration class."""
 
-    def __init__(self, verbose: bool = False, use_orchestrators: bool = True):
+    def __init__(
+        self,
+        verbose: bool = False,
+        use_orchestrators: bool = True,
+        output_dir: Optional[Path] = None,
+        events: Optional[EventBus] = None
+    ):
         self.config = ConfigLoader()
         self.input_loader = InputLoader()
-        self.orchestrator = OrchestratorManager(self.config)
-        self.output_generator = OutputGenerator()
+        self.events = events or get_event_bus()
+        self.orchestrator = OrchestratorManager(self.config, self.events)
+        self.output_generator = OutputGenerator(Path(output_dir) if output_dir else None)
+        self._journal_store: Optional[StateStore] = None
+        self._journal_lock = threading.Lock()
+        self.scheduler = RetryScheduler.from_config(self.config.pipeline)
+        self.max_workers = self.scheduler.max_workers  # batch_workers: ceiling for --all-days
         self.verbose = verbose
         self.use_orchestrators = use_orchestrators and ORCHESTRATORS_AVAILABLE
         self._setup_logging()
 
-        # Initialize orchestrators if available
+        # Initialize orchestrators if available (one scheduler shared by all)
         if self.use_orchestrators:
-            self.unit_planning_orch = UnitPlanningOrchestrator()
-            self.daily_gen_orch = DailyGenerationOrchestrator()
-            self.validation_orch = ValidationGateOrchestrator()
-            self.assembly_orch = AssemblyOrchestrator()
+            orch_args = {"config": self.config.pipeline, "scheduler": self.scheduler,
+                         "events": self.events}
+            self.unit_planning_orch = UnitPlanningOrchestrator(**orch_args)
+            self.daily_gen_orch = DailyGenerationOrchestrator(**orch_args)
+            self.validation_orch = ValidationGateOrchestrator(**orch_args)
+            self.assembly_orch = AssemblyOrchestrator(**orch_args)
 
     def _setup_logging(self):
         """Configure logging."""
@@ -746,14 +908,74 @@ class TheaterPipeline:
         )
         self.logger = logging.getLogger("TheaterPipeline")
 
-    def run(self, unit: int, day: int, dry_run: bool = False) -> Dict[str, Any]:
-        """Run the pipeline for a specific unit and day."""
+    def _open_journal(self, unit: int, day: int, resume_from: Optional[str]) -> RunJournal:
+        """Open this day's run journal, keeping only what resume_from reuses."""
+        with self._journal_lock:
+            if self._journal_store is None:
+                self._journal_store = StateStore(self.output_generator.output_dir / JOURNAL_DB_NAME)
+        journal = RunJournal(self._journal_store, unit, day)
+        completed = journal.start(resume_from)
+        if completed:
+            self.logger.info(f"Resuming: journaled phases {', '.join(completed)}")
+        return journal
+
+    def run(
+        self,
+        unit: int,
+        day: int,
+        dry_run: bool = False,
+        resume_from: Optional[str] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the pipeline for a specific unit and day.
+
+        Args:
+            unit: Unit number
+            day: Day within the unit
+            dry_run: Validate only; nothing is written or journaled
+            resume_from: RESUME_AUTO to replay only unfinished work, or a
+                phase name (PHASE_ORDER) to redo it and everything after
+            deadline: Wall-clock deadline for the day (orchestrator mode);
+                agents are not started once it has passed
+        """
+        self.events.emit(RUN_STARTED, unit=unit, day=day, dry_run=dry_run, resume_from=resume_from)
+        started = datetime.now()
+        result: Dict[str, Any] = {"status": "FAILED"}
+        try:
+            result = self._run_day(unit, day, dry_run, resume_from, deadline)
+            return result
+        except Exception as e:
+            result = {"status": "FAILED", "error": str(e)}
+            raise
+        finally:
+            summary = result.get("summary", {})
+            sizes = None
+            if self.events.active:
+                sizes = lesson_sizes(self.input_loader.load_lesson(unit, day)).to_dict()
+            self.events.emit(
+                RUN_FINISHED, unit=unit, day=day, status=result.get("status"),
+                error=result.get("error"), total_agents=summary.get("total_agents"),
+                failed_agents=summary.get("failed"), dry_run=dry_run, sizes=sizes,
+                duration_seconds=(datetime.now() - started).total_seconds()
+            )
+
+    def _run_day(
+        self,
+        unit: int,
+        day: int,
+        dry_run: bool,
+        resume_from: Optional[str],
+        deadline: Optional[Deadline]
+    ) -> Dict[str, Any]:
+        """Run one day (see run)."""
         self.logger.info("=" * 60)
         self.logger.info("THEATER EDUCATION PIPELINE")
         self.logger.info("=" * 60)
         self.logger.info(f"Unit: {unit}, Day: {day}")
         self.logger.info(f"Dry Run: {dry_run}")
         self.logger.info(f"Using Orchestrators: {self.use_orchestrators}")
+        self.logger.info(f"Resume From: {resume_from or 'none'}")
         self.logger.info("")
 
         # Load input
@@ -766,9 +988,13 @@ class TheaterPipeline:
         lesson_context = self.input_loader.create_lesson_context(lesson_data)
         self.logger.info(f"Topic: {lesson_context.topic}")
 
+        journal = None if dry_run else self._open_journal(unit, day, resume_from)
+
         # Use enhanced orchestrators if available
         if self.use_orchestrators:
-            return self._run_with_orchestrators(unit, day, lesson_context, lesson_data, dry_run)
+            return self._run_with_orchestrators(
+                unit, day, lesson_context, lesson_data, dry_run, journal, deadline
+            )
 
         # Create execution context
         context = {
@@ -783,26 +1009,27 @@ class TheaterPipeline:
 
         # Execute phases
         all_results = []
+        files: List[str] = []
 
         # Phase 1: Unit Planning
         self.logger.info("\n" + "-" * 40)
         self.logger.info("PHASE 1: UNIT PLANNING")
         self.logger.info("-" * 40)
-        results = self.orchestrator.execute_phase(PipelinePhase.UNIT_PLANNING, context)
+        results = self.orchestrator.execute_phase(PipelinePhase.UNIT_PLANNING, context, journal)
         all_results.extend(results)
 
         # Phase 2: Daily Generation
         self.logger.info("\n" + "-" * 40)
         self.logger.info("PHASE 2: DAILY GENERATION")
         self.logger.info("-" * 40)
-        results = self.orchestrator.execute_phase(PipelinePhase.DAILY_GENERATION, context)
+        results = self.orchestrator.execute_phase(PipelinePhase.DAILY_GENERATION, context, journal)
         all_results.extend(results)
 
         # Phase 3: Validation
         self.logger.info("\n" + "-" * 40)
         self.logger.info("PHASE 3: VALIDATION")
         self.logger.info("-" * 40)
-        results = self.orchestrator.execute_phase(PipelinePhase.VALIDATION, context)
+        results = self.orchestrator.execute_phase(PipelinePhase.VALIDATION, context, journal)
         all_results.extend(results)
 
         # Check validation results
@@ -820,11 +1047,11 @@ class TheaterPipeline:
             self.logger.info("\n" + "-" * 40)
             self.logger.info("PHASE 4: ASSEMBLY")
             self.logger.info("-" * 40)
-            results = self.orchestrator.execute_phase(PipelinePhase.ASSEMBLY, context)
+            results = self.orchestrator.execute_phase(PipelinePhase.ASSEMBLY, context, journal)
             all_results.extend(results)
 
             # Generate output files
-            self._generate_outputs(context, lesson_context)
+            files = self._generate_journaled_outputs(context, lesson_context, journal)
 
         # Generate summary
         summary = self._generate_summary(all_results)
@@ -840,6 +1067,7 @@ class TheaterPipeline:
         return {
             "status": "SUCCESS" if summary['failed'] == 0 else "PARTIAL",
             "summary": summary,
+            "files": files,
             "results": [
                 {
                     "agent": r.agent_name,
@@ -850,8 +1078,194 @@ class TheaterPipeline:
             ]
         }
 
-    def _generate_outputs(self, context: Dict, lesson_context: LessonContext):
-        """Generate output files."""
+    def run_batch(
+        self,
+        unit: int,
+        days: List[int],
+        dry_run: bool = False,
+        resume_from: Optional[str] = None,
+        workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Run several days of a unit in parallel under the scheduler's deadlines.
+
+        Each day gets the day deadline (inside the batch deadline); a day
+        that overruns is cancelled and reported as timed_out while the
+        other days finish.
+
+        Args:
+            workers: Days run at once; by default the count the cost
+                estimator recommends (up to batch_workers), or
+                batch_workers when there is no timing history
+
+        Returns:
+            Batch status plus one entry per day
+        """
+        if workers is None:
+            workers = self.estimate_batch(unit, days).recommended_workers or self.max_workers
+        self.scheduler.max_workers = workers
+        self.logger.info(f"Batch: Unit {unit}, {len(days)} days, {self.scheduler.max_workers} workers")
+        progress = Progress(total=len(days))
+
+        def run_day(day: int, deadline: Deadline) -> Dict[str, Any]:
+            status = "FAILED"
+            try:
+                result = self.run(unit, day, dry_run, resume_from, deadline=deadline)
+                status = result.get("status", status)
+                return result
+            finally:
+                self.events.emit(DAY_FINISHED, unit=unit, day=day, status=status,
+                                 **progress.advance())
+
+        with self.events.span("batch", unit=unit, days=len(days)) as finished:
+            outcomes = self.scheduler.run_batch(
+                days, run_day, label=lambda day: f"unit {unit} day {day}"
+            )
+            finished["timed_out"] = sum(1 for o in outcomes if o.status == "timed_out")
+
+        def day_status(outcome: BatchOutcome) -> str:
+            if outcome.status == "completed":
+                return outcome.result.get("status", "FAILED")
+            return outcome.status.upper()
+
+        statuses = [day_status(o) for o in outcomes]
+        for outcome, status in zip(outcomes, statuses):
+            error = outcome.error or (outcome.result or {}).get("error")
+            detail = f" ({error})" if error else ""
+            self.logger.info(f"  Day {outcome.item}: {status} in {outcome.duration_seconds:.1f}s{detail}")
+
+        return {
+            "status": "SUCCESS" if all(s == "SUCCESS" for s in statuses) else "PARTIAL",
+            "days": [
+                {**outcome.to_dict(), "day": outcome.item, "status": status}
+                for outcome, status in zip(outcomes, statuses)
+            ]
+        }
+
+    # =========================================================================
+    # COST ESTIMATE
+    # =========================================================================
+
+    def plan_days(self, unit: int, days: List[int]) -> List[WorkItem]:
+        """Days with their input sizes (days without input are left out)."""
+        items = []
+        for day in days:
+            lesson_data = self.input_loader.load_lesson(unit, day)
+            if lesson_data:
+                items.append(WorkItem(f"unit {unit} day {day}", lesson_sizes(lesson_data)))
+        return items
+
+    def estimate_batch(
+        self,
+        unit: int,
+        days: List[int],
+        workers: Optional[int] = None
+    ) -> BatchEstimate:
+        """
+        Predict wall clock and peak memory of running days from the timing history.
+
+        Args:
+            workers: Days run at once; by default the recommended count
+                (up to batch_workers)
+        """
+        estimator = CostEstimator(history_path())
+        return estimator.plan(RUNNER_THEATER, self.plan_days(unit, days), workers, self.max_workers)
+
+    # =========================================================================
+    # WORK QUEUE
+    # =========================================================================
+
+    def enqueue_days(
+        self,
+        broker: Broker,
+        unit: int,
+        days: List[int],
+        dry_run: bool = False
+    ) -> List[str]:
+        """
+        Enqueue one job per day, keyed by a hash of its lesson input and config.
+
+        Days whose job already ran (or is queued) with the same inputs are
+        not enqueued again.
+
+        Returns:
+            Ids of the jobs added or reset
+        """
+        added = []
+        for day in days:
+            lesson_data = self.input_loader.load_lesson(unit, day)
+            if not lesson_data:
+                self.logger.warning(f"No input for Unit {unit} Day {day}; not enqueued")
+                continue
+            job = Job(
+                job_id=f"{DAY_JOB}:{unit}:{day}",
+                kind=DAY_JOB,
+                params={"unit": unit, "day": day, "dry_run": dry_run},
+                input_hash=content_hash(lesson_data, self.config.pipeline, dry_run),
+                priority=day
+            )
+            if broker.enqueue(job):
+                added.append(job.job_id)
+        self.logger.info(f"Enqueued {len(added)} of {len(days)} days for Unit {unit}")
+        return added
+
+    def run_day_job(self, job: Job) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Worker handler for day jobs.
+
+        Returns:
+            (result summary, {path relative to the output folder: file})
+        """
+        params = job.params
+        result = self.run(params["unit"], params["day"], dry_run=params.get("dry_run", False))
+        if result["status"] == "FAILED":
+            raise RuntimeError(result.get("error", "Pipeline failed"))
+        root = self.output_generator.output_dir.resolve()
+        files = {Path(f).resolve().relative_to(root).as_posix(): f for f in result.get("files", [])}
+        summary = {k: result[k] for k in ("status", "summary", "validation_passed") if k in result}
+        return summary, files
+
+    def job_handlers(self) -> Dict[str, JobHandler]:
+        """Handlers this machine can run: days, plus step 12 sections when configured."""
+        handlers: Dict[str, JobHandler] = {DAY_JOB: self.run_day_job}
+        try:
+            from step12_powerpoint_population import SECTION_JOB, run_section_job
+            handlers[SECTION_JOB] = run_section_job
+        except Exception as e:
+            self.logger.info(f"Step 12 section jobs unavailable on this worker: {e}")
+        return handlers
+
+    def run_worker(self, broker: Broker, idle_timeout: float = 0.0) -> List[Job]:
+        """Run queued jobs until the queue stays empty for idle_timeout seconds."""
+        worker = Worker(broker, self.job_handlers())
+        self.logger.info(f"Worker {worker.worker_id} handling: {', '.join(worker.handlers)}")
+        jobs = worker.run(idle_timeout=idle_timeout)
+        for job in jobs:
+            self.logger.info(f"  {job.job_id}: {job.status}{f' ({job.error})' if job.error else ''}")
+        return jobs
+
+    def _generate_journaled_outputs(
+        self,
+        context: Dict,
+        lesson_context: LessonContext,
+        journal: Optional[RunJournal]
+    ) -> List[str]:
+        """Generate output files unless the journal has them; record them when done."""
+        journaled = journal.get("outputs") if journal else None
+        if journaled is not None and all(Path(p).exists() for p in journaled['files']):
+            self.logger.info("Outputs already generated (journal)")
+            return journaled['files']
+
+        files = self._generate_outputs(context, lesson_context)
+        for path in files:
+            self.events.file_written(path, unit=lesson_context.unit_number, day=lesson_context.day)
+        if journal:
+            journal.record("outputs", {'files': files})
+        return files
+
+    def _generate_outputs(self, context: Dict, lesson_context: LessonContext) -> List[str]:
+        """Generate output files; returns the paths written."""
+        files = []
         # Create output directory
         unit_folder = f"Unit_{lesson_context.unit_number}_{lesson_context.unit_name.replace(' ', '_')}"
         day_folder = f"Day_{lesson_context.day:02d}"
@@ -863,6 +1277,7 @@ class TheaterPipeline:
         if lesson_plan:
             lesson_path = output_dir / "lesson_plan.md"
             self.output_generator.generate_lesson_plan_md(lesson_plan, lesson_path)
+            files.append(str(lesson_path))
             self.logger.info(f"Generated: {lesson_path}")
 
         # Generate PowerPoint using Theater PPTX Generator
@@ -895,6 +1310,7 @@ class TheaterPipeline:
             )
 
             if result['status'] == 'success':
+                files.append(str(result['file_path']))
                 self.logger.info(f"Generated: {result['file_path']}")
             else:
                 self.logger.error(f"PowerPoint generation failed: {result.get('error', 'Unknown error')}")
@@ -903,30 +1319,66 @@ class TheaterPipeline:
             self.logger.warning(f"PowerPoint generation unavailable: {e}")
             # Create placeholder
             pptx_placeholder = output_dir / "powerpoint_placeholder.txt"
-            with open(pptx_placeholder, 'w') as f:
-                f.write("PowerPoint generation requires python-pptx library.\n")
-                f.write(f"Install with: pip install python-pptx\n")
-                f.write(f"Topic: {lesson_context.topic}\n")
-                f.write(f"Slides needed: 16 (12 content + 4 auxiliary)\n")
+            atomic_write_text(pptx_placeholder, (
+                "PowerPoint generation requires python-pptx library.\n"
+                "Install with: pip install python-pptx\n"
+                f"Topic: {lesson_context.topic}\n"
+                "Slides needed: 16 (12 content + 4 auxiliary)\n"
+            ))
+            files.append(str(pptx_placeholder))
             self.logger.info(f"Generated placeholder: {pptx_placeholder}")
 
+        return files
+
     def _generate_summary(self, results: List[AgentResult]) -> Dict:
         """Generate execution summary."""
+        # Compare by value: package agents and journal replays use different enums
+        statuses = [r.status.value for r in results]
         return {
             "total_agents": len(results),
-            "completed": sum(1 for r in results if r.status == AgentStatus.COMPLETED),
-            "failed": sum(1 for r in results if r.status == AgentStatus.FAILED),
-            "skipped": sum(1 for r in results if r.status == AgentStatus.SKIPPED),
+            "completed": statuses.count(AgentStatus.COMPLETED.value),
+            "failed": statuses.count(AgentStatus.FAILED.value),
+            "skipped": statuses.count(AgentStatus.SKIPPED.value),
             "total_duration": sum(r.duration_seconds for r in results)
         }
 
+    def _journaled_phase(
+        self,
+        journal: Optional[RunJournal],
+        phase: PipelinePhase,
+        run_phase,
+        context: Optional['AgentContext'] = None
+    ) -> 'OrchestratorResult':
+        """
+        Run an orchestrator phase, or replay it from the journal.
+
+        Only fully completed phases are journaled; failed, partial or
+        escalated phases are run again on resume.
+        """
+        where = {"unit": context.unit_number, "day": context.day} if context else {}
+        with self.events.span("phase", phase=phase.value, **where) as finished:
+            journaled = journal.get(phase.value) if journal else None
+            if journaled is not None:
+                self.logger.info(f"Replaying {phase.value} from journal")
+                result = OrchestratorResult(**journaled)
+            else:
+                result = run_phase()
+                if journal and result.status == "completed":
+                    journal.record(phase.value, asdict(result))
+            finished.update(status=result.status, replayed=journaled is not None,
+                            agents_run=len(result.agents_run),
+                            agents_failed=len(result.agents_failed))
+        return result
+
     def _run_with_orchestrators(
         self,
         unit: int,
         day: int,
         lesson_context: LessonContext,
         lesson_data: Dict,
-        dry_run: bool
+        dry_run: bool,
+        journal: Optional[RunJournal] = None,
+        deadline: Optional[Deadline] = None
     ) -> Dict[str, Any]:
         """Run pipeline using enhanced orchestrators with retry logic."""
         from datetime import datetime
@@ -945,10 +1397,12 @@ class TheaterPipeline:
             unit_number=unit,
             unit_name=unit_names.get(unit, "Unknown"),
             day=day,
-            topic=lesson_context.topic
+            topic=lesson_context.topic,
+            deadline=deadline
         )
 
         all_results = []
+        files: List[str] = []
         phase_outputs = {}
 
         # Phase 1: Unit Planning
@@ -956,7 +1410,11 @@ class TheaterPipeline:
         self.logger.info("PHASE 1: UNIT PLANNING (with orchestrator)")
         self.logger.info("-" * 40)
 
-        unit_result = self.unit_planning_orch.run(agent_context)
+        unit_result = self._journaled_phase(
+            journal, PipelinePhase.UNIT_PLANNING,
+            lambda: self.unit_planning_orch.run(agent_context),
+            agent_context
+        )
         all_results.append(("unit_planning", unit_result))
         phase_outputs["unit_planning"] = unit_result.outputs
 
@@ -969,7 +1427,11 @@ class TheaterPipeline:
         self.logger.info("PHASE 2: DAILY GENERATION (with orchestrator)")
         self.logger.info("-" * 40)
 
-        daily_result = self.daily_gen_orch.run(agent_context, daily_input=lesson_data)
+        daily_result = self._journaled_phase(
+            journal, PipelinePhase.DAILY_GENERATION,
+            lambda: self.daily_gen_orch.run(agent_context, daily_input=lesson_data),
+            agent_context
+        )
         all_results.append(("daily_generation", daily_result))
         phase_outputs["daily_generation"] = daily_result.outputs
 
@@ -981,7 +1443,11 @@ class TheaterPipeline:
         self.logger.info("PHASE 3: VALIDATION (with orchestrator)")
         self.logger.info("-" * 40)
 
-        validation_result = self.validation_orch.run(agent_context, daily_output=daily_result.outputs)
+        validation_result = self._journaled_phase(
+            journal, PipelinePhase.VALIDATION,
+            lambda: self.validation_orch.run(agent_context, daily_output=daily_result.outputs),
+            agent_context
+        )
         all_results.append(("validation", validation_result))
         phase_outputs["validation"] = validation_result.outputs
 
@@ -993,15 +1459,25 @@ class TheaterPipeline:
             self.logger.warning(f"  Failed gate: {rejection.get('failed_gate', 'unknown')}")
             self.logger.warning(f"  Reason: {rejection.get('reason', 'unknown')}")
 
+        # A day past its deadline must not assemble (or write) anything
+        if deadline is not None:
+            deadline.check()
+
         # Phase 4: Assembly (if not dry run and validation passed)
         if not dry_run and validation_passed:
             self.logger.info("\n" + "-" * 40)
             self.logger.info("PHASE 4: ASSEMBLY (with orchestrator)")
             self.logger.info("-" * 40)
 
-            assembly_result = self.assembly_orch.run(
-                agent_context,
-                validated_output=validation_result.outputs.get("validated_output", daily_result.outputs)
+            assembly_result = self._journaled_phase(
+                journal, PipelinePhase.ASSEMBLY,
+                lambda: self.assembly_orch.run(
+                    agent_context,
+                    validated_output=validation_result.outputs.get(
+                        "validated_output", daily_result.outputs
+                    )
+                ),
+                agent_context
             )
             all_results.append(("assembly", assembly_result))
             phase_outputs["assembly"] = assembly_result.outputs
@@ -1015,7 +1491,7 @@ class TheaterPipeline:
                 "presenter_notes_writer_output": daily_result.outputs.get("presenter_notes", {}),
                 "raw_lesson_data": lesson_data  # Pass raw data with expanded content
             }
-            self._generate_outputs(context, lesson_context)
+            files = self._generate_journaled_outputs(context, lesson_context, journal)
 
         # Calculate summary
         total_duration = (datetime.now() - start_time).total_seconds()
@@ -1043,6 +1519,7 @@ class TheaterPipeline:
                 "total_duration": total_duration
             },
             "phase_outputs": phase_outputs,
+            "files": files,
             "results": [
                 {
                     "phase": phase,
@@ -1056,6 +1533,37 @@ class TheaterPipeline:
         }
 
 
+def run_queue_mode(pipeline: TheaterPipeline, args: argparse.Namespace, days: List[int]) -> Dict[str, Any]:
+    """Enqueue, work or collect against the --broker work queue."""
+    broker = open_broker(args.broker)
+    if args.enqueue == 'days':
+        added = pipeline.enqueue_days(broker, args.unit, days, dry_run=args.dry_run)
+        return {"status": "SUCCESS", "enqueued": added}
+    if args.enqueue == 'sections':
+        from step12_powerpoint_population import enqueue_sections
+        added = enqueue_sections(broker)
+        pipeline.logger.info(f"Enqueued {len(added)} step 12 sections")
+        return {"status": "SUCCESS", "enqueued": added}
+    if args.worker:
+        jobs = pipeline.run_worker(broker, idle_timeout=args.idle_timeout)
+        done = all(job.status == "completed" for job in jobs)
+        return {"status": "SUCCESS" if done else "PARTIAL", "jobs": [job.job_id for job in jobs]}
+
+    # Day artifacts are relative to the output directory, section decks
+    # to step 12's production folder
+    written = broker.collect_artifacts(pipeline.output_generator.output_dir, kind=DAY_JOB)
+    if any(job.kind != DAY_JOB for job in broker.jobs(COMPLETED)):
+        try:
+            from step12_powerpoint_population import collect_sections
+            written += collect_sections(broker)
+        except Exception as e:
+            pipeline.logger.warning(f"Step 12 section decks not collected: {e}")
+    stats = broker.stats()
+    pipeline.logger.info(f"Collected {len(written)} files; queue: {stats}")
+    finished = stats["completed"] == sum(stats.values())
+    return {"status": "SUCCESS" if finished else "PARTIAL", "files": [str(p) for p in written]}
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -1069,33 +1577,103 @@ Examples:
   %(prog)s --unit 4 --day 1              Generate One Acts Day 1
   %(prog)s --unit 1 --day 1 --dry-run    Validate only, no output
   %(prog)s --unit 1 --day 1 --verbose    Show detailed logging
+  %(prog)s --unit 1 --all-days           Generate every Greek Theater day
+  %(prog)s --unit 1 --all-days --events-jsonl outputs/events.jsonl --events-port 8765
+  %(prog)s --unit 1 --all-days --estimate          Predict time and memory, run nothing
+  %(prog)s --unit 1 --all-days --workers 2         Run two days at a time
+
+Work queue (spread days / step 12 sections over several machines):
+  %(prog)s --broker queue.db --enqueue days --unit 1 --all-days
+  %(prog)s --broker queue.db --enqueue sections
+  %(prog)s --broker queue.db --worker --idle-timeout 60     (on each machine)
+  %(prog)s --broker queue.db --collect --output-dir production   (decks go to step 12's production folder)
         """
     )
 
-    parser.add_argument('--unit', type=int, required=True, choices=[1, 2, 3, 4],
+    parser.add_argument('--unit', type=int, choices=[1, 2, 3, 4],
                         help='Unit number (1=Greek, 2=Commedia, 3=Shakespeare, 4=One Acts)')
-    parser.add_argument('--day', type=int, required=True,
-                        help='Day number within the unit')
+    days = parser.add_mutually_exclusive_group()
+    days.add_argument('--day', type=int,
+                      help='Day number within the unit')
+    days.add_argument('--all-days', action='store_true',
+                      help='Generate every day of the unit in parallel (batch deadlines '
+                           'from config/pipeline.yaml)')
     parser.add_argument('--dry-run', action='store_true',
                         help='Validate only, do not generate output files')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose output')
-    parser.add_argument('--resume-from', type=str,
-                        help='Resume from a specific step (e.g., step7)')
+    parser.add_argument('--resume-from', type=str, choices=[RESUME_AUTO] + PHASE_ORDER,
+                        help='Resume from the run journal: "auto" replays only unfinished '
+                             'work; a phase name re-runs that phase and everything after it')
     parser.add_argument('--output-dir', type=str,
                         help='Custom output directory')
+    parser.add_argument('--events-jsonl', type=str,
+                        help='Append progress events to this JSON-lines file')
+    parser.add_argument('--events-port', type=int,
+                        help='Stream progress events as Server-Sent Events on '
+                             'http://127.0.0.1:PORT/events')
+    parser.add_argument('--estimate', action='store_true',
+                        help='Predict wall clock and peak memory from the timing history '
+                             'and exit without running')
+    parser.add_argument('--workers', type=int,
+                        help='Days run at once with --all-days (default: estimated from '
+                             'the timing history, up to batch_workers)')
+    queue = parser.add_argument_group('work queue')
+    queue.add_argument('--broker', type=str,
+                       help='Work-queue broker: a SQLite file or <scheme>:<location>')
+    modes = queue.add_mutually_exclusive_group()
+    modes.add_argument('--enqueue', choices=['days', 'sections'],
+                       help='Enqueue the selected days, or every step 12 section, instead of running')
+    modes.add_argument('--worker', action='store_true',
+                       help='Run queued jobs until the queue is empty')
+    modes.add_argument('--collect', action='store_true',
+                       help='Write the artifacts of finished jobs into the output directory')
+    queue.add_argument('--idle-timeout', type=float, default=0.0,
+                       help='Seconds a worker waits for new jobs before exiting (default: 0)')
 
     args = parser.parse_args()
 
+    queue_mode = args.enqueue or args.worker or args.collect
+    if queue_mode and not args.broker:
+        parser.error("--enqueue, --worker and --collect need --broker")
+    if args.estimate and queue_mode:
+        parser.error("--estimate cannot be combined with the work-queue modes")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if not (args.worker or args.collect or args.enqueue == 'sections'):
+        if args.unit is None or (args.day is None and not args.all_days):
+            parser.error("--unit and one of --day/--all-days are required")
+
     # Validate day number based on unit
     unit_days = {1: 20, 2: 18, 3: 25, 4: 17}
     max_days = unit_days.get(args.unit, 20)
-    if args.day < 1 or args.day > max_days:
+    if args.day is not None and (args.day < 1 or args.day > max_days):
         parser.error(f"Day must be between 1 and {max_days} for Unit {args.unit}")
+    selected_days = list(range(1, max_days + 1)) if args.all_days else [args.day]
 
     # Run pipeline
-    pipeline = TheaterPipeline(verbose=args.verbose)
-    result = pipeline.run(unit=args.unit, day=args.day, dry_run=args.dry_run)
+    events = get_event_bus()
+    if args.events_jsonl or args.events_port is not None:
+        events = configure_event_bus(jsonl=args.events_jsonl, sse_port=args.events_port)
+    pipeline = TheaterPipeline(verbose=args.verbose, output_dir=args.output_dir, events=events)
+    if args.estimate:
+        estimate = pipeline.estimate_batch(args.unit, selected_days, args.workers)
+        print(estimate.summary())
+        return 0
+    events.subscribe(TimingRecorder(history_path(), RUNNER_THEATER))
+    if queue_mode:
+        result = run_queue_mode(pipeline, args, selected_days)
+    elif args.all_days:
+        result = pipeline.run_batch(
+            unit=args.unit, days=selected_days,
+            dry_run=args.dry_run, resume_from=args.resume_from, workers=args.workers
+        )
+    else:
+        result = pipeline.run(
+            unit=args.unit, day=args.day, dry_run=args.dry_run, resume_from=args.resume_from
+        )
+
+    events.close()
 
     # Exit code based on result
     if result['status'] == 'SUCCESS':
@@ -38,7 +38,9 @@ from .body_char_enforcer import (
 from .text_limits_enforcer import (
     enforce_all_text_limits,
     validate_all_text_limits,
-    enforce_all_slides
+    enforce_all_slides,
+    validate_text_limits_bulk,
+    TextLimitsBulkResult
 )
 from .marker_insertion import (
     insert_markers,
@@ -77,6 +79,7 @@ from .monologue_generator import (
 from .monologue_validator import (
     validate_slide_monologue,
     validate_presentation_monologues,
+    validate_monologue_stream,
     has_valid_monologue,
     get_monologue_issues,
     count_monologue_words,
@@ -431,6 +434,8 @@ __all__ = [
     'enforce_all_text_limits',
     'validate_all_text_limits',
     'enforce_all_slides',
+    'validate_text_limits_bulk',
+    'TextLimitsBulkResult',
     # Marker insertion (R14)
     'insert_markers',
     'validate_markers',
@@ -464,6 +469,7 @@ __all__ = [
     # Monologue validation (HARDCODED)
     'validate_slide_monologue',
     'validate_presentation_monologues',
+    'validate_monologue_stream',
     'has_valid_monologue',
     'get_monologue_issues',
     'count_monologue_words',
@@ -26,6 +26,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from skills.utilities.atomic_write import atomic_save
+
 try:
     from docx import Document
     from docx.shared import Inches, Pt
@@ -263,7 +265,7 @@ def generate_sorting_handout(
 
     # Save if path provided
     if output_path:
-        doc.save(str(output_path))
+        atomic_save(doc, output_path)
 
     return doc
 
@@ -376,7 +378,7 @@ def generate_matching_handout(
     add_footer(doc, unit_day)
 
     if output_path:
-        doc.save(str(output_path))
+        atomic_save(doc, output_path)
 
     return doc
 
@@ -470,7 +472,7 @@ def generate_sequencing_handout(
     add_footer(doc, unit_day)
 
     if output_path:
-        doc.save(str(output_path))
+        atomic_save(doc, output_path)
 
     return doc
 
@@ -548,7 +550,7 @@ def generate_discussion_handout(
     add_footer(doc, unit_day)
 
     if output_path:
-        doc.save(str(output_path))
+        atomic_save(doc, output_path)
 
     return doc
 
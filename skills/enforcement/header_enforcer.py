@@ -16,6 +16,8 @@ Usage:
 import re
 from typing import Dict, Any, Tuple
 
+from skills.utilities.regex_registry import compile_pattern
+
 
 # Character limits - Updated to 36 chars, 1 line only (from config/constraints.yaml)
 MAX_CHARS_PER_LINE = 36
@@ -48,13 +50,17 @@ ABBREVIATIONS = {
     'infection control': 'Infection Ctrl',
 }
 
+# (case-insensitive pattern, replacement) for each abbreviation, in order
+_ABBREVIATION_RES = [
+    (compile_pattern(re.escape(full), re.IGNORECASE), abbrev)
+    for full, abbrev in ABBREVIATIONS.items()
+]
+
 
 def abbreviate_text(text: str) -> str:
     """Apply abbreviations to reduce text length."""
     result = text
-    for full, abbrev in ABBREVIATIONS.items():
-        # Case-insensitive replacement
-        pattern = re.compile(re.escape(full), re.IGNORECASE)
+    for pattern, abbrev in _ABBREVIATION_RES:
         result = pattern.sub(abbrev, result)
     return result
 
@@ -11,6 +11,8 @@ Usage:
 import re
 from typing import Dict, Any, List, Tuple
 
+from skills.utilities.keyword_matcher import get_matcher
+
 
 MIN_PAUSE_MARKERS = 2
 MIN_EMPHASIS_MARKERS_CONTENT = 1
@@ -24,6 +26,47 @@ def count_markers(notes: str) -> Dict[str, int]:
     }
 
 
+# Common theater terms to emphasize, grouped by area
+KEY_THEATER_TERMS = (
+    # Performance terms
+    'blocking', 'staging', 'movement',
+    'projection', 'articulation', 'diction',
+    'motivation', 'objective', 'intention',
+    'subtext', 'given circumstances',
+    'ensemble', 'chorus', 'company',
+
+    # Technical terms
+    'upstage', 'downstage', 'stage left', 'stage right',
+    'wings', 'flies', 'apron',
+    'cue', 'blackout', 'transition',
+    'costume', 'props', 'set',
+
+    # Acting technique
+    'beat', 'action', 'tactic',
+    'emotional truth', 'sense memory',
+    'physicality', 'gesture', 'posture',
+
+    # Greek theater terms
+    'theatron', 'orchestra', 'skene',
+    'dithyramb', 'dionysus',
+    'tragedy', 'comedy', 'catharsis',
+    'mask', 'protagonist', 'antagonist',
+
+    # Commedia terms
+    'lazzi', 'stock character', 'improvisation',
+    'arlecchino', 'pantalone', 'zanni',
+
+    # Shakespeare terms
+    'iambic pentameter', 'verse', 'prose',
+    'soliloquy', 'monologue', 'aside',
+    'scansion', 'antithesis',
+
+    # Directing terms
+    'directorial', 'concept', 'vision',
+    'rehearsal', 'table work', 'run-through',
+)
+
+
 def find_key_terms(text: str, unit: str = 'general') -> List[str]:
     """
     Find key theater terms that should be emphasized.
@@ -35,52 +78,8 @@ def find_key_terms(text: str, unit: str = 'general') -> List[str]:
     Returns:
         List of terms to emphasize
     """
-    # Common theater terms to emphasize
-    key_patterns = [
-        # Performance terms
-        r'\b(blocking|staging|movement)\b',
-        r'\b(projection|articulation|diction)\b',
-        r'\b(motivation|objective|intention)\b',
-        r'\b(subtext|given circumstances)\b',
-        r'\b(ensemble|chorus|company)\b',
-
-        # Technical terms
-        r'\b(upstage|downstage|stage left|stage right)\b',
-        r'\b(wings|flies|apron)\b',
-        r'\b(cue|blackout|transition)\b',
-        r'\b(costume|props|set)\b',
-
-        # Acting technique
-        r'\b(beat|action|tactic)\b',
-        r'\b(emotional truth|sense memory)\b',
-        r'\b(physicality|gesture|posture)\b',
-
-        # Greek theater terms
-        r'\b(theatron|orchestra|skene)\b',
-        r'\b(chorus|dithyramb|Dionysus)\b',
-        r'\b(tragedy|comedy|catharsis)\b',
-        r'\b(mask|protagonist|antagonist)\b',
-
-        # Commedia terms
-        r'\b(lazzi|stock character|improvisation)\b',
-        r'\b(Arlecchino|Pantalone|Zanni)\b',
-
-        # Shakespeare terms
-        r'\b(iambic pentameter|verse|prose)\b',
-        r'\b(soliloquy|monologue|aside)\b',
-        r'\b(scansion|antithesis)\b',
-
-        # Directing terms
-        r'\b(directorial|concept|vision)\b',
-        r'\b(rehearsal|table work|run-through)\b',
-    ]
-
-    found_terms = []
-    text_lower = text.lower()
-
-    for pattern in key_patterns:
-        matches = re.findall(pattern, text_lower)
-        found_terms.extend(matches)
+    matcher = get_matcher(KEY_THEATER_TERMS, whole_words=True)
+    found_terms = matcher.matched(text)
 
     # Return unique terms, capitalized
     return list(set(term.title() for term in found_terms))
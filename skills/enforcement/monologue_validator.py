@@ -17,7 +17,7 @@ Pipeline: Theater Education
 """
 
 import re
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, List, Tuple
 
 
 # =============================================================================
@@ -47,6 +47,13 @@ MARKER_PATTERNS = {
     "WAIT": r'\[WAIT[:\s]?[^\]]*\]',
 }
 
+# Markers are excluded from word counts
+_ANY_MARKER_RE = re.compile(r'\[[^\]]+\]')
+_WORD_RE = re.compile(r'\S+')
+
+# Characters of an offending monologue kept by streaming validation
+STREAM_EXCERPT_CHARS = 160
+
 # Forbidden patterns (bullet-point style)
 FORBIDDEN_PATTERNS = [
     r'^\s*[\•\-\*]\s',      # Bullet points at line start
@@ -84,8 +91,7 @@ def validate_slide_monologue(
     warnings = []
 
     # Count words (exclude markers from count)
-    clean_text = re.sub(r'\[[^\]]+\]', '', monologue)
-    word_count = len(clean_text.split())
+    word_count = count_monologue_words(monologue)
 
     # R1: Word count validation
     # Content slides have strict requirements; auxiliary slides are more lenient
@@ -223,6 +229,108 @@ def validate_presentation_monologues(
             total_markers[name] += result["markers"].get(name, 0)
 
     # R6: Presentation-level requirements
+    presentation_issues = _check_presentation_totals(total_words, total_markers)
+
+    # Calculate pass/fail
+    all_issues = total_issues + presentation_issues
+    critical_issues = [i for i in all_issues if i.get("severity") == "CRITICAL"]
+    slides_passed = sum(1 for r in slide_results if r["valid"])
+
+    return {
+        "valid": len(critical_issues) == 0,
+        "slides_checked": len(monologues),
+        "slides_passed": slides_passed,
+        "slides_failed": len(monologues) - slides_passed,
+        "total_words": total_words,
+        "total_markers": total_markers,
+        "estimated_duration_minutes": round(total_words / 150, 1),
+        "slide_results": slide_results,
+        "issues": all_issues,
+        "warnings": total_warnings,
+        "summary": generate_validation_summary(slide_results, all_issues, total_markers)
+    }
+
+
+def validate_monologue_stream(
+    monologues: Iterable[str],
+    slide_types: Iterable[str] = None,
+    excerpt_chars: int = STREAM_EXCERPT_CHARS
+) -> Dict[str, Any]:
+    """
+    Validate presenter notes one slide at a time without holding them all.
+
+    Same rules as validate_presentation_monologues(), but monologues may be
+    any iterable (e.g. a generator reading notes from a PPTX). Statistics are
+    aggregated incrementally; only failing slides are kept, each with a short
+    excerpt of its notes instead of the full text.
+
+    Args:
+        monologues: Iterable of presenter notes strings
+        slide_types: Optional iterable of slide types (defaults to standard structure)
+        excerpt_chars: Characters of an offending monologue to keep
+
+    Returns:
+        Validation result with "failed_slides" in place of "slide_results"
+    """
+    if slide_types is None:
+        slide_types = (
+            ["agenda", "warmup"] +
+            ["content"] * 12 +
+            ["activity", "journal"]
+        )
+
+    failed_slides = []
+    total_issues = []
+    total_warnings = []
+    total_words = 0
+    total_markers = {name: 0 for name in MARKER_PATTERNS}
+    slides_checked = 0
+
+    for i, (monologue, slide_type) in enumerate(zip(monologues, slide_types)):
+        result = validate_slide_monologue(monologue, i + 1, slide_type)
+        slides_checked += 1
+
+        total_issues.extend(result["issues"])
+        total_warnings.extend(result["warnings"])
+        total_words += result["word_count"]
+
+        for name in total_markers:
+            total_markers[name] += result["markers"].get(name, 0)
+
+        if not result["valid"]:
+            excerpt = monologue[:excerpt_chars]
+            if len(monologue) > excerpt_chars:
+                excerpt += "..."
+            result["excerpt"] = excerpt
+            failed_slides.append(result)
+
+    # R6: Presentation-level requirements
+    presentation_issues = _check_presentation_totals(total_words, total_markers)
+
+    all_issues = total_issues + presentation_issues
+    critical_issues = [i for i in all_issues if i.get("severity") == "CRITICAL"]
+    slides_passed = slides_checked - len(failed_slides)
+
+    return {
+        "valid": len(critical_issues) == 0,
+        "slides_checked": slides_checked,
+        "slides_passed": slides_passed,
+        "slides_failed": len(failed_slides),
+        "total_words": total_words,
+        "total_markers": total_markers,
+        "estimated_duration_minutes": round(total_words / 150, 1),
+        "failed_slides": failed_slides,
+        "issues": all_issues,
+        "warnings": total_warnings,
+        "summary": _format_validation_summary(slides_passed, slides_checked, all_issues, total_markers)
+    }
+
+
+def _check_presentation_totals(
+    total_words: int,
+    total_markers: Dict[str, int]
+) -> List[Dict[str, Any]]:
+    """R6: Presentation-level word and marker minimums."""
     presentation_issues = []
 
     if total_words < MIN_TOTAL_WORDS:
@@ -253,24 +361,7 @@ def validate_presentation_monologues(
             "message": f"Total [CHECK] markers ({total_markers['CHECK']}) below minimum ({MIN_TOTAL_CHECK})."
         })
 
-    # Calculate pass/fail
-    all_issues = total_issues + presentation_issues
-    critical_issues = [i for i in all_issues if i.get("severity") == "CRITICAL"]
-    slides_passed = sum(1 for r in slide_results if r["valid"])
-
-    return {
-        "valid": len(critical_issues) == 0,
-        "slides_checked": len(monologues),
-        "slides_passed": slides_passed,
-        "slides_failed": len(monologues) - slides_passed,
-        "total_words": total_words,
-        "total_markers": total_markers,
-        "estimated_duration_minutes": round(total_words / 150, 1),
-        "slide_results": slide_results,
-        "issues": all_issues,
-        "warnings": total_warnings,
-        "summary": generate_validation_summary(slide_results, all_issues, total_markers)
-    }
+    return presentation_issues
 
 
 def generate_validation_summary(
@@ -279,13 +370,21 @@ def generate_validation_summary(
     markers: Dict[str, int]
 ) -> str:
     """Generate human-readable validation summary."""
+    passed = sum(1 for r in slide_results if r["valid"])
+    return _format_validation_summary(passed, len(slide_results), issues, markers)
+
+
+def _format_validation_summary(
+    passed: int,
+    total: int,
+    issues: List[Dict],
+    markers: Dict[str, int]
+) -> str:
+    """Format the summary block from aggregate counts."""
     lines = ["=" * 60]
     lines.append("MONOLOGUE VALIDATION SUMMARY")
     lines.append("=" * 60)
 
-    passed = sum(1 for r in slide_results if r["valid"])
-    total = len(slide_results)
-
     if passed == total:
         lines.append(f"STATUS: PASSED ({passed}/{total} slides)")
     else:
@@ -331,8 +430,8 @@ def get_monologue_issues(monologue: str, slide_index: int = 1) -> List[str]:
 
 def count_monologue_words(monologue: str) -> int:
     """Count words in monologue (excluding markers)."""
-    clean_text = re.sub(r'\[[^\]]+\]', '', monologue)
-    return len(clean_text.split())
+    clean_text = _ANY_MARKER_RE.sub('', monologue)
+    return sum(1 for _ in _WORD_RE.finditer(clean_text))
 
 
 def count_monologue_markers(monologue: str) -> Dict[str, int]:
@@ -351,6 +450,7 @@ __all__ = [
     # Main validation functions
     "validate_slide_monologue",
     "validate_presentation_monologues",
+    "validate_monologue_stream",
     # Quick checks
     "has_valid_monologue",
     "get_monologue_issues",
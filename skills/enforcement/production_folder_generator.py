@@ -27,6 +27,8 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+from skills.utilities.atomic_write import atomic_write_text
+
 
 # =============================================================================
 # HARDCODED CONSTANTS (CANNOT BE MODIFIED)
@@ -179,7 +181,7 @@ Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}
 ---
 *Theater Education Pipeline - Hardcoded Production Output*
 """
-    path.write_text(content)
+    atomic_write_text(path, content)
 
 
 # =============================================================================
@@ -9,11 +9,20 @@ Only body LINE limits are enforced (12 lines max).
 Usage:
     from skills.enforcement.text_limits_enforcer import enforce_all_text_limits
     fixed_slide = enforce_all_text_limits(slide)
+
+    bulk = validate_text_limits_bulk(headers, bodies)
+    for i in bulk.invalid_indices:
+        details = bulk.details(i)   # validate_all_text_limits() result
 """
 
-from typing import Dict, Any, List
-from .header_enforcer import enforce_header_limits, validate_header
-from .body_line_enforcer import enforce_body_lines, validate_body_lines
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Sequence
+from .header_enforcer import (
+    enforce_header_limits, validate_header,
+    MAX_CHARS_PER_LINE as HEADER_MAX_CHARS, MAX_LINES as HEADER_MAX_LINES
+)
+from .body_line_enforcer import enforce_body_lines, validate_body_lines, MAX_BODY_LINES
 from .body_char_enforcer import validate_body_chars  # Only for validation, not enforcement
 
 
@@ -86,6 +95,65 @@ def validate_all_text_limits(slide: Dict[str, Any]) -> Dict[str, Any]:
     return results
 
 
+@dataclass
+class TextLimitsBulkResult:
+    """
+    R1/R2 checks for a whole deck as parallel arrays.
+
+    details(i) builds the validate_all_text_limits() dict for one slide on
+    demand; truncation warnings are flagged but do not affect validity.
+    """
+    headers: List[str]
+    bodies: List[str]
+    header_lines: array = field(default_factory=lambda: array('i'))
+    header_max_line: array = field(default_factory=lambda: array('i'))
+    body_lines: array = field(default_factory=lambda: array('i'))
+    truncation_warnings: List[int] = field(default_factory=list)
+    invalid_indices: List[int] = field(default_factory=list)
+
+    @property
+    def all_valid(self) -> bool:
+        return not self.invalid_indices
+
+    def details(self, index: int) -> Dict[str, Any]:
+        """validate_all_text_limits() result for one slide."""
+        return validate_all_text_limits({'header': self.headers[index], 'body': self.bodies[index]})
+
+
+def validate_text_limits_bulk(headers: Sequence[str], bodies: Sequence[str]) -> TextLimitsBulkResult:
+    """
+    Validate header and body limits for a deck given as two columns.
+
+    Args:
+        headers: One header per slide
+        bodies: One body per slide
+
+    Returns:
+        TextLimitsBulkResult with the indices of invalid slides
+    """
+    if len(headers) != len(bodies):
+        raise ValueError("headers and bodies must have one entry per slide")
+
+    result = TextLimitsBulkResult(headers=list(headers), bodies=list(bodies))
+
+    for index, (header, body) in enumerate(zip(result.headers, result.bodies)):
+        header_lines = [len(line) for line in header.split('\n') if line.strip()]
+        body_line_count = sum(1 for line in body.split('\n') if line.strip())
+        longest = max(header_lines, default=0)
+
+        result.header_lines.append(len(header_lines))
+        result.header_max_line.append(longest)
+        result.body_lines.append(body_line_count)
+
+        if "..." in body or "\u2026" in body:
+            result.truncation_warnings.append(index)
+        if (len(header_lines) > HEADER_MAX_LINES or longest > HEADER_MAX_CHARS
+                or body_line_count > MAX_BODY_LINES):
+            result.invalid_indices.append(index)
+
+    return result
+
+
 def enforce_all_slides(slides: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Apply text limit enforcement to all slides.
@@ -18,6 +18,8 @@ Created: 2026-01-06
 from typing import Dict, List, Any, Optional, Tuple
 import re
 
+from skills.utilities.regex_registry import compile_pattern, compile_patterns
+
 # Character limits - Single line only
 MAX_CHARS_PER_LINE = 36
 MAX_LINES = 1
@@ -72,13 +74,37 @@ FILLER_WORDS = [
     "understanding", "overview", "introduction",
 ]
 
+_AND_RE = compile_pattern(r'\band\b', re.IGNORECASE)
+
+# (whole-word case-insensitive pattern, replacement) for each abbreviation, in order
+_ABBREVIATION_RES = [
+    (compile_pattern(r'\b' + re.escape(full) + r'\b', re.IGNORECASE), abbrev)
+    for full, abbrev in ABBREVIATIONS.items()
+]
+
+# Common prefixes/suffixes stripped by extract_core_concept
+_PREFIX_RES = compile_patterns([
+    r'^understanding\s+',
+    r'^overview\s+of\s+',
+    r'^introduction\s+to\s+',
+    r'^the\s+',
+    r'^comprehensive\s+',
+    r'^basic\s+',
+    r'^advanced\s+',
+], re.IGNORECASE)
+
+_SUFFIX_RES = compile_patterns([
+    r'\s+in\s+healthcare(\s+settings?)?$',
+    r'\s+for\s+nurses?$',
+    r'\s+in\s+nursing(\s+practice)?$',
+    r'\s+and\s+best\s+practices$',
+], re.IGNORECASE)
+
 
 def apply_abbreviations(text: str) -> str:
     """Apply medical/nursing abbreviations to shorten text."""
     result = text
-    for full, abbrev in ABBREVIATIONS.items():
-        # Case-insensitive replacement
-        pattern = re.compile(r'\b' + re.escape(full) + r'\b', re.IGNORECASE)
+    for pattern, abbrev in _ABBREVIATION_RES:
         if abbrev:
             result = pattern.sub(abbrev, result)
         else:
@@ -102,7 +128,7 @@ def remove_filler_words(text: str) -> str:
 
 def replace_and_with_ampersand(text: str) -> str:
     """Replace 'and' with '&' to save characters."""
-    return re.sub(r'\band\b', '&', text, flags=re.IGNORECASE)
+    return _AND_RE.sub('&', text)
 
 
 def condense_to_single_line(text: str) -> str:
@@ -145,30 +171,13 @@ def condense_to_single_line(text: str) -> str:
 def extract_core_concept(text: str, context: Optional[Dict] = None) -> str:
     """Extract the core concept when other strategies fail."""
     # Remove common prefixes
-    prefixes_to_remove = [
-        r'^understanding\s+',
-        r'^overview\s+of\s+',
-        r'^introduction\s+to\s+',
-        r'^the\s+',
-        r'^comprehensive\s+',
-        r'^basic\s+',
-        r'^advanced\s+',
-    ]
-
     result = text
-    for prefix in prefixes_to_remove:
-        result = re.sub(prefix, '', result, flags=re.IGNORECASE)
+    for prefix in _PREFIX_RES:
+        result = prefix.sub('', result)
 
     # Remove common suffixes
-    suffixes_to_remove = [
-        r'\s+in\s+healthcare(\s+settings?)?$',
-        r'\s+for\s+nurses?$',
-        r'\s+in\s+nursing(\s+practice)?$',
-        r'\s+and\s+best\s+practices$',
-    ]
-
-    for suffix in suffixes_to_remove:
-        result = re.sub(suffix, '', result, flags=re.IGNORECASE)
+    for suffix in _SUFFIX_RES:
+        result = suffix.sub('', result)
 
     return result.strip()
 
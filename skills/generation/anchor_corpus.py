@@ -0,0 +1,283 @@
+"""
+Anchor Corpus - Tokenize anchor text once for the preparation analyzers.
+
+Provides:
+- AnchorCorpus: anchors tokenized once and accepted by every preparation
+  analyzer (corpus=...) in place of the raw dicts
+- PreparedAnchor: lowercased title and "title full_text", interned word
+  tokens, title words longer than 3 characters, and cached keyword hits
+- register_vocabulary(): named keyword lists matched together in one
+  Aho-Corasick pass per distinct word, with `keyword in text` semantics
+
+Usage:
+    from skills.generation.anchor_corpus import AnchorCorpus, register_vocabulary
+
+    corpus = AnchorCorpus.from_anchors(anchors)
+    classifier.classify_anchors(anchors, corpus=corpus)
+    ranker.rank_anchors(anchors, corpus=corpus)
+
+    register_vocabulary('priority.safety_critical', SAFETY_CRITICAL)
+    hits = corpus[0].matched('priority.safety_critical', SAFETY_CRITICAL)
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from skills.utilities.keyword_matcher import KeywordMatcher, get_matcher
+from skills.utilities.regex_registry import compile_pattern
+
+
+_WORD_RE = compile_pattern(r'\b[a-z]+\b')
+_RUN_RE = compile_pattern(r'[a-z]+')
+
+# Title words shorter than this are skipped as topic candidates
+MIN_TITLE_WORD_LENGTH = 4
+
+_NO_HITS: FrozenSet[str] = frozenset()
+
+
+# =============================================================================
+# VOCABULARY REGISTRY
+# =============================================================================
+
+# Vocabulary name -> keyword tuple
+_vocabularies: Dict[str, Tuple[str, ...]] = {}
+
+# Matcher state for the union of registered vocabularies (rebuilt lazily)
+_combined: Optional['_CombinedVocabulary'] = None
+
+
+def register_vocabulary(name: str, keywords: Sequence[str]) -> None:
+    """
+    Register a keyword list for the shared per-anchor scan.
+
+    Args:
+        name: Vocabulary name (e.g. 'priority.high_yield')
+        keywords: Lowercase phrases matched as substrings
+    """
+    global _combined
+    keywords = tuple(keywords)
+    if _vocabularies.get(name) != keywords:
+        _vocabularies[name] = keywords
+        _combined = None
+
+
+class _CombinedVocabulary:
+    """
+    Every registered keyword, matched through the text's [a-z] runs.
+
+    A keyword made only of [a-z] occurs in the text exactly when it occurs
+    inside one of the text's maximal [a-z] runs, and runs (words) repeat
+    across anchors, so the pieces found in each distinct run are computed
+    once and cached. A keyword with other characters ('vital signs',
+    'half-life') is a candidate only when its longest [a-z] piece was
+    found, and is then confirmed with a substring test on the text.
+    """
+
+    def __init__(self, vocabularies: Dict[str, Tuple[str, ...]]):
+        owners: Dict[str, List[str]] = {}
+        for name, keywords in vocabularies.items():
+            for keyword in keywords:
+                names = owners.setdefault(keyword.lower(), [])
+                if name not in names:
+                    names.append(name)
+        self.owners: Dict[str, Tuple[str, ...]] = {kw: tuple(n) for kw, n in owners.items()}
+        self.names: FrozenSet[str] = frozenset(vocabularies)
+
+        self.anchored: Dict[str, List[str]] = {}
+        self.unanchored: List[str] = []
+        pieces = set()
+        for keyword in self.owners:
+            parts = _RUN_RE.findall(keyword)
+            if parts == [keyword]:
+                pieces.add(keyword)
+            elif parts:
+                piece = max(parts, key=len)
+                pieces.add(piece)
+                self.anchored.setdefault(piece, []).append(keyword)
+            else:
+                self.unanchored.append(keyword)
+
+        self.matcher = KeywordMatcher(sorted(pieces))
+        self._run_pieces: Dict[str, FrozenSet[str]] = {}
+
+    def pieces_in(self, run: str) -> FrozenSet[str]:
+        """Registered pieces occurring in one [a-z] run (cached per run)."""
+        found = self._run_pieces.get(run)
+        if found is None:
+            found = frozenset(self.matcher.matched(run))
+            self._run_pieces[run] = found
+        return found
+
+    def keywords_in(self, text: str) -> List[str]:
+        """Registered keywords occurring as substrings of lowercase text."""
+        pieces = set()
+        for run in set(_RUN_RE.findall(text)):
+            pieces |= self.pieces_in(run)
+
+        owners, anchored = self.owners, self.anchored
+        found = [kw for kw in pieces if kw in owners]
+        for piece in pieces:
+            for keyword in anchored.get(piece, ()):
+                if keyword in text:
+                    found.append(keyword)
+        found.extend(kw for kw in self.unanchored if kw in text)
+        return found
+
+
+def _combined_vocabulary() -> _CombinedVocabulary:
+    global _combined
+    if _combined is None:
+        _combined = _CombinedVocabulary(_vocabularies)
+    return _combined
+
+
+@dataclass
+class PreparedAnchor:
+    """One anchor's normalized text, tokens and cached keyword hits."""
+    index: int
+    anchor: Dict
+    title: str
+    text: str
+    words: Tuple[str, ...]
+    title_words: Tuple[str, ...]
+    content_word_count: int = 0
+    hits: Dict[Tuple[str, str], FrozenSet[str]] = field(default_factory=dict, repr=False)
+    # Vocabulary names covered by scan_registered (absent name = no hits)
+    scanned: FrozenSet[str] = field(default=_NO_HITS, repr=False)
+
+    def anchor_id(self, default: Optional[str] = None) -> str:
+        """The anchor's id, or default (anchor_<index> when not given)."""
+        if default is None:
+            default = f'anchor_{self.index}'
+        return self.anchor.get('id', default)
+
+    def matched(
+        self,
+        name: str,
+        keywords: Sequence[str],
+        source: str = 'text'
+    ) -> FrozenSet[str]:
+        """
+        Keywords of a vocabulary that occur in this anchor (cached by name).
+
+        Args:
+            name: Vocabulary name; one name must always mean one keyword list
+            keywords: The vocabulary phrases
+            source: 'text' (title + full_text) or 'title'
+
+        Returns:
+            Frozen set of the phrases found as substrings
+        """
+        key = (name, source)
+        hits = self.hits.get(key)
+        if hits is not None:
+            return hits
+        if not self.scanned and name in _vocabularies:
+            self.scan_registered()
+        if name in self.scanned:
+            return self.hits.get(key, _NO_HITS)
+
+        hits = frozenset(get_matcher(keywords).matched(getattr(self, source)))
+        self.hits[key] = hits
+        return hits
+
+    def scan_registered(self) -> None:
+        """Fill hits for every registered vocabulary in one pass over text."""
+        vocabulary = _combined_vocabulary()
+        owners = vocabulary.owners
+        in_text = vocabulary.keywords_in(self.text)
+        in_title = [kw for kw in in_text if kw in self.title]
+
+        found: Dict[Tuple[str, str], List[str]] = {}
+        for source, keywords in (('text', in_text), ('title', in_title)):
+            for keyword in keywords:
+                for name in owners[keyword]:
+                    found.setdefault((name, source), []).append(keyword)
+        for key, keywords in found.items():
+            self.hits[key] = frozenset(keywords)
+        self.scanned = vocabulary.names
+
+    def matched_in_order(
+        self,
+        name: str,
+        keywords: Sequence[str],
+        source: str = 'text'
+    ) -> List[str]:
+        """Matched keywords in vocabulary order (the order of a keyword loop)."""
+        hits = self.matched(name, keywords, source)
+        if not hits:
+            return []
+        return [kw for kw in keywords if kw in hits]
+
+
+def _intern_all(words: Sequence[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(w) for w in words)
+
+
+def prepare_anchor(anchor: Dict, index: int = 0) -> PreparedAnchor:
+    """Normalize and tokenize one anchor."""
+    title = anchor.get('title', '').lower()
+    content = anchor.get('full_text', '').lower()
+    text = f"{title} {content}"
+    return PreparedAnchor(
+        index=index,
+        anchor=anchor,
+        title=title,
+        text=text,
+        words=_intern_all(_WORD_RE.findall(text)),
+        title_words=_intern_all([w for w in title.split() if len(w) >= MIN_TITLE_WORD_LENGTH]),
+        content_word_count=len(content.split()),
+    )
+
+
+class AnchorCorpus:
+    """Prepared anchors, aligned index-for-index with the source list."""
+
+    def __init__(self, anchors: Sequence[Dict], prepared: List[PreparedAnchor]):
+        self.anchors = anchors
+        self.prepared = prepared
+
+    @classmethod
+    def from_anchors(cls, anchors: Sequence[Dict]) -> 'AnchorCorpus':
+        """Tokenize every anchor once."""
+        return cls(anchors, [prepare_anchor(a, i) for i, a in enumerate(anchors)])
+
+    @classmethod
+    def ensure(
+        cls,
+        anchors: Sequence[Dict],
+        corpus: Optional['AnchorCorpus'] = None
+    ) -> 'AnchorCorpus':
+        """
+        Return corpus if given (checking it covers anchors), else build one.
+
+        Raises:
+            ValueError: If corpus was built from a different anchor list
+        """
+        if corpus is None:
+            return cls.from_anchors(anchors)
+        if len(corpus) != len(anchors):
+            raise ValueError(
+                f"AnchorCorpus has {len(corpus)} anchors, expected {len(anchors)}"
+            )
+        return corpus
+
+    def __len__(self) -> int:
+        return len(self.prepared)
+
+    def __iter__(self) -> Iterator[PreparedAnchor]:
+        return iter(self.prepared)
+
+    def __getitem__(self, index: int) -> PreparedAnchor:
+        return self.prepared[index]
+
+    def hits(
+        self,
+        name: str,
+        keywords: Sequence[str],
+        source: str = 'text'
+    ) -> List[FrozenSet[str]]:
+        """Keyword hits of one vocabulary for every anchor, in anchor order."""
+        return [p.matched(name, keywords, source) for p in self.prepared]
@@ -23,6 +23,8 @@ import os
 import copy
 from pathlib import Path
 from typing import Dict, List, Any, Optional
+
+from skills.utilities.atomic_write import atomic_save
 from pptx import Presentation
 from pptx.util import Inches, Pt
 
@@ -238,7 +240,7 @@ def create_presentation_from_blueprint(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Save the presentation
-    prs.save(str(output_path))
+    atomic_save(prs, output_path)
 
     return output_path
 
@@ -313,7 +315,7 @@ def create_presentation_advanced(
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Save
-    prs.save(str(output_path))
+    atomic_save(prs, output_path)
 
     return output_path
 
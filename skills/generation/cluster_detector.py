@@ -5,18 +5,45 @@ This module identifies clusters of related anchor points based on content
 similarity, keyword overlap, and thematic connections. Used in Phase 2
 of the 5-Phase content analysis.
 
+Anchors are tokenized once into a KeywordMatrix: an interned keyword
+vocabulary with the anchor x keyword incidence stored as index arrays in
+both directions (keywords per anchor, anchors per keyword). Clustering
+walks the per-keyword postings and cluster cohesion (mean pairwise Jaccard)
+is computed from the matrix in blocks with NumPy, or with rows packed into
+integer bitsets without it, instead of pairwise Python set operations.
+
 Usage:
-    from skills.generation.cluster_detector import ClusterDetector
+    from skills.generation.cluster_detector import ClusterDetector, KeywordMatrix
 
     detector = ClusterDetector()
     clusters = detector.detect_clusters(anchors)
+
+    # Reuse one tokenization pass
+    matrix = KeywordMatrix.from_anchors(anchors)
+    clusters = detector.detect_clusters(anchors, keyword_matrix=matrix)
+
+    # Or build it from the shared AnchorCorpus
+    clusters = detector.detect_clusters(anchors, corpus=corpus)
 """
 
-import re
-from typing import Dict, List, Optional, Set, Tuple
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from skills.generation.anchor_corpus import AnchorCorpus, PreparedAnchor, prepare_anchor
+
+# Rows per block when multiplying the incidence matrix (bounds memory to
+# JACCARD_BLOCK_ROWS x cluster size intersection counts at a time)
+JACCARD_BLOCK_ROWS = 512
+
 
 @dataclass
 class Cluster:
@@ -29,6 +56,174 @@ class Cluster:
     size: int = 0
 
 
+class KeywordMatrix:
+    """
+    Sparse anchor x keyword incidence built from one keyword-extraction pass.
+
+    Keywords are interned to column ids in first-seen order (so ties between
+    equally frequent keywords break deterministically); rows follow the
+    anchor order. Both directions are kept as sorted int arrays:
+    row_keywords[row] (CSR) and postings[column] (CSC).
+    """
+
+    # Stop words to exclude from keyword analysis
+    STOP_WORDS = frozenset({
+        'the', 'and', 'or', 'of', 'in', 'to', 'a', 'an', 'for', 'is', 'on',
+        'with', 'by', 'as', 'at', 'from', 'be', 'are', 'was', 'were', 'been',
+        'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+        'could', 'should', 'may', 'might', 'must', 'shall', 'can', 'need',
+        'this', 'that', 'these', 'those', 'what', 'which', 'who', 'whom',
+        'their', 'there', 'where', 'when', 'why', 'how', 'all', 'each',
+        'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
+        'only', 'own', 'same', 'than', 'too', 'very'
+    })
+
+    # Minimum keyword length
+    MIN_KEYWORD_LENGTH = 3
+
+    def __init__(self, anchor_ids: Sequence[str], keyword_sets: Sequence[Iterable[str]]):
+        self.anchor_ids: List[str] = list(anchor_ids)
+        self.row_of: Dict[str, int] = {aid: row for row, aid in enumerate(self.anchor_ids)}
+        self.vocabulary: List[str] = []
+        self.column_of: Dict[str, int] = {}
+        self.row_keywords: List[array] = []
+        postings: List[List[int]] = []
+
+        for row, keywords in enumerate(keyword_sets):
+            columns = []
+            for keyword in keywords:
+                column = self.column_of.get(keyword)
+                if column is None:
+                    column = len(self.vocabulary)
+                    self.column_of[keyword] = column
+                    self.vocabulary.append(keyword)
+                    postings.append([])
+                columns.append(column)
+                postings[column].append(row)
+            self.row_keywords.append(array('i', sorted(columns)))
+
+        self.postings: List[array] = [array('i', rows) for rows in postings]
+        self.row_sizes = array('i', (len(cols) for cols in self.row_keywords))
+
+    @classmethod
+    def extract_keywords(cls, anchor: Dict) -> List[str]:
+        """Distinct keywords of one anchor in first-occurrence order (title + full_text)."""
+        return cls.prepared_keywords(prepare_anchor(anchor))
+
+    @classmethod
+    def prepared_keywords(cls, prepared: PreparedAnchor) -> List[str]:
+        """Distinct keywords of an already-tokenized anchor."""
+        return list(dict.fromkeys(
+            w for w in prepared.words
+            if len(w) >= cls.MIN_KEYWORD_LENGTH and w not in cls.STOP_WORDS
+        ))
+
+    @classmethod
+    def from_anchors(cls, anchors: List[Dict]) -> 'KeywordMatrix':
+        """Tokenize every anchor once."""
+        return cls.from_corpus(AnchorCorpus.from_anchors(anchors))
+
+    @classmethod
+    def from_corpus(cls, corpus: AnchorCorpus) -> 'KeywordMatrix':
+        """Build the matrix from anchors tokenized by the shared preprocessing pass."""
+        return cls(
+            [p.anchor_id() for p in corpus],
+            [cls.prepared_keywords(p) for p in corpus]
+        )
+
+    @property
+    def n_anchors(self) -> int:
+        return len(self.anchor_ids)
+
+    def keywords_of(self, row: int) -> Set[str]:
+        """Keyword strings for a row."""
+        return {self.vocabulary[c] for c in self.row_keywords[row]}
+
+    def keyword_sets(self) -> Dict[str, Set[str]]:
+        """Anchor ID -> keyword set (the legacy dict representation)."""
+        return {aid: self.keywords_of(row) for row, aid in enumerate(self.anchor_ids)}
+
+    def keyword_index(self) -> Dict[str, Set[str]]:
+        """Keyword -> set of anchor IDs (the legacy inverted index)."""
+        return {
+            self.vocabulary[c]: {self.anchor_ids[r] for r in rows}
+            for c, rows in enumerate(self.postings)
+        }
+
+    def keyword_counts(self, rows: Sequence[int]) -> Dict[int, int]:
+        """Column -> number of the given rows containing it."""
+        counts: Dict[int, int] = defaultdict(int)
+        for row in rows:
+            for column in self.row_keywords[row]:
+                counts[column] += 1
+        return counts
+
+    def mean_jaccard(self, rows: Sequence[int]) -> float:
+        """
+        Mean pairwise Jaccard similarity over the given rows.
+
+        Pairs where either row has no keywords are skipped, as are
+        single-row inputs (returns 1.0 for fewer than two rows).
+        """
+        if len(rows) < 2:
+            return 1.0
+        rows = [r for r in rows if self.row_sizes[r] > 0]
+        n = len(rows)
+        comparisons = n * (n - 1) // 2
+        if comparisons == 0:
+            return 0
+
+        if NUMPY_AVAILABLE:
+            total = self._jaccard_sum_numpy(rows)
+        else:
+            total = self._jaccard_sum_bitsets(rows)
+        return total / comparisons
+
+    def _jaccard_sum_numpy(self, rows: List[int]) -> float:
+        """Sum of upper-triangle Jaccard values via blocked X @ X.T."""
+        columns = sorted({c for r in rows for c in self.row_keywords[r]})
+        local = {c: i for i, c in enumerate(columns)}
+        n = len(rows)
+
+        incidence = np.zeros((n, len(columns)), dtype=np.float32)
+        for i, row in enumerate(rows):
+            incidence[i, [local[c] for c in self.row_keywords[row]]] = 1.0
+        sizes = np.asarray([self.row_sizes[r] for r in rows], dtype=np.float64)
+
+        total = 0.0
+        for start in range(0, n, JACCARD_BLOCK_ROWS):
+            stop = min(n, start + JACCARD_BLOCK_ROWS)
+            inter = (incidence[start:stop] @ incidence.T).astype(np.float64)
+            union = sizes[start:stop, None] + sizes[None, :] - inter
+            # Keep only pairs (i, j) with j > i
+            upper = np.arange(n)[None, :] > np.arange(start, stop)[:, None]
+            total += float((inter / union)[upper].sum())
+        return total
+
+    def _jaccard_sum_bitsets(self, rows: List[int]) -> float:
+        """Sum of upper-triangle Jaccard values with rows packed into int bitsets."""
+        bitsets = []
+        for row in rows:
+            bits = 0
+            for column in self.row_keywords[row]:
+                bits |= 1 << column
+            bitsets.append(bits)
+        sizes = [self.row_sizes[r] for r in rows]
+
+        total = 0.0
+        for i, bits in enumerate(bitsets):
+            size = sizes[i]
+            for j in range(i + 1, len(bitsets)):
+                inter = _popcount(bits & bitsets[j])
+                if inter:
+                    total += inter / (size + sizes[j] - inter)
+        return total
+
+
+def _popcount(value: int) -> int:
+    return value.bit_count() if hasattr(value, 'bit_count') else bin(value).count('1')
+
+
 @dataclass
 class ClusteringResult:
     """Container for clustering results."""
@@ -44,22 +239,13 @@ class ClusterDetector:
     """Detect clusters of related anchors."""
 
     # Stop words to exclude from keyword analysis
-    STOP_WORDS = {
-        'the', 'and', 'or', 'of', 'in', 'to', 'a', 'an', 'for', 'is', 'on',
-        'with', 'by', 'as', 'at', 'from', 'be', 'are', 'was', 'were', 'been',
-        'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-        'could', 'should', 'may', 'might', 'must', 'shall', 'can', 'need',
-        'this', 'that', 'these', 'those', 'what', 'which', 'who', 'whom',
-        'their', 'there', 'where', 'when', 'why', 'how', 'all', 'each',
-        'every', 'both', 'few', 'more', 'most', 'other', 'some', 'such',
-        'only', 'own', 'same', 'than', 'too', 'very'
-    }
+    STOP_WORDS = KeywordMatrix.STOP_WORDS
 
     # Minimum cluster size
     MIN_CLUSTER_SIZE = 2
 
     # Minimum keyword length
-    MIN_KEYWORD_LENGTH = 3
+    MIN_KEYWORD_LENGTH = KeywordMatrix.MIN_KEYWORD_LENGTH
 
     def __init__(self, config_path: Optional[str] = None):
         """
@@ -74,7 +260,9 @@ class ClusterDetector:
         self,
         anchors: List[Dict],
         min_cluster_size: int = None,
-        similarity_threshold: float = 0.3
+        similarity_threshold: float = 0.3,
+        keyword_matrix: Optional[KeywordMatrix] = None,
+        corpus: Optional[AnchorCorpus] = None
     ) -> ClusteringResult:
         """
         Detect clusters of related anchors.
@@ -83,6 +271,8 @@ class ClusterDetector:
             anchors: List of anchor dictionaries
             min_cluster_size: Minimum anchors per cluster
             similarity_threshold: Minimum similarity for clustering
+            keyword_matrix: Precomputed KeywordMatrix.from_anchors(anchors)
+            corpus: Shared AnchorCorpus for anchors (used when no matrix is given)
 
         Returns:
             ClusteringResult with detected clusters
@@ -90,16 +280,13 @@ class ClusterDetector:
         if min_cluster_size is None:
             min_cluster_size = self.MIN_CLUSTER_SIZE
 
-        # Step 1: Extract keywords from each anchor
-        anchor_keywords = self._extract_anchor_keywords(anchors)
-
-        # Step 2: Build keyword-to-anchor index
-        keyword_index = self._build_keyword_index(anchor_keywords)
+        # Steps 1-2: Extract keywords once into the anchor x keyword matrix
+        if keyword_matrix is None:
+            keyword_matrix = KeywordMatrix.from_corpus(AnchorCorpus.ensure(anchors, corpus))
+        matrix = keyword_matrix
 
         # Step 3: Find clusters based on keyword overlap
-        clusters = self._cluster_by_keywords(
-            anchors, anchor_keywords, keyword_index, min_cluster_size
-        )
+        clusters = self._cluster_matrix(matrix, min_cluster_size)
 
         # Step 4: Identify unclustered anchors
         clustered_ids = set()
@@ -122,41 +309,70 @@ class ClusterDetector:
                 'avg_cluster_size': sum(c.size for c in clusters) / len(clusters) if clusters else 0,
                 'max_cluster_size': max(c.size for c in clusters) if clusters else 0,
                 'min_cluster_size': min(c.size for c in clusters) if clusters else 0,
-                'unique_keywords': len(keyword_index)
+                'unique_keywords': len(matrix.vocabulary)
             }
         )
 
-    def _extract_anchor_keywords(self, anchors: List[Dict]) -> Dict[str, Set[str]]:
+    def _cluster_matrix(self, matrix: KeywordMatrix, min_size: int) -> List[Cluster]:
+        """
+        Create clusters by walking keyword postings, most frequent first.
+
+        Same selection as _cluster_by_keywords; anchor IDs are listed in
+        anchor order.
+        """
+        clusters = []
+        used = bytearray(matrix.n_anchors)
+
+        # Stable sort keeps first-seen keyword order among equal frequencies
+        order = sorted(
+            range(len(matrix.vocabulary)),
+            key=lambda c: len(matrix.postings[c]),
+            reverse=True
+        )
+
+        for column in order:
+            if len(matrix.postings[column]) < min_size:
+                break
+
+            rows = [r for r in matrix.postings[column] if not used[r]]
+            if len(rows) < min_size:
+                continue
+
+            counts = matrix.keyword_counts(rows)
+            common = sorted(
+                ((c, n) for c, n in counts.items() if n > 1),
+                key=lambda x: x[1], reverse=True
+            )
+
+            clusters.append(Cluster(
+                cluster_id=f"cluster_{len(clusters) + 1}",
+                theme=matrix.vocabulary[column].title(),
+                anchor_ids=[matrix.anchor_ids[r] for r in rows],
+                keywords=[matrix.vocabulary[c] for c, _ in common[:5]],  # Top 5 keywords
+                cohesion_score=matrix.mean_jaccard(rows),
+                size=len(rows)
+            ))
+            for r in rows:
+                used[r] = 1
+
+        return clusters
+
+    def _extract_anchor_keywords(
+        self,
+        anchors: List[Dict],
+        corpus: Optional[AnchorCorpus] = None
+    ) -> Dict[str, Set[str]]:
         """
         Extract keywords from each anchor.
 
         Args:
             anchors: List of anchors
+            corpus: Shared AnchorCorpus for anchors
 
         Returns:
             Dictionary mapping anchor ID to set of keywords
         """
-        anchor_keywords = {}
-
-        for i, anchor in enumerate(anchors):
-            anchor_id = anchor.get('id', f'anchor_{i}')
-            title = anchor.get('title', '').lower()
-            content = anchor.get('full_text', '').lower()
-
-            # Extract words from title and content
-            all_text = f"{title} {content}"
-            words = re.findall(r'\b[a-z]+\b', all_text)
-
-            # Filter to meaningful keywords
-            keywords = {
-                w for w in words
-                if len(w) >= self.MIN_KEYWORD_LENGTH
-                and w not in self.STOP_WORDS
-            }
-
-            anchor_keywords[anchor_id] = keywords
-
-        return anchor_keywords
+        return KeywordMatrix.from_corpus(AnchorCorpus.ensure(anchors, corpus)).keyword_sets()
 
     def _build_keyword_index(
         self,
@@ -284,23 +500,8 @@ class ClusterDetector:
             return 1.0
 
         anchor_list = list(anchor_ids)
-        total_similarity = 0
-        comparisons = 0
-
-        for i in range(len(anchor_list)):
-            for j in range(i + 1, len(anchor_list)):
-                kw1 = anchor_keywords.get(anchor_list[i], set())
-                kw2 = anchor_keywords.get(anchor_list[j], set())
-
-                if kw1 and kw2:
-                    # Jaccard similarity
-                    intersection = len(kw1 & kw2)
-                    union = len(kw1 | kw2)
-                    similarity = intersection / union if union > 0 else 0
-                    total_similarity += similarity
-                    comparisons += 1
-
-        return total_similarity / comparisons if comparisons > 0 else 0
+        matrix = KeywordMatrix(anchor_list, [anchor_keywords.get(a, set()) for a in anchor_list])
+        return matrix.mean_jaccard(range(len(anchor_list)))
 
     def merge_small_clusters(
         self,
@@ -13,14 +13,22 @@ Usage:
         detect_sequential_markers,
         analyze_information_density,
         detect_hierarchical_structure,
+        analyze_structure,
         suggest_visual_type
     )
+
+    # Run the detectors once and share the result between consumers
+    structure = analyze_structure(body)
+    suggestion = suggest_visual_type(body, structure=structure)
 """
 
 import re
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 
+from skills.utilities.feature_cache import cached_analysis
+from skills.utilities.regex_registry import compile_pattern, compile_patterns
+
 # Import VisualType from the pattern matcher for consistency
 from .visual_pattern_matcher import VisualType
 
@@ -132,6 +140,47 @@ HIERARCHY_PHRASES = [
 ]
 
 
+# =============================================================================
+# PRECOMPILED PATTERNS
+# =============================================================================
+
+_BULLET_RES = compile_patterns(BULLET_PATTERNS, re.IGNORECASE)
+_NUMBERED_LIST_RES = compile_patterns([
+    r'^\s*\d+\.\s+',
+    r'^\s*\d+\)\s+',
+    r'^\s*\[\d+\]\s+',
+])
+_BULLETED_LIST_RES = compile_patterns([
+    r'^\s*[\*\-\•]\s+',
+    r'^\s*[a-zA-Z]\.\s+',
+    r'^\s*[a-zA-Z]\)\s+',
+    r'^\s*\([a-zA-Z]+\)\s+',
+])
+_COMPARISON_PHRASE_RES = compile_patterns(COMPARISON_PHRASES, re.IGNORECASE)
+_SEQUENTIAL_PHRASE_RES = compile_patterns(SEQUENTIAL_PHRASES, re.IGNORECASE)
+_HIERARCHY_PHRASE_RES = compile_patterns(HIERARCHY_PHRASES, re.IGNORECASE)
+
+_VS_ITEMS_RE = compile_pattern(r'(\b[\w\-]+)\s+(?:vs\.?|versus)\s+(\b[\w\-]+)', re.IGNORECASE)
+_COMPARE_ITEMS_RE = compile_pattern(
+    r'compare[sd]?\s+(\b[\w\-]+)\s+(?:and|with|to)\s+(\b[\w\-]+)', re.IGNORECASE)
+_BULLET_PREFIX_RE = compile_pattern(r'^[\*\-\•]\s*')
+_NUMBER_PREFIX_RE = compile_pattern(r'^\d+[\.\)]\s*')
+_STEP_NUMBER_RE = compile_pattern(r'\bstep\s*(\d+)')
+_TRANSITION_RE = compile_pattern(r'\bthen\b|\bnext\b|\bfinally\b')
+_WORD_RE = compile_pattern(r'\b\w+\b')
+_CAPITALIZED_WORD_RE = compile_pattern(r'\b([A-Z][a-zA-Z]+)\b')
+_COLON_TERM_RE = compile_pattern(r'(\b[\w\s]+):')
+_PAREN_TERM_RE = compile_pattern(r'\(([^)]+)\)')
+_LEVEL_NUMBER_RE = compile_pattern(r'level\s*(\d+)')
+_TYPES_OF_RE = compile_pattern(r'\btypes?\s+of\b')
+_SUBTYPES_RE = compile_pattern(r'\bsub(?:types?|categor)')
+_TYPES_ROOT_RE = compile_pattern(r'types?\s+of\s+(\b[\w\s]+?)(?:\s*:|$|\n)', re.IGNORECASE)
+_CATEGORY_ROOT_RE = compile_pattern(r'(\b[\w\s]+?)\s+categor(?:y|ies)', re.IGNORECASE)
+_CLASSIFICATION_ROOT_RE = compile_pattern(
+    r'classification\s+of\s+(\b[\w\s]+?)(?:\s*:|$|\n)', re.IGNORECASE)
+_IF_THEN_RE = compile_pattern(r'\bif\b.*\bthen\b')
+
+
 # =============================================================================
 # FUNCTION 1: count_bullet_points
 # =============================================================================
@@ -171,8 +220,8 @@ def count_bullet_points(body: str) -> int:
             continue  # Skip nested bullets
 
         # Check against all bullet patterns
-        for pattern in BULLET_PATTERNS:
-            if re.match(pattern, stripped, re.IGNORECASE):
+        for pattern in _BULLET_RES:
+            if pattern.match(stripped):
                 bullet_count += 1
                 break
 
@@ -219,21 +268,6 @@ def detect_list_patterns(body: str) -> Dict[str, Any]:
     level_counts: Dict[int, int] = {}
     max_depth = 0
 
-    # Numbered patterns
-    numbered_patterns = [
-        r'^\s*\d+\.\s+',
-        r'^\s*\d+\)\s+',
-        r'^\s*\[\d+\]\s+',
-    ]
-
-    # Bulleted patterns
-    bulleted_patterns = [
-        r'^\s*[\*\-\•]\s+',
-        r'^\s*[a-zA-Z]\.\s+',
-        r'^\s*[a-zA-Z]\)\s+',
-        r'^\s*\([a-zA-Z]+\)\s+',
-    ]
-
     for line in lines:
         if not line.strip():
             continue
@@ -245,16 +279,16 @@ def detect_list_patterns(body: str) -> Dict[str, Any]:
         level = (indent_chars // 2) + 1 if indent_chars > 0 else 1
 
         # Check for numbered list
-        for pattern in numbered_patterns:
-            if re.match(pattern, line):
+        for pattern in _NUMBERED_LIST_RES:
+            if pattern.match(line):
                 result['has_numbered_list'] = True
                 level_counts[level] = level_counts.get(level, 0) + 1
                 max_depth = max(max_depth, level)
                 break
         else:
             # Check for bulleted list
-            for pattern in bulleted_patterns:
-                if re.match(pattern, line):
+            for pattern in _BULLETED_LIST_RES:
+                if pattern.match(line):
                     result['has_bulleted_list'] = True
                     level_counts[level] = level_counts.get(level, 0) + 1
                     max_depth = max(max_depth, level)
@@ -308,8 +342,8 @@ def identify_comparison_structure(body: str) -> Dict[str, Any]:
 
     # Check for comparison phrases
     comparison_found = False
-    for pattern in COMPARISON_PHRASES:
-        if re.search(pattern, body_lower, re.IGNORECASE):
+    for pattern in _COMPARISON_PHRASE_RES:
+        if pattern.search(body_lower):
             comparison_found = True
             break
 
@@ -347,14 +381,12 @@ def _extract_comparison_items(body: str) -> List[str]:
     items = []
 
     # Pattern: "X vs Y" or "X versus Y"
-    vs_pattern = r'(\b[\w\-]+)\s+(?:vs\.?|versus)\s+(\b[\w\-]+)'
-    vs_matches = re.findall(vs_pattern, body, re.IGNORECASE)
+    vs_matches = _VS_ITEMS_RE.findall(body)
     for match in vs_matches:
         items.extend([m.strip() for m in match if m.strip()])
 
     # Pattern: "Compare X and Y"
-    compare_pattern = r'compare[sd]?\s+(\b[\w\-]+)\s+(?:and|with|to)\s+(\b[\w\-]+)'
-    compare_matches = re.findall(compare_pattern, body, re.IGNORECASE)
+    compare_matches = _COMPARE_ITEMS_RE.findall(body)
     for match in compare_matches:
         items.extend([m.strip() for m in match if m.strip()])
 
@@ -364,8 +396,8 @@ def _extract_comparison_items(body: str) -> List[str]:
     for line in lines:
         stripped = line.strip()
         # Remove bullet markers
-        stripped = re.sub(r'^[\*\-\•]\s*', '', stripped)
-        stripped = re.sub(r'^\d+[\.\)]\s*', '', stripped)
+        stripped = _BULLET_PREFIX_RE.sub('', stripped)
+        stripped = _NUMBER_PREFIX_RE.sub('', stripped)
 
         if ':' in stripped:
             before_colon = stripped.split(':')[0].strip()
@@ -424,8 +456,8 @@ def detect_sequential_markers(body: str) -> Dict[str, Any]:
 
     # Count sequential phrase matches
     sequential_score = 0
-    for pattern in SEQUENTIAL_PHRASES:
-        matches = re.findall(pattern, body_lower, re.IGNORECASE)
+    for pattern in _SEQUENTIAL_PHRASE_RES:
+        matches = pattern.findall(body_lower)
         sequential_score += len(matches)
 
     if sequential_score < 1:
@@ -439,7 +471,7 @@ def detect_sequential_markers(body: str) -> Dict[str, Any]:
     steps_score = sum(1 for kw in STEPS_INDICATORS if kw in body_lower)
 
     # Also check for explicit step numbering
-    step_numbers = re.findall(r'\bstep\s*(\d+)', body_lower)
+    step_numbers = _STEP_NUMBER_RE.findall(body_lower)
     if step_numbers:
         steps_score += 2
 
@@ -472,7 +504,7 @@ def _estimate_step_count(body: str) -> int:
         Estimated step count
     """
     # Count explicit step numbers
-    step_numbers = re.findall(r'\bstep\s*(\d+)', body.lower())
+    step_numbers = _STEP_NUMBER_RE.findall(body.lower())
     if step_numbers:
         return max(int(n) for n in step_numbers)
 
@@ -488,7 +520,7 @@ def _estimate_step_count(body: str) -> int:
         return ordinal_count
 
     # Count "then"/"next" transitions
-    transitions = len(re.findall(r'\bthen\b|\bnext\b|\bfinally\b', body.lower()))
+    transitions = len(_TRANSITION_RE.findall(body.lower()))
     if transitions > 0:
         return transitions + 1
 
@@ -531,7 +563,7 @@ def analyze_information_density(body: str) -> Dict[str, Any]:
         return result
 
     # Calculate total words
-    words = re.findall(r'\b\w+\b', body)
+    words = _WORD_RE.findall(body)
     result['total_words'] = len(words)
 
     # Calculate words per line
@@ -572,7 +604,7 @@ def _count_unique_concepts(body: str) -> int:
     concepts = set()
 
     # Capitalized words that aren't sentence starters
-    words = re.findall(r'\b([A-Z][a-zA-Z]+)\b', body)
+    words = _CAPITALIZED_WORD_RE.findall(body)
 
     # Filter out common sentence starters
     starters = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'has', 'have',
@@ -583,14 +615,14 @@ def _count_unique_concepts(body: str) -> int:
             concepts.add(word.lower())
 
     # Terms before colons (often key terms)
-    colon_terms = re.findall(r'(\b[\w\s]+):', body)
+    colon_terms = _COLON_TERM_RE.findall(body)
     for term in colon_terms:
         term_clean = term.strip().lower()
         if term_clean and len(term_clean) < 50:
             concepts.add(term_clean)
 
     # Terms in parentheses (often clarifications/technical terms)
-    paren_terms = re.findall(r'\(([^)]+)\)', body)
+    paren_terms = _PAREN_TERM_RE.findall(body)
     for term in paren_terms:
         term_clean = term.strip().lower()
         if term_clean and len(term_clean) < 50:
@@ -678,8 +710,8 @@ def detect_hierarchical_structure(body: str) -> Dict[str, Any]:
 
     # Check for hierarchy phrases
     hierarchy_score = 0
-    for pattern in HIERARCHY_PHRASES:
-        if re.search(pattern, body_lower, re.IGNORECASE):
+    for pattern in _HIERARCHY_PHRASE_RES:
+        if pattern.search(body_lower):
             hierarchy_score += 1
 
     # Check for nested list structure
@@ -721,13 +753,13 @@ def _estimate_hierarchy_levels(body: str) -> int:
     body_lower = body.lower()
 
     # Check for explicit level mentions
-    level_matches = re.findall(r'level\s*(\d+)', body_lower)
+    level_matches = _LEVEL_NUMBER_RE.findall(body_lower)
     if level_matches:
         return max(int(n) for n in level_matches)
 
     # Check for "types of X" -> "subtypes of Y" pattern
-    has_types = bool(re.search(r'\btypes?\s+of\b', body_lower))
-    has_subtypes = bool(re.search(r'\bsub(?:types?|categor)', body_lower))
+    has_types = bool(_TYPES_OF_RE.search(body_lower))
+    has_subtypes = bool(_SUBTYPES_RE.search(body_lower))
 
     if has_types and has_subtypes:
         return 3
@@ -754,31 +786,59 @@ def _extract_root_concept(body: str) -> Optional[str]:
         Root concept name or None
     """
     # Pattern: "Types of X" -> X is root
-    types_match = re.search(r'types?\s+of\s+(\b[\w\s]+?)(?:\s*:|$|\n)',
-                            body, re.IGNORECASE)
+    types_match = _TYPES_ROOT_RE.search(body)
     if types_match:
         return types_match.group(1).strip()
 
     # Pattern: "X categories" -> X is root
-    cat_match = re.search(r'(\b[\w\s]+?)\s+categor(?:y|ies)',
-                          body, re.IGNORECASE)
+    cat_match = _CATEGORY_ROOT_RE.search(body)
     if cat_match:
         return cat_match.group(1).strip()
 
     # Pattern: "Classification of X" -> X is root
-    class_match = re.search(r'classification\s+of\s+(\b[\w\s]+?)(?:\s*:|$|\n)',
-                            body, re.IGNORECASE)
+    class_match = _CLASSIFICATION_ROOT_RE.search(body)
     if class_match:
         return class_match.group(1).strip()
 
     return None
 
 
+# =============================================================================
+# SHARED STRUCTURE ANALYSIS
+# =============================================================================
+
+@cached_analysis('analyze_structure', key=lambda body: (body,))
+def analyze_structure(body: str) -> Dict[str, Any]:
+    """
+    Run every structure detector over a body once.
+
+    suggest_visual_type and ml_visual_recommender.extract_features both
+    consume these results; passing the same dict to each avoids running
+    the detectors twice per slide.
+
+    Args:
+        body: The slide body text to analyze
+
+    Returns:
+        Dictionary with bullet_count, list_patterns, comparison, sequential,
+        density and hierarchical (outputs of functions 1-6)
+    """
+    return {
+        'bullet_count': count_bullet_points(body),
+        'list_patterns': detect_list_patterns(body),
+        'comparison': identify_comparison_structure(body),
+        'sequential': detect_sequential_markers(body),
+        'density': analyze_information_density(body),
+        'hierarchical': detect_hierarchical_structure(body),
+    }
+
+
 # =============================================================================
 # FUNCTION 7: suggest_visual_type
 # =============================================================================
 
-def suggest_visual_type(body: str) -> Dict[str, Any]:
+@cached_analysis('suggest_visual_type', key=lambda body, structure=None: (body,), types=(VisualType,))
+def suggest_visual_type(body: str, structure: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Comprehensive analysis combining all detectors to suggest the best
     visual type for the content.
@@ -797,6 +857,7 @@ def suggest_visual_type(body: str) -> Dict[str, Any]:
 
     Args:
         body: The slide body text to analyze
+        structure: Precomputed analyze_structure(body) result (optional)
 
     Returns:
         Dictionary containing:
@@ -828,12 +889,14 @@ def suggest_visual_type(body: str) -> Dict[str, Any]:
         return result
 
     # Run all analyses
-    bullet_count = count_bullet_points(body)
-    list_patterns = detect_list_patterns(body)
-    comparison = identify_comparison_structure(body)
-    sequential = detect_sequential_markers(body)
-    density = analyze_information_density(body)
-    hierarchical = detect_hierarchical_structure(body)
+    if structure is None:
+        structure = analyze_structure(body)
+    bullet_count = structure['bullet_count']
+    list_patterns = structure['list_patterns']
+    comparison = structure['comparison']
+    sequential = structure['sequential']
+    density = structure['density']
+    hierarchical = structure['hierarchical']
 
     # Store analysis results
     result['analysis'] = {
@@ -922,7 +985,7 @@ def suggest_visual_type(body: str) -> Dict[str, Any]:
     decision_matches = sum(1 for kw in decision_keywords if kw in body_lower)
     dtree_score = min(0.8, decision_matches * 0.15)
     # Boost if multiple branching indicators
-    if re.search(r'\bif\b.*\bthen\b', body_lower):
+    if _IF_THEN_RE.search(body_lower):
         dtree_score += 0.3
     scores[VisualType.DECISION_TREE] = min(1.0, dtree_score)
 
@@ -944,6 +1007,9 @@ def suggest_visual_type(body: str) -> Dict[str, Any]:
 # UTILITY FUNCTIONS
 # =============================================================================
 
+@cached_analysis('analyze_slide_content', key=lambda slide: (
+    slide.get('header', slide.get('title', '')), slide.get('body', ''), slide.get('slide_number')
+), types=(VisualType,))
 def analyze_slide_content(slide: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convenience function to analyze a full slide dictionary.
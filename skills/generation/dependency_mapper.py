@@ -16,12 +16,27 @@ Usage:
 
     mapper = DependencyMapper()
     result = mapper.map_dependencies(anchors)
+
+    # Share one tokenization pass with the other analyzers
+    result = mapper.map_dependencies(anchors, corpus=AnchorCorpus.from_anchors(anchors))
+
+    # Anchors that depend on each other are reported, not silently appended
+    for cycle in result.cycles:
+        print(" -> ".join(cycle.path))
 """
 
 import re
 from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
+from skills.generation.anchor_corpus import (
+    AnchorCorpus,
+    PreparedAnchor,
+    prepare_anchor,
+    register_vocabulary,
+)
+from skills.generation.dependency_graph import DependencyCycle, DependencyGraph, TopologicalOrder
+
 
 @dataclass
 class Dependency:
@@ -45,6 +60,7 @@ class DependencyMappingResult:
     dependency_graph: Dict = field(default_factory=dict)
     suggested_order: List[str] = field(default_factory=list)
     metrics: Dict = field(default_factory=dict)
+    cycles: List[DependencyCycle] = field(default_factory=list)
 
 
 class DependencyMapper:
@@ -93,7 +109,8 @@ class DependencyMapper:
     def map_dependencies(
         self,
         anchors: List[Dict],
-        include_weak: bool = False
+        include_weak: bool = False,
+        corpus: Optional[AnchorCorpus] = None
     ) -> DependencyMappingResult:
         """
         Map dependencies between anchors.
@@ -101,12 +118,15 @@ class DependencyMapper:
         Args:
             anchors: List of anchor dictionaries
             include_weak: Include weak/optional dependencies
+            corpus: Shared AnchorCorpus for anchors
 
         Returns:
             DependencyMappingResult with mapped relationships
         """
+        corpus = AnchorCorpus.ensure(anchors, corpus)
+
         # Step 1: Classify anchors by content type
-        classifications = self._classify_anchors(anchors)
+        classifications = self._classify_anchors(anchors, corpus)
 
         # Step 2: Identify foundational and terminal anchors
         foundational = classifications['foundational']
@@ -128,7 +148,7 @@ class DependencyMapper:
         ))
 
         # Topic-based dependencies
-        dependencies.extend(self._create_topic_dependencies(anchors))
+        dependencies.extend(self._create_topic_dependencies(anchors, corpus))
 
         # Filter weak dependencies if not included
         if not include_weak:
@@ -136,12 +156,13 @@ class DependencyMapper:
 
         # Step 4: Build dependency graph
         graph = self._build_dependency_graph(anchors, dependencies)
+        index_graph = self._index_graph(anchors, dependencies)
 
-        # Step 5: Calculate suggested order (topological sort)
-        suggested_order = self._calculate_suggested_order(anchors, dependencies)
+        # Step 5: Calculate suggested order (topological sort, cycles collapsed)
+        ordering = self._order_dependencies(anchors, dependencies, index_graph)
 
         # Step 6: Identify terminal anchors (no outgoing dependencies)
-        terminal = self._identify_terminal_anchors(anchors, dependencies)
+        terminal = self._identify_terminal_anchors(anchors, dependencies, index_graph)
 
         return DependencyMappingResult(
             total_anchors=len(anchors),
@@ -150,22 +171,30 @@ class DependencyMapper:
             foundational_anchors=foundational,
             terminal_anchors=terminal,
             dependency_graph=graph,
-            suggested_order=suggested_order,
+            suggested_order=ordering.order,
             metrics={
                 'foundational_count': len(foundational),
                 'terminal_count': len(terminal),
                 'assessment_count': len(assessment),
                 'intervention_count': len(intervention),
-                'avg_dependencies_per_anchor': len(dependencies) / len(anchors) if anchors else 0
-            }
+                'avg_dependencies_per_anchor': len(dependencies) / len(anchors) if anchors else 0,
+                'cycle_count': len(ordering.cycles),
+                'anchors_in_cycles': sum(len(c.anchor_ids) for c in ordering.cycles)
+            },
+            cycles=ordering.cycles
         )
 
-    def _classify_anchors(self, anchors: List[Dict]) -> Dict[str, List[str]]:
+    def _classify_anchors(
+        self,
+        anchors: List[Dict],
+        corpus: Optional[AnchorCorpus] = None
+    ) -> Dict[str, List[str]]:
         """
         Classify anchors by content type based on keywords.
 
         Args:
             anchors: List of anchors
+            corpus: Shared AnchorCorpus for anchors
 
         Returns:
             Dict with classified anchor IDs
@@ -178,17 +207,14 @@ class DependencyMapper:
             'other': []
         }
 
-        for i, anchor in enumerate(anchors):
-            anchor_id = anchor.get('id', f'anchor_{i}')
-            title = anchor.get('title', '').lower()
-            content = anchor.get('full_text', '').lower()
-            full_text = f"{title} {content}"
+        for prepared in AnchorCorpus.ensure(anchors, corpus):
+            anchor_id = prepared.anchor_id()
 
             # Check each category
-            is_foundational = any(kw in full_text for kw in self.FOUNDATIONAL_KEYWORDS)
-            is_advanced = any(kw in full_text for kw in self.ADVANCED_KEYWORDS)
-            is_assessment = any(kw in full_text for kw in self.ASSESSMENT_KEYWORDS)
-            is_intervention = any(kw in full_text for kw in self.INTERVENTION_KEYWORDS)
+            is_foundational = bool(prepared.matched('dependency.foundational', self.FOUNDATIONAL_KEYWORDS))
+            is_advanced = bool(prepared.matched('dependency.advanced', self.ADVANCED_KEYWORDS))
+            is_assessment = bool(prepared.matched('dependency.assessment', self.ASSESSMENT_KEYWORDS))
+            is_intervention = bool(prepared.matched('dependency.intervention', self.INTERVENTION_KEYWORDS))
 
             # Assign to categories (can be multiple)
             if is_foundational:
@@ -260,24 +286,24 @@ class DependencyMapper:
 
         return dependencies
 
-    def _create_topic_dependencies(self, anchors: List[Dict]) -> List[Dependency]:
+    def _create_topic_dependencies(
+        self,
+        anchors: List[Dict],
+        corpus: Optional[AnchorCorpus] = None
+    ) -> List[Dependency]:
         """Create dependencies based on topic relationships."""
         dependencies = []
-        anchor_map = {a.get('id', f'anchor_{i}'): a for i, a in enumerate(anchors)}
 
         # Extract topics from titles
         topic_anchors = {}
-        for i, anchor in enumerate(anchors):
-            anchor_id = anchor.get('id', f'anchor_{i}')
-            title = anchor.get('title', '').lower()
-
+        for prepared in AnchorCorpus.ensure(anchors, corpus):
             # Extract main topic (first significant word)
-            words = [w for w in title.split() if len(w) > 3]
+            words = prepared.title_words
             if words:
                 topic = words[0]
                 if topic not in topic_anchors:
                     topic_anchors[topic] = []
-                topic_anchors[topic].append((anchor_id, title))
+                topic_anchors[topic].append((prepared.anchor_id(), prepared))
 
         # Within same topic, order by complexity indicators
         for topic, anchor_list in topic_anchors.items():
@@ -287,7 +313,7 @@ class DependencyMapper:
             # Sort by complexity (basic/intro first)
             sorted_anchors = sorted(
                 anchor_list,
-                key=lambda x: self._complexity_score(x[1])
+                key=lambda x: self._complexity_score(x[1].title, x[1])
             )
 
             # Create chain dependencies
@@ -306,21 +332,19 @@ class DependencyMapper:
 
         return dependencies
 
-    def _complexity_score(self, title: str) -> int:
+    def _complexity_score(self, title: str, prepared: Optional[PreparedAnchor] = None) -> int:
         """Calculate complexity score for ordering (lower = simpler)."""
+        if prepared is None:
+            prepared = prepare_anchor({'title': title})
         score = 50  # Base score
 
         # Lower score for foundational keywords
-        for kw in self.FOUNDATIONAL_KEYWORDS:
-            if kw in title:
-                score -= 20
-                break
+        if prepared.matched('dependency.foundational', self.FOUNDATIONAL_KEYWORDS, 'title'):
+            score -= 20
 
         # Higher score for advanced keywords
-        for kw in self.ADVANCED_KEYWORDS:
-            if kw in title:
-                score += 20
-                break
+        if prepared.matched('dependency.advanced', self.ADVANCED_KEYWORDS, 'title'):
+            score += 20
 
         return score
 
@@ -362,52 +386,57 @@ class DependencyMapper:
 
         return graph
 
-    def _calculate_suggested_order(
+    def _index_graph(
         self,
         anchors: List[Dict],
         dependencies: List[Dependency]
-    ) -> List[str]:
-        """Calculate suggested ordering using simplified topological sort."""
-        # Build adjacency list
-        anchor_ids = [a.get('id', f'anchor_{i}') for i, a in enumerate(anchors)]
-        incoming_count = {aid: 0 for aid in anchor_ids}
-        outgoing = {aid: [] for aid in anchor_ids}
-
-        for dep in dependencies:
-            if dep.from_anchor in outgoing and dep.to_anchor in incoming_count:
-                outgoing[dep.from_anchor].append(dep.to_anchor)
-                incoming_count[dep.to_anchor] += 1
-
-        # Kahn's algorithm
-        order = []
-        no_incoming = [aid for aid in anchor_ids if incoming_count[aid] == 0]
-
-        while no_incoming:
-            # Pick anchor with no incoming dependencies
-            current = no_incoming.pop(0)
-            order.append(current)
+    ) -> DependencyGraph:
+        """Intern anchor IDs and store dependency edges as index arrays."""
+        return DependencyGraph(
+            [a.get('id', f'anchor_{i}') for i, a in enumerate(anchors)],
+            ((dep.from_anchor, dep.to_anchor) for dep in dependencies)
+        )
 
-            # Remove edges from current
-            for neighbor in outgoing[current]:
-                incoming_count[neighbor] -= 1
-                if incoming_count[neighbor] == 0:
-                    no_incoming.append(neighbor)
+    def _order_dependencies(
+        self,
+        anchors: List[Dict],
+        dependencies: List[Dependency],
+        index_graph: Optional[DependencyGraph] = None
+    ) -> TopologicalOrder:
+        """
+        Topologically order anchors, collapsing dependency cycles.
 
-        # Add any remaining (cycles) at end
-        remaining = [aid for aid in anchor_ids if aid not in order]
-        order.extend(remaining)
+        Ready anchors are taken first-in-first-out (anchor order, then edge
+        order). Anchors in a cycle are placed together, in anchor order,
+        once everything they depend on outside the cycle is placed, and the
+        cycle is returned in the result.
+        """
+        if index_graph is None:
+            index_graph = self._index_graph(anchors, dependencies)
+        return index_graph.topological_order()
 
-        return order
+    def _calculate_suggested_order(
+        self,
+        anchors: List[Dict],
+        dependencies: List[Dependency]
+    ) -> List[str]:
+        """Calculate suggested ordering using topological sort."""
+        return self._order_dependencies(anchors, dependencies).order
 
     def _identify_terminal_anchors(
         self,
         anchors: List[Dict],
-        dependencies: List[Dependency]
+        dependencies: List[Dependency],
+        index_graph: Optional[DependencyGraph] = None
     ) -> List[str]:
-        """Identify anchors with no outgoing dependencies."""
-        anchor_ids = {a.get('id', f'anchor_{i}') for i, a in enumerate(anchors)}
-        has_outgoing = {dep.from_anchor for dep in dependencies}
-        return list(anchor_ids - has_outgoing)
+        """Identify anchors with no outgoing dependencies (in anchor order)."""
+        if index_graph is None:
+            index_graph = self._index_graph(anchors, dependencies)
+        offsets = index_graph.offsets
+        return [
+            anchor_id for i, anchor_id in enumerate(index_graph.node_ids)
+            if offsets[i] == offsets[i + 1]
+        ]
 
     def format_report(self, result: DependencyMappingResult) -> str:
         """Format dependency mapping result as report."""
@@ -439,6 +468,15 @@ class DependencyMapper:
             if len(result.terminal_anchors) > 5:
                 lines.append(f"  ... and {len(result.terminal_anchors) - 5} more")
 
+        if result.cycles:
+            lines.append("")
+            lines.append(f"Cycles ({len(result.cycles)}), ordered as groups:")
+            for cycle in result.cycles[:5]:
+                lines.append(f"  {' -> '.join(cycle.path)} -> {cycle.path[0]} "
+                             f"({len(cycle.anchor_ids)} anchors)")
+            if len(result.cycles) > 5:
+                lines.append(f"  ... and {len(result.cycles) - 5} more")
+
         lines.append("")
         lines.append("-" * 60)
         lines.append("SUGGESTED ORDER:")
@@ -459,6 +497,12 @@ class DependencyMapper:
         return "\n".join(lines)
 
 
+register_vocabulary('dependency.foundational', DependencyMapper.FOUNDATIONAL_KEYWORDS)
+register_vocabulary('dependency.advanced', DependencyMapper.ADVANCED_KEYWORDS)
+register_vocabulary('dependency.assessment', DependencyMapper.ASSESSMENT_KEYWORDS)
+register_vocabulary('dependency.intervention', DependencyMapper.INTERVENTION_KEYWORDS)
+
+
 def map_dependencies(anchors: List[Dict]) -> DependencyMappingResult:
     """Convenience function to map dependencies."""
     mapper = DependencyMapper()
@@ -11,17 +11,37 @@ This module classifies anchor content into the 6 NCLEX content domains:
 
 Used in Step 3 (Official Sorting) of the preparation pipeline.
 
+The domain keyword lists are compiled once (per classifier class) into a
+DomainKeywordIndex: one vocabulary holding every keyword, plus postings
+from each keyword to the (domain, list position) entries it scores. An
+anchor's keywords are found in a single scan of its text, title hits are
+read off those, and scoring walks only the hits, so the cost per anchor
+no longer grows with the keyword lists.
+
 Usage:
     from skills.generation.domain_classifier import DomainClassifier
 
     classifier = DomainClassifier()
     result = classifier.classify_anchors(anchors)
+
+    # Share one tokenization pass with the other analyzers
+    corpus = AnchorCorpus.from_anchors(anchors)
+    result = classifier.classify_anchors(anchors, corpus=corpus)
+
+    # Per-domain keyword matches for one anchor
+    classifier.keyword_index().domain_matches(prepare_anchor(anchor))
 """
 
-import re
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+
+from skills.generation.anchor_corpus import (
+    AnchorCorpus,
+    PreparedAnchor,
+    prepare_anchor,
+    register_vocabulary,
+)
 
 
 @dataclass
@@ -45,6 +65,60 @@ class ClassificationResult:
     metrics: Dict = field(default_factory=dict)
 
 
+class DomainKeywordIndex:
+    """
+    Domain keyword lists compiled into one vocabulary with postings.
+
+    domain_matches() reproduces the classic per-domain loop (each keyword
+    found in the text, in list order, listed twice when it is also in the
+    title) from the set of hits alone.
+    """
+
+    def __init__(self, domains: Dict[str, Dict], name: str):
+        self.name = name
+        self.domain_keys: Tuple[str, ...] = tuple(domains)
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for slot, key in enumerate(self.domain_keys):
+            for position, keyword in enumerate(domains[key]['keywords']):
+                postings.setdefault(keyword, []).append((slot, position))
+        self.postings: Dict[str, Tuple[Tuple[int, int], ...]] = {
+            kw: tuple(entries) for kw, entries in postings.items()
+        }
+        self.keywords: Tuple[str, ...] = tuple(self.postings)
+        register_vocabulary(name, self.keywords)
+
+    def hits(self, prepared: PreparedAnchor) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """Keywords found in the anchor's text and title."""
+        text_hits = prepared.matched(self.name, self.keywords)
+        if not text_hits:
+            return text_hits, text_hits
+        return text_hits, prepared.matched(self.name, self.keywords, 'title')
+
+    def domain_matches(
+        self,
+        prepared: PreparedAnchor,
+        hits: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = None
+    ) -> Dict[str, List[str]]:
+        """Matched keywords per domain, title matches double counted."""
+        text_hits, title_hits = hits if hits is not None else self.hits(prepared)
+        found: List[List[Tuple[int, str]]] = [[] for _ in self.domain_keys]
+        for keyword in text_hits:
+            for slot, position in self.postings[keyword]:
+                found[slot].append((position, keyword))
+
+        matches: Dict[str, List[str]] = {}
+        for key, entries in zip(self.domain_keys, found):
+            entries.sort()
+            matched = []
+            for _, keyword in entries:
+                matched.append(keyword)
+                # Weight title matches higher
+                if keyword in title_hits:
+                    matched.append(keyword)  # Double count
+            matches[key] = matched
+        return matches
+
+
 class DomainClassifier:
     """Classify content into NCLEX domains."""
 
@@ -207,38 +281,45 @@ class DomainClassifier:
         except Exception:
             pass
 
-    def classify_anchor(self, anchor: Dict) -> DomainClassification:
+    @classmethod
+    def keyword_index(cls) -> DomainKeywordIndex:
+        """The compiled index for this class's DOMAINS (built once)."""
+        index = cls.__dict__.get('_keyword_index')
+        if index is None:
+            index = DomainKeywordIndex(cls.DOMAINS, f"domain.{cls.__name__}")
+            cls._keyword_index = index
+        return index
+
+    def classify_anchor(
+        self,
+        anchor: Dict,
+        prepared: Optional[PreparedAnchor] = None
+    ) -> DomainClassification:
         """
         Classify a single anchor into NCLEX domain.
 
         Args:
             anchor: Anchor dictionary with id, title, full_text
+            prepared: The anchor's entry in a shared AnchorCorpus
 
         Returns:
             DomainClassification result
         """
-        anchor_id = anchor.get('id', 'unknown')
-        title = anchor.get('title', '').lower()
-        content = anchor.get('full_text', '').lower()
-        full_text = f"{title} {content}"
-
-        # Score each domain
-        domain_scores = {}
-        matched_keywords = {}
-
-        for domain_key, domain_info in self.DOMAINS.items():
-            keywords = domain_info['keywords']
-            matches = []
-
-            for keyword in keywords:
-                if keyword in full_text:
-                    matches.append(keyword)
-                    # Weight title matches higher
-                    if keyword in title:
-                        matches.append(keyword)  # Double count
+        if prepared is None:
+            prepared = prepare_anchor(anchor)
+        index = self.keyword_index()
+        return self._classify_matches(
+            anchor.get('id', 'unknown'),
+            index.domain_matches(prepared)
+        )
 
-            domain_scores[domain_key] = len(matches)
-            matched_keywords[domain_key] = matches
+    def _classify_matches(
+        self,
+        anchor_id: str,
+        matched_keywords: Dict[str, List[str]]
+    ) -> DomainClassification:
+        """Build the classification from per-domain keyword matches."""
+        domain_scores = {key: len(matches) for key, matches in matched_keywords.items()}
 
         # Find primary domain
         if not any(domain_scores.values()):
@@ -281,12 +362,20 @@ class DomainClassifier:
             matched_keywords=matched_keywords[primary_domain][:5]
         )
 
-    def classify_anchors(self, anchors: List[Dict]) -> ClassificationResult:
+    def classify_anchors(
+        self,
+        anchors: List[Dict],
+        corpus: Optional[AnchorCorpus] = None
+    ) -> ClassificationResult:
         """
         Classify multiple anchors.
 
+        Keyword hits come from one scan per anchor; anchors with the same
+        title/text hits share one scoring pass.
+
         Args:
             anchors: List of anchor dictionaries
+            corpus: Shared AnchorCorpus for anchors
 
         Returns:
             ClassificationResult with all classifications
@@ -294,9 +383,23 @@ class DomainClassifier:
         classifications = []
         domain_distribution = {domain: 0 for domain in self.DOMAINS}
         unclassified = []
-
-        for anchor in anchors:
-            classification = self.classify_anchor(anchor)
+        corpus = AnchorCorpus.ensure(anchors, corpus)
+        index = self.keyword_index()
+        scored: Dict[Tuple[FrozenSet[str], FrozenSet[str]], DomainClassification] = {}
+
+        for anchor, prepared in zip(anchors, corpus):
+            anchor_id = anchor.get('id', 'unknown')
+            hits = index.hits(prepared)
+            template = scored.get(hits)
+            if template is None:
+                template = self._classify_matches(anchor_id, index.domain_matches(prepared, hits))
+                scored[hits] = template
+            classification = replace(
+                template,
+                anchor_id=anchor_id,
+                secondary_domains=list(template.secondary_domains),
+                matched_keywords=list(template.matched_keywords)
+            )
             classifications.append(classification)
 
             if classification.confidence >= 0.3:
@@ -379,6 +482,10 @@ class DomainClassifier:
         return "\n".join(lines)
 
 
+# Compile (and register) the default domain vocabulary at import
+DomainClassifier.keyword_index()
+
+
 def classify_anchors(anchors: List[Dict]) -> ClassificationResult:
     """Convenience function to classify anchors."""
     classifier = DomainClassifier()
@@ -20,22 +20,46 @@ Usage:
         train_from_samples,
         ensemble_predict
     )
+
+    # Pattern-trained model, loaded from its cached artifact when current
+    recommender = get_recommender()
+    recommender.save_model('model.npz')  # versioned artifact, no pickle
+
+    # Recommend for a whole section with quota-aware selection
+    deck = MLVisualRecommender().recommend_deck(slides)
+    chosen = deck.selected  # slide numbers
+
+    # Score a whole section at once (NumPy when installed)
+    matrix = features_to_matrix([extract_features(s, i + 1, n) for i, s in enumerate(slides)])
+    probs = recommender.model.predict_proba_batch(matrix)
 """
 
-import re
+import hashlib
 import json
 import math
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
-import pickle
 from collections import Counter
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from skills.utilities.feature_cache import cached_analysis, source_fingerprint
+from skills.utilities.regex_registry import compile_pattern, compile_patterns
+
 # Import existing modules
 from .visual_pattern_matcher import (
     VisualType,
+    VisualOpportunityScore,
     score_visual_opportunity_multifactor,
+    score_deck,
+    rank_scored_slides,
     get_all_visual_scores,
     NCLEX_DOMAIN_KEYWORDS
 )
@@ -45,14 +69,45 @@ from .content_structure_analyzer import (
     identify_comparison_structure,
     detect_sequential_markers,
     analyze_information_density,
-    detect_hierarchical_structure
+    detect_hierarchical_structure,
+    analyze_structure,
+    suggest_visual_type
 )
+from .visual_model_store import (
+    ModelArtifact,
+    check_artifact_path,
+    default_artifact_path,
+    read_artifact,
+    read_metadata,
+    write_artifact
+)
+from .visual_selection import VisualCandidate, select_visuals
+from skills.validation.visual_quota_tracker import get_selection_bounds
 
 
 # =============================================================================
 # FEATURE EXTRACTION
 # =============================================================================
 
+_WORD_RE = compile_pattern(r'\b\w+\b')
+_VS_KEYWORD_RE = compile_pattern(r'\bvs\.?\b|\bversus\b')
+
+# Technical term indicators
+_TECHNICAL_TERM_RES = compile_patterns([
+    r'\b[A-Z]{2,}s?\b',  # Abbreviations like ACE, ARB, COPD
+    r'\b\w+emia\b',  # Medical terms ending in -emia
+    r'\b\w+itis\b',  # -itis
+    r'\b\w+osis\b',  # -osis
+    r'\b\w+ectomy\b',  # -ectomy
+    r'\b\w+plasty\b',  # -plasty
+    r'\b\d+\s*(?:mg|mcg|mL|L|g|kg)\b',  # Dosage patterns
+    r'\(\w+\)',  # Parenthetical terms
+])
+# Bump when extract_features() changes what a feature value means, so
+# persisted model artifacts built with the old semantics are retrained
+FEATURE_EXTRACTION_VERSION = 1
+
+
 @dataclass
 class SlideFeatures:
     """Feature vector for a slide, used as input to ML model."""
@@ -203,11 +258,26 @@ class SlideFeatures:
             'slide_position_score', 'is_intro_slide', 'is_summary_slide'
         ]
 
-
+    @classmethod
+    def feature_schema(cls) -> Dict[str, Any]:
+        """Feature schema recorded in model artifacts (version + ordered names)."""
+        return {'version': FEATURE_EXTRACTION_VERSION, 'names': cls.feature_names()}
+
+
+@cached_analysis(
+    'extract_features',
+    key=lambda slide, slide_number=0, total_slides=0, structure=None: (
+        slide.get('header', ''), slide.get('body', ''), slide.get('slide_type', ''),
+        slide_number, total_slides
+    ),
+    depends_on=('skills.generation.content_structure_analyzer', 'skills.generation.visual_pattern_matcher'),
+    types=(SlideFeatures,)
+)
 def extract_features(
     slide: Dict[str, Any],
     slide_number: int = 0,
-    total_slides: int = 0
+    total_slides: int = 0,
+    structure: Optional[Dict[str, Any]] = None
 ) -> SlideFeatures:
     """
     Extract comprehensive feature vector from slide content.
@@ -219,12 +289,15 @@ def extract_features(
         slide: Slide dictionary with header, body, slide_type
         slide_number: Position in section (1-indexed)
         total_slides: Total slides in section
+        structure: Precomputed analyze_structure(body) result (optional)
 
     Returns:
         SlideFeatures dataclass with all extracted features
     """
     header = slide.get('header', '')
     body = slide.get('body', '')
+    if structure is None:
+        structure = analyze_structure(body)
     slide_type = slide.get('slide_type', '').lower()
     content = f"{header}\n{body}"
     content_lower = content.lower()
@@ -234,7 +307,7 @@ def extract_features(
     # =========================
     # Basic Content Metrics
     # =========================
-    words = re.findall(r'\b\w+\b', content)
+    words = _WORD_RE.findall(content)
     lines = [l for l in content.split('\n') if l.strip()]
 
     features.word_count = len(words)
@@ -248,9 +321,9 @@ def extract_features(
     # =========================
     # Structure Features
     # =========================
-    features.bullet_count = count_bullet_points(body)
+    features.bullet_count = structure['bullet_count']
 
-    list_patterns = detect_list_patterns(body)
+    list_patterns = structure['list_patterns']
     features.has_numbered_list = list_patterns['has_numbered_list']
     features.has_bulleted_list = list_patterns['has_bulleted_list']
     features.list_depth = list_patterns['list_depth']
@@ -275,12 +348,12 @@ def extract_features(
     # =========================
     # Comparison Features
     # =========================
-    comparison = identify_comparison_structure(body)
+    comparison = structure['comparison']
     features.is_comparison = comparison['is_comparison']
     features.comparison_item_count = len(comparison['comparison_items'])
     features.is_binary_comparison = comparison['comparison_type'] == 'binary'
 
-    features.vs_keyword_count = len(re.findall(r'\bvs\.?\b|\bversus\b', content_lower))
+    features.vs_keyword_count = len(_VS_KEYWORD_RE.findall(content_lower))
 
     # Contrast score based on contrast keywords
     contrast_keywords = ['however', 'unlike', 'whereas', 'contrast', 'different']
@@ -289,7 +362,7 @@ def extract_features(
     # =========================
     # Sequential Features
     # =========================
-    sequential = detect_sequential_markers(body)
+    sequential = structure['sequential']
     features.is_sequential = sequential['is_sequential']
     features.sequence_type_process = sequential['sequence_type'] == 'process'
     features.sequence_type_timeline = sequential['sequence_type'] == 'timeline'
@@ -299,7 +372,7 @@ def extract_features(
     # =========================
     # Hierarchical Features
     # =========================
-    hierarchical = detect_hierarchical_structure(body)
+    hierarchical = structure['hierarchical']
     features.is_hierarchical = hierarchical['is_hierarchical']
     features.hierarchy_levels = hierarchical['levels_detected']
     features.has_root_concept = hierarchical['root_concept'] is not None
@@ -311,7 +384,7 @@ def extract_features(
     # =========================
     # Density Features
     # =========================
-    density = analyze_information_density(body)
+    density = structure['density']
     features.density_score = density['density_score']
     features.unique_concepts = density['unique_concepts']
 
@@ -433,25 +506,13 @@ def _calculate_technical_term_density(content: str) -> float:
     if not content:
         return 0.0
 
-    # Technical term indicators
-    technical_patterns = [
-        r'\b[A-Z]{2,}s?\b',  # Abbreviations like ACE, ARB, COPD
-        r'\b\w+emia\b',  # Medical terms ending in -emia
-        r'\b\w+itis\b',  # -itis
-        r'\b\w+osis\b',  # -osis
-        r'\b\w+ectomy\b',  # -ectomy
-        r'\b\w+plasty\b',  # -plasty
-        r'\b\d+\s*(?:mg|mcg|mL|L|g|kg)\b',  # Dosage patterns
-        r'\(\w+\)',  # Parenthetical terms
-    ]
-
-    words = re.findall(r'\b\w+\b', content)
+    words = _WORD_RE.findall(content)
     if not words:
         return 0.0
 
     technical_count = 0
-    for pattern in technical_patterns:
-        technical_count += len(re.findall(pattern, content))
+    for pattern in _TECHNICAL_TERM_RES:
+        technical_count += len(pattern.findall(content))
 
     return min(1.0, technical_count / (len(words) / 5))
 
@@ -468,13 +529,32 @@ class TrainingExample:
     confidence: float = 1.0  # How confident we are in this label
 
 
+def features_to_matrix(features: Sequence[Union[SlideFeatures, Sequence[float]]]):
+    """
+    Stack feature vectors into an (n_slides, n_features) matrix.
+
+    Args:
+        features: SlideFeatures objects or already-built vectors
+
+    Returns:
+        NumPy float array when NumPy is installed, otherwise a list of lists
+    """
+    rows = [f.to_vector() if isinstance(f, SlideFeatures) else list(f) for f in features]
+    if NUMPY_AVAILABLE:
+        return np.asarray(rows, dtype=float).reshape(len(rows), len(SlideFeatures.feature_names()))
+    return rows
+
+
 class NaiveBayesVisualClassifier:
     """
     Lightweight Naive Bayes classifier for visual type prediction.
 
-    Uses Gaussian Naive Bayes with calibrated probability outputs.
-    No external dependencies - implements from scratch using numpy-compatible
-    operations with Python's built-in math module.
+    Uses Gaussian Naive Bayes with calibrated probability outputs. After
+    training, per-class means, inverse variances and log-normalizers
+    (log prior minus the sum of log standard deviations) are precomputed as
+    (n_classes, n_features) arrays, so a whole deck is scored with one
+    vectorized operation. NumPy is used when installed; otherwise the same
+    precomputed terms are evaluated with plain Python lists.
     """
 
     def __init__(self):
@@ -488,6 +568,11 @@ class NaiveBayesVisualClassifier:
         # Calibration parameters
         self.calibration_temp = 1.0  # Temperature for probability calibration
 
+        # Precomputed scoring terms (built by _compile)
+        self._means = None
+        self._inv_vars = None
+        self._log_norms = None
+
     def fit(self, examples: List[TrainingExample]) -> None:
         """
         Train the classifier on labeled examples.
@@ -515,22 +600,8 @@ class NaiveBayesVisualClassifier:
         # Calculate feature statistics per class
         for c in self.classes:
             if class_examples[c]:
-                vectors = class_examples[c]
-                n = len(vectors)
-
-                # Calculate means
-                means = [0.0] * self.n_features
-                for v in vectors:
-                    for i, val in enumerate(v):
-                        means[i] += val / n
+                means, stds = self._column_stats(class_examples[c])
                 self.feature_means[c] = means
-
-                # Calculate standard deviations
-                stds = [0.0] * self.n_features
-                for v in vectors:
-                    for i, val in enumerate(v):
-                        stds[i] += (val - means[i]) ** 2 / n
-                stds = [max(0.01, math.sqrt(s)) for s in stds]  # Min std to avoid division by zero
                 self.feature_stds[c] = stds
             else:
                 # Default for classes with no examples
@@ -538,53 +609,133 @@ class NaiveBayesVisualClassifier:
                 self.feature_stds[c] = [1.0] * self.n_features
 
         self.is_trained = True
-
-    def predict_proba(self, features: SlideFeatures) -> Dict[VisualType, float]:
+        self._compile()
+
+    def _column_stats(self, vectors: List[List[float]]) -> Tuple[List[float], List[float]]:
+        """Per-feature mean and population std (min 0.01 to avoid division by zero)."""
+        if NUMPY_AVAILABLE:
+            matrix = np.asarray(vectors, dtype=float)
+            means = matrix.mean(axis=0)
+            stds = np.maximum(0.01, np.sqrt(((matrix - means) ** 2).mean(axis=0)))
+            return means.tolist(), stds.tolist()
+
+        n = len(vectors)
+        columns = list(zip(*vectors))
+        means = [sum(col) / n for col in columns]
+        stds = [
+            max(0.01, math.sqrt(sum((val - mean) ** 2 for val in col) / n))
+            for col, mean in zip(columns, means)
+        ]
+        return means, stds
+
+    def _compile(self) -> None:
+        """Precompute means, inverse variances and log-normalizers per class."""
+        means = [self.feature_means[c] for c in self.classes]
+        stds = [self.feature_stds[c] for c in self.classes]
+        priors = [self.class_priors[c] for c in self.classes]
+
+        if NUMPY_AVAILABLE:
+            std_matrix = np.asarray(stds, dtype=float)
+            self._means = np.asarray(means, dtype=float)
+            self._inv_vars = 1.0 / (std_matrix * std_matrix)
+            self._log_norms = np.log(np.asarray(priors, dtype=float)) - np.log(std_matrix).sum(axis=1)
+        else:
+            self._means = means
+            self._inv_vars = [[1.0 / (sd * sd) for sd in row] for row in stds]
+            self._log_norms = [
+                math.log(prior) - sum(math.log(sd) for sd in row)
+                for prior, row in zip(priors, stds)
+            ]
+
+    def _log_probs_batch(self, matrix):
+        """Unnormalized log posteriors, one row per slide and one column per class."""
+        if NUMPY_AVAILABLE:
+            diff = matrix[:, None, :] - self._means[None, :, :]
+            quad = np.einsum('ncf,ncf,cf->nc', diff, diff, self._inv_vars)
+            return self._log_norms[None, :] - 0.5 * quad
+
+        rows = []
+        for vector in matrix:
+            row = []
+            for means, inv_vars, log_norm in zip(self._means, self._inv_vars, self._log_norms):
+                quad = 0.0
+                for val, mean, inv_var in zip(vector, means, inv_vars):
+                    d = val - mean
+                    quad += d * d * inv_var
+                row.append(log_norm - 0.5 * quad)
+            rows.append(row)
+        return rows
+
+    def predict_proba_batch(self, features_matrix):
         """
-        Predict probability distribution over visual types.
+        Predict probability distributions for many slides at once.
 
         Args:
-            features: SlideFeatures for a slide
+            features_matrix: (n_slides, n_features) array, list of vectors,
+                or list of SlideFeatures
 
         Returns:
-            Dictionary mapping VisualType to probability
+            (n_slides, n_classes) probabilities, columns in self.classes order
+            (NumPy array when NumPy is installed, otherwise list of lists)
         """
+        if not NUMPY_AVAILABLE or not hasattr(features_matrix, 'shape'):
+            features_matrix = features_to_matrix(features_matrix)
+        n_slides = len(features_matrix)
+
         if not self.is_trained:
-            # Return uniform distribution if not trained
+            # Uniform distribution if not trained
             uniform = 1.0 / len(self.classes)
-            return {c: uniform for c in self.classes}
+            if NUMPY_AVAILABLE:
+                return np.full((n_slides, len(self.classes)), uniform)
+            return [[uniform] * len(self.classes) for _ in range(n_slides)]
 
-        vector = features.to_vector()
-        log_probs: Dict[VisualType, float] = {}
+        if self._log_norms is None:
+            self._compile()
 
-        for c in self.classes:
-            # Start with log prior
-            log_prob = math.log(self.class_priors[c])
+        log_probs = self._log_probs_batch(features_matrix)
 
-            # Add log likelihood of each feature
-            means = self.feature_means[c]
-            stds = self.feature_stds[c]
+        # Convert to probabilities with temperature scaling
+        if NUMPY_AVAILABLE:
+            scaled = np.exp((log_probs - log_probs.max(axis=1, keepdims=True)) / self.calibration_temp)
+            return scaled / scaled.sum(axis=1, keepdims=True)
+
+        probs = []
+        for row in log_probs:
+            max_log = max(row)
+            scaled = [math.exp((lp - max_log) / self.calibration_temp) for lp in row]
+            total = sum(scaled)
+            probs.append([p / total for p in scaled])
+        return probs
+
+    def predict_batch(self, features_matrix) -> List[Tuple[VisualType, float]]:
+        """
+        Predict the most likely visual type for many slides.
 
-            for i, val in enumerate(vector):
-                # Gaussian log likelihood
-                z = (val - means[i]) / stds[i]
-                log_prob -= 0.5 * z * z
-                log_prob -= math.log(stds[i])
+        Returns:
+            List of (VisualType, confidence), one per row
+        """
+        results = []
+        for row in self.predict_proba_batch(features_matrix):
+            row = list(row)
+            best = max(range(len(row)), key=row.__getitem__)
+            results.append((self.classes[best], float(row[best])))
+        return results
 
-            log_probs[c] = log_prob
+    def proba_row_to_dict(self, row) -> Dict[VisualType, float]:
+        """Map one row of predict_proba_batch output to {VisualType: probability}."""
+        return {c: float(p) for c, p in zip(self.classes, row)}
 
-        # Convert to probabilities with temperature scaling
-        max_log = max(log_probs.values())
-        probs = {}
-        total = 0.0
+    def predict_proba(self, features: SlideFeatures) -> Dict[VisualType, float]:
+        """
+        Predict probability distribution over visual types.
 
-        for c, lp in log_probs.items():
-            p = math.exp((lp - max_log) / self.calibration_temp)
-            probs[c] = p
-            total += p
+        Args:
+            features: SlideFeatures for a slide
 
-        # Normalize
-        return {c: p / total for c, p in probs.items()}
+        Returns:
+            Dictionary mapping VisualType to probability
+        """
+        return self.proba_row_to_dict(self.predict_proba_batch([features])[0])
 
     def predict(self, features: SlideFeatures) -> Tuple[VisualType, float]:
         """
@@ -601,31 +752,67 @@ class NaiveBayesVisualClassifier:
         return (best_class, probs[best_class])
 
     def save(self, path: str) -> None:
-        """Save model to disk."""
-        state = {
-            'class_priors': {k.value: v for k, v in self.class_priors.items()},
-            'feature_means': {k.value: v for k, v in self.feature_means.items()},
-            'feature_stds': {k.value: v for k, v in self.feature_stds.items()},
-            'is_trained': self.is_trained,
-            'calibration_temp': self.calibration_temp
+        """Save model to disk as a .npz/.json artifact (see visual_model_store)."""
+        arrays, metadata = self.to_artifact()
+        write_artifact(path, arrays, metadata)
+
+    def to_artifact(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Export the trained state as (arrays, metadata) for visual_model_store.
+
+        Arrays are (n_classes,) priors and (n_classes, n_features) means and
+        stds, rows in self.classes order.
+        """
+        arrays = {
+            'class_priors': [self.class_priors[c] for c in self.classes],
+            'feature_means': [self.feature_means[c] for c in self.classes],
+            'feature_stds': [self.feature_stds[c] for c in self.classes],
+        }
+        metadata = {
+            'model': type(self).__name__,
+            'classes': [c.value for c in self.classes],
+            'feature_schema': SlideFeatures.feature_schema(),
+            'calibration_temp': self.calibration_temp,
         }
-        with open(path, 'wb') as f:
-            pickle.dump(state, f)
+        return arrays, metadata
+
+    def from_artifact(self, artifact: ModelArtifact) -> bool:
+        """
+        Restore trained state from an artifact.
+
+        Returns False (leaving the model untouched) if the artifact was built
+        for another model, class list or feature schema.
+        """
+        header = artifact.metadata
+        if (header.get('model') != type(self).__name__
+                or header.get('classes') != [c.value for c in self.classes]
+                or header.get('feature_schema') != SlideFeatures.feature_schema()):
+            return False
 
-    def load(self, path: str) -> bool:
-        """Load model from disk. Returns True if successful."""
         try:
-            with open(path, 'rb') as f:
-                state = pickle.load(f)
-
-            self.class_priors = {VisualType(k): v for k, v in state['class_priors'].items()}
-            self.feature_means = {VisualType(k): v for k, v in state['feature_means'].items()}
-            self.feature_stds = {VisualType(k): v for k, v in state['feature_stds'].items()}
-            self.is_trained = state['is_trained']
-            self.calibration_temp = state.get('calibration_temp', 1.0)
-            return True
-        except (FileNotFoundError, KeyError, pickle.PickleError):
+            priors = [float(p) for p in artifact.arrays['class_priors']]
+            means = [[float(v) for v in row] for row in artifact.arrays['feature_means']]
+            stds = [[float(v) for v in row] for row in artifact.arrays['feature_stds']]
+        except (KeyError, TypeError, ValueError):
             return False
+        n_classes = len(self.classes)
+        if (len(priors) != n_classes or len(means) != n_classes or len(stds) != n_classes
+                or any(len(row) != self.n_features for row in means + stds)):
+            return False
+
+        self.class_priors = dict(zip(self.classes, priors))
+        self.feature_means = dict(zip(self.classes, means))
+        self.feature_stds = dict(zip(self.classes, stds))
+        self.calibration_temp = header.get('calibration_temp', 1.0)
+        self.is_trained = True
+        self._compile()
+        return True
+
+    def load(self, path: str) -> bool:
+        """Load a .npz/.json model artifact. Returns True if successful."""
+        check_artifact_path(path)
+        artifact = read_artifact(path)
+        return artifact is not None and self.from_artifact(artifact)
 
 
 # =============================================================================
@@ -643,7 +830,7 @@ class MLVisualRecommender:
         recommender = MLVisualRecommender()
 
         # Load pre-trained model if available
-        recommender.load_model('model.pkl')
+        recommender.load_model('model.npz')
 
         # Or train from samples
         recommender.train_from_samples(training_data)
@@ -656,6 +843,7 @@ class MLVisualRecommender:
         self.model = NaiveBayesVisualClassifier()
         self.rule_weight = 0.4  # Weight for rule-based predictions
         self.ml_weight = 0.6   # Weight for ML predictions
+        self.training_stats: Optional[Dict[str, Any]] = None
 
         if model_path:
             self.load_model(model_path)
@@ -672,7 +860,7 @@ class MLVisualRecommender:
         """
         self.model.fit(examples)
 
-        return {
+        self.training_stats = {
             'num_examples': len(examples),
             'is_trained': self.model.is_trained,
             'classes': [c.value for c in self.model.classes],
@@ -681,6 +869,7 @@ class MLVisualRecommender:
                 for c in self.model.classes
             }
         }
+        return self.training_stats
 
     def train_from_samples(
         self,
@@ -751,18 +940,134 @@ class MLVisualRecommender:
             - all_probabilities: Distribution over all types
         """
         features = extract_features(slide, slide_number, total_slides)
+        ml_probs = self.model.predict_proba(features) if self.model.is_trained else None
+        rule_score = score_visual_opportunity_multifactor(slide, slide_number, total_slides)
+        return self._build_recommendation(features, ml_probs, rule_score)
+
+    def recommend_deck(
+        self,
+        slides: List[Dict[str, Any]],
+        min_visuals: Optional[int] = None,
+        max_visuals: Optional[int] = None,
+        lead_in: Sequence[str] = ()
+    ) -> 'DeckRecommendation':
+        """
+        Recommend visuals for a whole section in one pass.
+
+        Structure analysis runs once per slide and feeds both the ML
+        features and the structure suggestion; the ML model scores the
+        whole section as one matrix; the rule-based scores come from the
+        same score_deck pass that rank_slides_for_visuals uses. Selection
+        then applies the section's visual quota.
+
+        Args:
+            slides: List of slide dictionaries (header, body, ...)
+            min_visuals: Override the quota minimum
+            max_visuals: Override the quota maximum
+            lead_in: Visual types chosen just before this section (the
+                variety rule continues across sections)
+
+        Returns:
+            DeckRecommendation
+        """
+        total = len(slides)
+        numbers = [slide.get('slide_number', i + 1) for i, slide in enumerate(slides)]
+        structures = [analyze_structure(slide.get('body', '')) for slide in slides]
+        features = [
+            extract_features(slide, numbers[i], total, structure=structures[i])
+            for i, slide in enumerate(slides)
+        ]
+
+        probs = None
+        if self.model.is_trained and features:
+            probs = self.model.predict_proba_batch(features_to_matrix(features))
+
+        scored = score_deck(slides)
+
+        recommendations = []
+        for i, slide in enumerate(slides):
+            ml_probs = self.model.proba_row_to_dict(probs[i]) if probs is not None else None
+            rec = self._build_recommendation(features[i], ml_probs, scored[i][1])
+            rec['slide_number'] = numbers[i]
+            suggestion = suggest_visual_type(slide.get('body', ''), structure=structures[i])
+            rec['structure_suggestion'] = suggestion['primary_suggestion'].value
+            recommendations.append(rec)
+
+        ranked = rank_scored_slides(scored)
+        selected, quota = self._select_with_quota(
+            recommendations, ranked, min_visuals, max_visuals, lead_in
+        )
+        return DeckRecommendation(
+            recommendations=recommendations,
+            ranked=ranked,
+            selected=selected,
+            quota=quota
+        )
+
+    def _select_with_quota(
+        self,
+        recommendations: List[Dict[str, Any]],
+        ranked: List[Tuple[int, VisualOpportunityScore]],
+        min_visuals: Optional[int] = None,
+        max_visuals: Optional[int] = None,
+        lead_in: Sequence[str] = ()
+    ) -> Tuple[List[int], Dict[str, Any]]:
+        """
+        Pick slides for visuals within the section quota.
+
+        Slides the ensemble flags (should_have_visual) are candidates with
+        their confidence as score; the rest of the rule-based ranking are
+        fallback candidates that only fill up to the minimum, as
+        generate_fallback_visual does. select_visuals solves the choice
+        with the variety rule in one pass. Marks each recommendation with
+        'selected' and 'selected_by' ('ensemble' or 'fallback').
+
+        Returns:
+            (selected slide numbers in deck order, quota summary)
+        """
+        total = len(recommendations)
+        minimum, maximum = get_selection_bounds(total, min_visuals, max_visuals)
+
+        rule_types = {num: score.visual_type.value for num, score in ranked}
+        rule_scores = {num: score.total_score for num, score in ranked}
+        candidates = []
+        for rec in recommendations:
+            slide_num = rec['slide_number']
+            if rec['should_have_visual']:
+                candidates.append(VisualCandidate(
+                    slide_num, [(rec['recommended_type'], rec['confidence'])]
+                ))
+            elif slide_num in rule_types:
+                candidates.append(VisualCandidate(
+                    slide_num, [(rule_types[slide_num], rule_scores[slide_num])], fallback=True
+                ))
+
+        selection = select_visuals(candidates, minimum, maximum, lead_in=lead_in)
+        chosen = {
+            pick.slide_number: 'fallback' if pick.fallback else 'ensemble'
+            for pick in selection.picks
+        }
+        for rec in recommendations:
+            rec['selected'] = rec['slide_number'] in chosen
+            rec['selected_by'] = chosen.get(rec['slide_number'])
 
-        # Get ML prediction
-        if self.model.is_trained:
-            ml_type, ml_conf = self.model.predict(features)
-            ml_probs = self.model.predict_proba(features)
+        return selection.slide_numbers, selection.quota_summary(total)
+
+    def _build_recommendation(
+        self,
+        features: SlideFeatures,
+        ml_probs: Optional[Dict[VisualType, float]],
+        rule_score: VisualOpportunityScore
+    ) -> Dict[str, Any]:
+        """Combine ML probabilities and a rule score into a recommendation dict."""
+        if ml_probs is not None:
+            ml_type = max(ml_probs, key=ml_probs.get)
+            ml_conf = ml_probs[ml_type]
         else:
             ml_type = VisualType.TABLE
             ml_conf = 0.0
             ml_probs = {c: 0.0 for c in self.model.classes}
 
-        # Get rule-based prediction
-        rule_score = score_visual_opportunity_multifactor(slide, slide_number, total_slides)
         rule_type = rule_score.visual_type
         rule_conf = rule_score.total_score
 
@@ -880,12 +1185,80 @@ class MLVisualRecommender:
         }
 
     def save_model(self, path: str) -> None:
-        """Save the trained model to disk."""
-        self.model.save(path)
+        """Save the trained model to disk (.npz or .json artifact)."""
+        self.save_artifact(path)
 
     def load_model(self, path: str) -> bool:
-        """Load a trained model from disk."""
-        return self.model.load(path)
+        """Load a trained model from disk (.npz or .json artifact)."""
+        return self.load_artifact(path)
+
+    def save_artifact(
+        self,
+        path: Union[str, Path],
+        training_hash: Optional[str] = None
+    ) -> Optional[Path]:
+        """
+        Write the trained model as a versioned artifact (see visual_model_store).
+
+        Args:
+            path: .npz (requires NumPy) or .json target
+            training_hash: Fingerprint of the training data, checked on load
+
+        Returns:
+            Path written, or None if the directory is not writable
+        """
+        arrays, metadata = self.model.to_artifact()
+        metadata['training_hash'] = training_hash
+        metadata['training_stats'] = self.training_stats
+        return write_artifact(path, arrays, metadata)
+
+    def load_artifact(
+        self,
+        path: Union[str, Path],
+        training_hash: Optional[str] = None
+    ) -> bool:
+        """
+        Load a model artifact if it matches the current feature schema.
+
+        Args:
+            path: Artifact written by save_artifact
+            training_hash: If given, the artifact must have been trained on
+                data with this fingerprint
+
+        Returns:
+            True if the model was loaded
+
+        Raises:
+            ValueError: If path is not a .npz or .json file
+        """
+        check_artifact_path(path)
+        header = read_metadata(path)
+        if header is None:
+            return False
+        if training_hash is not None and header.get('training_hash') != training_hash:
+            return False
+
+        artifact = read_artifact(path)
+        if artifact is None or not self.model.from_artifact(artifact):
+            return False
+        self.training_stats = header.get('training_stats')
+        return True
+
+
+@dataclass
+class DeckRecommendation:
+    """Section-level result of MLVisualRecommender.recommend_deck."""
+    recommendations: List[Dict[str, Any]]  # recommend() format + slide_number, in deck order
+    ranked: List[Tuple[int, VisualOpportunityScore]]  # same as rank_slides_for_visuals()
+    selected: List[int]  # slide numbers chosen under the quota, deck order
+    quota: Dict[str, Any]
+
+    def recommendation_for(self, slide_number: int) -> Optional[Dict[str, Any]]:
+        """Look up the recommendation for a slide number."""
+        for rec in self.recommendations:
+            if rec['slide_number'] == slide_number:
+                return rec
+        return None
 
 
 # =============================================================================
@@ -897,10 +1270,18 @@ _recommender: Optional[MLVisualRecommender] = None
 
 
 def get_recommender() -> MLVisualRecommender:
-    """Get or create the global recommender instance."""
+    """
+    Get or create the global recommender instance.
+
+    On first use the pattern-trained model is loaded from its cached
+    artifact, or trained and cached if the training data or feature
+    schema changed since the artifact was written.
+    """
     global _recommender
     if _recommender is None:
-        _recommender = MLVisualRecommender()
+        recommender = MLVisualRecommender()
+        load_or_train_pattern_model(recommender)
+        _recommender = recommender
     return _recommender
 
 
@@ -923,6 +1304,27 @@ def get_ml_recommendation(
     return get_recommender().recommend(slide, slide_number, total_slides)
 
 
+def recommend_deck(
+    slides: List[Dict[str, Any]],
+    min_visuals: Optional[int] = None,
+    max_visuals: Optional[int] = None,
+    lead_in: Sequence[str] = ()
+) -> DeckRecommendation:
+    """
+    Convenience function to recommend visuals for a whole section.
+
+    Args:
+        slides: List of slide dictionaries
+        min_visuals: Override the quota minimum
+        max_visuals: Override the quota maximum
+        lead_in: Visual types chosen just before this section
+
+    Returns:
+        DeckRecommendation
+    """
+    return get_recommender().recommend_deck(slides, min_visuals, max_visuals, lead_in)
+
+
 def train_from_samples(
     samples: List[Dict[str, Any]],
     labels: Optional[List[str]] = None
@@ -1187,17 +1589,76 @@ MI: Irreversible necrosis''',
     return examples
 
 
-def initialize_with_patterns() -> Dict[str, Any]:
+# Modules whose source defines the built-in training data: the example
+# slides and generator (this module), the pattern tables and the analyzers
+# feeding extract_features()
+TRAINING_SOURCE_MODULES = (
+    __name__,
+    'skills.generation.visual_pattern_matcher',
+    'skills.generation.content_structure_analyzer',
+)
+
+
+def pattern_training_hash() -> str:
+    """
+    Fingerprint of the built-in training data.
+
+    FEATURE_EXTRACTION_VERSION plus the source of TRAINING_SOURCE_MODULES,
+    so a model artifact is reused without generating any feature vectors
+    and retrained when the examples, patterns or features change.
+
+    Returns:
+        Hex digest
+    """
+    fingerprint = source_fingerprint('pattern_training', TRAINING_SOURCE_MODULES)
+    return hashlib.sha256(f"v{FEATURE_EXTRACTION_VERSION}:{fingerprint}".encode()).hexdigest()
+
+
+def load_or_train_pattern_model(
+    recommender: MLVisualRecommender,
+    artifact_path: Optional[Union[str, Path]] = None,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    Load the pattern-trained model from its artifact, retraining if stale.
+
+    Args:
+        recommender: Recommender to load into
+        artifact_path: Override artifact location (default: pipeline cache dir)
+        force: Retrain and rewrite the artifact even if it is current
+
+    Returns:
+        Training statistics
+    """
+    path = Path(artifact_path) if artifact_path else default_artifact_path()
+    training_hash = pattern_training_hash()
+
+    if not force and recommender.load_artifact(path, training_hash=training_hash):
+        return recommender.training_stats
+
+    stats = recommender.train(generate_training_data_from_patterns())
+    recommender.save_artifact(path, training_hash=training_hash)
+    return stats
+
+
+def initialize_with_patterns(force: bool = False) -> Dict[str, Any]:
     """
     Initialize the global recommender with pattern-based training data.
 
     Call this function to bootstrap the ML model with built-in patterns.
+    The trained model is cached as a model artifact and reused until the
+    training data or feature schema changes.
+
+    Args:
+        force: Retrain even if the cached artifact is current
 
     Returns:
         Training statistics
     """
-    examples = generate_training_data_from_patterns()
-    return get_recommender().train(examples)
+    global _recommender
+    if _recommender is None:
+        _recommender = MLVisualRecommender()
+    return load_or_train_pattern_model(_recommender, force=force)
 
 
 # =============================================================================
@@ -9,14 +9,18 @@ Usage:
 
     builder = OutlineBuilder()
     outline = builder.build_outline(anchors, domain="medical_surgical")
+
+    # Share one tokenization pass with the other analyzers
+    outline = builder.build_outline(anchors, corpus=AnchorCorpus.from_anchors(anchors))
 """
 
-import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from skills.generation.anchor_corpus import AnchorCorpus, PreparedAnchor
+
 
 @dataclass
 class Section:
@@ -91,7 +95,8 @@ class OutlineBuilder:
         anchors: List[Dict],
         domain: str = "fundamentals",
         clusters: Optional[List[Dict]] = None,
-        priority_rankings: Optional[List[Dict]] = None
+        priority_rankings: Optional[List[Dict]] = None,
+        corpus: Optional[AnchorCorpus] = None
     ) -> Outline:
         """
         Build a complete section outline.
@@ -101,6 +106,7 @@ class OutlineBuilder:
             domain: NCLEX domain for this content
             clusters: Optional pre-computed clusters
             priority_rankings: Optional priority rankings
+            corpus: Shared AnchorCorpus for anchors
 
         Returns:
             Outline with sections
@@ -121,7 +127,7 @@ class OutlineBuilder:
             )
         else:
             sections = self._create_sections_balanced(
-                anchors, section_count, priority_rankings
+                anchors, section_count, priority_rankings, corpus
             )
 
         # Calculate slide estimates
@@ -200,10 +206,12 @@ class OutlineBuilder:
         self,
         anchors: List[Dict],
         section_count: int,
-        priority_rankings: Optional[List[Dict]] = None
+        priority_rankings: Optional[List[Dict]] = None,
+        corpus: Optional[AnchorCorpus] = None
     ) -> List[Section]:
         """Create balanced sections without cluster data."""
         sections = []
+        prepared = list(AnchorCorpus.ensure(anchors, corpus))
 
         # Calculate distribution
         base_per_section = len(anchors) // section_count
@@ -213,21 +221,23 @@ class OutlineBuilder:
         if priority_rankings:
             priority_map = {r.get('anchor_id', r.get('id')): r.get('priority_score', 50)
                           for r in priority_rankings}
-            anchors = sorted(anchors,
-                           key=lambda a: priority_map.get(a.get('id', ''), 50),
-                           reverse=True)
+            prepared = sorted(prepared,
+                            key=lambda p: priority_map.get(p.anchor.get('id', ''), 50),
+                            reverse=True)
+            anchors = [p.anchor for p in prepared]
 
         # Distribute anchors
         current_idx = 0
         for i in range(section_count):
             section_size = base_per_section + (1 if i < remainder else 0)
             section_anchors = anchors[current_idx:current_idx + section_size]
+            section_prepared = prepared[current_idx:current_idx + section_size]
 
             # Generate section name from anchor titles
-            section_name = self._generate_section_name(section_anchors, i + 1)
+            section_name = self._generate_section_name(section_anchors, i + 1, section_prepared)
 
             # Extract keywords
-            keywords = self._extract_keywords(section_anchors)
+            keywords = self._extract_keywords(section_anchors, section_prepared)
 
             section = Section(
                 section_number=i + 1,
@@ -290,18 +300,22 @@ class OutlineBuilder:
 
         return sections
 
-    def _generate_section_name(self, anchors: List[Dict], section_num: int) -> str:
+    def _generate_section_name(
+        self,
+        anchors: List[Dict],
+        section_num: int,
+        prepared: Optional[List[PreparedAnchor]] = None
+    ) -> str:
         """Generate a descriptive section name from anchors."""
         if not anchors:
             return f"Section {section_num}"
+        if prepared is None:
+            prepared = AnchorCorpus.from_anchors(anchors).prepared
 
         # Extract common theme from titles
-        titles = [a.get('title', '') for a in anchors]
         words = []
-
-        for title in titles:
-            title_words = title.lower().split()
-            words.extend([w for w in title_words if len(w) > 3])
+        for p in prepared:
+            words.extend(p.title_words)
 
         if not words:
             return f"Section {section_num}"
@@ -320,17 +334,19 @@ class OutlineBuilder:
 
         return f"Section {section_num}"
 
-    def _extract_keywords(self, anchors: List[Dict]) -> List[str]:
+    def _extract_keywords(
+        self,
+        anchors: List[Dict],
+        prepared: Optional[List[PreparedAnchor]] = None
+    ) -> List[str]:
         """Extract keywords from anchor content."""
         all_words = []
         stop_words = {'the', 'and', 'or', 'of', 'in', 'to', 'a', 'for', 'is', 'on', 'with'}
+        if prepared is None:
+            prepared = AnchorCorpus.from_anchors(anchors).prepared
 
-        for anchor in anchors:
-            title = anchor.get('title', '').lower()
-            content = anchor.get('full_text', '').lower()
-
-            words = re.findall(r'\b[a-z]+\b', f"{title} {content}")
-            all_words.extend([w for w in words if len(w) > 3 and w not in stop_words])
+        for p in prepared:
+            all_words.extend([w for w in p.words if len(w) > 3 and w not in stop_words])
 
         # Count and sort
         word_counts = {}
@@ -11,17 +11,26 @@ The 5 Phases are:
 4. Section Formation - Form lecture sections
 5. Arc Planning - Generate sequence iterations
 
+Anchors are tokenized once per analyze() run into an AnchorCorpus that
+phases 1, 3 and 4 share; pass the corpus in to reuse it with the other
+preparation analyzers.
+
 Usage:
     from skills.generation.phase_analyzer import PhaseAnalyzer
 
     analyzer = PhaseAnalyzer()
     result = analyzer.analyze(anchors)
+
+    corpus = AnchorCorpus.from_anchors(anchors)
+    result = analyzer.analyze(anchors, corpus=corpus)
 """
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from skills.generation.anchor_corpus import AnchorCorpus, register_vocabulary
+
 
 @dataclass
 class PhaseResult:
@@ -60,6 +69,16 @@ class PhaseAnalyzer:
         "Arc Planning"
     ]
 
+    # Title keywords marking prerequisite vs advanced anchors (phase 3)
+    FOUNDATIONAL_KEYWORDS = [
+        'introduction', 'basic', 'fundamental', 'overview', 'definition',
+        'anatomy', 'physiology', 'assessment', 'principles'
+    ]
+    ADVANCED_KEYWORDS = [
+        'advanced', 'complex', 'management', 'intervention', 'treatment',
+        'complication', 'emergency', 'crisis'
+    ]
+
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the PhaseAnalyzer.
@@ -83,12 +102,17 @@ class PhaseAnalyzer:
         """Generate a unique run identifier."""
         return f"phase_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-    def analyze(self, anchors: List[Dict]) -> AnalysisResult:
+    def analyze(
+        self,
+        anchors: List[Dict],
+        corpus: Optional[AnchorCorpus] = None
+    ) -> AnalysisResult:
         """
         Execute full 5-Phase analysis on anchors.
 
         Args:
             anchors: List of anchor dictionaries
+            corpus: Shared AnchorCorpus for anchors
 
         Returns:
             AnalysisResult with complete analysis
@@ -96,9 +120,10 @@ class PhaseAnalyzer:
         run_id = self.generate_run_id()
         phase_results = []
         status = "success"
+        corpus = AnchorCorpus.ensure(anchors, corpus)
 
         # Phase 1: Content Survey
-        phase1 = self.phase1_content_survey(anchors)
+        phase1 = self.phase1_content_survey(anchors, corpus=corpus)
         phase_results.append(phase1)
 
         # Phase 2: Cluster Discovery
@@ -106,12 +131,13 @@ class PhaseAnalyzer:
         phase_results.append(phase2)
 
         # Phase 3: Relationship Mapping
-        phase3 = self.phase3_relationship_mapping(anchors, phase2.data)
+        phase3 = self.phase3_relationship_mapping(anchors, phase2.data, corpus=corpus)
         phase_results.append(phase3)
 
         # Phase 4: Section Formation
         phase4 = self.phase4_section_formation(
-            anchors, phase2.data.get('clusters', []), phase3.data.get('dependencies', [])
+            anchors, phase2.data.get('clusters', []), phase3.data.get('dependencies', []),
+            corpus=corpus
         )
         phase_results.append(phase4)
 
@@ -137,7 +163,11 @@ class PhaseAnalyzer:
             summary=self._build_summary(anchors, phase_results)
         )
 
-    def phase1_content_survey(self, anchors: List[Dict]) -> PhaseResult:
+    def phase1_content_survey(
+        self,
+        anchors: List[Dict],
+        corpus: Optional[AnchorCorpus] = None
+    ) -> PhaseResult:
         """
         Phase 1: Content Survey - Inventory the anchor landscape.
 
@@ -158,19 +188,17 @@ class PhaseAnalyzer:
             keywords = {}
             topics = {}
             total_words = 0
+            corpus = AnchorCorpus.ensure(anchors, corpus)
 
-            for anchor in anchors:
-                title = anchor.get('title', '').lower()
-                content = anchor.get('full_text', '').lower()
+            for anchor, prepared in zip(anchors, corpus):
+                title_words = prepared.title_words
 
                 # Extract keywords from title
-                title_words = [w for w in title.split() if len(w) > 3]
                 for word in title_words:
                     keywords[word] = keywords.get(word, 0) + 1
 
                 # Count content words
-                content_words = len(content.split()) if content else 0
-                total_words += content_words
+                total_words += prepared.content_word_count
 
                 # Categorize by first significant word
                 if title_words:
@@ -276,7 +304,8 @@ class PhaseAnalyzer:
     def phase3_relationship_mapping(
         self,
         anchors: List[Dict],
-        cluster_data: Dict
+        cluster_data: Dict,
+        corpus: Optional[AnchorCorpus] = None
     ) -> PhaseResult:
         """
         Phase 3: Relationship Mapping - Map prerequisite dependencies.
@@ -296,26 +325,20 @@ class PhaseAnalyzer:
             dependencies = []
             anchor_map = {a.get('id', f'anchor_{i}'): a for i, a in enumerate(anchors)}
 
-            # Define prerequisite keywords
-            foundational_keywords = [
-                'introduction', 'basic', 'fundamental', 'overview', 'definition',
-                'anatomy', 'physiology', 'assessment', 'principles'
-            ]
-            advanced_keywords = [
-                'advanced', 'complex', 'management', 'intervention', 'treatment',
-                'complication', 'emergency', 'crisis'
-            ]
-
             # Identify foundational vs advanced anchors
             foundational = []
             advanced = []
+            corpus = AnchorCorpus.ensure(anchors, corpus)
 
-            for anchor in anchors:
-                title = anchor.get('title', '').lower()
+            for anchor, prepared in zip(anchors, corpus):
                 anchor_id = anchor.get('id', '')
 
-                is_foundational = any(kw in title for kw in foundational_keywords)
-                is_advanced = any(kw in title for kw in advanced_keywords)
+                is_foundational = bool(
+                    prepared.matched('phase.foundational', self.FOUNDATIONAL_KEYWORDS, 'title')
+                )
+                is_advanced = bool(
+                    prepared.matched('phase.advanced', self.ADVANCED_KEYWORDS, 'title')
+                )
 
                 if is_foundational:
                     foundational.append(anchor_id)
@@ -355,7 +378,8 @@ class PhaseAnalyzer:
         self,
         anchors: List[Dict],
         clusters: List[Dict],
-        dependencies: List[Dict]
+        dependencies: List[Dict],
+        corpus: Optional[AnchorCorpus] = None
     ) -> PhaseResult:
         """
         Phase 4: Section Formation - Form lecture sections.
@@ -384,14 +408,17 @@ class PhaseAnalyzer:
             anchors_per_section = total_anchors // target_sections
             remainder = total_anchors % target_sections
 
+            corpus = AnchorCorpus.ensure(anchors, corpus)
+
             current_idx = 0
             for i in range(target_sections):
                 section_size = anchors_per_section + (1 if i < remainder else 0)
                 section_anchors = anchors[current_idx:current_idx + section_size]
 
                 # Determine section theme from anchor titles
-                titles = [a.get('title', '') for a in section_anchors]
-                common_words = self._find_common_theme(titles)
+                common_words = self._common_theme_from_words(
+                    p.title_words for p in corpus.prepared[current_idx:current_idx + section_size]
+                )
 
                 section = {
                     'section_number': i + 1,
@@ -479,15 +506,18 @@ class PhaseAnalyzer:
         """Find common theme from list of titles."""
         if not titles:
             return ""
+        corpus = AnchorCorpus.from_anchors([{'title': t} for t in titles])
+        return self._common_theme_from_words(p.title_words for p in corpus)
 
+    def _common_theme_from_words(self, title_words) -> str:
+        """Most common significant word across already-tokenized titles."""
         # Extract words and find most common
         word_counts = {}
         stop_words = {'the', 'and', 'of', 'in', 'to', 'a', 'for', 'is', 'on', 'with'}
 
-        for title in titles:
-            words = title.lower().split()
+        for words in title_words:
             for word in words:
-                if len(word) > 3 and word not in stop_words:
+                if word not in stop_words:
                     word_counts[word] = word_counts.get(word, 0) + 1
 
         if word_counts:
@@ -541,6 +571,10 @@ class PhaseAnalyzer:
         return "\n".join(lines)
 
 
+register_vocabulary('phase.foundational', PhaseAnalyzer.FOUNDATIONAL_KEYWORDS)
+register_vocabulary('phase.advanced', PhaseAnalyzer.ADVANCED_KEYWORDS)
+
+
 def analyze_anchors(anchors: List[Dict]) -> AnalysisResult:
     """Convenience function to analyze anchors."""
     analyzer = PhaseAnalyzer()
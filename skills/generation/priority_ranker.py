@@ -14,6 +14,9 @@ Usage:
 
     ranker = PriorityRanker()
     result = ranker.rank_anchors(anchors)
+
+    # Share one tokenization pass with the other analyzers
+    result = ranker.rank_anchors(anchors, corpus=AnchorCorpus.from_anchors(anchors))
 """
 
 import re
@@ -21,6 +24,13 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+from skills.generation.anchor_corpus import (
+    AnchorCorpus,
+    PreparedAnchor,
+    prepare_anchor,
+    register_vocabulary,
+)
+
 
 @dataclass
 class PriorityRanking:
@@ -145,29 +155,33 @@ class PriorityRanker:
         """
         self.config_path = config_path
 
-    def rank_anchor(self, anchor: Dict) -> PriorityRanking:
+    def rank_anchor(
+        self,
+        anchor: Dict,
+        prepared: Optional[PreparedAnchor] = None
+    ) -> PriorityRanking:
         """
         Calculate priority ranking for a single anchor.
 
         Args:
             anchor: Anchor dictionary
+            prepared: The anchor's entry in a shared AnchorCorpus
 
         Returns:
             PriorityRanking result
         """
         anchor_id = anchor.get('id', 'unknown')
-        title = anchor.get('title', '').lower()
-        content = anchor.get('full_text', '').lower()
-        full_text = f"{title} {content}"
+        if prepared is None:
+            prepared = prepare_anchor(anchor)
 
         # Calculate client needs score
-        client_needs_score, primary_category, cn_matches = self._score_client_needs(full_text)
+        client_needs_score, primary_category, cn_matches = self._score_client_needs(prepared)
 
         # Calculate high-yield score
-        high_yield_score, hy_matches = self._score_high_yield(full_text)
+        high_yield_score, hy_matches = self._score_high_yield(prepared)
 
         # Check for safety-critical content
-        is_safety_critical, safety_matches = self._check_safety_critical(full_text)
+        is_safety_critical, safety_matches = self._check_safety_critical(prepared)
 
         # Calculate overall priority score
         base_score = (client_needs_score * 0.4) + (high_yield_score * 0.3)
@@ -177,10 +191,9 @@ class PriorityRanker:
             base_score = min(100, base_score + 30)
 
         # Title match bonus (content in title is more important)
-        title_bonus = 0
-        for indicator in self.HIGH_YIELD_INDICATORS:
-            if indicator in title:
-                title_bonus += 5
+        title_bonus = 5 * len(prepared.matched_in_order(
+            'priority.high_yield', self.HIGH_YIELD_INDICATORS, 'title'
+        ))
         base_score = min(100, base_score + title_bonus)
 
         # Determine priority level
@@ -217,16 +230,13 @@ class PriorityRanker:
             rationale="; ".join(rationale_parts) if rationale_parts else "General nursing content"
         )
 
-    def _score_client_needs(self, text: str) -> Tuple[float, str, List[str]]:
+    def _score_client_needs(self, prepared: PreparedAnchor) -> Tuple[float, str, List[str]]:
         """Score based on Client Needs category matching."""
         category_scores = {}
         category_matches = {}
 
         for category, info in self.CLIENT_NEEDS.items():
-            matches = []
-            for keyword in info['keywords']:
-                if keyword in text:
-                    matches.append(keyword)
+            matches = prepared.matched_in_order(f"priority.{category}", info['keywords'])
 
             # Weight by category importance on exam
             score = len(matches) * info['weight'] * 20
@@ -242,31 +252,30 @@ class PriorityRanker:
 
         return min(100, total_score), best_category[0], category_matches[best_category[0]]
 
-    def _score_high_yield(self, text: str) -> Tuple[float, List[str]]:
+    def _score_high_yield(self, prepared: PreparedAnchor) -> Tuple[float, List[str]]:
         """Score based on high-yield indicators."""
-        matches = []
-        for indicator in self.HIGH_YIELD_INDICATORS:
-            if indicator in text:
-                matches.append(indicator)
+        matches = prepared.matched_in_order('priority.high_yield', self.HIGH_YIELD_INDICATORS)
 
         score = len(matches) * 8  # 8 points per high-yield match
         return min(100, score), matches
 
-    def _check_safety_critical(self, text: str) -> Tuple[bool, List[str]]:
+    def _check_safety_critical(self, prepared: PreparedAnchor) -> Tuple[bool, List[str]]:
         """Check for safety-critical content."""
-        matches = []
-        for topic in self.SAFETY_CRITICAL:
-            if topic in text:
-                matches.append(topic)
+        matches = prepared.matched_in_order('priority.safety_critical', self.SAFETY_CRITICAL)
 
         return len(matches) >= 1, matches
 
-    def rank_anchors(self, anchors: List[Dict]) -> RankingResult:
+    def rank_anchors(
+        self,
+        anchors: List[Dict],
+        corpus: Optional[AnchorCorpus] = None
+    ) -> RankingResult:
         """
         Rank multiple anchors by priority.
 
         Args:
             anchors: List of anchor dictionaries
+            corpus: Shared AnchorCorpus for anchors
 
         Returns:
             RankingResult with all rankings
@@ -279,8 +288,9 @@ class PriorityRanker:
             'low': 0
         }
 
-        for anchor in anchors:
-            ranking = self.rank_anchor(anchor)
+        corpus = AnchorCorpus.ensure(anchors, corpus)
+        for anchor, prepared in zip(anchors, corpus):
+            ranking = self.rank_anchor(anchor, prepared)
             rankings.append(ranking)
             priority_distribution[ranking.priority_level] += 1
 
@@ -358,6 +368,12 @@ class PriorityRanker:
         return "\n".join(lines)
 
 
+for _category, _info in PriorityRanker.CLIENT_NEEDS.items():
+    register_vocabulary(f"priority.{_category}", _info['keywords'])
+register_vocabulary('priority.high_yield', PriorityRanker.HIGH_YIELD_INDICATORS)
+register_vocabulary('priority.safety_critical', PriorityRanker.SAFETY_CRITICAL)
+
+
 def rank_anchors(anchors: List[Dict]) -> RankingResult:
     """Convenience function to rank anchors."""
     ranker = PriorityRanker()
@@ -5,14 +5,36 @@ Template-based slide generation with visual integration
 Requirements:
 - python-pptx (pip install python-pptx)
 - Pillow (pip install Pillow)
+
+Progress (sections started/finished with ETA, files written) is also
+emitted on the shared EventBus; set THEATER_PIPELINE_EVENTS_JSONL or
+THEATER_PIPELINE_EVENTS_PORT to record or stream it.
+
+Sections can also be spread over several machines through the work
+queue (skills/utilities/work_queue.py): enqueue_sections() adds one job
+per integrated blueprint and run_section_job() is the worker handler
+(run_theater_pipeline.py --enqueue sections / --worker).
+
+Finished sections are recorded in the timing history, and
+estimate_sections() predicts the wall clock and peak memory of
+populating every section on N queue workers from it
+(python step12_powerpoint_population.py --estimate [--workers N]).
 """
 
 import os
 import re
 import json
 import shutil
+import argparse
 from pathlib import Path
 from datetime import datetime
+
+from skills.utilities.atomic_write import atomic_save, atomic_write_text
+from skills.utilities.cost_estimator import (
+    RUNNER_STEP12, CostEstimator, TimingRecorder, WorkItem, blueprint_sizes, history_path
+)
+from skills.utilities.event_bus import SECTION_FINISHED, SECTION_STARTED, Progress, get_event_bus
+from skills.utilities.work_queue import Job, content_hash, file_hash
 from copy import deepcopy
 from pptx import Presentation
 from pptx.util import Pt, Inches, Emu
@@ -2328,12 +2350,118 @@ def populate_section(template_path, blueprint_path, output_path, diagrams_folder
     log_entries.append(f"  Hidden duplicate TIER 1 textboxes")
 
     # Save presentation
-    prs.save(output_path)
+    atomic_save(prs, output_path)
     log_entries.append(f"  Final slide count: {len(prs.slides)}")
     log_entries.append(f"  Saved: {output_path}")
 
     return True, section_name
 
+# ============================================
+# COST ESTIMATE
+# ============================================
+
+def estimate_sections(workers=None):
+    """
+    Predict wall clock and peak memory of populating every integrated blueprint.
+
+    Args:
+        workers: Sections populated at once (queue workers); by default
+            the recommended count, up to one per CPU
+
+    Returns:
+        BatchEstimate
+    """
+    integrated_folder = Path(PRODUCTION_FOLDER) / "integrated"
+    items = []
+    for blueprint_file in sorted(integrated_folder.glob("step10_integrated_*.txt")):
+        _, slides_data = parse_blueprint(str(blueprint_file))
+        items.append(WorkItem(blueprint_file.name, blueprint_sizes(slides_data)))
+    estimator = CostEstimator(history_path())
+    return estimator.plan(RUNNER_STEP12, items, workers, max_workers=os.cpu_count() or 1)
+
+
+# ============================================
+# WORK QUEUE
+# ============================================
+
+# Work-queue job kind for one section's step 12
+SECTION_JOB = "section"
+
+
+def enqueue_sections(broker):
+    """
+    Enqueue one step 12 job per integrated blueprint.
+
+    Each job is keyed by a hash of its blueprint, the templates, the
+    diagrams folder and the config, so unchanged sections that were
+    already populated are not redone and any changed input re-runs them.
+
+    Returns:
+        Ids of the jobs added or reset
+    """
+    production_path = Path(PRODUCTION_FOLDER)
+    integrated_folder = production_path / "integrated"
+    diagrams_folder = production_path / "diagrams"
+    diagrams = {
+        path.relative_to(diagrams_folder).as_posix(): file_hash(path)
+        for path in sorted(diagrams_folder.rglob("*")) if path.is_file()
+    }
+    shared_hash = content_hash(file_hash(TEMPLATE_PATH, VISUAL_TEMPLATE_PATH), diagrams, CONFIG)
+    added = []
+    for section_num, blueprint_file in enumerate(sorted(integrated_folder.glob("step10_integrated_*.txt")), 1):
+        params = {"blueprint": blueprint_file.name, "section_num": section_num}
+        job = Job(
+            job_id=f"{SECTION_JOB}:{blueprint_file.stem}:step12",
+            kind=SECTION_JOB,
+            params=params,
+            input_hash=content_hash(file_hash(blueprint_file), shared_hash, params),
+            priority=section_num
+        )
+        if broker.enqueue(job):
+            added.append(job.job_id)
+    return added
+
+
+def run_section_job(job):
+    """
+    Worker handler: populate one section from the shared production folder.
+
+    Returns:
+        (result, {path relative to the production folder: pptx file})
+    """
+    production_path = Path(PRODUCTION_FOLDER)
+    blueprint_file = production_path / "integrated" / job.params["blueprint"]
+    section_name, _ = parse_blueprint(str(blueprint_file))
+    output_path = production_path / "powerpoints" / f"{sanitize_filename(section_name)}.pptx"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    log_entries = []
+    success, _ = populate_section(
+        TEMPLATE_PATH,
+        str(blueprint_file),
+        str(output_path),
+        str(production_path / "diagrams"),
+        job.params["section_num"],
+        log_entries
+    )
+    if not success:
+        raise RuntimeError("; ".join(e.strip() for e in log_entries if "ERROR" in e) or "Population failed")
+    return {"section": section_name, "log": log_entries}, {f"powerpoints/{output_path.name}": output_path}
+
+
+def collect_sections(broker):
+    """
+    Write the decks of finished section jobs into the production folder.
+
+    Section artifacts are named relative to PRODUCTION_FOLDER, where
+    step 12 itself writes them.
+
+    Returns:
+        Paths written
+    """
+    return broker.collect_artifacts(PRODUCTION_FOLDER, kind=SECTION_JOB)
+
+
 def main():
     """Main execution function."""
     log_entries = []
@@ -2382,6 +2510,9 @@ def main():
 
     success_count = 0
     error_count = 0
+    events = get_event_bus()
+    events.subscribe(TimingRecorder(history_path(), RUNNER_STEP12))
+    progress = Progress(total=len(blueprint_files))
 
     # Process each section
     for section_num, blueprint_file in enumerate(blueprint_files, 1):
@@ -2389,10 +2520,15 @@ def main():
         log_entries.append(f"PROCESSING SECTION {section_num}")
         log_entries.append("-" * 60)
         log_entries.append(f"  Blueprint: {blueprint_file.name}")
+        section_started = datetime.now()
+        events.emit(SECTION_STARTED, section=section_num, blueprint=blueprint_file.name)
+        status = "failed"
+        sizes = None
 
         try:
             # Parse to get section name for output filename
-            section_name, _ = parse_blueprint(str(blueprint_file))
+            section_name, slides_data = parse_blueprint(str(blueprint_file))
+            sizes = blueprint_sizes(slides_data).to_dict()
             safe_name = sanitize_filename(section_name)
             output_path = powerpoints_folder / f"{safe_name}.pptx"
 
@@ -2407,6 +2543,8 @@ def main():
 
             if success:
                 success_count += 1
+                status = "completed"
+                events.file_written(output_path, section=section_num)
             else:
                 error_count += 1
 
@@ -2416,6 +2554,12 @@ def main():
             import traceback
             log_entries.append(f"  Traceback: {traceback.format_exc()}")
 
+        events.emit(
+            SECTION_FINISHED, section=section_num, blueprint=blueprint_file.name,
+            status=status, sizes=sizes,
+            duration_seconds=(datetime.now() - section_started).total_seconds(),
+            **progress.advance()
+        )
         log_entries.append("")
 
     # Summary
@@ -2436,8 +2580,8 @@ def main():
 
     # Write log file to logs/ subfolder
     log_path = logs_folder / "population_log.txt"
-    with open(log_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(log_entries))
+    atomic_write_text(log_path, '\n'.join(log_entries))
+    events.file_written(log_path)
 
     print(f"\nPopulation complete!")
     print(f"PowerPoints: {powerpoints_folder}")
@@ -2446,4 +2590,14 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Step 12: populate section PowerPoints from blueprints")
+    parser.add_argument('--estimate', action='store_true',
+                        help='Predict wall clock and peak memory from the timing history '
+                             'and exit without populating')
+    parser.add_argument('--workers', type=int,
+                        help='Queue workers to estimate for (default: recommended count)')
+    args = parser.parse_args()
+    if args.estimate:
+        print(estimate_sections(args.workers).summary())
+    else:
+        main()
@@ -35,6 +35,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+from skills.utilities.atomic_write import atomic_save
+
 try:
     from pptx import Presentation
     from pptx.util import Inches, Pt
@@ -866,12 +868,8 @@ def create_theater_presentation(
             year=year
         )
 
-    # Ensure output directory exists
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Save presentation
-    prs.save(str(output_path))
+    # Save presentation (atomic: a crash never leaves a partial deck)
+    output_path = atomic_save(prs, output_path)
 
     return output_path
 
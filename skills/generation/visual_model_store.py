@@ -0,0 +1,180 @@
+"""
+Visual Model Store - Versioned, pickle-free artifacts for the visual recommender.
+
+The NaiveBayes visual classifier is a handful of small numeric arrays. This
+module writes them as an uncompressed .npz archive with a JSON metadata
+header (format version, feature schema, training-data hash, training
+stats) stored as a uint8 member, and reads them back with
+allow_pickle=False. Without NumPy the same header and arrays are written
+as a .json file.
+
+Readers check the header before touching the arrays, so a worker can tell
+whether an artifact is stale (different feature schema or training data)
+without loading it.
+
+Usage:
+    from skills.generation.visual_model_store import (
+        check_artifact_path,
+        default_artifact_path,
+        read_artifact,
+        read_metadata,
+        write_artifact,
+    )
+
+    write_artifact(path, {'class_priors': priors, ...}, metadata)
+    header = read_metadata(path)
+    if header and header['training_hash'] == expected_hash:
+        artifact = read_artifact(path)
+"""
+
+import json
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from skills.parsing.standards_cache import default_cache_dir
+from skills.utilities.atomic_write import atomic_write
+
+
+# Bump when the artifact layout (member names, header keys) changes
+ARTIFACT_FORMAT_VERSION = 1
+
+ARTIFACT_BASENAME = "visual_recommender"
+
+# Archive member holding the JSON header
+METADATA_MEMBER = "metadata"
+
+# Artifact formats; anything else (e.g. a legacy .pkl) is rejected
+ARTIFACT_SUFFIXES = (".npz", ".json")
+
+
+@dataclass
+class ModelArtifact:
+    """Header plus named arrays (NumPy arrays, or lists without NumPy)."""
+    metadata: Dict[str, Any]
+    arrays: Dict[str, Any]
+
+
+def default_artifact_path(cache_dir: Optional[Union[str, Path]] = None) -> Path:
+    """Artifact path in the pipeline cache dir (.npz with NumPy, else .json)."""
+    directory = Path(cache_dir) if cache_dir else default_cache_dir()
+    suffix = ".npz" if NUMPY_AVAILABLE else ".json"
+    return directory / f"{ARTIFACT_BASENAME}{suffix}"
+
+
+def check_artifact_path(path: Union[str, Path]) -> Path:
+    """
+    Return path as a Path if it names a supported artifact format.
+
+    Raises:
+        ValueError: If the suffix is not .npz or .json
+    """
+    path = Path(path)
+    if path.suffix not in ARTIFACT_SUFFIXES:
+        raise ValueError(f"Model artifacts must be .npz or .json, not {path.name!r}")
+    return path
+
+
+def _is_npz(path: Path) -> bool:
+    return path.suffix == ".npz"
+
+
+def write_artifact(
+    path: Union[str, Path],
+    arrays: Dict[str, Any],
+    metadata: Dict[str, Any]
+) -> Optional[Path]:
+    """
+    Write arrays and header atomically (see atomic_write).
+
+    Args:
+        path: Target .npz or .json path (.npz requires NumPy)
+        arrays: Member name -> array-like of floats
+        metadata: JSON-serializable header
+
+    Returns:
+        Path written, or None if the directory is not writable
+
+    Raises:
+        ValueError: If path is not .npz/.json, or .npz without NumPy
+    """
+    path = check_artifact_path(path)
+    header = dict(metadata, format_version=ARTIFACT_FORMAT_VERSION)
+    if _is_npz(path) and not NUMPY_AVAILABLE:
+        raise ValueError("Writing .npz model artifacts requires NumPy")
+
+    try:
+        with atomic_write(path, 'wb') as f:
+            if _is_npz(path):
+                members = {name: np.asarray(value, dtype=float) for name, value in arrays.items()}
+                members[METADATA_MEMBER] = np.frombuffer(
+                    json.dumps(header, sort_keys=True).encode('utf-8'), dtype=np.uint8
+                )
+                np.savez(f, **members)
+            else:
+                payload = {
+                    METADATA_MEMBER: header,
+                    'arrays': {name: _to_list(value) for name, value in arrays.items()},
+                }
+                f.write(json.dumps(payload, sort_keys=True).encode('utf-8'))
+    except OSError:
+        return None
+    return path
+
+
+def _to_list(value: Any) -> Any:
+    return value.tolist() if hasattr(value, 'tolist') else value
+
+
+def _read(path: Path, with_arrays: bool) -> Optional[ModelArtifact]:
+    if not path.exists():
+        return None
+    try:
+        if _is_npz(path):
+            if not NUMPY_AVAILABLE:
+                return None
+            with np.load(path, allow_pickle=False) as archive:
+                header = json.loads(archive[METADATA_MEMBER].tobytes().decode('utf-8'))
+                arrays = {}
+                if with_arrays:
+                    arrays = {name: archive[name] for name in archive.files if name != METADATA_MEMBER}
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            header = payload[METADATA_MEMBER]
+            arrays = payload['arrays'] if with_arrays else {}
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+
+    if not isinstance(header, dict) or header.get('format_version') != ARTIFACT_FORMAT_VERSION:
+        return None
+    return ModelArtifact(metadata=header, arrays=arrays)
+
+
+def read_metadata(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Read only the header of an artifact.
+
+    Returns:
+        Header dict, or None on a missing, unreadable or other-version file
+    """
+    artifact = _read(Path(path), with_arrays=False)
+    return artifact.metadata if artifact else None
+
+
+def read_artifact(path: Union[str, Path]) -> Optional[ModelArtifact]:
+    """
+    Read header and arrays (never unpickles).
+
+    Returns:
+        ModelArtifact, or None on a missing, unreadable or other-version file
+    """
+    return _read(Path(path), with_arrays=True)
@@ -12,7 +12,8 @@ Usage:
     from skills.generation.visual_pattern_matcher import (
         identify_visual_opportunity, score_visual_fit, get_visual_type,
         score_visual_opportunity_multifactor, rank_slides_for_visuals,
-        apply_proactive_triggers, generate_fallback_visual
+        apply_proactive_triggers, generate_fallback_visual,
+        score_deck, rank_scored_slides
     )
 """
 
@@ -21,6 +22,9 @@ from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+from skills.utilities.feature_cache import cached_analysis
+from skills.utilities.regex_registry import compile_pattern, compile_patterns
+
 
 class VisualType(Enum):
     """Supported visual aid types."""
@@ -155,6 +159,30 @@ VISUAL_PATTERNS = {
     ]
 }
 
+# Precompiled forms of VISUAL_PATTERNS (case-insensitive and exact)
+_VISUAL_PATTERN_RES = {
+    vt: compile_patterns(patterns, re.IGNORECASE) for vt, patterns in VISUAL_PATTERNS.items()
+}
+_VISUAL_PATTERN_RES_EXACT = {
+    vt: compile_patterns(patterns) for vt, patterns in VISUAL_PATTERNS.items()
+}
+
+_TOP_LEVEL_BULLET_RES = compile_patterns([
+    r'^[\*\-\•]\s+',
+    r'^\d+\.\s+',
+    r'^\d+\)\s+',
+    r'^[a-zA-Z]\.\s+',
+    r'^[a-zA-Z]\)\s+'
+])
+_VS_PAIR_RE = compile_pattern(r'\b\w+\s+(?:vs\.?|versus)\s+\w+', re.IGNORECASE)
+_COLON_ITEM_RE = compile_pattern(r'^[\*\-\•]?\s*([A-Za-z][A-Za-z0-9\s]+):', re.MULTILINE)
+_PROCESS_RES = compile_patterns([
+    r'\bstep\s*\d+', r'\bfirst\b', r'\bthen\b', r'\bnext\b',
+    r'\bfinally\b', r'\bleads?\s+to\b', r'\bresults?\s+in\b',
+    r'\bfollowed\s+by\b', r'\bafter\b', r'\bbefore\b'
+])
+_WORD_RE = compile_pattern(r'\b\w+\b')
+
 
 def identify_visual_opportunity(
     slide_content: str
@@ -199,11 +227,11 @@ def score_visual_fit(
     if visual_type not in VISUAL_PATTERNS:
         return 0.0
 
-    patterns = VISUAL_PATTERNS[visual_type]
+    patterns = _VISUAL_PATTERN_RES[visual_type]
     matches = 0
 
     for pattern in patterns:
-        if re.search(pattern, content, re.IGNORECASE):
+        if pattern.search(content):
             matches += 1
 
     # Score based on pattern matches
@@ -264,14 +292,6 @@ def _count_bullets(body: str) -> int:
     if not body:
         return 0
 
-    bullet_patterns = [
-        r'^[\*\-\•]\s+',
-        r'^\d+\.\s+',
-        r'^\d+\)\s+',
-        r'^[a-zA-Z]\.\s+',
-        r'^[a-zA-Z]\)\s+'
-    ]
-
     count = 0
     for line in body.split('\n'):
         stripped = line.strip()
@@ -280,8 +300,8 @@ def _count_bullets(body: str) -> int:
         # Skip indented (nested) bullets
         if line.startswith('  ') or line.startswith('\t'):
             continue
-        for pattern in bullet_patterns:
-            if re.match(pattern, stripped):
+        for pattern in _TOP_LEVEL_BULLET_RES:
+            if pattern.match(stripped):
                 count += 1
                 break
     return count
@@ -293,12 +313,12 @@ def _has_multiple_items(body: str, min_count: int) -> bool:
         return False
 
     # Check for "X vs Y" or "X versus Y" patterns
-    vs_matches = re.findall(r'\b\w+\s+(?:vs\.?|versus)\s+\w+', body, re.IGNORECASE)
+    vs_matches = _VS_PAIR_RE.findall(body)
     if vs_matches:
         return True
 
     # Check for colon-prefixed items (e.g., "Drug A: ...\nDrug B: ...")
-    colon_items = re.findall(r'^[\*\-\•]?\s*([A-Za-z][A-Za-z0-9\s]+):', body, re.MULTILINE)
+    colon_items = _COLON_ITEM_RE.findall(body)
     return len(colon_items) >= min_count
 
 
@@ -324,14 +344,8 @@ def _has_process_indicators(body: str, min_indicators: int) -> bool:
     if not body:
         return False
 
-    process_patterns = [
-        r'\bstep\s*\d+', r'\bfirst\b', r'\bthen\b', r'\bnext\b',
-        r'\bfinally\b', r'\bleads?\s+to\b', r'\bresults?\s+in\b',
-        r'\bfollowed\s+by\b', r'\bafter\b', r'\bbefore\b'
-    ]
-
     body_lower = body.lower()
-    count = sum(1 for p in process_patterns if re.search(p, body_lower))
+    count = sum(1 for p in _PROCESS_RES if p.search(body_lower))
     return count >= min_indicators
 
 
@@ -341,7 +355,7 @@ def _calculate_content_density(body: str) -> float:
         return 0.0
 
     lines = [l for l in body.split('\n') if l.strip()]
-    words = re.findall(r'\b\w+\b', body)
+    words = _WORD_RE.findall(body)
 
     if not lines:
         return 0.0
@@ -399,6 +413,9 @@ def _calculate_position_score(slide_number: int, total_slides: int) -> float:
 # MULTI-FACTOR SCORING FUNCTIONS
 # =============================================================================
 
+@cached_analysis('score_visual_opportunity_multifactor', key=lambda slide, slide_number=0, total_slides=0: (
+    slide.get('header', ''), slide.get('body', ''), slide.get('slide_type', ''), slide_number, total_slides
+), types=(VisualOpportunityScore, VisualType))
 def score_visual_opportunity_multifactor(
     slide: Dict[str, Any],
     slide_number: int = 0,
@@ -442,8 +459,8 @@ def score_visual_opportunity_multifactor(
 
     # Calculate individual factor scores
     all_keyword_scores = {}
-    for visual_type, patterns in VISUAL_PATTERNS.items():
-        matches = sum(1 for p in patterns if re.search(p, content_lower))
+    for visual_type, patterns in _VISUAL_PATTERN_RES_EXACT.items():
+        matches = sum(1 for p in patterns if p.search(content_lower))
         all_keyword_scores[visual_type] = min(1.0, matches / 3)
 
     # Find best visual type by keyword
@@ -504,6 +521,38 @@ def score_visual_opportunity_multifactor(
     )
 
 
+def score_deck(
+    slides: List[Dict[str, Any]]
+) -> List[Tuple[int, VisualOpportunityScore]]:
+    """
+    Score every slide in a section once, in deck order.
+
+    This is the rule-based pass shared by rank_slides_for_visuals and
+    MLVisualRecommender.recommend_deck.
+
+    Args:
+        slides: List of slide dictionaries
+
+    Returns:
+        List of (slide_number, VisualOpportunityScore), one per slide
+    """
+    total_slides = len(slides)
+    scored = []
+    for i, slide in enumerate(slides):
+        slide_num = slide.get('slide_number', i + 1)
+        scored.append((slide_num, score_visual_opportunity_multifactor(slide, slide_num, total_slides)))
+    return scored
+
+
+def rank_scored_slides(
+    scored: List[Tuple[int, VisualOpportunityScore]]
+) -> List[Tuple[int, VisualOpportunityScore]]:
+    """Drop NONE scores and sort by total score descending (stable)."""
+    ranked = [(num, score) for num, score in scored if score.visual_type != VisualType.NONE]
+    ranked.sort(key=lambda x: x[1].total_score, reverse=True)
+    return ranked
+
+
 def rank_slides_for_visuals(
     slides: List[Dict[str, Any]],
     min_visuals: int = 2,
@@ -516,6 +565,10 @@ def rank_slides_for_visuals(
     - Priority ranking when multiple types match
     - Fallback visual generation when quota not met
 
+    Quota-aware selection over the ranking is done by
+    visual_selection.select_visuals (via MLVisualRecommender.recommend_deck,
+    which reuses the same score_deck pass).
+
     Args:
         slides: List of slide dictionaries
         min_visuals: Minimum visuals required
@@ -524,21 +577,7 @@ def rank_slides_for_visuals(
     Returns:
         Sorted list of (slide_number, VisualOpportunityScore) tuples
     """
-    total_slides = len(slides)
-    max_visuals = int(total_slides * max_percentage)
-
-    scored_slides = []
-
-    for i, slide in enumerate(slides):
-        slide_num = slide.get('slide_number', i + 1)
-        score = score_visual_opportunity_multifactor(slide, slide_num, total_slides)
-        if score.visual_type != VisualType.NONE:
-            scored_slides.append((slide_num, score))
-
-    # Sort by total score descending
-    scored_slides.sort(key=lambda x: x[1].total_score, reverse=True)
-
-    return scored_slides
+    return rank_scored_slides(score_deck(slides))
 
 
 def apply_proactive_triggers(slide: Dict[str, Any]) -> Optional[Tuple[VisualType, str]]:
@@ -0,0 +1,183 @@
+"""
+Visual Selection - Quota-aware choice of which slides get visuals.
+
+Provides:
+- select_visuals(): one pass over a section's candidates choosing slides
+  and types under a minimum/maximum quota and the variety rule (at most
+  max_run visuals of one type in a row), shared by step 9 and part 2
+- Preference order: reaching the minimum, fewest variety violations,
+  highest primary score, highest fallback score
+- Fallback candidates, used only to reach the minimum
+
+Usage:
+    from skills.generation.visual_selection import VisualCandidate, select_visuals
+
+    candidates = [
+        VisualCandidate(3, [('TABLE', 82.0), ('FLOWCHART', 61.0)]),
+        VisualCandidate(9, [('TIMELINE', 0.35)], fallback=True),
+    ]
+    selection = select_visuals(candidates, minimum=2, maximum=6)
+    for pick in selection.picks:
+        print(pick.slide_number, pick.visual_type, pick.selected_by)
+
+    # Continue the variety rule from the previous section's visuals
+    select_visuals(next_candidates, 1, 4, lead_in=selection.visual_types)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# Default variety rule: at most this many consecutive visuals of one type
+MAX_TYPE_RUN = 2
+
+
+@dataclass
+class VisualCandidate:
+    """A slide that may receive a visual."""
+    slide_number: int
+    options: List[Tuple[str, float]]  # (visual type, score), preferred first
+    fallback: bool = False  # only used to reach the minimum
+
+
+@dataclass
+class VisualPick:
+    """A selected slide and the visual type assigned to it."""
+    slide_number: int
+    visual_type: str
+    score: float
+    option_rank: int = 0  # index into the candidate's options
+    fallback: bool = False
+
+    @property
+    def selected_by(self) -> str:
+        return 'fallback' if self.fallback else 'score'
+
+
+@dataclass
+class VisualSelection:
+    """Result of select_visuals, picks in candidate (deck) order."""
+    picks: List[VisualPick] = field(default_factory=list)
+    minimum: int = 0
+    maximum: int = 0
+    variety_violations: int = 0
+
+    @property
+    def slide_numbers(self) -> List[int]:
+        return [pick.slide_number for pick in self.picks]
+
+    @property
+    def visual_types(self) -> List[str]:
+        return [pick.visual_type for pick in self.picks]
+
+    @property
+    def fallback_count(self) -> int:
+        return sum(1 for pick in self.picks if pick.fallback)
+
+    @property
+    def meets_minimum(self) -> bool:
+        return len(self.picks) >= self.minimum
+
+    def quota_summary(self, total_slides: int) -> Dict[str, Any]:
+        """Quota fields as reported by recommend_deck."""
+        return {
+            'total_slides': total_slides,
+            'minimum': self.minimum,
+            'maximum': self.maximum,
+            'selected': len(self.picks),
+            'fallback_added': self.fallback_count,
+            'meets_minimum': self.meets_minimum,
+            'variety_violations': self.variety_violations
+        }
+
+
+def _lead_in_state(lead_in: Sequence[str], max_run: int) -> Tuple[Optional[str], int]:
+    if not lead_in:
+        return None, 0
+    last = lead_in[-1]
+    run = 0
+    for visual_type in reversed(lead_in):
+        if visual_type != last or run > max_run:
+            break
+        run += 1
+    return last, run
+
+
+def select_visuals(
+    candidates: Sequence[VisualCandidate],
+    minimum: int,
+    maximum: int,
+    max_run: int = MAX_TYPE_RUN,
+    lead_in: Sequence[str] = ()
+) -> VisualSelection:
+    """
+    Choose slides and visual types for a section under quota and variety.
+
+    Args:
+        candidates: Candidate slides in deck order
+        minimum: Visuals wanted at least (fallback candidates fill up to it)
+        maximum: Visuals allowed at most
+        max_run: Longest allowed run of one visual type
+        lead_in: Visual types placed just before these candidates (e.g.
+            the previous section's picks), continuing the variety rule
+
+    Returns:
+        VisualSelection (minimum is clamped to maximum)
+    """
+    maximum = max(0, maximum)
+    minimum = max(0, min(minimum, maximum))
+
+    # State (count, last type, run, fallback used) -> (violations, primary, fallback)
+    last, run = _lead_in_state(lead_in, max_run)
+    start = (0, last, run, False)
+    layer: Dict[tuple, Tuple[int, float, float]] = {start: (0, 0.0, 0.0)}
+    history: List[Dict[tuple, Tuple[tuple, int]]] = []
+
+    for candidate in candidates:
+        next_layer = dict(layer)
+        back = {state: (state, -1) for state in layer}
+        for state, (violations, primary, fallback) in layer.items():
+            count, last_type, run_length, used_fallback = state
+            if count >= maximum:
+                continue
+            uses_fallback = used_fallback or candidate.fallback
+            if uses_fallback and count >= minimum:
+                continue
+            for rank, (visual_type, score) in enumerate(candidate.options):
+                new_run = run_length + 1 if visual_type == last_type else 1
+                value = (
+                    violations - (new_run > max_run),
+                    primary + (0.0 if candidate.fallback else score),
+                    fallback + (score if candidate.fallback else 0.0)
+                )
+                new_state = (count + 1, visual_type, min(new_run, max_run + 1), uses_fallback)
+                current = next_layer.get(new_state)
+                if current is None or value > current:
+                    next_layer[new_state] = value
+                    back[new_state] = (state, rank)
+        history.append(back)
+        layer = next_layer
+
+    best = max(layer, key=lambda s: (min(s[0], minimum), layer[s]))
+
+    picks: List[VisualPick] = []
+    state = best
+    for candidate, back in zip(reversed(candidates), reversed(history)):
+        state, rank = back[state]
+        if rank >= 0:
+            visual_type, score = candidate.options[rank]
+            picks.append(VisualPick(
+                slide_number=candidate.slide_number,
+                visual_type=visual_type,
+                score=score,
+                option_rank=rank,
+                fallback=candidate.fallback
+            ))
+    picks.reverse()
+
+    return VisualSelection(
+        picks=picks,
+        minimum=minimum,
+        maximum=maximum,
+        variety_violations=-layer[best][0]
+    )
@@ -0,0 +1,210 @@
+"""
+Standards Cache - Persistent cache of parsed and validated standards.
+
+Provides:
+- load_cached_standards() / store_cached_standards(): parsed standards and
+  the validate_all_standards() result persisted as JSON across processes
+- compute_cache_key(): SHA-256 over the standards/config sources and
+  CACHE_FORMAT_VERSION
+- clear_standards_cache(): remove the cached entry
+
+Usage:
+    from skills.parsing.standards_cache import (
+        load_cached_standards,
+        store_cached_standards,
+    )
+
+    entry = load_cached_standards()
+    if entry is None:
+        parsed = StandardsParser().parse_all_standards()
+        validation = StandardsValidator().validate_all_standards()
+        store_cached_standards(parsed, validation)
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from skills.parsing.standards_parser import (
+    CharacterLimits, DeliveryMode, FixedSlideSpec, ParsedStandards,
+    PresenterNotesRequirements, TimingGuidance
+)
+from skills.utilities.atomic_write import atomic_write_json
+from skills.validation.standards_validator import AllStandardsResult, StandardsValidationResult
+
+
+# Bump when ParsedStandards / AllStandardsResult change shape
+CACHE_FORMAT_VERSION = 2
+
+CACHE_FILENAME = "standards_cache.json"
+
+# Environment override for the cache directory (e.g. shared worker scratch)
+CACHE_DIR_ENV = "THEATER_PIPELINE_CACHE_DIR"
+
+# Source globs (relative to project root) that feed standards parsing/validation
+SOURCE_GLOBS = ("standards/**/*.md", "config/*.yaml")
+
+
+@dataclass
+class StandardsCacheEntry:
+    """A cached parse + validation result and the key it was built from."""
+    key: str
+    parsed_standards: ParsedStandards
+    validation_result: AllStandardsResult
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StandardsCacheEntry':
+        """Rebuild an entry written by to_dict() (KeyError/TypeError if malformed)."""
+        parsed = data['parsed_standards']
+        validation = data['validation_result']
+
+        def optional(kind, value):
+            return kind(**value) if value is not None else None
+
+        return cls(
+            key=data['key'],
+            parsed_standards=ParsedStandards(
+                success=parsed['success'],
+                delivery_modes={
+                    name: DeliveryMode(**mode) for name, mode in parsed['delivery_modes'].items()
+                },
+                fixed_slides={
+                    name: FixedSlideSpec(**spec) for name, spec in parsed['fixed_slides'].items()
+                },
+                timing_guidance=optional(TimingGuidance, parsed['timing_guidance']),
+                character_limits=optional(CharacterLimits, parsed['character_limits']),
+                presenter_notes=optional(PresenterNotesRequirements, parsed['presenter_notes']),
+                errors=parsed['errors'],
+                warnings=parsed['warnings'],
+                source_files=parsed['source_files'],
+            ),
+            validation_result=AllStandardsResult(
+                is_valid=validation['is_valid'],
+                overall_score=validation['overall_score'],
+                results={
+                    name: StandardsValidationResult(**result)
+                    for name, result in validation['results'].items()
+                },
+                summary=validation['summary'],
+            ),
+        )
+
+
+def default_base_path() -> Path:
+    """Project root (same default as StandardsParser/StandardsValidator)."""
+    return Path(__file__).parent.parent.parent
+
+
+def default_cache_dir(base_path: Optional[Path] = None) -> Path:
+    """Cache directory: $THEATER_PIPELINE_CACHE_DIR or outputs/cache."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    return Path(base_path or default_base_path()) / "outputs" / "cache"
+
+
+def list_source_files(base_path: Optional[Path] = None) -> List[Path]:
+    """List every file whose content affects the cached result, sorted."""
+    base = Path(base_path or default_base_path())
+    files = set()
+    for pattern in SOURCE_GLOBS:
+        files.update(p for p in base.glob(pattern) if p.is_file())
+    return sorted(files)
+
+
+def compute_cache_key(base_path: Optional[Path] = None) -> str:
+    """
+    Hash the content of all standards and config source files.
+
+    Args:
+        base_path: Project root
+
+    Returns:
+        Hex digest identifying the current set of source files
+    """
+    base = Path(base_path or default_base_path())
+    digest = hashlib.sha256(f"v{CACHE_FORMAT_VERSION}".encode())
+    for path in list_source_files(base):
+        digest.update(path.relative_to(base).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _cache_path(base_path: Optional[Path], cache_dir: Optional[Union[str, Path]]) -> Path:
+    directory = Path(cache_dir) if cache_dir else default_cache_dir(base_path)
+    return directory / CACHE_FILENAME
+
+
+def load_cached_standards(
+    base_path: Optional[Path] = None,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> Optional[StandardsCacheEntry]:
+    """
+    Load the cached entry if it matches the current source files.
+
+    Args:
+        base_path: Project root
+        cache_dir: Override cache directory
+
+    Returns:
+        StandardsCacheEntry, or None on miss, stale key or unreadable file
+    """
+    path = _cache_path(base_path, cache_dir)
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = StandardsCacheEntry.from_dict(json.load(f))
+    except Exception:
+        return None
+
+    if entry.key != compute_cache_key(base_path):
+        return None
+    return entry
+
+
+def store_cached_standards(
+    parsed_standards: ParsedStandards,
+    validation_result: AllStandardsResult,
+    base_path: Optional[Path] = None,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> Optional[Path]:
+    """
+    Persist a parse + validation result keyed by current source hashes.
+
+    The file is written atomically so concurrent workers never read a
+    partial cache.
+
+    Returns:
+        Path written, or None if the cache directory is not writable
+    """
+    path = _cache_path(base_path, cache_dir)
+    entry = StandardsCacheEntry(
+        key=compute_cache_key(base_path),
+        parsed_standards=parsed_standards,
+        validation_result=validation_result,
+    )
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return atomic_write_json(path, entry.to_dict())
+    except OSError:
+        return None
+
+
+def clear_standards_cache(
+    base_path: Optional[Path] = None,
+    cache_dir: Optional[Union[str, Path]] = None
+) -> None:
+    """Remove the persisted cache file if present."""
+    path = _cache_path(base_path, cache_dir)
+    if path.exists():
+        path.unlink()
@@ -9,6 +9,8 @@ Architecture:
 - Cache Always: All subsequent calls use cached data
 - Validate Early: Pre-validation at pipeline init, not Step 5
 - Thread-Safe: Uses lock for multi-threaded scenarios
+- Persist Across Processes: Results are also cached on disk, keyed by the
+  content hashes of standards/*.md and config/*.yaml (see standards_cache)
 
 Usage:
     from skills.parsing.standards_loader_singleton import (
@@ -34,6 +36,10 @@ from typing import Dict, Optional, Any
 from dataclasses import dataclass, field
 
 from skills.parsing.standards_parser import StandardsParser, ParsedStandards
+from skills.parsing.standards_cache import (
+    load_cached_standards,
+    store_cached_standards
+)
 from skills.validation.standards_validator import (
     StandardsValidator,
     AllStandardsResult,
@@ -50,6 +56,7 @@ class StandardsLoaderState:
     parsed_standards: Optional[ParsedStandards] = None
     validation_result: Optional[AllStandardsResult] = None
     is_valid: bool = False
+    loaded_from_cache: bool = False
     initialization_errors: list = field(default_factory=list)
 
 
@@ -72,6 +79,9 @@ class StandardsLoaderSingleton:
     _lock = threading.Lock()
     _state: StandardsLoaderState = None
 
+    # Set False to always re-parse (the on-disk cache is still refreshed)
+    use_persistent_cache: bool = True
+
     def __new__(cls):
         """Thread-safe singleton creation with double-checked locking."""
         if cls._instance is None:
@@ -88,19 +98,30 @@ class StandardsLoaderSingleton:
         Initialize standards loading on first access.
 
         Performs:
-        1. Creates StandardsParser instance
-        2. Parses all standards files
-        3. Creates StandardsValidator instance
-        4. Validates all standards
-        5. Sets validity flag
+        1. Creates StandardsParser and StandardsValidator instances
+        2. Loads parsed standards + validation from the persistent cache
+        3. On a miss, parses and validates all standards, then persists them
+        4. Sets validity flag
         """
         if self._state.initialized:
             return
 
         try:
-            # Initialize parser and parse standards
             self._state.parser = StandardsParser()
-            self._state.parsed_standards = self._state.parser.parse_all_standards()
+            self._state.validator = StandardsValidator()
+
+            cached = load_cached_standards() if self.use_persistent_cache else None
+            if cached is not None:
+                self._state.parsed_standards = cached.parsed_standards
+                self._state.validation_result = cached.validation_result
+                self._state.loaded_from_cache = True
+            else:
+                self._state.parsed_standards = self._state.parser.parse_all_standards()
+                self._state.validation_result = self._state.validator.validate_all_standards()
+                store_cached_standards(
+                    self._state.parsed_standards,
+                    self._state.validation_result
+                )
 
             # Check parsing success
             if not self._state.parsed_standards.success:
@@ -108,10 +129,6 @@ class StandardsLoaderSingleton:
                     self._state.parsed_standards.errors
                 )
 
-            # Initialize validator and validate standards
-            self._state.validator = StandardsValidator()
-            self._state.validation_result = self._state.validator.validate_all_standards()
-
             # Set overall validity
             self._state.is_valid = (
                 self._state.parsed_standards.success and
@@ -245,6 +262,16 @@ class StandardsLoaderSingleton:
                 cls._instance._state = StandardsLoaderState()
                 cls._instance = None
 
+    def is_loaded_from_cache(self) -> bool:
+        """
+        Check whether standards came from the persistent on-disk cache.
+
+        Returns:
+            True if parsing and validation were skipped on this process
+        """
+        self._ensure_initialized()
+        return self._state.loaded_from_cache
+
     @classmethod
     def is_initialized(cls) -> bool:
         """
@@ -340,6 +367,7 @@ def get_standards_status() -> Dict[str, Any]:
     return {
         "initialized": StandardsLoaderSingleton.is_initialized(),
         "is_valid": loader.is_standards_valid(),
+        "loaded_from_cache": loader.is_loaded_from_cache(),
         "errors": loader.get_initialization_errors(),
         "parsed_success": (
             loader.get_standards().success
@@ -26,6 +26,8 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import date
 
+from skills.utilities.regex_registry import compile_pattern
+
 
 @dataclass
 class DeliveryMode:
@@ -151,6 +153,13 @@ class ParsedStandards:
     source_files: List[str] = field(default_factory=list)
 
 
+# Timing / notes guidance patterns, compiled once for every parse
+_WPM_RE = compile_pattern(r'(\d+)-(\d+)\s*words?\s*per\s*minute', re.IGNORECASE)
+_MAX_WORDS_RE = compile_pattern(r'(?:maximum|max)[:\s]+(\d+)\s*words?', re.IGNORECASE)
+_MAX_DURATION_RE = compile_pattern(r'(\d+)\s*seconds?\s*(?:\(|of)', re.IGNORECASE)
+_REDUCTION_RE = compile_pattern(r'reduce.*?(\d+)%', re.IGNORECASE)
+
+
 class StandardsParser:
     """Parse presentation standards from markdown and YAML files."""
 
@@ -359,18 +368,18 @@ class StandardsParser:
         timing = TimingGuidance()
 
         # Look for word count patterns
-        wpm_match = re.search(r'(\d+)-(\d+)\s*words?\s*per\s*minute', content, re.IGNORECASE)
+        wpm_match = _WPM_RE.search(content)
         if wpm_match:
             timing.words_per_minute_min = int(wpm_match.group(1))
             timing.words_per_minute_max = int(wpm_match.group(2))
 
         # Look for maximum words
-        max_words_match = re.search(r'(?:maximum|max)[:\s]+(\d+)\s*words?', content, re.IGNORECASE)
+        max_words_match = _MAX_WORDS_RE.search(content)
         if max_words_match:
             timing.max_words = int(max_words_match.group(1))
 
         # Look for maximum duration
-        max_duration_match = re.search(r'(\d+)\s*seconds?\s*(?:\(|of)', content, re.IGNORECASE)
+        max_duration_match = _MAX_DURATION_RE.search(content)
         if max_duration_match:
             timing.max_duration_seconds = int(max_duration_match.group(1))
 
@@ -393,7 +402,7 @@ class StandardsParser:
                 reqs.required_markers.append('[EMPHASIS]')
 
         # Check for active learning reduction
-        reduction_match = re.search(r'reduce.*?(\d+)%', content, re.IGNORECASE)
+        reduction_match = _REDUCTION_RE.search(content)
         if reduction_match:
             reqs.active_learning_word_reduction = f"{reduction_match.group(1)}%"
 
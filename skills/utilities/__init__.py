@@ -79,6 +79,7 @@ from .marker_inserter import (
     get_visual_type_counts, get_slides_by_marker_type,
     VALID_VISUAL_TYPES
 )
+from .state_store import StateStore
 from .step_state_manager import (
     StepStateManager, StepState, RetryContext
 )
@@ -87,12 +88,49 @@ from .error_recovery import (
     ErrorType, RecoveryAction, RecoveryStrategy,
     handle_error, get_recovery_strategy
 )
+from .failure_index import (
+    FailureIndex, FailureSignature, ActionStats, failure_signature
+)
 from .smart_retry_controller import (
     SmartRetryController, IncrementalScorer,
     RetryStrategy, TerminationReason, RetryResult,
-    RetryContext as SmartRetryContext, RetryIteration,
+    RetryContext as SmartRetryContext, RetryIteration, SlideConvergence,
     create_retry_controller, execute_step_with_retry
 )
+from .blueprint_diff import (
+    BlueprintVersion, SlideRecord, SlideDiff
+)
+from .serializer import (
+    Serializer, PayloadSchema, encode, decode, export_json, get_serializer,
+    register_serializer, MSGPACK_AVAILABLE
+)
+from .retry_scheduler import (
+    RetryScheduler, RetryDecision, Deadline, DeadlineExceeded, AgentTimeout, BatchOutcome
+)
+from .event_bus import (
+    EventBus, PipelineEvent, Progress, EventSink, JsonlSink, CallbackSink, SSESink,
+    configure_event_bus, get_event_bus
+)
+from .work_queue import (
+    Job, Artifact, Broker, SQLiteBroker, Worker, content_hash, file_hash,
+    open_broker, register_broker
+)
+from .cost_estimator import (
+    CostEstimator, TimingRecorder, BatchEstimate, WorkItem, InputSize,
+    lesson_sizes, blueprint_sizes, history_path
+)
+from .keyword_matcher import (
+    KeywordMatcher, KeywordHit, get_matcher
+)
+from .regex_registry import (
+    compile_pattern, compile_patterns, registry_size
+)
+from .feature_cache import (
+    FeatureCache, cached_analysis, configure_feature_cache, get_feature_cache
+)
+from .pptx_text import (
+    DeckText, SlideText, ShapeText, read_deck_text, extract_deck_text
+)
 
 __all__ = [
     # ==========================================================================
@@ -160,14 +198,41 @@ __all__ = [
     'get_visual_type_counts', 'get_slides_by_marker_type',
     'VALID_VISUAL_TYPES',
     # Step State Manager (inter-step persistence)
-    'StepStateManager', 'StepState', 'RetryContext',
+    'StateStore', 'StepStateManager', 'StepState', 'RetryContext',
     # Error Recovery (unified error handling)
     'ErrorRecovery', 'PipelineError', 'RecoveryResult',
     'ErrorType', 'RecoveryAction', 'RecoveryStrategy',
     'handle_error', 'get_recovery_strategy',
+    # Failure Index (persistent failure signatures and recovery outcomes)
+    'FailureIndex', 'FailureSignature', 'ActionStats', 'failure_signature',
     # Smart Retry Controller (intelligent retry loops)
     'SmartRetryController', 'IncrementalScorer',
     'RetryStrategy', 'TerminationReason', 'RetryResult',
-    'SmartRetryContext', 'RetryIteration',
+    'SmartRetryContext', 'RetryIteration', 'SlideConvergence',
     'create_retry_controller', 'execute_step_with_retry',
+    # Blueprint Diff (immutable slide records, per-slide diffs)
+    'BlueprintVersion', 'SlideRecord', 'SlideDiff',
+    # Serializer (compact payload encoding, JSON export)
+    'Serializer', 'PayloadSchema', 'encode', 'decode', 'export_json',
+    'get_serializer', 'register_serializer', 'MSGPACK_AVAILABLE',
+    # Retry Scheduler (budgets, back-off, deadlines)
+    'RetryScheduler', 'RetryDecision', 'Deadline', 'DeadlineExceeded',
+    'AgentTimeout', 'BatchOutcome',
+    # Event Bus (structured progress events: JSONL, callback, SSE sinks)
+    'EventBus', 'PipelineEvent', 'Progress', 'EventSink', 'JsonlSink',
+    'CallbackSink', 'SSESink', 'configure_event_bus', 'get_event_bus',
+    # Work Queue (leased jobs and artifacts for multi-machine runs)
+    'Job', 'Artifact', 'Broker', 'SQLiteBroker', 'Worker', 'content_hash',
+    'file_hash', 'open_broker', 'register_broker',
+    # Cost Estimator (timing history, batch time/memory predictions)
+    'CostEstimator', 'TimingRecorder', 'BatchEstimate', 'WorkItem', 'InputSize',
+    'lesson_sizes', 'blueprint_sizes', 'history_path',
+    # Keyword Matcher (single-scan multi-keyword matching)
+    'KeywordMatcher', 'KeywordHit', 'get_matcher',
+    # Regex Registry (patterns compiled once at import)
+    'compile_pattern', 'compile_patterns', 'registry_size',
+    # Feature Cache (content-addressed analysis results)
+    'FeatureCache', 'cached_analysis', 'configure_feature_cache', 'get_feature_cache',
+    # PPTX Text (zip/XML slide text, cached by file digest)
+    'DeckText', 'SlideText', 'ShapeText', 'read_deck_text', 'extract_deck_text',
 ]
@@ -0,0 +1,118 @@
+"""
+Atomic Write
+Crash-safe file output: write to a temp file, then rename over the target.
+
+Provides:
+- atomic_write(): a temp file in the target's directory, flushed,
+  fsynced and os.replace()d over the target when the block exits
+- Text, bytes, JSON and document (pptx/docx) helpers built on it
+- The target keeps its permissions (new files follow the umask); on
+  error the temp file is removed and the target is left untouched
+
+Usage:
+    from skills.utilities.atomic_write import (
+        atomic_write, atomic_write_text, atomic_write_bytes, atomic_write_json, atomic_save
+    )
+
+    atomic_write_text('production/Day_01/lesson_plan.md', content)
+    atomic_write_json('outputs/report.json', report, indent=2)
+    atomic_save(prs, 'production/Day_01/powerpoint.pptx')   # pptx / docx
+
+    with atomic_write('outputs/log.txt') as f:
+        f.write('...')
+"""
+
+import json
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
+
+PathLike = Union[str, Path]
+
+# Process umask (read once: os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _target_mode(path: Path) -> int:
+    """Permission bits for the written file: the existing target's, else 0o666 less the umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_write(
+    path: PathLike,
+    mode: str = 'w',
+    encoding: Optional[str] = 'utf-8',
+    newline: Optional[str] = None
+) -> Iterator[IO]:
+    """
+    Open a temp file that replaces path when the block exits cleanly.
+
+    Args:
+        path: Target file (parent directories are created)
+        mode: 'w' for text or 'wb' for bytes
+        encoding: Text encoding (ignored for 'wb')
+        newline: Newline translation for text mode, as for open()
+    """
+    if mode not in ('w', 'wb'):
+        raise ValueError(f"atomic_write mode must be 'w' or 'wb', not {mode!r}")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates the file 0600; give it the mode a plain open() would
+        os.chmod(tmp, _target_mode(path))
+        if mode == 'wb':
+            f = os.fdopen(fd, 'wb')
+        else:
+            f = os.fdopen(fd, 'w', encoding=encoding, newline=newline)
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def atomic_write_text(path: PathLike, text: str, encoding: str = 'utf-8') -> Path:
+    """Atomically write text to path; returns the path."""
+    with atomic_write(path, 'w', encoding=encoding) as f:
+        f.write(text)
+    return Path(path)
+
+
+def atomic_write_bytes(path: PathLike, data: bytes) -> Path:
+    """Atomically write bytes to path; returns the path."""
+    with atomic_write(path, 'wb') as f:
+        f.write(data)
+    return Path(path)
+
+
+def atomic_write_json(path: PathLike, data: Any, **dump_kwargs: Any) -> Path:
+    """Atomically write data as JSON (dump_kwargs go to json.dump); returns the path."""
+    with atomic_write(path, 'w') as f:
+        json.dump(data, f, **dump_kwargs)
+    return Path(path)
+
+
+def atomic_save(document: Any, path: PathLike) -> Path:
+    """
+    Atomically save a document with a save(stream) method.
+
+    Works with python-pptx Presentation and python-docx Document, which
+    both accept a writable binary stream.
+    """
+    with atomic_write(path, 'wb') as f:
+        document.save(f)
+    return Path(path)
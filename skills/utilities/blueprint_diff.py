@@ -0,0 +1,218 @@
+"""
+Blueprint Diff
+Immutable slide records and per-slide structural diffs between blueprint
+versions.
+
+Provides:
+- BlueprintVersion: a blueprint as immutable SlideRecords, sharing
+  unchanged records with the previous version
+- SlideDiff: per-slide added/removed/modified change and changed fields
+- freeze() / thaw() / slide_digest(): immutable copies and content digests
+
+Usage:
+    from skills.utilities.blueprint_diff import BlueprintVersion
+
+    base, _ = BlueprintVersion.from_slides(output['slides'])
+    version, diffs = BlueprintVersion.from_slides(
+        next_output['slides'], previous=base, trusted=locked_slides
+    )
+    for diff in diffs:
+        print(diff.slide_number, diff.change, diff.fields)
+
+    slides = version.to_slides()          # mutable copies
+    replayed = base.apply(diffs)          # same records as version
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Collection, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+# =============================================================================
+# FREEZING
+# =============================================================================
+
+def freeze(value: Any) -> Any:
+    """Deep read-only copy: dicts become mapping proxies, lists/tuples tuples, sets frozensets."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen value (tuples come back as lists)."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    if isinstance(value, frozenset):
+        return {thaw(v) for v in value}
+    return value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (tuple, set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def slide_digest(slide: Mapping[str, Any]) -> str:
+    """Content digest of a slide (frozen or not)."""
+    text = json.dumps(slide, sort_keys=True, default=_plain)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+# =============================================================================
+# RECORDS AND DIFFS
+# =============================================================================
+
+@dataclass(frozen=True)
+class SlideRecord:
+    """Immutable snapshot of one slide."""
+    slide_number: int
+    content: Mapping[str, Any]  # frozen
+    digest: str
+
+    @classmethod
+    def from_slide(cls, key: int, slide: Mapping[str, Any], digest: Optional[str] = None) -> 'SlideRecord':
+        return cls(key, freeze(slide), digest or slide_digest(slide))
+
+    def to_slide(self) -> Dict[str, Any]:
+        """Mutable copy of the slide."""
+        return thaw(self.content)
+
+
+@dataclass(frozen=True)
+class SlideDiff:
+    """Change to one slide between two blueprint versions."""
+    slide_number: int
+    change: str  # 'added', 'removed', 'modified'
+    fields: Tuple[str, ...] = ()  # top-level keys that differ
+    before: Optional[SlideRecord] = None
+    after: Optional[SlideRecord] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Log form: what changed, with digests instead of content."""
+        return {
+            'slide_number': self.slide_number,
+            'change': self.change,
+            'fields': list(self.fields),
+            'before_digest': self.before.digest if self.before else None,
+            'after_digest': self.after.digest if self.after else None
+        }
+
+
+def _changed_fields(before: Mapping[str, Any], after: Mapping[str, Any]) -> Tuple[str, ...]:
+    keys = list(before) + [k for k in after if k not in before]
+    return tuple(str(k) for k in keys if before.get(k) != after.get(k) or (k in before) != (k in after))
+
+
+# =============================================================================
+# VERSIONS
+# =============================================================================
+
+@dataclass(frozen=True)
+class BlueprintVersion:
+    """
+    Slides of one blueprint version as shared immutable records.
+
+    Keys are slide numbers; a slide without one is keyed by -(position + 1).
+    """
+    records: Mapping[int, SlideRecord] = field(default_factory=lambda: MappingProxyType({}))
+    order: Tuple[int, ...] = ()
+    # key -> the (mutable) slide object each record was last matched to
+    sources: Mapping[int, Any] = field(default_factory=lambda: MappingProxyType({}), compare=False)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @classmethod
+    def from_slides(
+        cls,
+        slides: Iterable[Mapping[str, Any]],
+        previous: Optional['BlueprintVersion'] = None,
+        trusted: Collection[int] = ()
+    ) -> Tuple['BlueprintVersion', List[SlideDiff]]:
+        """
+        Build a version from slides, sharing records with previous.
+
+        Args:
+            slides: Slides in deck order
+            previous: Version to diff against (None for a base version)
+            trusted: Slide numbers whose object, if it is the one previous
+                saw, is known unchanged (skips digesting)
+
+        Returns:
+            (version, diffs against previous in deck order)
+        """
+        previous = previous or cls()
+        records: Dict[int, SlideRecord] = {}
+        sources: Dict[int, Any] = {}
+        order: List[int] = []
+        diffs: List[SlideDiff] = []
+
+        for position, slide in enumerate(slides):
+            key = slide.get('slide_number')
+            if key is None:
+                key = -(position + 1)
+            order.append(key)
+            sources[key] = slide
+            before = previous.records.get(key)
+
+            if before is not None and key in trusted and previous.sources.get(key) is slide:
+                records[key] = before
+                continue
+
+            digest = slide_digest(slide)
+            if before is not None and before.digest == digest:
+                records[key] = before
+                continue
+
+            after = SlideRecord.from_slide(key, slide, digest)
+            records[key] = after
+            if before is None:
+                diffs.append(SlideDiff(key, 'added', tuple(str(k) for k in after.content), after=after))
+            else:
+                diffs.append(SlideDiff(
+                    key, 'modified', _changed_fields(before.content, after.content), before, after
+                ))
+
+        for key in previous.order:
+            if key not in records:
+                diffs.append(SlideDiff(key, 'removed', before=previous.records[key]))
+
+        return cls(MappingProxyType(records), tuple(order), MappingProxyType(sources)), diffs
+
+    def apply(self, diffs: Iterable[SlideDiff]) -> 'BlueprintVersion':
+        """Version with diffs applied (added slides go last, in diff order)."""
+        records = dict(self.records)
+        order = list(self.order)
+        for diff in diffs:
+            if diff.change == 'removed':
+                records.pop(diff.slide_number, None)
+                order.remove(diff.slide_number)
+            else:
+                if diff.slide_number not in records:
+                    order.append(diff.slide_number)
+                records[diff.slide_number] = diff.after
+        return BlueprintVersion(MappingProxyType(records), tuple(order))
+
+    def detached(self) -> 'BlueprintVersion':
+        """Same records without references to the source slide objects."""
+        return BlueprintVersion(self.records, self.order)
+
+    def shared_with(self, other: 'BlueprintVersion') -> int:
+        """Number of records this version shares (by identity) with other."""
+        return sum(1 for key, record in self.records.items() if other.records.get(key) is record)
+
+    def to_slides(self) -> List[Dict[str, Any]]:
+        """Mutable copies of the slides in deck order."""
+        return [self.records[key].to_slide() for key in self.order]
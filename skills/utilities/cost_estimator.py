@@ -0,0 +1,619 @@
+"""
+Cost Estimator
+Predict how long a batch build will take, and how much memory it needs,
+before launching it.
+
+Provides:
+- TimingRecorder - an EventSink that stores the duration, input size
+  (content points, slides, notes words), concurrency and peak memory of
+  every finished day/section and agent
+- CostEstimator  - fits seconds = (intercept + rate * work units) *
+  (1 + contention * (concurrent items - 1)) per runner, replays a batch
+  on N workers, and predicts wall clock and peak memory;
+  recommend_workers() picks the smallest worker count within 5% of the
+  best wall clock that fits in memory
+- History in a StateStore table ($THEATER_PIPELINE_TIMINGS_DB, default
+  outputs/state/run_timings.db); estimating never creates it
+
+Usage:
+    from skills.utilities.cost_estimator import (
+        CostEstimator, TimingRecorder, WorkItem, lesson_sizes, history_path
+    )
+
+    # While running: record what each item cost
+    bus.subscribe(TimingRecorder(history_path(), runner='theater'))
+
+    # Before running: predict a batch
+    estimator = CostEstimator(history_path())
+    items = [WorkItem(f'day {d}', lesson_sizes(load_lesson(d))) for d in days]
+    estimate = estimator.estimate('theater', items, workers=4)
+    print(estimate.summary())
+    workers = estimator.recommend_workers('theater', items, max_workers=8)
+"""
+
+import os
+import statistics
+import sys
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from skills.utilities.event_bus import (
+    AGENT_FINISHED, DAY_FINISHED, DAY_STARTED, RUN_FINISHED, RUN_STARTED,
+    SECTION_FINISHED, SECTION_STARTED, EventSink, PipelineEvent
+)
+from skills.utilities.state_store import StateStore
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+
+# Runners with recorded history
+RUNNER_THEATER = 'theater'
+RUNNER_RJ = 'rj_unit'
+RUNNER_STEP12 = 'step12'
+
+# Sample kinds
+ITEM = 'item'    # one day or section
+AGENT = 'agent'  # one agent within a day
+
+# Environment variable overriding the history database
+TIMINGS_DB_ENV = 'THEATER_PIPELINE_TIMINGS_DB'
+DEFAULT_HISTORY_PATH = Path(__file__).resolve().parent.parent.parent / 'outputs' / 'state' / 'run_timings.db'
+
+# Presenter-notes words that count as one work unit
+NOTES_WORDS_PER_UNIT = 100
+
+# Most recent samples used per fit
+MAX_SAMPLES = 200
+
+# recommend_workers() accepts this much over the best wall clock
+SPEEDUP_TOLERANCE = 0.05
+
+# Slowdown of each item per extra item running alongside it, assumed
+# until the history has items recorded at two or more concurrencies
+DEFAULT_CONTENTION = 0.1
+
+# Contention values tried when fitting it (0 .. MAX_CONTENTION)
+MAX_CONTENTION = 2.0
+CONTENTION_STEPS = 200
+
+# Share of physical memory a batch may plan to use
+MEMORY_HEADROOM = 0.8
+
+_STARTED_TO_FINISHED = {
+    RUN_STARTED: RUN_FINISHED,
+    DAY_STARTED: DAY_FINISHED,
+    SECTION_STARTED: SECTION_FINISHED
+}
+
+_FAILED_STATUSES = {'failed', 'error', 'timed_out'}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_timings (
+    runner TEXT,
+    kind TEXT,
+    name TEXT,
+    seconds REAL,
+    content_points INTEGER,
+    slides INTEGER,
+    notes_words INTEGER,
+    workers INTEGER,
+    baseline_mb REAL,
+    peak_mb REAL,
+    recorded_at TEXT
+);
+CREATE INDEX IF NOT EXISTS run_timings_runner ON run_timings (runner, kind, name)
+"""
+
+
+def history_path() -> Path:
+    """Timing history database ($THEATER_PIPELINE_TIMINGS_DB or the default)."""
+    return Path(os.environ.get(TIMINGS_DB_ENV) or DEFAULT_HISTORY_PATH)
+
+
+def peak_memory_mb() -> Optional[float]:
+    """Peak resident memory of this process so far, in MB (None if unknown)."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def available_memory_mb() -> Optional[float]:
+    """Physical memory of this machine in MB (None if unknown)."""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+# =============================================================================
+# INPUT SIZES
+# =============================================================================
+
+@dataclass
+class InputSize:
+    """Size of one item's inputs."""
+    content_points: int = 0
+    slides: int = 0
+    notes_words: int = 0
+
+    @property
+    def units(self) -> float:
+        """Work units: content points + slides + notes words / NOTES_WORDS_PER_UNIT."""
+        return self.content_points + self.slides + self.notes_words / NOTES_WORDS_PER_UNIT
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'InputSize':
+        data = data or {}
+        return cls(*(int(data.get(k) or 0) for k in ('content_points', 'slides', 'notes_words')))
+
+
+def lesson_sizes(lesson_data: Optional[Dict[str, Any]]) -> InputSize:
+    """
+    Size of a lesson input (sample_theater / Romeo and Juliet day JSON).
+
+    Notes words are the words of the content points and their expanded
+    text, which the presenter notes are written from.
+    """
+    points = (lesson_data or {}).get('content_points', [])
+    words = 0
+    for point in points:
+        if isinstance(point, dict):
+            texts = [point.get('point', '')] + list(point.get('expanded', []))
+        else:
+            texts = [point]
+        words += sum(len(str(text).split()) for text in texts)
+    return InputSize(content_points=len(points), notes_words=words)
+
+
+def blueprint_sizes(slides: List[Dict[str, Any]]) -> InputSize:
+    """Size of a parsed step 12 blueprint (parse_blueprint() slides)."""
+    return InputSize(
+        slides=len(slides),
+        notes_words=sum(len(str(s.get('notes') or '').split()) for s in slides)
+    )
+
+
+@dataclass
+class WorkItem:
+    """One item of a batch to estimate (a day or a section)."""
+    name: str
+    size: InputSize = field(default_factory=InputSize)
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+class TimingRecorder(EventSink):
+    """
+    Records finished items and agents into the timing history.
+
+    An item is any *_finished event that carries a 'sizes' dict and a
+    duration (run_finished per theater day, day_finished per Romeo and
+    Juliet day, section_finished per step 12 section). Agent events are
+    held until their day's item event arrives and stored with its sizes.
+    Dry runs, failed items and agents replayed from a journal are not
+    recorded, since they do not reflect what the work costs.
+    """
+
+    def __init__(self, history: Union[StateStore, str, Path], runner: str):
+        """
+        Args:
+            history: StateStore or database path (see history_path())
+            runner: RUNNER_THEATER, RUNNER_RJ or RUNNER_STEP12
+        """
+        self.store = history if isinstance(history, StateStore) else StateStore(history)
+        with self.store.transaction() as conn:
+            for statement in filter(None, (s.strip() for s in _SCHEMA.split(';'))):
+                conn.execute(statement)
+        self.runner = runner
+        self.baseline_mb = peak_memory_mb()
+        self._agents: Dict[Tuple[Any, Any], List[Tuple[str, float]]] = {}
+        self._replayed: set = set()
+        # Started kind -> in-flight item -> most items running at once while it ran
+        self._running: Dict[str, Dict[Tuple[Any, ...], int]] = {}
+        self._lock = threading.Lock()
+
+    def handle(self, event: PipelineEvent) -> None:
+        fields = event.fields
+        key = (fields.get('unit'), fields.get('day'))
+        item = key + (fields.get('section'),)
+        with self._lock:
+            if event.kind in _STARTED_TO_FINISHED:
+                running = self._running.setdefault(event.kind, {})
+                running[item] = 0
+                for other in running:
+                    running[other] = max(running[other], len(running))
+                return
+            workers = None
+            for started, finished in _STARTED_TO_FINISHED.items():
+                if event.kind == finished:
+                    workers = self._running.get(started, {}).pop(item, None) or workers
+
+            if event.kind == AGENT_FINISHED:
+                if fields.get('replayed'):
+                    self._replayed.add(key)
+                elif fields.get('status') not in _FAILED_STATUSES and fields.get('duration_seconds'):
+                    self._agents.setdefault(key, []).append(
+                        (fields.get('agent', ''), fields['duration_seconds'])
+                    )
+                return
+            if 'sizes' not in fields or fields.get('duration_seconds') is None:
+                return
+            agents = self._agents.pop(key, [])
+            replayed = key in self._replayed
+            self._replayed.discard(key)
+
+        status = str(fields.get('status') or '').lower()
+        if fields.get('dry_run') or status in _FAILED_STATUSES:
+            return
+        size = InputSize.from_dict(fields['sizes'])
+        samples = [(AGENT, agent, seconds) for agent, seconds in agents]
+        if not replayed:
+            samples.append((ITEM, '', fields['duration_seconds']))
+        self.record(samples, size, workers or 1)
+
+    def record(self, samples: Iterable[Tuple[str, str, float]], size: InputSize, workers: int = 1) -> None:
+        """Store (kind, name, seconds) samples for an item of the given size run workers at once."""
+        now = datetime.now().isoformat()
+        peak = peak_memory_mb()
+        with self.store.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO run_timings (runner, kind, name, seconds, content_points, slides, "
+                "notes_words, workers, baseline_mb, peak_mb, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(self.runner, kind, name, seconds, size.content_points, size.slides,
+                  size.notes_words, workers, self.baseline_mb, peak, now)
+                 for kind, name, seconds in samples]
+            )
+
+
+# =============================================================================
+# MODEL
+# =============================================================================
+
+@dataclass
+class LinearFit:
+    """seconds = (intercept + rate * work units) * (1 + contention * (workers - 1))."""
+    intercept: float
+    rate: float
+    samples: int
+    contention: float = 0.0
+
+    def predict(self, units: float, workers: int = 1) -> float:
+        """Seconds for an item of units while workers items run at once."""
+        return (self.intercept + self.rate * units) * slowdown(self.contention, workers)
+
+
+def slowdown(contention: float, workers: int) -> float:
+    """Factor by which an item slows with workers items running at once."""
+    return 1.0 + contention * (max(1, workers) - 1)
+
+
+def fit_linear(points: List[Tuple[float, float]]) -> Optional[LinearFit]:
+    """
+    Least-squares fit of (units, seconds) points, kept non-negative.
+
+    With a single input size the time is taken as proportional to it
+    (or constant when the size is zero).
+    """
+    if not points:
+        return None
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    mean_x, mean_y = statistics.fmean(xs), statistics.fmean(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread > 0:
+        rate = max(0.0, sum((x - mean_x) * (y - mean_y) for x, y in points) / spread)
+        intercept = mean_y - rate * mean_x
+        if intercept >= 0:
+            return LinearFit(intercept, rate, len(points))
+    if sum(xs) > 0:
+        return LinearFit(0.0, sum(ys) / sum(xs), len(points))
+    return LinearFit(mean_y, 0.0, len(points))
+
+
+def fit_contended(points: List[Tuple[float, int, float]]) -> Optional[LinearFit]:
+    """
+    Fit of (units, workers, seconds) points, including contention.
+
+    Seconds are normalised to a single worker for each contention value
+    tried, and the value whose fit has the least squared error is kept.
+    With every point at one concurrency, contention cannot be measured
+    and DEFAULT_CONTENTION is assumed.
+    """
+    if not points:
+        return None
+    if len({workers for _, workers, _ in points}) < 2:
+        candidates = [DEFAULT_CONTENTION]
+    else:
+        candidates = [MAX_CONTENTION * i / CONTENTION_STEPS for i in range(CONTENTION_STEPS + 1)]
+
+    best, best_error = None, None
+    for contention in candidates:
+        fit = fit_linear([(units, seconds / slowdown(contention, workers))
+                          for units, workers, seconds in points])
+        fit.contention = contention
+        error = sum((fit.predict(units, workers) - seconds) ** 2 for units, workers, seconds in points)
+        if best_error is None or error < best_error - 1e-9:
+            best, best_error = fit, error
+    return best
+
+
+def simulate_schedule(durations: List[float], workers: int, contention: float = 0.0) -> float:
+    """
+    Wall clock of running durations in order on workers.
+
+    Each item starts on the first free worker. Durations are single-worker
+    seconds; while n items run, each progresses slowdown(contention, n)
+    times slower.
+    """
+    queue = deque(durations)
+    running: List[float] = []
+    clock = 0.0
+    while queue or running:
+        while queue and len(running) < max(1, workers):
+            running.append(queue.popleft())
+        step = min(running)
+        clock += step * slowdown(contention, len(running))
+        running = [left - step for left in running if left - step > 1e-9]
+    return clock
+
+
+@dataclass
+class BatchEstimate:
+    """Predicted cost of a batch on a given number of workers."""
+    runner: str
+    workers: int
+    items: int
+    wall_seconds: Optional[float]
+    serial_seconds: Optional[float]
+    peak_mb: Optional[float]
+    coverage: float  # share of items predicted from history
+    per_item: List[Dict[str, Any]] = field(default_factory=list)
+    recommended_workers: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def summary(self) -> str:
+        """Human-readable estimate."""
+        if self.wall_seconds is None:
+            return (f"No timing history for {self.runner} yet: run a build once "
+                    f"to record it ({self.items} items requested)")
+        lines = [
+            f"Estimate for {self.items} {self.runner} items on {self.workers} worker(s):",
+            f"  Wall clock: {_format_seconds(self.wall_seconds)} "
+            f"(serial {_format_seconds(self.serial_seconds)})",
+            f"  Peak memory: {f'{self.peak_mb:.0f} MB' if self.peak_mb is not None else 'unknown'}",
+            f"  From history: {self.coverage:.0%} of items"
+        ]
+        if self.recommended_workers is not None:
+            lines.append(f"  Recommended workers: {self.recommended_workers}")
+        return '\n'.join(lines)
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return 'unknown'
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{secs:02d}s" if hours else f"{minutes}m{secs:02d}s"
+
+
+# =============================================================================
+# ESTIMATOR
+# =============================================================================
+
+class CostEstimator:
+    """Predicts batch wall clock and peak memory from the timing history."""
+
+    def __init__(self, history: Union[StateStore, str, Path]):
+        """
+        Args:
+            history: StateStore or database path (see history_path());
+                a path that does not exist is not created and gives no
+                history
+        """
+        if isinstance(history, StateStore):
+            self.store: Optional[StateStore] = history
+        else:
+            self.store = StateStore(history) if Path(history).exists() else None
+        if self.store is not None:
+            with self.store.transaction() as conn:
+                for statement in filter(None, (s.strip() for s in _SCHEMA.split(';'))):
+                    conn.execute(statement)
+
+    def _rows(self, runner: str, kind: str, name: Optional[str] = None) -> List[Tuple]:
+        if self.store is None:
+            return []
+        query = ("SELECT content_points, slides, notes_words, seconds, workers, baseline_mb, "
+                 "peak_mb FROM run_timings WHERE runner = ? AND kind = ?")
+        params: Tuple = (runner, kind)
+        if name is not None:
+            query += " AND name = ?"
+            params += (name,)
+        return self.store.connection().execute(
+            query + " ORDER BY rowid DESC LIMIT ?", params + (MAX_SAMPLES,)
+        ).fetchall()
+
+    def item_fit(self, runner: str) -> Optional[LinearFit]:
+        """Fit of whole-item (day / section) durations against size and concurrency."""
+        rows = self._rows(runner, ITEM)
+        return fit_contended([(InputSize(*row[:3]).units, row[4] or 1, row[3]) for row in rows])
+
+    def agent_fits(self, runner: str) -> Dict[str, LinearFit]:
+        """Fit of each agent's durations against size and concurrency."""
+        if self.store is None:
+            return {}
+        names = [row[0] for row in self.store.connection().execute(
+            "SELECT DISTINCT name FROM run_timings WHERE runner = ? AND kind = ?", (runner, AGENT)
+        ).fetchall()]
+        fits = {}
+        for name in names:
+            rows = self._rows(runner, AGENT, name)
+            fits[name] = fit_contended([(InputSize(*row[:3]).units, row[4] or 1, row[3]) for row in rows])
+        return fits
+
+    def memory_profile(self, runner: str) -> Optional[Tuple[float, float]]:
+        """
+        (baseline MB, MB per concurrent item), or None without memory history.
+
+        Per-item memory is the largest growth of the process peak over
+        its baseline divided by the concurrency at the time, so the
+        prediction errs on the high side.
+        """
+        rows = [row for row in self._rows(runner, ITEM) if row[5] is not None and row[6] is not None]
+        if not rows:
+            return None
+        baseline = statistics.median(row[5] for row in rows)
+        per_item = max(max(0.0, row[6] - row[5]) / max(1, row[4] or 1) for row in rows)
+        return baseline, per_item
+
+    def predict_item(
+        self,
+        runner: str,
+        item: WorkItem,
+        fits: Optional[Tuple[Optional[LinearFit], Dict[str, LinearFit]]] = None
+    ) -> Tuple[Optional[float], str]:
+        """
+        Predicted single-worker seconds for one item and the basis used.
+
+        Returns:
+            (seconds, 'item' | 'agents' | 'none')
+        """
+        item_fit, agent_fits = fits or self.fits(runner)
+        units = item.size.units
+        if item_fit is not None:
+            return item_fit.predict(units), 'item'
+        if agent_fits:
+            return sum(fit.predict(units) for fit in agent_fits.values()), 'agents'
+        return None, 'none'
+
+    @staticmethod
+    def _contention(fits: Tuple[Optional[LinearFit], Dict[str, LinearFit]]) -> float:
+        """Contention of the item fit, or the agents' time-weighted mean."""
+        item_fit, agent_fits = fits
+        if item_fit is not None:
+            return item_fit.contention
+        weights = [(fit.predict(1), fit.contention) for fit in agent_fits.values()]
+        total = sum(weight for weight, _ in weights)
+        if not total:
+            return DEFAULT_CONTENTION
+        return sum(weight * contention for weight, contention in weights) / total
+
+    def fits(self, runner: str) -> Tuple[Optional[LinearFit], Dict[str, LinearFit]]:
+        """(item fit, agent fits) for runner."""
+        return self.item_fit(runner), self.agent_fits(runner)
+
+    def estimate(
+        self,
+        runner: str,
+        items: List[WorkItem],
+        workers: int = 1,
+        fits: Optional[Tuple[Optional[LinearFit], Dict[str, LinearFit]]] = None
+    ) -> BatchEstimate:
+        """
+        Predict wall clock and peak memory of running items on workers.
+
+        Items run slower the more run at once (see fit_contended()).
+        Items without a prediction are costed at the mean of the others;
+        with no history at all the times are None. Per-item seconds and
+        serial_seconds are single-worker times.
+        """
+        fits = fits or self.fits(runner)
+        predictions = [self.predict_item(runner, item, fits) for item in items]
+        known = [seconds for seconds, _ in predictions if seconds is not None]
+        fill = statistics.fmean(known) if known else None
+        durations = [seconds if seconds is not None else fill for seconds, _ in predictions]
+
+        wall = serial = peak = None
+        if fill is not None:
+            wall = simulate_schedule(durations, workers, self._contention(fits))
+            serial = sum(durations)
+        memory = self.memory_profile(runner)
+        if memory is not None and items:
+            baseline, per_item = memory
+            peak = baseline + per_item * min(workers, len(items))
+
+        return BatchEstimate(
+            runner=runner,
+            workers=workers,
+            items=len(items),
+            wall_seconds=wall,
+            serial_seconds=serial,
+            peak_mb=peak,
+            coverage=len(known) / len(items) if items else 0.0,
+            per_item=[
+                {'name': item.name, 'units': item.size.units, 'seconds': seconds, 'basis': basis}
+                for item, (seconds, basis) in zip(items, predictions)
+            ]
+        )
+
+    def recommend_workers(
+        self,
+        runner: str,
+        items: List[WorkItem],
+        max_workers: int,
+        memory_limit_mb: Optional[float] = None
+    ) -> Optional[int]:
+        """
+        Smallest worker count within SPEEDUP_TOLERANCE of the best wall clock.
+
+        Wall clocks come from the contention model, so extra workers stop
+        paying off once the slowdown they cause outweighs the overlap.
+
+        Worker counts whose predicted peak memory exceeds memory_limit_mb
+        (default: MEMORY_HEADROOM of physical memory) are not considered.
+
+        Returns:
+            Worker count, or None when there is no timing history
+        """
+        if memory_limit_mb is None:
+            physical = available_memory_mb()
+            memory_limit_mb = physical * MEMORY_HEADROOM if physical else None
+
+        fits = self.fits(runner)
+        candidates = []
+        for workers in range(1, max(1, min(max_workers, len(items))) + 1):
+            estimate = self.estimate(runner, items, workers, fits)
+            if estimate.wall_seconds is None:
+                return None
+            within_memory = (estimate.peak_mb is None or memory_limit_mb is None
+                             or estimate.peak_mb <= memory_limit_mb)
+            if within_memory or workers == 1:
+                candidates.append((workers, estimate.wall_seconds))
+        best = min(wall for _, wall in candidates)
+        return next(w for w, wall in candidates if wall <= best * (1 + SPEEDUP_TOLERANCE))
+
+    def plan(
+        self,
+        runner: str,
+        items: List[WorkItem],
+        workers: Optional[int] = None,
+        max_workers: int = 1
+    ) -> BatchEstimate:
+        """
+        Estimate on workers, or on the recommended count when workers is None.
+
+        The recommendation (up to max_workers) is set on the estimate.
+        """
+        recommended = self.recommend_workers(runner, items, max_workers)
+        estimate = self.estimate(runner, items, workers or recommended or max_workers)
+        estimate.recommended_workers = recommended
+        return estimate
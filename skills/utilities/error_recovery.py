@@ -7,6 +7,9 @@ Provides:
 - Automatic recovery strategies
 - Fallback actions for common failure scenarios
 - Integration with StepStateManager for retry coordination
+- Persistent failure index: classifications and recovery outcomes keyed
+  by failure signature, so recurring failures are recognised and the
+  action with the lowest expected time to recovery is preferred
 
 Usage:
     from skills.utilities.error_recovery import (
@@ -24,14 +27,25 @@ Usage:
 
     # Get recovery strategy
     strategy = get_recovery_strategy(ErrorType.QUOTA_NOT_MET)
+
+    # Strategy informed by past recoveries of the same failure; handle()
+    # runs the chosen action
+    strategy = recovery.get_strategy(ErrorType.CONSTRAINT_VIOLATION, context)
+
+    # Once the retried step is re-validated, record whether it worked
+    recovery.record_outcome(result, success=passed)
+    print(recovery.get_error_summary()['top_failures'])
 """
 
 from enum import Enum, auto
 from typing import Dict, Any, List, Optional, Callable, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+import time
 import traceback
 
+from skills.utilities.failure_index import FailureIndex, FailureSignature, failure_signature
+
 
 class ErrorType(Enum):
     """Classification of pipeline errors."""
@@ -130,6 +144,8 @@ class RecoveryResult:
     new_state: Optional[Dict[str, Any]] = None
     retry_recommended: bool = False
     next_step: Optional[int] = None
+    signature: Optional[FailureSignature] = None
+    started_at: float = 0.0
 
 
 # =============================================================================
@@ -297,6 +313,49 @@ def _handle_constraint_violation(
     )
 
 
+def _handle_retry_from_step(
+    context: Dict[str, Any],
+    state_manager: Optional[Any] = None
+) -> RecoveryResult:
+    """
+    Handle any error by retrying from an earlier step.
+
+    Strategy:
+    Re-run from the strategy's target step (context['target_step']).
+    """
+    step = context.get('step')
+    target_step = context.get('target_step') or step
+
+    if state_manager and step is not None:
+        state_manager.set_retry_context(
+            step=step,
+            failing_categories=context.get('failing_categories')
+        )
+
+    return RecoveryResult(
+        success=target_step is not None,
+        action_taken=RecoveryAction.RETRY_FROM_STEP,
+        message=f"Retrying from step {target_step}",
+        retry_recommended=target_step is not None,
+        next_step=target_step
+    )
+
+
+def _handle_abort(
+    context: Dict[str, Any],
+    state_manager: Optional[Any] = None
+) -> RecoveryResult:
+    """Handle unrecoverable errors by stopping the pipeline."""
+    error_msg = context.get('error_message', 'Unrecoverable error')
+
+    return RecoveryResult(
+        success=False,
+        action_taken=RecoveryAction.ABORT,
+        message=f"Aborting: {error_msg}",
+        retry_recommended=False
+    )
+
+
 def _handle_unknown(
     context: Dict[str, Any],
     state_manager: Optional[Any] = None
@@ -323,6 +382,17 @@ ERROR_HANDLERS = {
     ErrorType.UNKNOWN: _handle_unknown,
 }
 
+# Handlers for an action regardless of error type; used when the chosen
+# strategy is not the error type's own handler
+ACTION_HANDLERS: Dict[RecoveryAction, Callable] = {
+    RecoveryAction.RETRY_FROM_STEP: _handle_retry_from_step,
+    RecoveryAction.FORCE_VISUAL_IDENTIFICATION: _handle_quota_not_met,
+    RecoveryAction.ADD_DEFAULT_MARKERS: _handle_missing_marker,
+    RecoveryAction.REGENERATE_VISUAL_SPEC: _handle_spec_mismatch,
+    RecoveryAction.ESCALATE_TO_USER: _handle_unknown,
+    RecoveryAction.ABORT: _handle_abort,
+}
+
 
 # =============================================================================
 # RECOVERY STRATEGIES - Pre-defined strategies for each error type
@@ -399,19 +469,49 @@ class ErrorRecovery:
     Unified error recovery system for the NCLEX pipeline.
 
     Coordinates error handling, recovery strategies, and retry logic
-    with the StepStateManager.
+    with the StepStateManager. With a failure index (by default the one
+    in the state manager's database) classifications and recovery
+    outcomes persist across runs.
     """
 
-    def __init__(self, state_manager: Optional[Any] = None):
+    def __init__(
+        self,
+        state_manager: Optional[Any] = None,
+        failure_index: Optional[FailureIndex] = None
+    ):
         """
         Initialize error recovery system.
 
         Args:
             state_manager: Optional StepStateManager instance
+            failure_index: Persistent failure index (default: one sharing
+                state_manager.store, or none without a state manager)
         """
         self.state_manager = state_manager
+        if failure_index is None and getattr(state_manager, 'store', None) is not None:
+            failure_index = FailureIndex(state_manager.store)
+        self.failure_index = failure_index
         self.error_history: List[PipelineError] = []
         self.recovery_history: List[RecoveryResult] = []
+        self._classified: Dict[str, ErrorType] = {}
+
+    @staticmethod
+    def signature_for(
+        kind: str,
+        step: Optional[int],
+        context: Optional[Dict[str, Any]] = None,
+        message: str = ''
+    ) -> FailureSignature:
+        """
+        Failure signature from an error kind, step and context.
+
+        The rule is the context's rule, violation_type or category; the
+        message defaults to the context's error_message.
+        """
+        context = context or {}
+        rule = context.get('rule') or context.get('violation_type') or context.get('category')
+        message = message or context.get('error_message') or context.get('message') or ''
+        return failure_signature(kind, step, str(rule) if rule else None, str(message))
 
     def classify_error(
         self,
@@ -422,6 +522,9 @@ class ErrorRecovery:
         """
         Classify an exception into an ErrorType.
 
+        A failure seen before (same signature) reuses its recorded
+        classification instead of being matched again.
+
         Args:
             error: The exception that occurred
             step: Current pipeline step
@@ -430,8 +533,23 @@ class ErrorRecovery:
         Returns:
             Classified ErrorType
         """
+        signature = self.signature_for(type(error).__name__, step, context, str(error))
+        error_type = self._classified.get(signature.key)
+        if error_type is None and self.failure_index is not None:
+            name = self.failure_index.classification(signature)
+            error_type = ErrorType[name] if name in ErrorType.__members__ else None
+        if error_type is None:
+            error_type = self._match_error(error)
+
+        self._classified[signature.key] = error_type
+        if self.failure_index is not None:
+            self.failure_index.record_occurrence(signature, error_type.name)
+        return error_type
+
+    @staticmethod
+    def _match_error(error: Exception) -> ErrorType:
+        """Classify an exception from its message."""
         error_str = str(error).lower()
-        context = context or {}
 
         # QA-related errors
         if 'score' in error_str or 'threshold' in error_str:
@@ -509,6 +627,12 @@ class ErrorRecovery:
         """
         Handle an error and attempt recovery.
 
+        Runs the action chosen by get_strategy(): the error type's own
+        handler while that action is the default, otherwise the
+        handler for the chosen action. Nothing is recorded here; the
+        caller that re-validates the retried step reports whether the
+        recovery worked with record_outcome().
+
         Args:
             error_type: Type of error to handle
             context: Error context with relevant data
@@ -516,27 +640,87 @@ class ErrorRecovery:
         Returns:
             RecoveryResult with outcome
         """
-        handler = ERROR_HANDLERS.get(error_type, _handle_unknown)
-        result = handler(context, self.state_manager)
+        strategy = self.get_strategy(error_type, context)
+        handler = ERROR_HANDLERS.get(error_type)
+        if handler is None or strategy.action != get_recovery_strategy(error_type).action:
+            handler = ACTION_HANDLERS.get(strategy.action, handler or _handle_unknown)
 
+        started = time.perf_counter()
+        context = {'target_step': strategy.target_step, **context}
+        result = handler(context, self.state_manager)
+        result.started_at = started
+        result.signature = self.signature_for(error_type.name, context.get('step'), context)
         self.recovery_history.append(result)
         return result
 
-    def get_strategy(self, error_type: ErrorType) -> RecoveryStrategy:
+    def record_outcome(
+        self,
+        result: RecoveryResult,
+        success: bool,
+        duration_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Record whether a recovery returned by handle() fixed the failure.
+
+        Call once the retried step has been re-validated.
+
+        Args:
+            result: RecoveryResult from handle()
+            success: Whether the re-validated step passed
+            duration_seconds: Total recovery time (default: time since
+                handle() was called)
+        """
+        if self.failure_index is None or result.signature is None:
+            return
+        seconds = time.perf_counter() - result.started_at if duration_seconds is None \
+            else duration_seconds
+        self.failure_index.record_outcome(
+            result.signature, result.action_taken.name, success, seconds,
+            error_type=result.signature.kind
+        )
+
+    def get_strategy(
+        self,
+        error_type: ErrorType,
+        context: Optional[Dict[str, Any]] = None
+    ) -> RecoveryStrategy:
         """
         Get the recovery strategy for an error type.
 
+        With a failure index, the action with the lowest expected time to
+        recovery for this failure (or, failing that, for this error type) replaces
+        the default action; its history is in parameters['history'].
+
         Args:
             error_type: Type of error
+            context: Error context (step, rule, error_message) identifying
+                the failure
 
         Returns:
             RecoveryStrategy instance
         """
-        return RECOVERY_STRATEGIES.get(
-            error_type,
-            RecoveryStrategy(
-                action=RecoveryAction.ESCALATE_TO_USER,
-                description="No specific strategy defined"
+        strategy = get_recovery_strategy(error_type)
+        if self.failure_index is None:
+            return strategy
+
+        context = context or {}
+        signature = self.signature_for(error_type.name, context.get('step'), context)
+        best = self.failure_index.best_action(signature, error_type=error_type.name)
+        if best is None or best.action not in RecoveryAction.__members__:
+            return strategy
+
+        action = RecoveryAction[best.action]
+        description = strategy.description
+        if action != strategy.action:
+            description = f"{action.name} has the lowest expected recovery time " \
+                          f"({best.successes}/{best.attempts} successful)"
+        return replace(
+            strategy,
+            action=action,
+            parameters={**strategy.parameters, 'history': best.to_dict()},
+            description=description,
+            fallback_action=strategy.fallback_action or (
+                strategy.action if action != strategy.action else None
             )
         )
 
@@ -576,13 +760,15 @@ class ErrorRecovery:
             },
             'recoverable_count': len([e for e in self.error_history if e.recoverable]),
             'recovery_attempts': len(self.recovery_history),
-            'successful_recoveries': len([r for r in self.recovery_history if r.success])
+            'successful_recoveries': len([r for r in self.recovery_history if r.success]),
+            'top_failures': self.failure_index.report(limit=5) if self.failure_index else []
         }
 
     def clear_history(self) -> None:
         """Clear error and recovery history."""
         self.error_history.clear()
         self.recovery_history.clear()
+        self._classified.clear()
 
 
 # =============================================================================
@@ -0,0 +1,421 @@
+"""
+Event Bus
+Structured progress events for pipeline runs and batches.
+
+Runners emit run/phase/day started and finished, agent finished, gate
+failed and file written events, with timings (and sizes for files).
+Sinks:
+
+- JsonlSink     - one JSON object per line, appended to a file
+- CallbackSink  - an in-process function (dashboards, tests)
+- SSESink       - a small local HTTP server streaming Server-Sent Events
+                  (GET /events; a reconnecting client passes
+                  Last-Event-ID and gets the events it missed)
+
+Progress events carry completed/total counts, throughput and an ETA.
+With no sinks attached emit() returns at once.
+
+Usage:
+    from skills.utilities.event_bus import (
+        get_event_bus, configure_event_bus, JsonlSink, CallbackSink, SSESink
+    )
+
+    bus = configure_event_bus(jsonl='outputs/events.jsonl', sse_port=8765)
+    bus.subscribe(CallbackSink(lambda event: print(event.kind, event.fields)))
+
+    with bus.span('phase', phase='validation', day=3):
+        ...                                         # phase_started / phase_finished
+    bus.emit('gate_failed', gate='timing_validator', day=3)
+    bus.file_written('production/Day_03/lesson_plan.md', day=3)
+
+    # curl -N http://127.0.0.1:8765/events
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Event kinds emitted by the pipeline runners (span() also emits
+# batch_/unit_started and _finished)
+RUN_STARTED = 'run_started'
+RUN_FINISHED = 'run_finished'
+PHASE_STARTED = 'phase_started'
+PHASE_FINISHED = 'phase_finished'
+DAY_STARTED = 'day_started'
+DAY_FINISHED = 'day_finished'
+SECTION_STARTED = 'section_started'
+SECTION_FINISHED = 'section_finished'
+AGENT_FINISHED = 'agent_finished'
+GATE_FAILED = 'gate_failed'
+FILE_WRITTEN = 'file_written'
+
+# Environment variables read by get_event_bus()
+EVENTS_JSONL_ENV = 'THEATER_PIPELINE_EVENTS_JSONL'
+EVENTS_PORT_ENV = 'THEATER_PIPELINE_EVENTS_PORT'
+
+# Events an SSESink keeps for reconnecting clients
+SSE_HISTORY = 1000
+
+# Seconds between SSE keep-alive comments
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+# =============================================================================
+# EVENTS
+# =============================================================================
+
+@dataclass
+class PipelineEvent:
+    """One progress event."""
+    kind: str
+    seq: int
+    timestamp: float  # epoch seconds
+    elapsed: float    # seconds since the bus started
+    fields: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'kind': self.kind,
+            'seq': self.seq,
+            'timestamp': round(self.timestamp, 6),
+            'elapsed': round(self.elapsed, 6),
+            **self.fields
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(',', ':'), default=str)
+
+
+@dataclass
+class Progress:
+    """Completed/total counter with throughput and ETA (thread-safe)."""
+    total: int
+    completed: int = 0
+    started: float = field(default_factory=time.monotonic)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def advance(self, count: int = 1) -> Dict[str, Any]:
+        """Count finished items; returns progress fields for an event."""
+        with self._lock:
+            self.completed += count
+            completed = self.completed
+        elapsed = time.monotonic() - self.started
+        rate = completed / elapsed if elapsed > 0 else 0.0
+        remaining = max(0, self.total - completed)
+        return {
+            'completed': completed,
+            'total': self.total,
+            'per_minute': round(rate * 60, 3),
+            'eta_seconds': round(remaining / rate, 1) if rate else None
+        }
+
+
+# =============================================================================
+# SINKS
+# =============================================================================
+
+class EventSink(ABC):
+    """Receives every event emitted on the bus it is subscribed to."""
+
+    @abstractmethod
+    def handle(self, event: PipelineEvent) -> None:
+        """Deliver one event."""
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class CallbackSink(EventSink):
+    """Calls fn(event) in the emitting thread."""
+
+    def __init__(self, fn: Callable[[PipelineEvent], Any], kinds: Optional[List[str]] = None):
+        """
+        Args:
+            fn: Called with each event
+            kinds: Only these event kinds (default: all)
+        """
+        self.fn = fn
+        self.kinds = set(kinds) if kinds else None
+
+    def handle(self, event: PipelineEvent) -> None:
+        if self.kinds is None or event.kind in self.kinds:
+            self.fn(event)
+
+
+class JsonlSink(EventSink):
+    """Appends events to a JSON-lines file, one flushed line per event."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def handle(self, event: PipelineEvent) -> None:
+        line = event.to_json() + '\n'
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class SSESink(EventSink):
+    """
+    Local HTTP server streaming events as Server-Sent Events.
+
+    GET /events streams every event (id: seq, event: kind, data: JSON);
+    recent events are replayed to clients that send Last-Event-ID. The
+    server runs on daemon threads and binds to localhost by default.
+    """
+
+    def __init__(self, port: int = 0, host: str = '127.0.0.1', history: int = SSE_HISTORY):
+        """
+        Args:
+            port: Port to listen on (0 picks a free one; see .url)
+            host: Interface to bind
+            history: Recent events kept for reconnecting clients
+        """
+        self._history: Deque[PipelineEvent] = deque(maxlen=history)
+        self._clients: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name='event-bus-sse', daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/events"
+
+    def handle(self, event: PipelineEvent) -> None:
+        with self._lock:
+            self._history.append(event)
+            clients = list(self._clients)
+        for client in clients:
+            client.put(event)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            clients, self._clients = self._clients, []
+        for client in clients:
+            client.put(None)
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _subscribe(self, last_seq: Optional[int]) -> queue.Queue:
+        client: queue.Queue = queue.Queue()
+        with self._lock:
+            if self._closed:
+                client.put(None)
+                return client
+            if last_seq is not None:
+                for event in self._history:
+                    if event.seq > last_seq:
+                        client.put(event)
+            self._clients.append(client)
+        return client
+
+    def _unsubscribe(self, client: queue.Queue) -> None:
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+
+    def _handler_class(self) -> type:
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/events':
+                    self.send_error(404)
+                    return
+                last_id = self.headers.get('Last-Event-ID')
+                client = sink._subscribe(int(last_id) if last_id and last_id.isdigit() else None)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                try:
+                    self.wfile.write(b': connected\n\n')
+                    self.wfile.flush()
+                    while True:
+                        try:
+                            event = client.get(timeout=SSE_KEEPALIVE_SECONDS)
+                        except queue.Empty:
+                            self.wfile.write(b': keep-alive\n\n')
+                            self.wfile.flush()
+                            continue
+                        if event is None:
+                            break
+                        self.wfile.write(
+                            f"id: {event.seq}\nevent: {event.kind}\ndata: {event.to_json()}\n\n"
+                            .encode('utf-8')
+                        )
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    sink._unsubscribe(client)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("SSE %s", format % args)
+
+        return Handler
+
+
+# =============================================================================
+# BUS
+# =============================================================================
+
+class EventBus:
+    """Dispatches events to its sinks (synchronously, in emit order)."""
+
+    def __init__(self, sinks: Optional[List[EventSink]] = None):
+        self._sinks: List[EventSink] = list(sinks or [])
+        self._lock = threading.RLock()  # a callback may emit
+        self._seq = 0
+        self._started = time.monotonic()
+
+    @property
+    def active(self) -> bool:
+        """True when at least one sink is subscribed."""
+        return bool(self._sinks)
+
+    def subscribe(self, sink: EventSink) -> EventSink:
+        with self._lock:
+            self._sinks = self._sinks + [sink]
+        return sink
+
+    def unsubscribe(self, sink: EventSink) -> None:
+        with self._lock:
+            self._sinks = [s for s in self._sinks if s is not sink]
+
+    def close(self) -> None:
+        """Unsubscribe and close every sink."""
+        with self._lock:
+            sinks, self._sinks = self._sinks, []
+        for sink in sinks:
+            sink.close()
+
+    def emit(self, kind: str, **fields: Any) -> Optional[PipelineEvent]:
+        """
+        Emit an event to every sink.
+
+        A failing sink is logged and skipped; it never fails the run.
+
+        Returns:
+            The event, or None when no sink is subscribed
+        """
+        if not self._sinks:
+            return None
+        with self._lock:
+            self._seq += 1
+            event = PipelineEvent(kind, self._seq, time.time(),
+                                  time.monotonic() - self._started, fields)
+            sinks = self._sinks
+            for sink in sinks:
+                try:
+                    sink.handle(event)
+                except Exception as e:
+                    logger.warning(f"Event sink {type(sink).__name__} failed: {e}")
+        return event
+
+    @contextmanager
+    def span(self, name: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Emit <name>_started, then <name>_finished with duration_seconds.
+
+        The yielded dict is merged into the finished event (e.g. a
+        status); an exception marks it status='error' and propagates.
+        """
+        result: Dict[str, Any] = {}
+        if not self._sinks:
+            yield result
+            return
+        self.emit(f"{name}_started", **fields)
+        started = time.perf_counter()
+        try:
+            yield result
+        except BaseException as e:
+            result.setdefault('status', 'error')
+            result.setdefault('error', str(e))
+            raise
+        finally:
+            self.emit(f"{name}_finished", **fields, **result,
+                      duration_seconds=round(time.perf_counter() - started, 6))
+
+    def file_written(self, path: Union[str, Path], **fields: Any) -> Optional[PipelineEvent]:
+        """Emit file_written with the file's size."""
+        if not self._sinks:
+            return None
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = None
+        return self.emit(FILE_WRITTEN, path=str(path), bytes=size, **fields)
+
+
+# Global bus instance (lazy-created)
+_bus: Optional[EventBus] = None
+
+
+def configure_event_bus(
+    jsonl: Optional[Union[str, Path]] = None,
+    sse_port: Optional[int] = None,
+    callback: Optional[Callable[[PipelineEvent], Any]] = None
+) -> EventBus:
+    """Replace the shared bus (closing the old one's sinks) with the given sinks."""
+    global _bus
+    if _bus is not None:
+        _bus.close()
+    sinks: List[EventSink] = []
+    if jsonl:
+        sinks.append(JsonlSink(jsonl))
+    if sse_port is not None:
+        sink = SSESink(port=sse_port)
+        logger.info(f"Streaming pipeline events at {sink.url}")
+        sinks.append(sink)
+    if callback is not None:
+        sinks.append(CallbackSink(callback))
+    _bus = EventBus(sinks)
+    return _bus
+
+
+def get_event_bus() -> EventBus:
+    """
+    Get or create the shared bus.
+
+    $THEATER_PIPELINE_EVENTS_JSONL and $THEATER_PIPELINE_EVENTS_PORT
+    attach a JSONL / SSE sink to a newly created bus.
+    """
+    global _bus
+    if _bus is None:
+        port = os.environ.get(EVENTS_PORT_ENV)
+        configure_event_bus(
+            jsonl=os.environ.get(EVENTS_JSONL_ENV) or None,
+            sse_port=int(port) if port else None
+        )
+    return _bus
@@ -0,0 +1,326 @@
+"""
+Failure Index
+Persistent index of pipeline failures and the recovery actions that fixed them.
+
+Provides:
+- Failure signatures: error kind, step, rule and the message with its
+  variable parts (numbers, quoted values, paths, ids) normalised away
+- Per signature, the classification and, per recovery action, attempts,
+  successes and time spent (failed attempts included)
+- Ranking of actions by expected time to recovery
+- Tables in the pipeline's StateStore database, shared by concurrent
+  workers and not rolled back by checkpoint restores
+
+Usage:
+    from skills.utilities.failure_index import FailureIndex, failure_signature
+
+    index = FailureIndex('outputs/state/pipeline_state.db')
+    signature = failure_signature('CONSTRAINT_VIOLATION', step=7,
+                                  rule='char_limit', message=str(error))
+
+    index.record_outcome(signature, 'APPLY_FALLBACK', success=True, seconds=0.4)
+    best = index.best_action(signature)     # lowest expected time to recovery
+    print(index.report(limit=5))            # most frequent failures
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from skills.utilities.regex_registry import compile_pattern
+from skills.utilities.state_store import StateStore
+
+
+# Normalised messages are cut to this many characters
+MAX_MESSAGE_CHARS = 200
+
+# Actions need this many successes before they are preferred
+MIN_SUCCESSES = 1
+
+_QUOTED_RE = compile_pattern(r"'[^']*'|\"[^\"]*\"")
+_PATH_RE = compile_pattern(r"(?:[a-z]:)?[\w.-]*[/\\][\w./\\-]*|\b[\w-]+\.(?:json|md|txt|pptx|yaml|db)\b")
+_HEX_RE = compile_pattern(r"\b(?:0x)?[0-9a-f]{8,}\b")
+_NUMBER_RE = compile_pattern(r"[-+]?\d+(?:\.\d+)?")
+_SPACE_RE = compile_pattern(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS failure_signatures (
+    signature TEXT PRIMARY KEY,
+    kind TEXT,
+    step INTEGER,
+    rule TEXT,
+    message TEXT,
+    error_type TEXT,
+    occurrences INTEGER,
+    first_seen TEXT,
+    last_seen TEXT
+);
+CREATE TABLE IF NOT EXISTS recovery_outcomes (
+    signature TEXT,
+    action TEXT,
+    attempts INTEGER,
+    successes INTEGER,
+    success_seconds REAL,
+    best_seconds REAL,
+    last_used TEXT,
+    total_seconds REAL,
+    PRIMARY KEY (signature, action)
+);
+CREATE INDEX IF NOT EXISTS failure_signatures_error_type ON failure_signatures (error_type)
+"""
+
+
+# =============================================================================
+# SIGNATURES
+# =============================================================================
+
+def normalize_message(message: str) -> str:
+    """Message with quoted values, paths, ids and numbers replaced by placeholders."""
+    text = _QUOTED_RE.sub('<str>', str(message).lower())
+    text = _PATH_RE.sub('<path>', text)
+    text = _HEX_RE.sub('<id>', text)
+    text = _NUMBER_RE.sub('<n>', text)
+    return _SPACE_RE.sub(' ', text).strip()[:MAX_MESSAGE_CHARS]
+
+
+@dataclass(frozen=True)
+class FailureSignature:
+    """Identity of a recurring failure."""
+    kind: str  # exception class name or ErrorType name
+    step: Optional[int]
+    rule: str
+    message: str  # normalised
+
+    @property
+    def key(self) -> str:
+        text = '|'.join((self.kind, str(self.step), self.rule, self.message))
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def failure_signature(
+    kind: str,
+    step: Optional[int] = None,
+    rule: Optional[str] = None,
+    message: str = ''
+) -> FailureSignature:
+    """Build a signature, normalising the message."""
+    return FailureSignature(kind, step, rule or '', normalize_message(message))
+
+
+# =============================================================================
+# ACTION STATISTICS
+# =============================================================================
+
+@dataclass
+class ActionStats:
+    """History of one recovery action for one signature (or error type)."""
+    action: str
+    attempts: int
+    successes: int
+    success_seconds: float  # total time of the successful attempts
+    best_seconds: Optional[float] = None
+    total_seconds: Optional[float] = None  # total time of all attempts
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.attempts if self.attempts else 0.0
+
+    @property
+    def mean_seconds(self) -> Optional[float]:
+        """Mean duration of the successful attempts."""
+        return self.success_seconds / self.successes if self.successes else None
+
+    @property
+    def expected_seconds(self) -> Optional[float]:
+        """
+        Expected time until the action recovers the failure.
+
+        Mean attempt time (failed attempts included) over the success rate,
+        i.e. the cost of retrying the action until it works.
+        """
+        if not self.successes:
+            return None
+        total = self.success_seconds if self.total_seconds is None else self.total_seconds
+        return (total / self.attempts) / self.success_rate
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'action': self.action,
+            'attempts': self.attempts,
+            'successes': self.successes,
+            'success_rate': round(self.success_rate, 3),
+            'mean_seconds': self.mean_seconds,
+            'expected_seconds': self.expected_seconds,
+            'best_seconds': self.best_seconds
+        }
+
+
+def fastest_successful(stats: List[ActionStats]) -> Optional[ActionStats]:
+    """Action with the lowest expected time to recovery (ties: higher success rate)."""
+    candidates = [s for s in stats if s.successes >= MIN_SUCCESSES]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda s: (s.expected_seconds, -s.success_rate, s.action))
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class FailureIndex:
+    """Failure signatures, classifications and recovery outcomes in SQLite."""
+
+    def __init__(self, store: Union[StateStore, str, Path]):
+        """
+        Open the index.
+
+        Args:
+            store: StateStore to share (e.g. StepStateManager.store) or a
+                database path
+        """
+        self.store = store if isinstance(store, StateStore) else StateStore(store)
+        with self.store.transaction() as conn:
+            for statement in filter(None, (s.strip() for s in _SCHEMA.split(';'))):
+                conn.execute(statement)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(recovery_outcomes)")}
+            if 'total_seconds' not in columns:
+                # Older indexes only timed successes; those rows fall back to success_seconds
+                conn.execute("ALTER TABLE recovery_outcomes ADD COLUMN total_seconds REAL")
+
+    def _touch(self, conn: Any, signature: FailureSignature, error_type: Optional[str]) -> None:
+        now = datetime.now().isoformat()
+        conn.execute(
+            "INSERT INTO failure_signatures (signature, kind, step, rule, message, error_type, "
+            "occurrences, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?) "
+            "ON CONFLICT (signature) DO UPDATE SET occurrences = occurrences + 1, "
+            "last_seen = excluded.last_seen, "
+            "error_type = COALESCE(excluded.error_type, error_type)",
+            (signature.key, signature.kind, signature.step, signature.rule,
+             signature.message, error_type, now, now)
+        )
+
+    # =========================================================================
+    # CLASSIFICATIONS
+    # =========================================================================
+
+    def classification(self, signature: FailureSignature) -> Optional[str]:
+        """ErrorType name recorded for a signature, if any."""
+        row = self.store.connection().execute(
+            "SELECT error_type FROM failure_signatures WHERE signature = ?", (signature.key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def record_occurrence(self, signature: FailureSignature, error_type: Optional[str] = None) -> None:
+        """Count an occurrence of a signature (and remember its classification)."""
+        with self.store.transaction() as conn:
+            self._touch(conn, signature, error_type)
+
+    # =========================================================================
+    # OUTCOMES
+    # =========================================================================
+
+    def record_outcome(
+        self,
+        signature: FailureSignature,
+        action: str,
+        success: bool,
+        seconds: float,
+        error_type: Optional[str] = None
+    ) -> None:
+        """
+        Record one recovery attempt for a signature.
+
+        Args:
+            signature: Failure signature
+            action: RecoveryAction name
+            success: Whether the action recovered the failure
+            seconds: Time the attempt took (counted whether or not it worked)
+            error_type: ErrorType name of the failure, if known
+        """
+        won = 1 if success else 0
+        with self.store.transaction() as conn:
+            self._touch(conn, signature, error_type)
+            conn.execute(
+                "INSERT INTO recovery_outcomes (signature, action, attempts, successes, "
+                "success_seconds, best_seconds, last_used, total_seconds) "
+                "VALUES (?, ?, 1, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (signature, action) DO UPDATE SET "
+                "attempts = attempts + 1, successes = successes + excluded.successes, "
+                "success_seconds = success_seconds + excluded.success_seconds, "
+                "total_seconds = COALESCE(total_seconds, success_seconds) + excluded.total_seconds, "
+                "best_seconds = CASE WHEN excluded.best_seconds IS NULL THEN best_seconds "
+                "ELSE MIN(COALESCE(best_seconds, excluded.best_seconds), excluded.best_seconds) END, "
+                "last_used = excluded.last_used",
+                (signature.key, action, won, seconds * won, seconds if success else None,
+                 datetime.now().isoformat(), seconds)
+            )
+
+    def action_stats(
+        self,
+        signature: Optional[FailureSignature] = None,
+        error_type: Optional[str] = None
+    ) -> List[ActionStats]:
+        """Per-action history for a signature, or summed over an error type."""
+        if signature is not None:
+            where, params = "o.signature = ?", (signature.key,)
+        else:
+            where, params = "s.error_type = ?", (error_type,)
+        rows = self.store.connection().execute(
+            "SELECT o.action, SUM(o.attempts), SUM(o.successes), SUM(o.success_seconds), "
+            "MIN(o.best_seconds), SUM(COALESCE(o.total_seconds, o.success_seconds)) "
+            "FROM recovery_outcomes o "
+            "JOIN failure_signatures s ON s.signature = o.signature "
+            f"WHERE {where} GROUP BY o.action ORDER BY o.action",
+            params
+        ).fetchall()
+        return [ActionStats(*row) for row in rows]
+
+    def best_action(
+        self,
+        signature: FailureSignature,
+        error_type: Optional[str] = None
+    ) -> Optional[ActionStats]:
+        """
+        Action with the lowest expected time to recovery for a signature.
+
+        Falls back to the history of every signature of error_type when
+        this signature has no successful action yet.
+        """
+        best = fastest_successful(self.action_stats(signature))
+        if best is None and error_type:
+            best = fastest_successful(self.action_stats(error_type=error_type))
+        return best
+
+    # =========================================================================
+    # ANALYTICS
+    # =========================================================================
+
+    def report(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most frequent failures with their recovery history."""
+        rows = self.store.connection().execute(
+            "SELECT signature, kind, step, rule, message, error_type, occurrences, "
+            "first_seen, last_seen FROM failure_signatures "
+            "ORDER BY occurrences DESC, last_seen DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+        report = []
+        for key, kind, step, rule, message, error_type, occurrences, first, last in rows:
+            signature = FailureSignature(kind, step, rule, message)
+            stats = self.action_stats(signature)
+            best = fastest_successful(stats)
+            report.append({
+                'signature': key,
+                'kind': kind,
+                'step': step,
+                'rule': rule,
+                'message': message,
+                'error_type': error_type,
+                'occurrences': occurrences,
+                'first_seen': first,
+                'last_seen': last,
+                'actions': [s.to_dict() for s in stats],
+                'best_action': best.action if best else None
+            })
+        return report
@@ -0,0 +1,353 @@
+"""
+Feature Cache
+Content-addressed cache for slide analysis and feature extraction.
+
+Provides:
+- cached_analysis(): decorator caching an analyzer entry point on the
+  slide fields it reads, ANALYZER_VERSION and its source fingerprint
+- FeatureCache: JSON entries in a bounded LRU plus an optional shared
+  disk tier
+- get_feature_cache() / configure_feature_cache(): the process-wide cache
+- source_fingerprint(): hash of a set of modules' source files
+
+Usage:
+    from skills.utilities.feature_cache import (
+        cached_analysis, configure_feature_cache, get_feature_cache
+    )
+
+    @cached_analysis('suggest_visual_type', key=lambda body, structure=None: (body,),
+                     types=(VisualType,))
+    def suggest_visual_type(body, structure=None):
+        ...
+
+    configure_feature_cache(max_entries=8192, disk_dir='outputs/cache/features')
+    get_feature_cache().stats()
+"""
+
+import functools
+import hashlib
+import os
+import json
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type, Union
+
+
+# Bump to invalidate every cached analysis (e.g. result layout changes)
+ANALYZER_VERSION = 2
+
+DEFAULT_MAX_ENTRIES = 4096
+
+# Environment override enabling the on-disk tier (e.g. shared worker scratch)
+FEATURE_CACHE_DIR_ENV = "THEATER_PIPELINE_FEATURE_CACHE_DIR"
+
+
+class FeatureCache:
+    """
+    Two-tier (memory LRU + optional disk) cache of JSON-encoded analysis results.
+
+    Thread-safe; max_entries=0 disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_dir: Optional[Union[str, Path]] = None
+    ):
+        self.max_entries = max_entries
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the encoded result for key, checking memory then disk."""
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return blob
+
+        blob = self._read_disk(key)
+        with self._lock:
+            if blob is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, blob)
+        return blob
+
+    def put(self, key: str, blob: bytes) -> None:
+        """Store an encoded result in memory (and on disk if configured)."""
+        with self._lock:
+            self._remember(key, blob)
+        self._write_disk(key, blob)
+
+    def _remember(self, key: str, blob: bytes) -> None:
+        self._entries[key] = blob
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if self.disk_dir is None:
+            return None
+        try:
+            return self._disk_path(key).read_bytes()
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, blob: bytes) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(blob)
+                os.replace(tmp, path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop in-memory entries and reset counters (and disk files if disk=True)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.disk_dir is not None and self.disk_dir.exists():
+            for path in self.disk_dir.glob("*/*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                'disk_dir': str(self.disk_dir) if self.disk_dir else None,
+            }
+
+
+# Global cache instance (lazy-created)
+_cache: Optional[FeatureCache] = None
+
+
+def get_feature_cache() -> FeatureCache:
+    """Get or create the shared cache ($THEATER_PIPELINE_FEATURE_CACHE_DIR enables disk)."""
+    global _cache
+    if _cache is None:
+        _cache = FeatureCache(disk_dir=os.environ.get(FEATURE_CACHE_DIR_ENV) or None)
+    return _cache
+
+
+def configure_feature_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    disk_dir: Optional[Union[str, Path]] = None
+) -> FeatureCache:
+    """Replace the shared cache (max_entries=0 disables it)."""
+    global _cache
+    _cache = FeatureCache(max_entries=max_entries, disk_dir=disk_dir)
+    return _cache
+
+
+# =============================================================================
+# KEYING
+# =============================================================================
+
+# Entry point name -> fingerprint of the source files it depends on
+_fingerprints: Dict[str, str] = {}
+
+
+def source_fingerprint(name: str, modules: Iterable[str]) -> str:
+    """
+    Hash ANALYZER_VERSION plus the source of each module (computed once per name).
+
+    Args:
+        name: Fingerprint name (an entry point, or another derived artifact)
+        modules: Imported module names whose source files are hashed
+    """
+    fingerprint = _fingerprints.get(name)
+    if fingerprint is None:
+        digest = hashlib.sha256(f"v{ANALYZER_VERSION}".encode())
+        for module_name in modules:
+            module_file = getattr(sys.modules.get(module_name), '__file__', None)
+            digest.update(module_name.encode())
+            if module_file:
+                try:
+                    digest.update(Path(module_file).read_bytes())
+                except OSError:
+                    pass
+        fingerprint = digest.hexdigest()
+        _fingerprints[name] = fingerprint
+    return fingerprint
+
+
+def content_key(name: str, fingerprint: str, parts: Tuple[Any, ...]) -> str:
+    """
+    Digest of an entry point's inputs.
+
+    Args:
+        name: Entry point name
+        fingerprint: Analyzer source fingerprint
+        parts: The input values the entry point reads (str/int/None)
+
+    Returns:
+        Hex digest used as the cache key
+    """
+    digest = hashlib.sha256(name.encode())
+    digest.update(fingerprint.encode())
+    for part in parts:
+        text = '' if part is None else str(part)
+        digest.update(b"\0")
+        digest.update(type(part).__name__.encode())
+        digest.update(b"\0")
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+class UncacheableResult(TypeError):
+    """A result holds a value the JSON encoding cannot rebuild."""
+
+
+def _encode_value(value: Any, types: Dict[str, Type]) -> Any:
+    """Plain JSON data for value, tagging tuples, non-str keys and listed types."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode_value(v, types) for v in value]
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode_value(v, types) for v in value]}
+    if isinstance(value, dict):
+        if all(isinstance(k, str) and not k.startswith('__') for k in value):
+            return {k: _encode_value(v, types) for k, v in value.items()}
+        return {'__items__': [[_encode_value(k, types), _encode_value(v, types)] for k, v in value.items()]}
+    cls = type(value)
+    if types.get(cls.__qualname__) is cls:
+        if isinstance(value, Enum):
+            return {'__enum__': cls.__qualname__, 'name': value.name}
+        if is_dataclass(value):
+            return {'__dataclass__': cls.__qualname__,
+                    'fields': {f.name: _encode_value(getattr(value, f.name), types) for f in fields(value)}}
+    raise UncacheableResult(f"cannot cache a {cls.__qualname__} result")
+
+
+def _decode_value(data: Any, types: Dict[str, Type]) -> Any:
+    """Inverse of _encode_value; unknown tags raise UncacheableResult."""
+    if isinstance(data, list):
+        return [_decode_value(v, types) for v in data]
+    if not isinstance(data, dict):
+        return data
+    if '__tuple__' in data:
+        return tuple(_decode_value(v, types) for v in data['__tuple__'])
+    if '__items__' in data:
+        return {_decode_value(k, types): _decode_value(v, types) for k, v in data['__items__']}
+    if '__enum__' in data or '__dataclass__' in data:
+        cls = types.get(data.get('__enum__') or data.get('__dataclass__'))
+        if cls is None:
+            raise UncacheableResult(f"unlisted type {data.get('__enum__') or data.get('__dataclass__')!r}")
+        if '__enum__' in data:
+            return cls[data['name']]
+        values = {k: _decode_value(v, types) for k, v in data['fields'].items()}
+        init = {f.name for f in fields(cls) if f.init}
+        obj = cls(**{k: v for k, v in values.items() if k in init})
+        for k, v in values.items():
+            if k not in init:
+                setattr(obj, k, v)
+        return obj
+    return {k: _decode_value(v, types) for k, v in data.items()}
+
+
+def encode_result(result: Any, types: Dict[str, Type]) -> bytes:
+    """JSON bytes for a cached result (raises UncacheableResult)."""
+    return json.dumps(_encode_value(result, types), separators=(',', ':')).encode('utf-8')
+
+
+def decode_result(blob: bytes, types: Dict[str, Type]) -> Any:
+    """Rebuild a result from encode_result() bytes (raises ValueError/TypeError if malformed)."""
+    return _decode_value(json.loads(blob), types)
+
+
+def cached_analysis(
+    name: str,
+    key: Callable[..., Tuple[Any, ...]],
+    depends_on: Iterable[str] = (),
+    types: Iterable[Type] = ()
+) -> Callable:
+    """
+    Decorate an analysis function with the shared feature cache.
+
+    Args:
+        name: Entry point name (part of the key)
+        key: Called with the function's arguments; returns the tuple of
+            input values the result depends on
+        depends_on: Extra module names whose source feeds the fingerprint
+            (the function's own module is always included)
+        types: Dataclasses and enums the result may contain (nested
+            dataclasses included); results holding anything else beyond
+            JSON data, tuples and dicts are returned uncached
+
+    The undecorated function stays available as .uncached.
+    """
+    allowed = {cls.__qualname__: cls for cls in types}
+
+    def decorate(func: Callable) -> Callable:
+        modules = (func.__module__,) + tuple(depends_on)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_feature_cache()
+            if not cache.enabled:
+                return func(*args, **kwargs)
+
+            cache_key = content_key(name, source_fingerprint(name, modules), key(*args, **kwargs))
+            blob = cache.get(cache_key)
+            if blob is not None:
+                try:
+                    return decode_result(blob, allowed)
+                except (ValueError, TypeError, KeyError, AttributeError):
+                    pass
+
+            result = func(*args, **kwargs)
+            try:
+                cache.put(cache_key, encode_result(result, allowed))
+            except UncacheableResult:
+                pass
+            return result
+
+        wrapper.uncached = func
+        return wrapper
+
+    return decorate
@@ -0,0 +1,209 @@
+"""
+Keyword Matcher
+Multi-keyword matching over a single linear scan (Aho-Corasick automaton).
+
+Scoring heuristics across the validators check dozens of indicator phrases
+against the same notes text. A KeywordMatcher compiles one vocabulary list
+into an automaton once, then reports every hit with its position in a
+single pass over the text.
+
+Usage:
+    from skills.utilities.keyword_matcher import KeywordMatcher, get_matcher
+
+    matcher = get_matcher(("for example", "such as", "imagine"))
+    hits = matcher.find_all(text)          # [KeywordHit(start, end, keyword)]
+    found = matcher.matched(text)          # {'such as', 'imagine'}
+    score = matcher.count_distinct(text) * 25
+"""
+
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+
+class KeywordHit(NamedTuple):
+    """A single keyword occurrence in scanned text."""
+    start: int
+    end: int
+    keyword: str
+
+
+def _is_word_char(ch: str) -> bool:
+    """Match the regex \\w definition used by \\b boundaries."""
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordMatcher:
+    """
+    Precompiled Aho-Corasick automaton for one vocabulary list.
+
+    Matching is case-insensitive by default (keywords and text are both
+    lowercased). With whole_words=True a hit only counts when it is bounded
+    by non-word characters, equivalent to wrapping each keyword in \\b...\\b.
+    """
+
+    def __init__(self,
+                 keywords: Iterable[str],
+                 case_sensitive: bool = False,
+                 whole_words: bool = False):
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Vocabulary to match (duplicates and empties ignored)
+            case_sensitive: Match keywords exactly as given
+            whole_words: Require word boundaries around each hit
+        """
+        self.case_sensitive = case_sensitive
+        self.whole_words = whole_words
+
+        seen = []
+        for kw in keywords:
+            if not kw:
+                continue
+            kw = kw if case_sensitive else kw.lower()
+            if kw not in seen:
+                seen.append(kw)
+        self.keywords: Tuple[str, ...] = tuple(seen)
+
+        # State 0 is the root; each state has goto edges, a failure link and
+        # the keyword indices that end at it (including via failure links).
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        """Construct the trie, then failure links breadth-first."""
+        out: List[List[int]] = [[]]
+        for index, kw in enumerate(self.keywords):
+            state = 0
+            for ch in kw:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    out.append([])
+                state = nxt
+            out[state].append(index)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                out[nxt].extend(out[self._fail[nxt]])
+
+        self._out = [tuple(o) for o in out]
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """
+        Find every (possibly overlapping) keyword occurrence.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Hits ordered by end position
+        """
+        if not text or not self.keywords:
+            return []
+        haystack = text if self.case_sensitive else text.lower()
+        goto, fail, out, keywords = self._goto, self._fail, self._out, self.keywords
+
+        hits = []
+        state = 0
+        for pos, ch in enumerate(haystack):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = pos + 1
+                for index in out[state]:
+                    kw = keywords[index]
+                    start = end - len(kw)
+                    if self.whole_words and not self._on_boundary(haystack, start, end):
+                        continue
+                    hits.append(KeywordHit(start, end, kw))
+        return hits
+
+    @staticmethod
+    def _on_boundary(text: str, start: int, end: int) -> bool:
+        """Check \\b semantics at both edges of a hit."""
+        if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+            return False
+        if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+            return False
+        return True
+
+    def matched(self, text: str) -> Set[str]:
+        """Return the distinct keywords present in text."""
+        return {hit.keyword for hit in self.find_all(text)}
+
+    def count_distinct(self, text: str) -> int:
+        """Count how many distinct keywords appear (same as sum(kw in text))."""
+        return len(self.matched(text))
+
+    def contains_any(self, text: str) -> bool:
+        """Return True if at least one keyword appears."""
+        return bool(self.find_all(text))
+
+    def count(self, text: str) -> Counter:
+        """
+        Count non-overlapping occurrences per keyword (same as str.count).
+
+        Returns:
+            Counter of keyword -> occurrences
+        """
+        counts: Counter = Counter()
+        last_end: Dict[str, int] = {}
+        for hit in sorted(self.find_all(text), key=lambda h: h.start):
+            if hit.start >= last_end.get(hit.keyword, 0):
+                counts[hit.keyword] += 1
+                last_end[hit.keyword] = hit.end
+        return counts
+
+    def first_positions(self, text: str) -> Dict[str, int]:
+        """Map each matched keyword to its first start offset (str.find)."""
+        positions: Dict[str, int] = {}
+        for hit in self.find_all(text):
+            if hit.start < positions.get(hit.keyword, len(text) + 1):
+                positions[hit.keyword] = hit.start
+        return positions
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords)} keywords, states={len(self._goto)})"
+
+
+@lru_cache(maxsize=256)
+def _cached_matcher(keywords: Tuple[str, ...],
+                    case_sensitive: bool,
+                    whole_words: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, case_sensitive=case_sensitive, whole_words=whole_words)
+
+
+def get_matcher(keywords: Iterable[str],
+                case_sensitive: bool = False,
+                whole_words: bool = False) -> KeywordMatcher:
+    """
+    Get the shared matcher for a vocabulary list, building it on first use.
+
+    Args:
+        keywords: Vocabulary list (order preserved)
+        case_sensitive: Match keywords exactly as given
+        whole_words: Require word boundaries around each hit
+
+    Returns:
+        KeywordMatcher compiled once per distinct vocabulary
+    """
+    return _cached_matcher(tuple(keywords), case_sensitive, whole_words)
@@ -2,8 +2,13 @@
 Pipeline State Manager - Track and Update Pipeline Progress
 ============================================================
 
-This script manages the pipeline_state.json file to track progress
-of each section through the pipeline steps.
+This script tracks the progress of each section through the pipeline
+steps. State lives in pipeline_state.db (a SQLite StateStore): a status
+update changes one row, so several workers can update different sections
+at once. The database is authoritative; pipeline_state.json is imported
+on first use and again whenever it is newer than the last import or
+export (i.e. it was edited by hand), and can be regenerated from the
+database with the export command.
 
 Usage:
     # View current state
@@ -17,14 +22,33 @@ Usage:
 
     # Generate progress report
     python pipeline_state_manager.py report
+
+    # Write the current state back out as pipeline_state.json
+    python pipeline_state_manager.py export
 """
 
 import json
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from skills.utilities.atomic_write import atomic_write_json
+from skills.utilities.state_store import StateStore
 
 STATE_FILE = Path(__file__).parent / "pipeline_state.json"
+STATE_DB = STATE_FILE.with_suffix('.db')
+
+# Meta key holding the modification time of pipeline_state.json as last
+# imported into or exported from STATE_DB
+_JSON_IMPORTED = 'pipeline_state_json_imported'
+
+_store: Optional[StateStore] = None
 
 VALID_STATUSES = ["pending", "in_progress", "completed", "failed", "skipped"]
 
@@ -39,23 +63,68 @@ SECTION_STEPS = [
 ]
 
 
-def load_state() -> dict:
-    """Load pipeline state from JSON file."""
-    if not STATE_FILE.exists():
-        return create_default_state()
+def get_store() -> StateStore:
+    """
+    Open the state database.
+
+    It is seeded from pipeline_state.json (or the default state) on first
+    use, and the JSON is imported again whenever it has changed since it
+    was last imported or exported.
+    """
+    global _store
+    if _store is None:
+        _store = StateStore(STATE_DB)
+    store = _store
+    json_mtime = STATE_FILE.stat().st_mtime if STATE_FILE.exists() else None
+    synced = _synced_mtime(store.get_meta(_JSON_IMPORTED))
+    if synced is not None and (json_mtime is None or json_mtime <= synced):
+        return store
+
+    with store.transaction():
+        synced = _synced_mtime(store.get_meta(_JSON_IMPORTED))
+        if synced is None and json_mtime is None:
+            if not store.has_pipeline_state():
+                store.save_pipeline_state(create_default_state())
+            store.set_meta(_JSON_IMPORTED, '0')
+        elif json_mtime is not None and (synced is None or json_mtime > synced):
+            if synced is not None or not store.has_pipeline_state():
+                with open(STATE_FILE, 'r', encoding='utf-8') as f:
+                    store.save_pipeline_state(json.load(f))
+            store.set_meta(_JSON_IMPORTED, repr(json_mtime))
+    return store
+
+
+def _synced_mtime(value: Optional[str]) -> Optional[float]:
+    """Meta value as a timestamp (earlier versions stored the import time)."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
 
-    with open(STATE_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+
+def load_state() -> dict:
+    """Load pipeline state from the state database."""
+    return get_store().load_pipeline_state()
 
 
 def save_state(state: dict):
-    """Save pipeline state to JSON file."""
+    """Save a full pipeline state dict (only changed rows are written)."""
     state['pipeline_info']['last_updated'] = datetime.now().strftime('%Y-%m-%d')
+    get_store().save_pipeline_state(state)
 
-    with open(STATE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(state, f, indent=2)
+    print(f"State saved to {STATE_DB}")
 
-    print(f"State saved to {STATE_FILE}")
+
+def export_state(path: Optional[Path] = None) -> Path:
+    """Write the current state as pipeline_state.json (atomically)."""
+    path = atomic_write_json(path or STATE_FILE, load_state(), indent=2)
+    if path.resolve() == STATE_FILE.resolve():
+        get_store().set_meta(_JSON_IMPORTED, repr(path.stat().st_mtime))
+
+    print(f"State exported to {path}")
+    return path
 
 
 def create_default_state() -> dict:
@@ -80,21 +149,15 @@ def create_default_state() -> dict:
 
 def add_section(section_name: str):
     """Add a new section to track."""
-    state = load_state()
-
-    if section_name in state['sections']:
+    if not get_store().add_section(section_name, SECTION_STEPS):
         print(f"Section '{section_name}' already exists")
         return
 
-    state['sections'][section_name] = {step: "pending" for step in SECTION_STEPS}
-    save_state(state)
     print(f"Added section: {section_name}")
 
 
 def update_status(section_name: str, step: str, status: str):
     """Update the status of a step for a section."""
-    state = load_state()
-
     # Normalize step name
     if not step.startswith("step"):
         step = f"step{step}"
@@ -117,20 +180,20 @@ def update_status(section_name: str, step: str, status: str):
         print(f"Valid statuses: {', '.join(VALID_STATUSES)}")
         return
 
+    store = get_store()
+
     # Check if section exists
-    if section_name not in state['sections']:
+    section_steps = store.section_steps(section_name)
+    if not section_steps:
         print(f"Section '{section_name}' not found. Adding it...")
-        state['sections'][section_name] = {s: "pending" for s in SECTION_STEPS}
 
     # Check if step is valid
-    if step not in state['sections'][section_name]:
+    if step not in (section_steps or SECTION_STEPS):
         print(f"Invalid step: {step}")
         print(f"Valid steps: {', '.join(SECTION_STEPS)}")
         return
 
-    old_status = state['sections'][section_name][step]
-    state['sections'][section_name][step] = status
-    save_state(state)
+    old_status = store.set_section_status(section_name, step, status, default_steps=SECTION_STEPS)
     print(f"Updated {section_name}/{step}: {old_status} -> {status}")
 
 
@@ -273,6 +336,7 @@ def main():
         print("  python pipeline_state_manager.py update <section> <step> <status>")
         print("  python pipeline_state_manager.py add <section>")
         print("  python pipeline_state_manager.py report")
+        print("  python pipeline_state_manager.py export")
         return 1
 
     command = sys.argv[1].lower()
@@ -281,6 +345,8 @@ def main():
         show_status()
     elif command == "report":
         generate_report()
+    elif command == "export":
+        export_state()
     elif command == "add" and len(sys.argv) >= 3:
         add_section(sys.argv[2])
     elif command == "update" and len(sys.argv) >= 5:
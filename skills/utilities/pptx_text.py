@@ -0,0 +1,340 @@
+"""
+PPTX Text - Read slide and notes text straight from a .pptx file.
+
+Provides:
+- read_deck_text(): slide text, shape positions and notes read straight
+  from the zip package, cached per file digest through the feature cache
+- extract_deck_text(): the uncached reader
+- DeckText / SlideText / ShapeText: text as python-pptx reports it
+  (paragraphs joined by "\\n", line breaks as "\\v", placeholder positions
+  inherited from the layout and master)
+
+Usage:
+    from skills.utilities.pptx_text import read_deck_text
+
+    deck = read_deck_text('lecture.pptx')
+    for slide in deck.slides:
+        print(slide.slide_number, slide.content, slide.notes)
+        for shape in slide.shapes:
+            print(shape.text, shape.left, shape.top)
+"""
+
+import hashlib
+import os
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, IO, List, Optional, Tuple, Union
+
+from skills.utilities.feature_cache import cached_analysis
+
+
+NS = {
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+
+_SP_TREE = f"{{{NS['p']}}}spTree"
+_R = f"{{{NS['a']}}}r"
+_BR = f"{{{NS['a']}}}br"
+_FLD = f"{{{NS['a']}}}fld"
+_T = f"{{{NS['a']}}}t"
+_R_ID = f"{{{NS['r']}}}id"
+
+_REL_SLIDE_LAYOUT = '/slideLayout'
+_REL_SLIDE_MASTER = '/slideMaster'
+_REL_NOTES_SLIDE = '/notesSlide'
+
+# Layout placeholder type -> master placeholder type it inherits from
+_MASTER_PLACEHOLDER_TYPE = {
+    'body': 'body', 'chart': 'body', 'clipArt': 'body', 'ctrTitle': 'title',
+    'dgm': 'body', 'dt': 'dt', 'ftr': 'ftr', 'media': 'body', 'obj': 'body',
+    'pic': 'body', 'sldNum': 'sldNum', 'subTitle': 'body', 'tbl': 'body',
+    'title': 'title',
+}
+
+Dimensions = Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]
+
+
+@dataclass
+class ShapeText:
+    """Text and effective position (EMU) of one text-bearing shape."""
+    text: str
+    left: Optional[int] = None
+    top: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    placeholder_type: Optional[str] = None  # ph type if a placeholder
+
+
+@dataclass
+class SlideText:
+    """Text of one slide and its notes."""
+    slide_number: int
+    shapes: List[ShapeText] = field(default_factory=list)
+    notes: str = ""
+    has_notes_slide: bool = False
+
+    @property
+    def content(self) -> List[str]:
+        """Stripped, non-empty shape texts in shape order."""
+        return [s.text.strip() for s in self.shapes if s.text.strip()]
+
+
+@dataclass
+class DeckText:
+    """All slide text of a deck."""
+    path: str
+    digest: str
+    slides: List[SlideText] = field(default_factory=list)
+
+
+# =============================================================================
+# XML HELPERS
+# =============================================================================
+
+@dataclass
+class _Placeholder:
+    idx: int
+    ph_type: str
+    dims: Dimensions
+
+
+def _paragraph_text(paragraph: ET.Element) -> str:
+    parts = []
+    for child in paragraph:
+        if child.tag == _BR:
+            parts.append("\v")
+        elif child.tag in (_R, _FLD):
+            t = child.find(_T)
+            if t is not None and t.text:
+                parts.append(t.text)
+    return "".join(parts)
+
+
+def _shape_text(sp: ET.Element) -> str:
+    body = sp.find('p:txBody', NS)
+    if body is None:
+        return ""
+    return "\n".join(_paragraph_text(p) for p in body.findall('a:p', NS))
+
+
+def _shape_dimensions(sp: ET.Element) -> Dimensions:
+    xfrm = sp.find('p:spPr/a:xfrm', NS)
+    if xfrm is None:
+        return (None, None, None, None)
+    off = xfrm.find('a:off', NS)
+    ext = xfrm.find('a:ext', NS)
+    return (
+        int(off.get('x')) if off is not None else None,
+        int(off.get('y')) if off is not None else None,
+        int(ext.get('cx')) if ext is not None else None,
+        int(ext.get('cy')) if ext is not None else None,
+    )
+
+
+def _placeholder(sp: ET.Element) -> Optional[Tuple[int, str]]:
+    """(idx, type) of a placeholder shape, None for other shapes."""
+    if not len(sp):
+        return None
+    ph = sp[0].find('p:nvPr/p:ph', NS)
+    if ph is None:
+        return None
+    return int(ph.get('idx', 0)), ph.get('type', 'obj')
+
+
+def _iter_top_level_shapes(stream: IO[bytes]):
+    """
+    Stream a part up to its shape tree and yield the tree's p:sp children.
+
+    Parsing stops once the shape tree closes, so the rest of the part
+    (transitions, timing, extension data) is never read.
+    """
+    for _, elem in ET.iterparse(stream):
+        if elem.tag == _SP_TREE:
+            yield from elem.iterfind('p:sp', NS)
+            elem.clear()
+            return
+
+
+def _resolve(part: str, target: str) -> str:
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(part), target))
+
+
+def _rels_name(part: str) -> str:
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, '_rels', f"{name}.rels")
+
+
+class _Package:
+    """Relationship lookups and placeholder tables for one open zip."""
+
+    def __init__(self, archive: zipfile.ZipFile):
+        self.archive = archive
+        self.names = set(archive.namelist())
+        self._rels: Dict[str, Dict[str, Tuple[str, str]]] = {}
+        self._placeholders: Dict[str, List[_Placeholder]] = {}
+
+    def rels(self, part: str) -> Dict[str, Tuple[str, str]]:
+        """rId -> (relationship type, resolved target part)."""
+        rels = self._rels.get(part)
+        if rels is None:
+            rels = {}
+            name = _rels_name(part)
+            if name in self.names:
+                with self.archive.open(name) as f:
+                    for rel in ET.parse(f).getroot().findall('rel:Relationship', NS):
+                        if rel.get('TargetMode') == 'External':
+                            continue
+                        rels[rel.get('Id')] = (rel.get('Type', ''), _resolve(part, rel.get('Target', '')))
+            self._rels[part] = rels
+        return rels
+
+    def related(self, part: str, rel_suffix: str) -> Optional[str]:
+        for rel_type, target in self.rels(part).values():
+            if rel_type.endswith(rel_suffix) and target in self.names:
+                return target
+        return None
+
+    def placeholders(self, part: Optional[str]) -> List[_Placeholder]:
+        """Placeholders of a layout or master part, with their own dimensions."""
+        if part is None:
+            return []
+        found = self._placeholders.get(part)
+        if found is None:
+            found = []
+            with self.archive.open(part) as f:
+                for sp in _iter_top_level_shapes(f):
+                    ph = _placeholder(sp)
+                    if ph is not None:
+                        found.append(_Placeholder(ph[0], ph[1], _shape_dimensions(sp)))
+            self._placeholders[part] = found
+        return found
+
+    def slide_parts(self) -> List[str]:
+        """Slide part names in presentation order."""
+        presentation = 'ppt/presentation.xml'
+        rels = self.rels(presentation)
+        with self.archive.open(presentation) as f:
+            root = ET.parse(f).getroot()
+        parts = []
+        for sld_id in root.findall('p:sldIdLst/p:sldId', NS):
+            rel = rels.get(sld_id.get(_R_ID))
+            if rel is not None and rel[1] in self.names:
+                parts.append(rel[1])
+        return parts
+
+
+def _inherited_dimensions(
+    package: _Package,
+    slide_part: str,
+    idx: int,
+    dims: Dimensions
+) -> Dimensions:
+    """Fill a slide placeholder's missing dimensions from layout, then master."""
+    if all(value is not None for value in dims):
+        return dims
+    layout = package.related(slide_part, _REL_SLIDE_LAYOUT)
+    base = next((ph for ph in package.placeholders(layout) if ph.idx == idx), None)
+    if base is None:
+        return dims
+
+    base_dims = base.dims
+    if any(value is None for value in base_dims):
+        master_type = _MASTER_PLACEHOLDER_TYPE.get(base.ph_type)
+        master = package.related(layout, _REL_SLIDE_MASTER)
+        master_ph = next(
+            (ph for ph in package.placeholders(master) if ph.ph_type == master_type), None
+        )
+        master_dims = master_ph.dims if master_ph is not None else (None,) * 4
+        base_dims = tuple(b if b is not None else m for b, m in zip(base_dims, master_dims))
+    return tuple(d if d is not None else b for d, b in zip(dims, base_dims))
+
+
+def _read_slide(package: _Package, part: str, slide_number: int) -> SlideText:
+    shapes = []
+    with package.archive.open(part) as f:
+        for sp in _iter_top_level_shapes(f):
+            dims = _shape_dimensions(sp)
+            ph = _placeholder(sp)
+            if ph is not None:
+                dims = _inherited_dimensions(package, part, ph[0], dims)
+            shapes.append(ShapeText(_shape_text(sp), *dims, placeholder_type=ph[1] if ph else None))
+
+    slide = SlideText(slide_number=slide_number, shapes=shapes)
+    notes_part = package.related(part, _REL_NOTES_SLIDE)
+    if notes_part is not None:
+        slide.has_notes_slide = True
+        with package.archive.open(notes_part) as f:
+            for sp in _iter_top_level_shapes(f):
+                ph = _placeholder(sp)
+                if ph is not None and ph[1] == 'body':
+                    slide.notes = _shape_text(sp)
+                    break
+    return slide
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+# (path, mtime_ns, size) -> content digest
+_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's bytes (memoized while its mtime and size hold)."""
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    digest = _digests.get(memo_key)
+    if digest is None:
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        _digests[memo_key] = digest
+    return digest
+
+
+def extract_deck_text(path: Union[str, Path], digest: str = "") -> DeckText:
+    """
+    Read every slide's text and notes from a .pptx (no caching).
+
+    Raises:
+        zipfile.BadZipFile: If path is not a zip package
+        KeyError: If the package has no ppt/presentation.xml
+    """
+    with zipfile.ZipFile(path) as archive:
+        package = _Package(archive)
+        slides = [
+            _read_slide(package, part, number)
+            for number, part in enumerate(package.slide_parts(), start=1)
+        ]
+    return DeckText(path=str(path), digest=digest, slides=slides)
+
+
+@cached_analysis('read_deck_text', key=lambda path, digest: (digest,), types=(DeckText, SlideText, ShapeText))
+def _cached_deck_text(path: str, digest: str) -> DeckText:
+    return extract_deck_text(path, digest)
+
+
+def read_deck_text(path: Union[str, Path]) -> DeckText:
+    """
+    Slide and notes text of a .pptx, cached by file content digest.
+
+    Args:
+        path: Path to the .pptx file
+
+    Returns:
+        DeckText (a fresh copy; safe to mutate)
+    """
+    deck = _cached_deck_text(str(path), file_digest(path))
+    deck.path = str(path)
+    return deck
@@ -0,0 +1,63 @@
+"""
+Regex Registry
+Central registry of precompiled regular expressions for the skills package.
+
+Provides:
+- compile_pattern(): the shared compiled pattern for a (source, flags)
+  pair, compiled on first request
+- compile_patterns(): a tuple of compiled patterns with the same flags
+- registry_size(): number of distinct patterns compiled so far
+
+Usage:
+    from skills.utilities.regex_registry import compile_pattern, compile_patterns
+
+    _STEP_NUMBER_RE = compile_pattern(r'\\bstep\\s*(\\d+)')
+    _BULLET_RES = compile_patterns(BULLET_PATTERNS, re.IGNORECASE)
+
+    _STEP_NUMBER_RE.findall(body_lower)
+"""
+
+import re
+from typing import Dict, Iterable, Pattern, Tuple
+
+
+# (pattern, flags) -> compiled pattern; never evicted
+_REGISTRY: Dict[Tuple[str, int], Pattern] = {}
+
+
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """
+    Return the shared compiled pattern, compiling it on first request.
+
+    Args:
+        pattern: Regular expression source
+        flags: re flags (re.IGNORECASE, re.MULTILINE, ...)
+
+    Returns:
+        Compiled pattern shared by every caller using the same source/flags
+    """
+    key = (pattern, int(flags))
+    compiled = _REGISTRY.get(key)
+    if compiled is None:
+        compiled = re.compile(pattern, flags)
+        _REGISTRY[key] = compiled
+    return compiled
+
+
+def compile_patterns(patterns: Iterable[str], flags: int = 0) -> Tuple[Pattern, ...]:
+    """
+    Compile a list of patterns with the same flags.
+
+    Args:
+        patterns: Regular expression sources (order preserved)
+        flags: re flags applied to every pattern
+
+    Returns:
+        Tuple of compiled patterns
+    """
+    return tuple(compile_pattern(p, flags) for p in patterns)
+
+
+def registry_size() -> int:
+    """Number of distinct (pattern, flags) entries compiled so far."""
+    return len(_REGISTRY)
@@ -0,0 +1,358 @@
+"""
+Retry Scheduler
+Retry budgets, back-off and wall-clock deadlines for orchestrator retries.
+
+Provides:
+- RetryScheduler: per-agent and per-gate retry budgets, exponential
+  back-off, and call/day/batch deadlines from pipeline.yaml
+- Deadline: wall-clock deadline checked at every agent boundary
+  (cancellation is cooperative)
+- RetryDecision / BatchOutcome: results of record_failure() and run_batch()
+- DeadlineExceeded / AgentTimeout: raised when a deadline is overrun
+
+Usage:
+    from skills.utilities.retry_scheduler import RetryScheduler, Deadline
+
+    scheduler = RetryScheduler.from_config(pipeline_config)
+
+    # One day: budgets per agent/gate, calls bounded by the day deadline
+    day = Deadline(scheduler.day_timeout, label='day 3')
+    output = scheduler.call(agent_fn, agent_input, deadline=day)
+    decision = scheduler.record_failure(attempts, 'gate', 'timing_validator', day)
+    if decision.retry and day.wait(decision.delay):
+        ...
+
+    # A batch of days, each with its own deadline
+    outcomes = scheduler.run_batch(range(1, 21), lambda d, deadline: run_day(d, deadline))
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """A day or batch deadline passed (or was cancelled) before work finished."""
+
+
+class AgentTimeout(TimeoutError):
+    """A single agent call ran longer than its timeout and was abandoned."""
+
+
+# =============================================================================
+# DEADLINES
+# =============================================================================
+
+class Deadline:
+    """
+    Cancellable wall-clock deadline, optionally nested in a parent.
+
+    A child expires when its own time runs out or its parent expires;
+    cancelling a deadline cancels its children.
+    """
+
+    def __init__(
+        self,
+        seconds: Optional[float] = None,
+        parent: Optional['Deadline'] = None,
+        label: str = '',
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.parent = parent
+        self.label = label
+        self._clock = clock
+        self._expires_at = clock() + seconds if seconds is not None else None
+        self._cancelled = threading.Event()
+        self._children: List['Deadline'] = []
+        self._lock = threading.Lock()
+
+    def child(self, seconds: Optional[float] = None, label: str = '') -> 'Deadline':
+        """Deadline bounded by both seconds and this deadline."""
+        child = Deadline(seconds, parent=self, label=label, clock=self._clock)
+        with self._lock:
+            self._children.append(child)
+        if self.cancelled:
+            child.cancel()
+        return child
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None when unbounded."""
+        if self.cancelled:
+            return 0.0
+        own = None if self._expires_at is None else max(0.0, self._expires_at - self._clock())
+        inherited = self.parent.remaining() if self.parent else None
+        if own is None:
+            return inherited
+        if inherited is None:
+            return own
+        return min(own, inherited)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def cancel(self) -> None:
+        """Expire this deadline and every child now."""
+        self._cancelled.set()
+        with self._lock:
+            children = list(self._children)
+        for child in children:
+            child.cancel()
+
+    def wait(self, seconds: float) -> bool:
+        """
+        Sleep for seconds unless the deadline comes first.
+
+        Returns True if the full delay elapsed with time still left.
+        """
+        remaining = self.remaining()
+        if remaining is not None and remaining < seconds:
+            self._cancelled.wait(remaining)
+            return False
+        return not self._cancelled.wait(seconds) and not self.expired
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceeded(f"Deadline exceeded: {self.label or 'unnamed'}")
+
+
+# =============================================================================
+# DECISIONS AND OUTCOMES
+# =============================================================================
+
+@dataclass
+class RetryDecision:
+    """Whether a failed agent or gate may be retried, and after what delay."""
+    retry: bool
+    attempt: int
+    delay: float = 0.0
+    reason: str = ''
+
+
+@dataclass
+class BatchOutcome:
+    """Result of one item (day) in a batch."""
+    item: Any
+    status: str  # "completed", "failed", "timed_out", "skipped"
+    result: Any = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'item': self.item,
+            'status': self.status,
+            'error': self.error,
+            'duration_seconds': self.duration_seconds
+        }
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+@dataclass
+class RetryScheduler:
+    """
+    Retry policy: budgets, back-off and timeouts.
+
+    The scheduler holds no per-day state; attempt counts are kept in the
+    dict the caller passes in (AgentContext.retry_attempts), so one
+    scheduler is shared by every orchestrator and every day of a batch.
+    """
+    agent_retries: int = 0          # retries per agent per day
+    gate_retries: int = 3           # retries per validation gate per day
+    retry_delay: float = 0.0        # first back-off delay (seconds)
+    backoff: float = 2.0            # delay multiplier per attempt
+    max_delay: float = 60.0
+    agent_timeout: Optional[float] = None
+    day_timeout: Optional[float] = None
+    batch_timeout: Optional[float] = None
+    max_workers: int = 4
+
+    # pipeline.yaml settings key -> field
+    CONFIG_KEYS = {
+        'agent_max_retries': 'agent_retries',
+        'max_retries': 'gate_retries',
+        'retry_delay_seconds': 'retry_delay',
+        'retry_backoff': 'backoff',
+        'max_retry_delay_seconds': 'max_delay',
+        'timeout_seconds': 'agent_timeout',
+        'day_timeout_seconds': 'day_timeout',
+        'batch_timeout_seconds': 'batch_timeout',
+        'batch_workers': 'max_workers'
+    }
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None, **defaults: Any) -> 'RetryScheduler':
+        """
+        Build a scheduler from pipeline.yaml (or its 'settings' section).
+
+        Keyword arguments set defaults for settings the config leaves out.
+        """
+        config = config or {}
+        settings = config.get('settings', config)
+        values = dict(defaults)
+        for key, attr in cls.CONFIG_KEYS.items():
+            if settings.get(key) is not None:
+                values[attr] = settings[key]
+        return cls(**values)
+
+    def delay_for(self, attempt: int) -> float:
+        """Back-off delay before retry number attempt (1-based)."""
+        return min(self.max_delay, self.retry_delay * self.backoff ** max(0, attempt - 1))
+
+    def record_failure(
+        self,
+        attempts: Dict[str, int],
+        kind: str,
+        name: str,
+        deadline: Optional[Deadline] = None
+    ) -> RetryDecision:
+        """
+        Count a failure of an agent or gate and decide whether to retry.
+
+        Args:
+            attempts: Per-day attempt counts, updated in place
+            kind: 'agent' or 'gate' (selects the budget)
+            name: Agent or gate name
+            deadline: Day deadline; no retry is scheduled past it
+
+        Returns:
+            RetryDecision; delay is the back-off to wait before retrying
+        """
+        key = f"{kind}:{name}"
+        attempts[key] = attempt = attempts.get(key, 0) + 1
+        limit = self.gate_retries if kind == 'gate' else self.agent_retries
+
+        if attempt > limit:
+            return RetryDecision(False, attempt, reason=f"Max retries ({limit}) exceeded for {name}")
+
+        delay = self.delay_for(attempt)
+        remaining = deadline.remaining() if deadline else None
+        if remaining is not None and remaining <= delay:
+            label = deadline.label or 'deadline'
+            return RetryDecision(False, attempt, reason=f"{label} would pass before retrying {name}")
+        return RetryDecision(True, attempt, delay=delay)
+
+    def call(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        deadline: Optional[Deadline] = None,
+        name: str = 'agent'
+    ) -> Any:
+        """
+        Call fn(*args) bounded by agent_timeout and the deadline.
+
+        Raises:
+            DeadlineExceeded: the deadline passed before the call started
+            AgentTimeout: the call overran; its thread is abandoned and
+                whatever it returns later is discarded
+        """
+        if deadline is not None:
+            deadline.check()
+        timeout = self.agent_timeout
+        remaining = deadline.remaining() if deadline else None
+        if remaining is not None:
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        if timeout is None:
+            return fn(*args)
+
+        outcome: Dict[str, Any] = {}
+
+        def target() -> None:
+            try:
+                outcome['result'] = fn(*args)
+            except BaseException as e:
+                outcome['error'] = e
+
+        thread = threading.Thread(target=target, name=f"agent-{name}", daemon=True)
+        thread.start()
+        thread.join(timeout)
+        if thread.is_alive():
+            raise AgentTimeout(f"{name} timed out after {timeout:.1f}s")
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+
+    def run_batch(
+        self,
+        items: Iterable[Any],
+        fn: Callable[[Any, Deadline], Any],
+        label: Callable[[Any], str] = lambda item: f"day {item}"
+    ) -> List[BatchOutcome]:
+        """
+        Run fn(item, deadline) for each item on up to max_workers threads.
+
+        Each item gets a deadline of day_timeout inside the batch deadline.
+        An item that overruns is cancelled and reported as timed_out; its
+        worker slot is released at once so the rest of the batch carries
+        on. Items not started before the batch deadline are skipped.
+
+        Returns:
+            BatchOutcomes in item order
+        """
+        items = list(items)
+        batch = Deadline(self.batch_timeout, label='batch')
+        outcomes: Dict[int, BatchOutcome] = {}
+        running: Dict[int, Deadline] = {}
+        started: Dict[int, float] = {}
+        pending = list(range(len(items)))
+        done = threading.Condition()
+
+        def worker(index: int, deadline: Deadline) -> None:
+            try:
+                result = fn(items[index], deadline)
+                deadline.check()  # a result that arrives late does not count
+                outcome = BatchOutcome(items[index], 'completed', result)
+            except DeadlineExceeded as e:
+                outcome = BatchOutcome(items[index], 'timed_out', error=str(e))
+            except Exception as e:
+                outcome = BatchOutcome(items[index], 'failed', error=str(e))
+            with done:
+                if index not in outcomes:
+                    outcome.duration_seconds = time.monotonic() - started[index]
+                    outcomes[index] = outcome
+                done.notify_all()
+
+        with done:
+            while pending or running:
+                while pending and len(running) < max(1, self.max_workers) and not batch.expired:
+                    index = pending.pop(0)
+                    deadline = batch.child(self.day_timeout, label=label(items[index]))
+                    running[index] = deadline
+                    started[index] = time.monotonic()
+                    threading.Thread(
+                        target=worker, args=(index, deadline),
+                        name=f"batch-{label(items[index])}", daemon=True
+                    ).start()
+                if not running:
+                    break
+
+                waits = [d.remaining() for d in running.values()]
+                bounded = [w for w in waits if w is not None]
+                done.wait(min(bounded) if bounded else None)
+
+                for index, deadline in list(running.items()):
+                    if index in outcomes:
+                        del running[index]
+                    elif deadline.expired:
+                        deadline.cancel()
+                        outcomes[index] = BatchOutcome(
+                            items[index], 'timed_out',
+                            error=f"Deadline exceeded: {deadline.label}",
+                            duration_seconds=time.monotonic() - started[index]
+                        )
+                        del running[index]
+
+        for index in pending:
+            outcomes[index] = BatchOutcome(items[index], 'skipped', error='Batch deadline exceeded')
+        return [outcomes[i] for i in range(len(items))]
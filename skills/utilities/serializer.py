@@ -0,0 +1,295 @@
+"""
+Serializer
+Pluggable compact serialization for inter-phase payloads.
+
+Provides:
+- Serializers: json (default), msgpack (if installed) and pickle
+  (protocol 5, only when requested by name)
+- to_plain(): dataclasses, enums, datetimes, paths, tuples and sets
+  normalised to plain data, so every serializer loads the same data back
+- Named payload schemas (slides, lesson data, validation results) with a
+  version in a small envelope, so readers reject data they do not know
+- encode()/decode() with a 4-byte frame header naming the serializer;
+  decode() also reads legacy JSON text and refuses pickle frames unless
+  the caller passes accept=[..., 'pickle'] for a file it trusts
+
+Usage:
+    from skills.utilities.serializer import encode, decode, export_json
+
+    blob = encode(blueprint['slides'], schema='slides')   # default serializer
+    slides = decode(blob, schema='slides')
+
+    blob = encode(results, serializer='msgpack')          # compact
+    export_json(decode(blob), 'outputs/results.json')     # indented export
+
+    # Choose the default: PIPELINE_SERIALIZER=json|msgpack
+"""
+
+import dataclasses
+import json
+import os
+import pickle
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+from skills.utilities.atomic_write import atomic_write_json
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+
+# Frame header: magic + one byte serializer id
+FRAME_MAGIC = b'TP\x00'
+
+# Environment variable selecting the default serializer
+SERIALIZER_ENV = 'PIPELINE_SERIALIZER'
+
+# Serializers that must be named explicitly (never a default, never
+# decoded unless accepted by the caller)
+EXPLICIT_ONLY = {'pickle'}
+
+
+# =============================================================================
+# NORMALISATION AND SCHEMAS
+# =============================================================================
+
+def to_plain(value: Any) -> Any:
+    """Convert a payload to plain data (what json.dumps(default=str) would keep, losslessly)."""
+    if value is None or isinstance(value, (str, bool, int, float, bytes)):
+        return value
+    if isinstance(value, Enum):
+        return to_plain(value.value)
+    if isinstance(value, Mapping):
+        return {str(to_plain(k)): to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        items = [to_plain(v) for v in value]
+        try:
+            return sorted(items)
+        except TypeError:
+            return items
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: to_plain(getattr(value, f.name)) for f in dataclasses.fields(value)}
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, PurePath):
+        return str(value)
+    if isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    if hasattr(value, 'tolist'):  # numpy arrays and scalars
+        return to_plain(value.tolist())
+    return str(value)
+
+
+def _slide_list(slides: Any) -> List[Dict[str, Any]]:
+    slides = to_plain(slides)
+    if not isinstance(slides, list) or not all(isinstance(s, dict) for s in slides):
+        raise ValueError("slides payload must be a list of slide dicts")
+    for slide in slides:
+        if isinstance(slide.get('slide_number'), str) and slide['slide_number'].isdigit():
+            slide['slide_number'] = int(slide['slide_number'])
+    return slides
+
+
+def _mapping(name: str) -> Callable[[Any], Dict[str, Any]]:
+    def normalise(data: Any) -> Dict[str, Any]:
+        data = to_plain(data)
+        if not isinstance(data, dict):
+            raise ValueError(f"{name} payload must be a mapping")
+        return data
+    return normalise
+
+
+@dataclasses.dataclass(frozen=True)
+class PayloadSchema:
+    """Name, version and normaliser of a core payload."""
+    name: str
+    version: int
+    normalise: Callable[[Any], Any]
+
+
+SCHEMAS: Dict[str, PayloadSchema] = {
+    'slides': PayloadSchema('slides', 1, _slide_list),
+    'lesson': PayloadSchema('lesson', 1, _mapping('lesson')),
+    'validation': PayloadSchema('validation', 1, _mapping('validation')),
+}
+
+
+# =============================================================================
+# SERIALIZERS
+# =============================================================================
+
+class Serializer(ABC):
+    """Plain data <-> bytes."""
+    name = ''
+    frame_id = 0
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, blob: bytes) -> Any:
+        pass
+
+
+class JsonSerializer(Serializer):
+    """Compact UTF-8 JSON (non-string keys become strings, bytes become str)."""
+    name = 'json'
+    frame_id = 1
+
+    def dumps(self, data: Any) -> bytes:
+        return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+
+    def loads(self, blob: bytes) -> Any:
+        return json.loads(blob)
+
+
+class PickleSerializer(Serializer):
+    """Pickle protocol 5 (trusted files only; see EXPLICIT_ONLY)."""
+    name = 'pickle'
+    frame_id = 2
+    protocol = 5
+
+    def dumps(self, data: Any) -> bytes:
+        return pickle.dumps(data, protocol=self.protocol)
+
+    def loads(self, blob: bytes) -> Any:
+        return pickle.loads(blob)
+
+
+class MsgpackSerializer(Serializer):
+    """MessagePack (requires the msgpack package)."""
+    name = 'msgpack'
+    frame_id = 3
+
+    def dumps(self, data: Any) -> bytes:
+        return msgpack.packb(data, use_bin_type=True)
+
+    def loads(self, blob: bytes) -> Any:
+        return msgpack.unpackb(blob, raw=False, strict_map_key=False)
+
+
+_SERIALIZERS: Dict[str, Serializer] = {}
+_BY_FRAME: Dict[int, Serializer] = {}
+
+
+def register_serializer(serializer: Serializer) -> None:
+    """Make a serializer available by name and frame id."""
+    _SERIALIZERS[serializer.name] = serializer
+    _BY_FRAME[serializer.frame_id] = serializer
+
+
+register_serializer(JsonSerializer())
+register_serializer(PickleSerializer())
+if MSGPACK_AVAILABLE:
+    register_serializer(MsgpackSerializer())
+
+
+def available_serializers() -> List[str]:
+    return sorted(_SERIALIZERS)
+
+
+def get_serializer(name: Optional[Union[str, Serializer]] = None) -> Serializer:
+    """
+    Serializer by name; the default is $PIPELINE_SERIALIZER (json or
+    msgpack), else json. Pickle is returned only when asked for by name.
+    """
+    if isinstance(name, Serializer):
+        return name
+    if not name:
+        name = os.environ.get(SERIALIZER_ENV) or 'json'
+        if name in EXPLICIT_ONLY:
+            raise ValueError(f"{SERIALIZER_ENV}={name} is not allowed; request {name} by name")
+    if name not in _SERIALIZERS:
+        raise ValueError(f"Unknown serializer {name!r} (available: {', '.join(available_serializers())})")
+    return _SERIALIZERS[name]
+
+
+def default_accept() -> List[str]:
+    """Serializers decode() reads unless told otherwise (all but EXPLICIT_ONLY)."""
+    return [name for name in available_serializers() if name not in EXPLICIT_ONLY]
+
+
+# =============================================================================
+# ENCODE / DECODE
+# =============================================================================
+
+def encode(
+    data: Any,
+    schema: Optional[str] = None,
+    serializer: Optional[Union[str, Serializer]] = None
+) -> bytes:
+    """
+    Normalise and serialize a payload into a framed blob.
+
+    Args:
+        data: Payload
+        schema: Core payload name (SCHEMAS) to validate and tag it with
+        serializer: Serializer name or instance (default: get_serializer())
+    """
+    serializer = get_serializer(serializer)
+    if schema is not None:
+        spec = SCHEMAS[schema]
+        body = {'schema': spec.name, 'version': spec.version, 'data': spec.normalise(data)}
+    else:
+        body = {'schema': None, 'version': 0, 'data': to_plain(data)}
+    return FRAME_MAGIC + bytes([serializer.frame_id]) + serializer.dumps(body)
+
+
+def decode(
+    blob: Union[bytes, str, None],
+    schema: Optional[str] = None,
+    default: Any = None,
+    accept: Optional[Iterable[str]] = None
+) -> Any:
+    """
+    Decode a blob from encode() or legacy JSON text.
+
+    Args:
+        blob: Framed bytes, or JSON text/bytes without a frame
+        schema: Expected core payload name; raises ValueError on a
+            different schema or a newer version than this code knows
+        default: Returned for None
+        accept: Serializer names allowed (default: default_accept());
+            a frame from any other serializer raises ValueError. Pass
+            'pickle' only for files this process trusts.
+    """
+    if blob is None:
+        return default
+    if isinstance(blob, str):
+        return json.loads(blob)
+    blob = bytes(blob)
+    if not blob.startswith(FRAME_MAGIC):
+        return json.loads(blob)
+
+    frame_id = blob[len(FRAME_MAGIC)]
+    serializer = _BY_FRAME.get(frame_id)
+    if serializer is None:
+        raise ValueError(f"Payload written with serializer id {frame_id}, which is not available")
+    accepted = default_accept() if accept is None else list(accept)
+    if serializer.name not in accepted:
+        raise ValueError(f"Refusing {serializer.name} payload (accepted: {', '.join(accepted)})")
+    body = serializer.loads(blob[len(FRAME_MAGIC) + 1:])
+
+    if schema is None:
+        return body['data']
+    spec = SCHEMAS[schema]
+    if body.get('schema') != schema:
+        raise ValueError(f"Expected a {schema} payload, got {body.get('schema') or 'an untagged one'}")
+    if body['version'] > spec.version:
+        raise ValueError(f"{schema} payload version {body['version']} is newer than {spec.version}")
+    return body['data']
+
+
+def export_json(data: Any, path: Union[str, PurePath], indent: int = 2) -> PurePath:
+    """Write a payload as readable JSON (atomically); returns the path."""
+    return atomic_write_json(path, to_plain(data), indent=indent, default=str)
@@ -6,6 +6,8 @@ Key Features:
 - Context-aware retry with failing category targeting
 - Slide locking to avoid re-processing passing slides
 - Incremental scoring (only revalidate changed slides)
+- Iterations recorded as per-slide diffs against a base blueprint
+- Slide-granular retry: regenerate only failing slides, in parallel
 - Score trajectory tracking for early termination
 - Configurable retry strategies per error type
 
@@ -24,9 +26,19 @@ Usage:
         validate_fn=check_qa_score,
         context={'blueprint': blueprint}
     )
+
+    # Retry only the failing slides, fanned out over a worker pool
+    result = controller.execute_slides_with_retry(
+        step=8,
+        blueprint=blueprint,
+        regenerate_fn=rewrite_slide,          # (slide, slide_context) -> slide
+        validate_slide_fn=score_slide,        # slide -> (score, details)
+        failing_slides=[4, 17]
+    )
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Callable, Tuple, Set
@@ -34,6 +46,10 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 import copy
 
+from skills.utilities.atomic_write import atomic_write_bytes, atomic_write_json
+from skills.utilities.blueprint_diff import BlueprintVersion, SlideDiff
+from skills.utilities.serializer import encode
+
 
 class RetryStrategy(Enum):
     """Retry strategies for different scenarios."""
@@ -62,6 +78,8 @@ class RetryIteration:
     locked_slides: List[int]
     modifications: List[Dict[str, Any]]
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Slides changed since the previous iteration (empty for the base)
+    slide_diffs: List[SlideDiff] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -71,7 +89,31 @@ class RetryIteration:
             'failing_slides': self.failing_slides,
             'locked_slides': self.locked_slides,
             'modifications': self.modifications,
-            'timestamp': self.timestamp
+            'timestamp': self.timestamp,
+            'slide_diffs': [d.to_dict() for d in self.slide_diffs]
+        }
+
+
+@dataclass
+class SlideConvergence:
+    """Retry history of one slide in slide-granular retry."""
+    slide_number: int
+    scores: List[float] = field(default_factory=list)
+    attempts: int = 0
+    converged: bool = False
+    error: Optional[str] = None
+
+    @property
+    def best_score(self) -> float:
+        return max(self.scores) if self.scores else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'slide_number': self.slide_number,
+            'scores': self.scores,
+            'attempts': self.attempts,
+            'converged': self.converged,
+            'error': self.error
         }
 
 
@@ -87,6 +129,11 @@ class RetryContext:
     failing_categories: List[str] = field(default_factory=list)
     strategy: RetryStrategy = RetryStrategy.TARGETED_REPROCESS
     category_weights: Dict[str, float] = field(default_factory=dict)
+    # Iteration 1 blueprint; later iterations are its slide_diffs replayed
+    base_version: Optional[BlueprintVersion] = None
+    current_version: Optional[BlueprintVersion] = None
+    # Per-slide convergence (slide-granular retry only)
+    slide_convergence: Dict[int, SlideConvergence] = field(default_factory=dict)
 
     def add_iteration(self, iteration: RetryIteration) -> None:
         """Add an iteration to history."""
@@ -112,6 +159,15 @@ class RetryContext:
         improvements = [scores[i] - scores[i-1] for i in range(1, len(scores))]
         return sum(improvements) / len(improvements)
 
+    def version_at(self, iteration: int) -> Optional[BlueprintVersion]:
+        """Blueprint as of an iteration, rebuilt from the base and the diffs."""
+        if self.base_version is None:
+            return None
+        version = self.base_version
+        for it in self.iterations[1:iteration]:
+            version = version.apply(it.slide_diffs)
+        return version
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             'step': self.step,
@@ -122,7 +178,10 @@ class RetryContext:
             'locked_slides': list(self.locked_slides),
             'failing_categories': self.failing_categories,
             'strategy': self.strategy.name,
-            'category_weights': self.category_weights
+            'category_weights': self.category_weights,
+            'slide_convergence': {
+                str(num): conv.to_dict() for num, conv in self.slide_convergence.items()
+            }
         }
 
     @classmethod
@@ -203,7 +262,9 @@ class SmartRetryController:
         self,
         state_manager: Optional[Any] = None,
         error_recovery: Optional[Any] = None,
-        output_dir: str = "outputs/retry_logs"
+        output_dir: str = "outputs/retry_logs",
+        max_workers: int = 8,
+        log_format: str = "json"
     ):
         """
         Initialize the retry controller.
@@ -212,9 +273,16 @@ class SmartRetryController:
             state_manager: StepStateManager instance
             error_recovery: ErrorRecovery instance
             output_dir: Directory for retry logs
+            max_workers: Worker threads for slide-granular retry
+            log_format: "json" for readable logs, or a serializer name
+                ("msgpack", or "pickle" for trusted local use) for
+                compact ones read with serializer.decode() (pickle logs
+                need accept=['pickle'])
         """
         self.state_manager = state_manager
         self.error_recovery = error_recovery
+        self.max_workers = max_workers
+        self.log_format = log_format
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -257,6 +325,7 @@ class SmartRetryController:
 
         current_input = copy.deepcopy(initial_input)
         current_output = None
+        recovery = None
 
         for iteration in range(1, max_iterations + 1):
             try:
@@ -277,7 +346,11 @@ class SmartRetryController:
                     failing_slides
                 )
 
-                # Lock passing slides
+                # Diff against the previous iteration; a locked slide that
+                # changed keeps its lock only if it passed again
+                slide_diffs = self._record_version(current_output, context)
+                changed = {d.slide_number for d in slide_diffs}
+                context.locked_slides -= changed
                 context.locked_slides.update(passing_slides)
 
                 # Record this iteration
@@ -287,7 +360,8 @@ class SmartRetryController:
                     failing_categories=failing_categories,
                     failing_slides=failing_slides,
                     locked_slides=list(context.locked_slides),
-                    modifications=self._get_modifications(current_output)
+                    modifications=self._get_modifications(current_output),
+                    slide_diffs=slide_diffs
                 )
                 context.add_iteration(iteration_data)
                 context.failing_categories = failing_categories
@@ -296,8 +370,18 @@ class SmartRetryController:
                 if on_iteration:
                     on_iteration(iteration_data)
 
-                # Update state manager if available
-                if self.state_manager:
+                # Re-validation settles the previous iteration's recovery
+                if recovery is not None:
+                    self.error_recovery.record_outcome(recovery, success=score >= target_score)
+                    recovery = None
+
+                # Update state manager if available; a failure goes through
+                # error recovery, whose handler updates it
+                if self.error_recovery is not None and score < target_score:
+                    recovery = self._handle_failure(
+                        step, score, validation_details, failing_categories, passing_slides
+                    )
+                elif self.state_manager:
                     self.state_manager.record_score(step, score)
                     self.state_manager.mark_slides_locked(list(passing_slides))
 
@@ -334,6 +418,8 @@ class SmartRetryController:
                 )
 
             except Exception as e:
+                if recovery is not None:
+                    self.error_recovery.record_outcome(recovery, success=False)
                 self._save_retry_log(context)
                 return RetryResult(
                     success=False,
@@ -355,6 +441,249 @@ class SmartRetryController:
             context=context
         )
 
+    def execute_slides_with_retry(
+        self,
+        step: int,
+        blueprint: Dict[str, Any],
+        regenerate_fn: Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]],
+        validate_slide_fn: Callable[[Dict[str, Any]], Tuple[float, Dict[str, Any]]],
+        failing_slides: Optional[List[int]] = None,
+        target_score: float = 90.0,
+        max_iterations: int = 3,
+        on_iteration: Optional[Callable[[RetryIteration], None]] = None
+    ) -> RetryResult:
+        """
+        Retry only the failing slides of a blueprint, one slide per worker.
+
+        Each iteration regenerates and revalidates every slide that has not
+        converged, in parallel, and splices the results back into the deck.
+        A slide converges when it scores target_score; it keeps its best
+        version, and a slide that errors or runs out of attempts keeps the
+        version it had. Slides that pass are never regenerated or
+        revalidated. The retry stops early (NO_IMPROVEMENT) only when an
+        iteration completed a regeneration and no slide improved; errored
+        attempts are retried until max_iterations.
+
+        Args:
+            step: Pipeline step number
+            blueprint: Blueprint with a 'slides' list (not modified)
+            regenerate_fn: (slide, slide_context) -> new slide; slide is a
+                private copy and slide_context has the slide's failing
+                categories, validation details, attempt and score history
+            validate_slide_fn: slide -> (score, details); details may list
+                'failing_categories'
+            failing_slides: Slide numbers to retry (default: validate every
+                slide once and retry those below target)
+            target_score: Score each slide must reach
+            max_iterations: Maximum regeneration attempts per slide
+
+        Returns:
+            RetryResult; final_score is the lowest score among the slides
+            that were validated, final_blueprint the spliced deck
+        """
+        context = RetryContext(
+            step=step,
+            target_score=target_score,
+            max_iterations=max_iterations,
+            category_weights=self.category_weights
+        )
+        self._active_contexts[step] = context
+
+        slides = list(blueprint.get('slides', []))
+        positions = {
+            s.get('slide_number'): i for i, s in enumerate(slides) if s.get('slide_number') is not None
+        }
+        details_by_slide: Dict[int, Dict[str, Any]] = {}
+
+        def validate(num: int, slide: Dict[str, Any]) -> None:
+            score, details = validate_slide_fn(slide)
+            conv = context.slide_convergence.setdefault(num, SlideConvergence(num))
+            conv.scores.append(score)
+            conv.converged = score >= target_score
+            details_by_slide[num] = details
+
+        try:
+            if failing_slides is None:
+                to_check = list(positions)
+            else:
+                to_check = [num for num in failing_slides if num in positions]
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(lambda num: validate(num, slides[positions[num]]), to_check))
+        except Exception as e:
+            self._save_retry_log(context)
+            return RetryResult(
+                success=False,
+                final_score=0,
+                iterations_used=0,
+                termination_reason=TerminationReason.CRITICAL_ERROR,
+                error_message=str(e),
+                context=context
+            )
+
+        context.locked_slides = set(positions) - {
+            num for num, conv in context.slide_convergence.items() if not conv.converged
+        }
+        self._record_version({'slides': slides}, context)
+        strategy = self._determine_strategy(
+            sorted({cat for d in details_by_slide.values() for cat in d.get('failing_categories', [])})
+        )
+
+        def retry_slide(num: int) -> Tuple[int, Optional[Dict[str, Any]], Optional[str]]:
+            conv = context.slide_convergence[num]
+            details = details_by_slide.get(num, {})
+            categories = details.get('failing_categories', [])
+            slide_context = {
+                'slide_number': num,
+                'attempt': conv.attempts + 1,
+                'failing_categories': categories,
+                'validation_details': details,
+                'previous_scores': list(conv.scores),
+                'target_score': target_score,
+                'strategy': strategy.name,
+                'category_guidance': self._get_category_guidance(categories)
+            }
+            try:
+                new_slide = regenerate_fn(copy.deepcopy(slides[positions[num]]), slide_context)
+                score, new_details = validate_slide_fn(new_slide)
+            except Exception as e:
+                return num, None, str(e)
+            return num, (new_slide, score, new_details), None
+
+        iteration = 0
+        stalled = False
+        for iteration in range(1, max_iterations + 1):
+            pending = [
+                num for num, conv in context.slide_convergence.items()
+                if not conv.converged and conv.attempts < max_iterations
+            ]
+            if not pending:
+                iteration -= 1
+                break
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                outcomes = list(executor.map(retry_slide, pending))
+
+            # Splice results into a new list; untouched slides are shared
+            slides = list(slides)
+            improved = False
+            completed = False  # a regeneration finished without raising
+            for num, outcome, error in outcomes:
+                conv = context.slide_convergence[num]
+                conv.attempts += 1
+                conv.error = error
+                if outcome is None:
+                    continue
+                completed = True
+                new_slide, score, new_details = outcome
+                if score >= conv.best_score:
+                    improved = improved or score > conv.best_score
+                    slides[positions[num]] = new_slide
+                    details_by_slide[num] = new_details
+                conv.scores.append(score)
+                conv.converged = conv.best_score >= target_score
+
+            failing = [num for num, conv in context.slide_convergence.items() if not conv.converged]
+            context.locked_slides = set(positions) - set(failing)
+            context.failing_categories = sorted({
+                cat for num in failing for cat in details_by_slide.get(num, {}).get('failing_categories', [])
+            })
+            slide_diffs = self._record_version({'slides': slides}, context)
+            iteration_data = RetryIteration(
+                iteration=iteration,
+                score=self._slide_floor(context),
+                failing_categories=context.failing_categories,
+                failing_slides=failing,
+                locked_slides=list(context.locked_slides),
+                modifications=[
+                    {'slide_number': num, 'error': error} if error else {'slide_number': num}
+                    for num, _, error in outcomes
+                ],
+                slide_diffs=slide_diffs
+            )
+            context.add_iteration(iteration_data)
+
+            if on_iteration:
+                on_iteration(iteration_data)
+
+            if self.state_manager:
+                self.state_manager.record_score(step, iteration_data.score)
+                self.state_manager.mark_slides_locked(
+                    [num for num in pending if context.slide_convergence[num].converged]
+                )
+
+            # Errored attempts say nothing about convergence: only stop once a
+            # regeneration completed and nothing improved
+            if completed and not improved:
+                stalled = True
+                break
+
+        final_score = self._slide_floor(context)
+        failing = [num for num, conv in context.slide_convergence.items() if not conv.converged]
+        if not failing:
+            reason = TerminationReason.SUCCESS
+        elif stalled and iteration < max_iterations:
+            reason = TerminationReason.NO_IMPROVEMENT
+        else:
+            reason = TerminationReason.MAX_ITERATIONS
+
+        self._save_retry_log(context)
+        return RetryResult(
+            success=not failing,
+            final_score=final_score,
+            iterations_used=iteration,
+            termination_reason=reason,
+            final_blueprint=dict(blueprint, slides=slides),
+            context=context
+        )
+
+    def _handle_failure(
+        self,
+        step: int,
+        score: float,
+        validation_details: Dict[str, Any],
+        failing_categories: List[str],
+        passing_slides: Set[int]
+    ) -> Any:
+        """Pass a failed validation to error recovery; returns its RecoveryResult."""
+        from skills.utilities.error_recovery import ErrorType
+
+        return self.error_recovery.handle(ErrorType.QA_SCORE_LOW, {
+            'step': step,
+            'score': score,
+            'category_scores': validation_details.get('category_scores', {}),
+            'failing_categories': failing_categories,
+            'passing_slides': list(passing_slides),
+            'category': failing_categories[0] if failing_categories else None
+        })
+
+    def _slide_floor(self, context: RetryContext) -> float:
+        """Lowest best score across the slides tracked in slide-granular retry."""
+        scores = [conv.best_score for conv in context.slide_convergence.values()]
+        return min(scores) if scores else 100.0
+
+    def _record_version(
+        self,
+        output: Dict[str, Any],
+        context: RetryContext
+    ) -> List[SlideDiff]:
+        """
+        Record output's slides as the context's next blueprint version.
+
+        Only slides that differ from the previous iteration are frozen into
+        new records; locked slides passed back unchanged are not re-hashed.
+        Returns the diffs (none for the first, base iteration).
+        """
+        version, diffs = BlueprintVersion.from_slides(
+            output.get('slides', []),
+            previous=context.current_version,
+            trusted=context.locked_slides
+        )
+        context.current_version = version
+        if context.base_version is None:
+            context.base_version = version.detached()
+            return []
+        return diffs
+
     def _extract_failing_categories(
         self,
         validation_details: Dict[str, Any],
@@ -476,7 +805,8 @@ class SmartRetryController:
                 'locked_slides': list(context.locked_slides),
                 'strategy': strategy.name,
                 'previous_scores': context.get_score_trajectory(),
-                'target_score': context.target_score
+                'target_score': context.target_score,
+                'changed_slides': [d.slide_number for d in context.iterations[-1].slide_diffs]
             },
             'validation_details': validation_details,
             'category_guidance': self._get_category_guidance(context.failing_categories)
@@ -547,7 +877,7 @@ class SmartRetryController:
 
     def _save_retry_log(self, context: RetryContext) -> str:
         """Save retry log to disk."""
-        filename = f"retry_step{context.step}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"retry_step{context.step}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{self.log_format}"
         filepath = self.output_dir / filename
 
         log_data = {
@@ -558,12 +888,15 @@ class SmartRetryController:
                 'score_trajectory': context.get_score_trajectory(),
                 'improvement_rate': context.get_improvement_rate(),
                 'final_locked_slides': len(context.locked_slides),
+                'slides_changed': sum(len(it.slide_diffs) for it in context.iterations),
                 'final_failing_categories': context.failing_categories
             }
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2)
+        if self.log_format == "json":
+            atomic_write_json(filepath, log_data, indent=2)
+        else:
+            atomic_write_bytes(filepath, encode(log_data, serializer=self.log_format))
 
         return str(filepath)
 
@@ -707,6 +1040,7 @@ def execute_step_with_retry(
     execute_fn: Callable,
     validate_fn: Callable,
     initial_input: Dict[str, Any],
+    output_dir: str = "outputs/retry_logs",
     **kwargs
 ) -> RetryResult:
     """
@@ -717,12 +1051,13 @@ def execute_step_with_retry(
         execute_fn: Execution function
         validate_fn: Validation function
         initial_input: Initial input
+        output_dir: Directory for retry logs
         **kwargs: Additional arguments for execute_with_retry
 
     Returns:
         RetryResult
     """
-    controller = create_retry_controller()
+    controller = create_retry_controller(output_dir)
     return controller.execute_with_retry(
         step=step,
         execute_fn=execute_fn,
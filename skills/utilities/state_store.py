@@ -0,0 +1,723 @@
+"""
+State Store
+Transactional SQLite store for pipeline and step state.
+
+Provides:
+- One row per piece of state: steps, retry contexts, QA scores,
+  modifications, locked slides, section/global step statuses, pipeline
+  info and notes, and the run journal replayed by --resume-from
+- Short BEGIN IMMEDIATE transactions in WAL mode, safe for concurrent
+  threads and processes
+- In-database checkpoints (newest max_checkpoints kept)
+- Payloads stored as serializer.py frames (JSON, or msgpack when
+  configured; pickle only for stores opened with serializer='pickle')
+- One connection per thread; close() closes them all
+
+Usage:
+    from skills.utilities.state_store import StateStore
+
+    store = StateStore('outputs/state/pipeline_state.db')
+
+    store.put_step(7, status='completed', data={'qa_score': 85})
+    store.lock_slides([1, 2, 5])
+    store.add_score(8, 91.0)
+
+    store.set_section_status('Greek_Theater', 'step7_revision', 'completed',
+                             default_steps=SECTION_STEPS)
+
+    label = store.create_checkpoint('before_retry')
+    store.restore_checkpoint(label)
+
+    store.close()
+"""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from skills.utilities.serializer import Serializer, decode, default_accept, encode, get_serializer
+
+
+# Seconds a writer waits for the database lock before raising
+DEFAULT_BUSY_TIMEOUT = 30.0
+
+# Checkpoints kept per database; creating one more drops the oldest
+DEFAULT_MAX_CHECKPOINTS = 20
+
+# Live tables: name -> ((column, type), ...), primary key columns.
+# Every live table is copied into checkpoint_<name> on create_checkpoint.
+_TABLES: Dict[str, Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...]]] = {
+    'steps': (
+        (('step', 'INTEGER'), ('timestamp', 'TEXT'), ('status', 'TEXT'),
+         ('data', 'BLOB'), ('metadata', 'BLOB')),
+        ('step',)
+    ),
+    'retry_contexts': (
+        (('step', 'INTEGER'), ('iteration', 'INTEGER'), ('max_iterations', 'INTEGER'),
+         ('failing_categories', 'TEXT')),
+        ('step',)
+    ),
+    'scores': (
+        (('id', 'INTEGER'), ('step', 'INTEGER'), ('score', 'REAL')),
+        ('id',)
+    ),
+    'modifications': (
+        (('id', 'INTEGER'), ('step', 'INTEGER'), ('slide_number', 'INTEGER'),
+         ('type', 'TEXT'), ('details', 'BLOB'), ('iteration', 'INTEGER'),
+         ('timestamp', 'TEXT')),
+        ('id',)
+    ),
+    'locked_slides': (
+        (('slide_number', 'INTEGER'),),
+        ('slide_number',)
+    ),
+    'sections': (
+        (('section', 'TEXT'), ('step', 'TEXT'), ('status', 'TEXT')),
+        ('section', 'step')
+    ),
+    'global_steps': (
+        (('step', 'TEXT'), ('status', 'TEXT')),
+        ('step',)
+    ),
+    'pipeline_info': (
+        (('key', 'TEXT'), ('value', 'TEXT')),
+        ('key',)
+    ),
+    'notes': (
+        (('id', 'INTEGER'), ('text', 'TEXT')),
+        ('id',)
+    ),
+    'run_journal': (
+        (('run_key', 'TEXT'), ('phase', 'TEXT'), ('agent', 'TEXT'), ('status', 'TEXT'),
+         ('outputs', 'BLOB'), ('timestamp', 'TEXT')),
+        ('run_key', 'phase', 'agent')
+    ),
+}
+
+_STEP_TABLES = ('steps', 'retry_contexts', 'scores', 'modifications')
+
+_SCHEMA_EXTRA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    id INTEGER PRIMARY KEY,
+    label TEXT UNIQUE,
+    name TEXT,
+    timestamp TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS scores_step ON scores (step);
+CREATE INDEX IF NOT EXISTS modifications_step ON modifications (step);
+"""
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(',', ':'), default=str)
+
+
+def _loads(text: Optional[str], default: Any = None) -> Any:
+    return json.loads(text) if text is not None else default
+
+
+def _columns(table: str) -> List[str]:
+    return [name for name, _ in _TABLES[table][0]]
+
+
+def _create_statements() -> Iterator[str]:
+    for table, (columns, key) in _TABLES.items():
+        column_sql = ", ".join(f"{name} {kind}" for name, kind in columns)
+        yield f"CREATE TABLE IF NOT EXISTS {table} ({column_sql}, PRIMARY KEY ({', '.join(key)}))"
+        yield f"CREATE TABLE IF NOT EXISTS checkpoint_{table} (checkpoint_id INTEGER, {column_sql})"
+        yield (f"CREATE INDEX IF NOT EXISTS checkpoint_{table}_id "
+               f"ON checkpoint_{table} (checkpoint_id)")
+
+
+class StateStore:
+    """
+    SQLite (WAL) store of pipeline state rows.
+
+    One connection per thread; safe to share across threads and to open
+    the same path from several processes. Usable as a context manager
+    that closes every connection on exit.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        serializer: Optional[Union[str, Serializer]] = None,
+        max_checkpoints: Optional[int] = DEFAULT_MAX_CHECKPOINTS
+    ):
+        """
+        Open (creating if needed) the state database.
+
+        Args:
+            path: Database file path
+            busy_timeout: Seconds to wait for another writer's lock
+            serializer: Payload serializer name or instance (default:
+                serializer.get_serializer()); JSON and msgpack payloads
+                are always readable, pickle only when it is named here
+            max_checkpoints: Checkpoints kept (None keeps all)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout = busy_timeout
+        self.serializer = get_serializer(serializer)
+        self.accept = sorted(set(default_accept()) | {self.serializer.name})
+        self.max_checkpoints = max_checkpoints
+        self._local = threading.local()
+        # Open connections with their threads; close() bumps the generation
+        # so threads holding a closed connection open a new one
+        self._connections: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._connections_lock = threading.Lock()
+        self._generation = 0
+
+        with self.transaction() as conn:
+            for statement in _create_statements():
+                conn.execute(statement)
+            for statement in filter(None, (s.strip() for s in _SCHEMA_EXTRA.split(';'))):
+                conn.execute(statement)
+
+    # =========================================================================
+    # CONNECTIONS AND TRANSACTIONS
+    # =========================================================================
+
+    def connection(self) -> sqlite3.Connection:
+        """This thread's connection (autocommit; use transaction() to write)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._generation:
+            # check_same_thread=False only so close() can close it from
+            # another thread; each connection is used by its own thread
+            conn = sqlite3.connect(
+                str(self.path), timeout=self.busy_timeout, isolation_level=None,
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._connections_lock:
+                finished = [c for thread, c in self._connections if not thread.is_alive()]
+                self._connections = [(t, c) for t, c in self._connections if t.is_alive()]
+                self._connections.append((threading.current_thread(), conn))
+                self._local.conn = conn
+                self._local.generation = self._generation
+            for stale in finished:
+                stale.close()
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block as one write transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so read-modify-write
+        blocks (e.g. reading a status before changing it) are not
+        interleaved with another writer.
+        """
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn  # nested: part of the outer transaction
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close every thread's connection; later calls open new ones."""
+        with self._connections_lock:
+            connections = [conn for _, conn in self._connections]
+            self._connections = []
+            self._generation += 1
+            self._local.conn = None
+        for conn in connections:
+            conn.close()
+
+    def __enter__(self) -> 'StateStore':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.connection().execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    def _encode(self, payload: Any) -> sqlite3.Binary:
+        return sqlite3.Binary(encode(payload, serializer=self.serializer))
+
+    def _decode(self, blob: Any, default: Any = None) -> Any:
+        return decode(blob, default=default, accept=self.accept)
+
+    # =========================================================================
+    # STEP STATE
+    # =========================================================================
+
+    def put_step(
+        self,
+        step: int,
+        status: str = 'completed',
+        data: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
+    ) -> str:
+        """Insert or replace one step's state row; returns its timestamp."""
+        timestamp = timestamp or datetime.now().isoformat()
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO steps (step, timestamp, status, data, metadata) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (step) DO UPDATE SET "
+                "timestamp = excluded.timestamp, status = excluded.status, "
+                "data = excluded.data, metadata = excluded.metadata",
+                (step, timestamp, status, self._encode(data or {}), self._encode(metadata or {}))
+            )
+        return timestamp
+
+    def get_step(self, step: int) -> Optional[Dict[str, Any]]:
+        """One step's row as a dict (step_number, timestamp, status, data, metadata)."""
+        row = self.connection().execute(
+            "SELECT step, timestamp, status, data, metadata FROM steps WHERE step = ?",
+            (step,)
+        ).fetchone()
+        return self._step_row(row) if row else None
+
+    def get_steps(self) -> List[Dict[str, Any]]:
+        """All step rows, ordered by step number."""
+        rows = self.connection().execute(
+            "SELECT step, timestamp, status, data, metadata FROM steps ORDER BY step"
+        ).fetchall()
+        return [self._step_row(row) for row in rows]
+
+    def _step_row(self, row: tuple) -> Dict[str, Any]:
+        step, timestamp, status, data, metadata = row
+        return {
+            'step_number': step,
+            'timestamp': timestamp,
+            'status': status,
+            'data': self._decode(data, default={}),
+            'metadata': self._decode(metadata, default={}),
+        }
+
+    def put_retry_context(
+        self,
+        step: int,
+        iteration: int,
+        max_iterations: int,
+        failing_categories: Sequence[str]
+    ) -> None:
+        """Insert or replace a step's retry counters (scores and edits are rows of their own)."""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO retry_contexts (step, iteration, max_iterations, failing_categories) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT (step) DO UPDATE SET "
+                "iteration = excluded.iteration, max_iterations = excluded.max_iterations, "
+                "failing_categories = excluded.failing_categories",
+                (step, iteration, max_iterations, _dumps(list(failing_categories)))
+            )
+
+    def add_score(self, step: int, score: float) -> None:
+        with self.transaction() as conn:
+            conn.execute("INSERT INTO scores (step, score) VALUES (?, ?)", (step, score))
+
+    def add_modification(self, step: int, modification: Dict[str, Any]) -> None:
+        """Append one modification record (slide_number, type, details, iteration, timestamp)."""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO modifications "
+                "(step, slide_number, type, details, iteration, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (step, modification.get('slide_number'), modification.get('type'),
+                 self._encode(modification.get('details', {})), modification.get('iteration'),
+                 modification.get('timestamp'))
+            )
+
+    def get_retry_contexts(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Retry context dicts (RetryContext.to_dict layout) keyed by step.
+
+        A step has a context if it has counters, scores or modifications.
+        locked_slides is the store-wide lock set.
+        """
+        conn = self.connection()
+        contexts: Dict[int, Dict[str, Any]] = {}
+        locked = self.locked_slides()
+
+        def context(step: int) -> Dict[str, Any]:
+            if step not in contexts:
+                contexts[step] = {
+                    'iteration': 1, 'max_iterations': 3, 'failing_categories': [],
+                    'locked_slides': sorted(locked), 'previous_scores': [],
+                    'modifications_made': []
+                }
+            return contexts[step]
+
+        for step, iteration, max_iterations, failing in conn.execute(
+            "SELECT step, iteration, max_iterations, failing_categories "
+            "FROM retry_contexts ORDER BY step"
+        ):
+            ctx = context(step)
+            ctx['iteration'] = iteration
+            ctx['max_iterations'] = max_iterations
+            ctx['failing_categories'] = _loads(failing, [])
+        for step, score in conn.execute("SELECT step, score FROM scores ORDER BY id"):
+            context(step)['previous_scores'].append(score)
+        for step, slide, kind, details, iteration, timestamp in conn.execute(
+            "SELECT step, slide_number, type, details, iteration, timestamp "
+            "FROM modifications ORDER BY id"
+        ):
+            context(step)['modifications_made'].append({
+                'slide_number': slide, 'type': kind, 'details': self._decode(details, default={}),
+                'iteration': iteration, 'timestamp': timestamp
+            })
+        return contexts
+
+    def delete_step(self, step: int) -> None:
+        """Remove a step's state, retry counters, scores and modifications."""
+        with self.transaction() as conn:
+            for table in _STEP_TABLES:
+                conn.execute(f"DELETE FROM {table} WHERE step = ?", (step,))
+
+    def clear_steps(self) -> None:
+        """Remove all step state and slide locks."""
+        with self.transaction() as conn:
+            for table in _STEP_TABLES + ('locked_slides',):
+                conn.execute(f"DELETE FROM {table}")
+
+    # =========================================================================
+    # SLIDE LOCKS
+    # =========================================================================
+
+    def lock_slides(self, slide_numbers: Iterable[int]) -> None:
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO locked_slides (slide_number) VALUES (?)",
+                [(n,) for n in slide_numbers]
+            )
+
+    def unlock_slides(self, slide_numbers: Optional[Iterable[int]] = None) -> None:
+        """Unlock the given slides, or every slide if None."""
+        with self.transaction() as conn:
+            if slide_numbers is None:
+                conn.execute("DELETE FROM locked_slides")
+            else:
+                conn.executemany(
+                    "DELETE FROM locked_slides WHERE slide_number = ?",
+                    [(n,) for n in slide_numbers]
+                )
+
+    def locked_slides(self) -> List[int]:
+        return [n for (n,) in self.connection().execute(
+            "SELECT slide_number FROM locked_slides ORDER BY slide_number"
+        )]
+
+    # =========================================================================
+    # PIPELINE STATUS (pipeline_state.json layout)
+    # =========================================================================
+
+    def section_steps(self, section: str) -> Dict[str, str]:
+        """Step -> status for one section (empty if the section is not tracked)."""
+        return dict(self.connection().execute(
+            "SELECT step, status FROM sections WHERE section = ? ORDER BY rowid",
+            (section,)
+        ).fetchall())
+
+    def add_section(self, section: str, steps: Sequence[str], status: str = 'pending') -> bool:
+        """Track a new section with every step at status; False if it already exists."""
+        with self.transaction() as conn:
+            if conn.execute(
+                "SELECT 1 FROM sections WHERE section = ? LIMIT 1", (section,)
+            ).fetchone():
+                return False
+            conn.executemany(
+                "INSERT INTO sections (section, step, status) VALUES (?, ?, ?)",
+                [(section, step, status) for step in steps]
+            )
+            self._touch(conn)
+        return True
+
+    def set_section_status(
+        self,
+        section: str,
+        step: str,
+        status: str,
+        default_steps: Sequence[str] = ()
+    ) -> Optional[str]:
+        """
+        Change one section step's status in a single-row update.
+
+        An untracked section is first added with default_steps pending.
+
+        Returns:
+            The previous status
+
+        Raises:
+            KeyError: If the section has no such step
+        """
+        with self.transaction() as conn:
+            self.add_section(section, default_steps)
+            row = conn.execute(
+                "SELECT status FROM sections WHERE section = ? AND step = ?",
+                (section, step)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"{section}/{step}")
+            conn.execute(
+                "UPDATE sections SET status = ? WHERE section = ? AND step = ?",
+                (status, section, step)
+            )
+            self._touch(conn)
+        return row[0]
+
+    def set_global_step(self, step: str, status: str) -> None:
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO global_steps (step, status) VALUES (?, ?) "
+                "ON CONFLICT (step) DO UPDATE SET status = excluded.status",
+                (step, status)
+            )
+            self._touch(conn)
+
+    def set_pipeline_info(self, key: str, value: Any) -> None:
+        with self.transaction() as conn:
+            self._put_info(conn, key, value)
+            if key != 'last_updated':
+                self._touch(conn)
+
+    @staticmethod
+    def _put_info(conn: sqlite3.Connection, key: str, value: Any) -> None:
+        conn.execute(
+            "INSERT INTO pipeline_info (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, _dumps(value))
+        )
+
+    def _touch(self, conn: sqlite3.Connection) -> None:
+        self._put_info(conn, 'last_updated', datetime.now().strftime('%Y-%m-%d'))
+
+    def has_pipeline_state(self) -> bool:
+        conn = self.connection()
+        return any(
+            conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone()
+            for table in ('pipeline_info', 'sections', 'global_steps', 'notes')
+        )
+
+    def load_pipeline_state(self) -> Dict[str, Any]:
+        """Pipeline status assembled in the pipeline_state.json layout."""
+        conn = self.connection()
+        sections: Dict[str, Dict[str, str]] = {}
+        for section, step, status in conn.execute(
+            "SELECT section, step, status FROM sections ORDER BY rowid"
+        ):
+            sections.setdefault(section, {})[step] = status
+        return {
+            'pipeline_info': {
+                key: _loads(value)
+                for key, value in conn.execute("SELECT key, value FROM pipeline_info ORDER BY rowid")
+            },
+            'sections': sections,
+            'global_steps': dict(conn.execute(
+                "SELECT step, status FROM global_steps ORDER BY rowid"
+            ).fetchall()),
+            'notes': [text for (text,) in conn.execute("SELECT text FROM notes ORDER BY id")],
+        }
+
+    def save_pipeline_state(self, state: Dict[str, Any]) -> int:
+        """
+        Write a pipeline_state.json-layout dict, touching only changed rows.
+
+        Rows absent from state are deleted, so this is a full replace in
+        effect; prefer set_section_status/set_global_step for single updates.
+
+        Returns:
+            Number of rows inserted, updated or deleted
+        """
+        wanted = {
+            'pipeline_info': {
+                (key,): (_dumps(value),)
+                for key, value in state.get('pipeline_info', {}).items()
+            },
+            'sections': {
+                (section, step): (status,)
+                for section, steps in state.get('sections', {}).items()
+                for step, status in steps.items()
+            },
+            'global_steps': {
+                (step,): (status,) for step, status in state.get('global_steps', {}).items()
+            },
+        }
+        changed = 0
+        with self.transaction() as conn:
+            for table, rows in wanted.items():
+                changed += self._sync_rows(conn, table, rows)
+            notes = list(state.get('notes', []))
+            current = [text for (text,) in conn.execute("SELECT text FROM notes ORDER BY id")]
+            if notes != current:
+                conn.execute("DELETE FROM notes")
+                conn.executemany("INSERT INTO notes (text) VALUES (?)", [(n,) for n in notes])
+                changed += len(current) + len(notes)
+        return changed
+
+    @staticmethod
+    def _sync_rows(
+        conn: sqlite3.Connection,
+        table: str,
+        rows: Dict[tuple, tuple]
+    ) -> int:
+        columns, key = _TABLES[table]
+        names = [name for name, _ in columns]
+        values = [name for name in names if name not in key]
+        where = " AND ".join(f"{k} = ?" for k in key)
+
+        current = {
+            row[:len(key)]: row[len(key):]
+            for row in conn.execute(
+                f"SELECT {', '.join(key + tuple(values))} FROM {table}"
+            )
+        }
+        stale = [k for k in current if k not in rows]
+        dirty = [(k, v) for k, v in rows.items() if current.get(k) != v]
+
+        conn.executemany(f"DELETE FROM {table} WHERE {where}", stale)
+        conn.executemany(
+            f"INSERT INTO {table} ({', '.join(key + tuple(values))}) "
+            f"VALUES ({', '.join('?' * (len(key) + len(values)))}) "
+            f"ON CONFLICT ({', '.join(key)}) DO UPDATE SET "
+            + ", ".join(f"{v} = excluded.{v}" for v in values),
+            [k + v for k, v in dirty]
+        )
+        return len(stale) + len(dirty)
+
+    # =========================================================================
+    # RUN JOURNAL
+    # =========================================================================
+
+    def record_journal(
+        self,
+        run_key: str,
+        phase: str,
+        outputs: Any = None,
+        agent: str = '',
+        status: str = 'completed'
+    ) -> None:
+        """Record a finished phase (agent='') or agent of a run."""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO run_journal (run_key, phase, agent, status, outputs, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (run_key, phase, agent) DO UPDATE SET "
+                "status = excluded.status, outputs = excluded.outputs, "
+                "timestamp = excluded.timestamp",
+                (run_key, phase, agent, status, self._encode(outputs), datetime.now().isoformat())
+            )
+
+    def journal_entries(self, run_key: str) -> List[Dict[str, Any]]:
+        """A run's journal entries in the order they were recorded."""
+        return [
+            {'phase': phase, 'agent': agent, 'status': status,
+             'outputs': self._decode(outputs), 'timestamp': timestamp}
+            for phase, agent, status, outputs, timestamp in self.connection().execute(
+                "SELECT phase, agent, status, outputs, timestamp FROM run_journal "
+                "WHERE run_key = ? ORDER BY rowid",
+                (run_key,)
+            )
+        ]
+
+    def clear_journal(self, run_key: str, phases: Optional[Iterable[str]] = None) -> None:
+        """Forget a run's entries for the given phases (all phases if None)."""
+        with self.transaction() as conn:
+            if phases is None:
+                conn.execute("DELETE FROM run_journal WHERE run_key = ?", (run_key,))
+            else:
+                conn.executemany(
+                    "DELETE FROM run_journal WHERE run_key = ? AND phase = ?",
+                    [(run_key, phase) for phase in phases]
+                )
+
+    # =========================================================================
+    # CHECKPOINTS
+    # =========================================================================
+
+    def create_checkpoint(self, name: str) -> str:
+        """
+        Snapshot every live table; returns the checkpoint label.
+
+        Rows are copied table to table inside SQLite, so the cost is
+        proportional to the state size with no JSON encoding. Checkpoints
+        beyond max_checkpoints are dropped, oldest first.
+        """
+        with self.transaction() as conn:
+            timestamp = datetime.now().isoformat()
+            checkpoint_id = conn.execute(
+                "INSERT INTO checkpoints (name, timestamp) VALUES (?, ?)", (name, timestamp)
+            ).lastrowid
+            label = f"checkpoint_{name}_{checkpoint_id}"
+            conn.execute("UPDATE checkpoints SET label = ? WHERE id = ?", (label, checkpoint_id))
+            for table in _TABLES:
+                columns = ", ".join(_columns(table))
+                conn.execute(
+                    f"INSERT INTO checkpoint_{table} (checkpoint_id, {columns}) "
+                    f"SELECT ?, {columns} FROM {table} ORDER BY rowid",
+                    (checkpoint_id,)
+                )
+            if self.max_checkpoints is not None:
+                for (old_id,) in conn.execute(
+                    "SELECT id FROM checkpoints ORDER BY id DESC LIMIT -1 OFFSET ?",
+                    (max(1, self.max_checkpoints),)
+                ).fetchall():
+                    self._delete_checkpoint(conn, old_id)
+        return label
+
+    def delete_checkpoint(self, label: str) -> bool:
+        """Drop a checkpoint and its rows; False if unknown."""
+        with self.transaction() as conn:
+            row = conn.execute("SELECT id FROM checkpoints WHERE label = ?", (label,)).fetchone()
+            if row is None:
+                return False
+            self._delete_checkpoint(conn, row[0])
+        return True
+
+    @staticmethod
+    def _delete_checkpoint(conn: sqlite3.Connection, checkpoint_id: int) -> None:
+        for table in _TABLES:
+            conn.execute(f"DELETE FROM checkpoint_{table} WHERE checkpoint_id = ?", (checkpoint_id,))
+        conn.execute("DELETE FROM checkpoints WHERE id = ?", (checkpoint_id,))
+
+    def restore_checkpoint(self, label: str) -> bool:
+        """Replace every live table with a checkpoint's rows; False if unknown."""
+        with self.transaction() as conn:
+            row = conn.execute("SELECT id FROM checkpoints WHERE label = ?", (label,)).fetchone()
+            if row is None:
+                return False
+            for table in _TABLES:
+                columns = ", ".join(_columns(table))
+                conn.execute(f"DELETE FROM {table}")
+                conn.execute(
+                    f"INSERT INTO {table} ({columns}) SELECT {columns} "
+                    f"FROM checkpoint_{table} WHERE checkpoint_id = ? ORDER BY rowid",
+                    (row[0],)
+                )
+        return True
+
+    def list_checkpoints(self) -> List[Dict[str, Any]]:
+        return [
+            {'label': label, 'name': name, 'timestamp': timestamp}
+            for label, name, timestamp in self.connection().execute(
+                "SELECT label, name, timestamp FROM checkpoints ORDER BY id"
+            )
+        ]
@@ -36,6 +36,15 @@ from typing import Dict, Any, List, Optional, Set
 from dataclasses import dataclass, field, asdict
 import copy
 
+from skills.utilities.state_store import DEFAULT_MAX_CHECKPOINTS, StateStore
+
+
+# Database file StepStateManager keeps in its output directory
+STATE_DB_NAME = "pipeline_state.db"
+
+# Meta key set once legacy step_N_state.json files have been imported
+_LEGACY_IMPORTED = 'legacy_step_files_imported'
+
 
 @dataclass
 class RetryContext:
@@ -115,38 +124,94 @@ class StepStateManager:
     - Track retry iterations
     - Lock slides that don't need re-processing
     - Maintain modification history
+
+    State lives in a SQLite StateStore (pipeline_state.db in output_dir):
+    each change writes only its own rows, and checkpoints are snapshots
+    inside the database (the newest max_checkpoints are kept). Legacy
+    step_N_state.json files in output_dir are imported once on first use.
+    Call close() when done to release the database connections.
     """
 
-    def __init__(self, output_dir: str = "outputs/state"):
+    def __init__(
+        self,
+        output_dir: str = "outputs/state",
+        max_checkpoints: Optional[int] = DEFAULT_MAX_CHECKPOINTS
+    ):
         """
         Initialize the state manager.
 
         Args:
-            output_dir: Directory to store state files
+            output_dir: Directory holding the state database
+            max_checkpoints: Checkpoints kept (None keeps all)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.store = StateStore(self.output_dir / STATE_DB_NAME, max_checkpoints=max_checkpoints)
 
-        # In-memory state cache
+        # In-memory view of the store (reads never hit the database)
         self._states: Dict[int, StepState] = {}
         self._retry_contexts: Dict[int, RetryContext] = {}
         self._locked_slides: Set[int] = set()
 
-        # Load existing states from disk
+        if self.store.get_meta(_LEGACY_IMPORTED) is None:
+            self._import_legacy_files()
         self._load_existing_states()
 
-    def _load_existing_states(self) -> None:
-        """Load existing state files from disk."""
-        for state_file in self.output_dir.glob("step_*_state.json"):
+    def _import_legacy_files(self) -> None:
+        """Copy step_N_state.json files written by earlier versions into the store."""
+        for state_file in sorted(self.output_dir.glob("step_*_state.json")):
             try:
                 with open(state_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    state = StepState.from_dict(data)
-                    self._states[state.step_number] = state
-                    if state.retry_context:
-                        self._retry_contexts[state.step_number] = state.retry_context
+                    state = StepState.from_dict(json.load(f))
+                self._states[state.step_number] = state
+                if state.retry_context:
+                    self._retry_contexts[state.step_number] = state.retry_context
             except Exception as e:
                 print(f"Warning: Could not load state file {state_file}: {e}")
+        self._persist_all()
+        self.store.set_meta(_LEGACY_IMPORTED, datetime.now().isoformat())
+
+    def _load_existing_states(self) -> None:
+        """Load step states, retry contexts and slide locks from the store."""
+        self._states = {
+            row['step_number']: StepState.from_dict(row) for row in self.store.get_steps()
+        }
+        self._retry_contexts = {
+            step: RetryContext.from_dict(ctx)
+            for step, ctx in self.store.get_retry_contexts().items()
+        }
+        self._locked_slides = set(self.store.locked_slides())
+        for step, ctx in self._retry_contexts.items():
+            if step in self._states:
+                self._states[step].retry_context = ctx
+
+    def reload(self) -> None:
+        """Re-read the store (picks up changes made by other workers)."""
+        self._load_existing_states()
+
+    def close(self) -> None:
+        """Close the store's connections (reopened on next use)."""
+        self.store.close()
+
+    def _persist_retry_context(self, step: int) -> None:
+        ctx = self._retry_contexts[step]
+        self.store.put_retry_context(step, ctx.iteration, ctx.max_iterations, ctx.failing_categories)
+
+    def _persist_all(self) -> None:
+        """Replace the store's step state with the in-memory view (one transaction)."""
+        with self.store.transaction():
+            self.store.clear_steps()
+            for state in self._states.values():
+                self.store.put_step(
+                    state.step_number, state.status, state.data, state.metadata, state.timestamp
+                )
+            for step, ctx in self._retry_contexts.items():
+                self._persist_retry_context(step)
+                for score in ctx.previous_scores:
+                    self.store.add_score(step, score)
+                for modification in ctx.modifications_made:
+                    self.store.add_modification(step, modification)
+            self.store.lock_slides(self._locked_slides)
 
     def save_state(
         self,
@@ -165,11 +230,15 @@ class StepStateManager:
             metadata: Optional metadata (domain, section, etc.)
 
         Returns:
-            Path to saved state file
+            Path to the state database
         """
-        timestamp = datetime.now().isoformat()
+        with self.store.transaction():
+            timestamp = self.store.put_step(step, status, state, metadata)
+            if step in self._retry_contexts:
+                self._persist_retry_context(step)
 
-        step_state = StepState(
+        # Update cache
+        self._states[step] = StepState(
             step_number=step,
             timestamp=timestamp,
             status=status,
@@ -178,17 +247,7 @@ class StepStateManager:
             retry_context=self._retry_contexts.get(step)
         )
 
-        # Update cache
-        self._states[step] = step_state
-
-        # Save to disk
-        filename = f"step_{step}_state.json"
-        filepath = self.output_dir / filename
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(step_state.to_dict(), f, indent=2, default=str)
-
-        return str(filepath)
+        return str(self.store.path)
 
     def load_state(self, step: int) -> Optional[Dict[str, Any]]:
         """
@@ -204,17 +263,13 @@ class StepStateManager:
         if step in self._states:
             return self._states[step].data
 
-        # Try loading from disk
-        filepath = self.output_dir / f"step_{step}_state.json"
-        if filepath.exists():
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    state = StepState.from_dict(data)
-                    self._states[step] = state
-                    return state.data
-            except Exception as e:
-                print(f"Warning: Could not load state for step {step}: {e}")
+        # Another worker may have saved it since we loaded
+        row = self.store.get_step(step)
+        if row is not None:
+            state = StepState.from_dict(row)
+            state.retry_context = self._retry_contexts.get(step)
+            self._states[step] = state
+            return state.data
 
         return None
 
@@ -255,6 +310,7 @@ class StepStateManager:
         # Preserve locked slides
         ctx.locked_slides = self._locked_slides.copy()
 
+        self._persist_retry_context(step)
         return ctx
 
     def get_retry_context(self, step: int) -> Optional[RetryContext]:
@@ -280,6 +336,7 @@ class StepStateManager:
             slide_numbers: List of slide numbers to lock
         """
         self._locked_slides.update(slide_numbers)
+        self.store.lock_slides(slide_numbers)
 
         # Update all retry contexts
         for ctx in self._retry_contexts.values():
@@ -296,6 +353,7 @@ class StepStateManager:
             self._locked_slides.clear()
         else:
             self._locked_slides -= set(slide_numbers)
+        self.store.unlock_slides(slide_numbers)
 
         # Update all retry contexts
         for ctx in self._retry_contexts.values():
@@ -329,13 +387,15 @@ class StepStateManager:
             self._retry_contexts[step] = RetryContext()
 
         ctx = self._retry_contexts[step]
-        ctx.modifications_made.append({
+        modification = {
             'slide_number': slide_number,
             'type': modification_type,
             'details': details,
             'iteration': ctx.iteration,
             'timestamp': datetime.now().isoformat()
-        })
+        }
+        ctx.modifications_made.append(modification)
+        self.store.add_modification(step, modification)
 
     def record_score(self, step: int, score: float) -> None:
         """
@@ -349,6 +409,7 @@ class StepStateManager:
             self._retry_contexts[step] = RetryContext()
 
         self._retry_contexts[step].previous_scores.append(score)
+        self.store.add_score(step, score)
 
     def get_score_history(self, step: int) -> List[float]:
         """Get score history for a step."""
@@ -419,39 +480,32 @@ class StepStateManager:
         """
         Create a named checkpoint of current state.
 
+        The checkpoint is a snapshot of the state rows inside the store.
+
         Args:
             name: Checkpoint name
 
         Returns:
-            Path to checkpoint file
+            Checkpoint label (pass to restore_checkpoint)
         """
-        checkpoint = {
-            'name': name,
-            'timestamp': datetime.now().isoformat(),
-            'states': {str(k): v.to_dict() for k, v in self._states.items()},
-            'retry_contexts': {str(k): v.to_dict() for k, v in self._retry_contexts.items()},
-            'locked_slides': list(self._locked_slides)
-        }
-
-        filename = f"checkpoint_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        filepath = self.output_dir / filename
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(checkpoint, f, indent=2, default=str)
-
-        return str(filepath)
+        return self.store.create_checkpoint(name)
 
     def restore_checkpoint(self, filepath: str) -> bool:
         """
-        Restore state from a checkpoint file.
+        Restore state from a checkpoint.
 
         Args:
-            filepath: Path to checkpoint file
+            filepath: Checkpoint label from create_checkpoint, or the path
+                of a legacy checkpoint JSON file
 
         Returns:
             True if successful
         """
         try:
+            if self.store.restore_checkpoint(filepath):
+                self._load_existing_states()
+                return True
+
             with open(filepath, 'r', encoding='utf-8') as f:
                 checkpoint = json.load(f)
 
@@ -464,6 +518,7 @@ class StepStateManager:
                 for k, v in checkpoint.get('retry_contexts', {}).items()
             }
             self._locked_slides = set(checkpoint.get('locked_slides', []))
+            self._persist_all()
 
             return True
         except Exception as e:
@@ -477,10 +532,7 @@ class StepStateManager:
         if step in self._retry_contexts:
             del self._retry_contexts[step]
 
-        # Remove from disk
-        filepath = self.output_dir / f"step_{step}_state.json"
-        if filepath.exists():
-            filepath.unlink()
+        self.store.delete_step(step)
 
     def clear_all(self) -> None:
         """Clear all state data."""
@@ -488,9 +540,7 @@ class StepStateManager:
         self._retry_contexts.clear()
         self._locked_slides.clear()
 
-        # Remove all state files
-        for f in self.output_dir.glob("step_*_state.json"):
-            f.unlink()
+        self.store.clear_steps()
 
     def get_pipeline_summary(self) -> Dict[str, Any]:
         """Get summary of pipeline state."""
@@ -575,6 +625,7 @@ if __name__ == "__main__":
 
     # Cleanup
     manager.clear_all()
+    manager.close()
     import shutil
     shutil.rmtree("outputs/state_test", ignore_errors=True)
 
@@ -0,0 +1,508 @@
+"""
+Work Queue
+Job queue for spreading curriculum generation across processes and machines.
+
+Provides:
+- Job / Artifact: queued (unit, day) or (section, step) work keyed by an
+  input content hash, and the output files a worker pushes back
+- Broker / SQLiteBroker: leased job queue with retry limits; the default
+  keeps jobs and artifacts in a WAL-mode SQLite file, JSON only
+- register_broker() / open_broker(): pluggable broker backends
+- Worker: claims jobs, runs the registered handler and renews its lease
+- content_hash() / file_hash(): input hashes for enqueueing
+
+Usage:
+    from skills.utilities.work_queue import Job, Worker, content_hash, open_broker
+
+    broker = open_broker('outputs/queue.db')          # or 'sqlite:outputs/queue.db'
+    broker.enqueue(Job('day:1:3', 'day', {'unit': 1, 'day': 3},
+                       content_hash(lesson_data, config)))
+
+    # On each worker machine
+    Worker(broker, {'day': run_day_job}).run(idle_timeout=30)
+
+    # Back on the coordinator
+    print(broker.stats())
+    broker.collect_artifacts('production/')
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from skills.utilities.atomic_write import atomic_write_bytes
+from skills.utilities.serializer import decode, encode, to_plain
+from skills.utilities.state_store import StateStore
+
+
+# Seconds a claimed job stays leased without a heartbeat
+DEFAULT_LEASE_SECONDS = 300.0
+
+# Attempts before a failing job is marked failed
+DEFAULT_MAX_ATTEMPTS = 3
+
+# The only payload format the queue writes or reads
+PAYLOAD_FORMAT = 'json'
+
+# Job statuses
+PENDING = 'pending'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+
+def content_hash(*parts: Any) -> str:
+    """sha256 of payload parts (bytes as is, anything else as sorted plain JSON)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = json.dumps(to_plain(part), sort_keys=True, default=str).encode('utf-8')
+        digest.update(len(part).to_bytes(8, 'big'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def file_hash(*paths: Union[str, Path]) -> str:
+    """content_hash of the files' bytes (missing files hash as empty)."""
+    return content_hash(*(Path(p).read_bytes() if Path(p).exists() else b'' for p in paths))
+
+
+# =============================================================================
+# JOBS
+# =============================================================================
+
+@dataclass
+class Job:
+    """One unit of work and its state in the queue."""
+    job_id: str
+    kind: str                    # handler name, e.g. 'day' or 'section'
+    params: Dict[str, Any]
+    input_hash: str = ''
+    priority: int = 0            # lower runs first
+    status: str = PENDING
+    attempts: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    worker: Optional[str] = None
+    lease_expires: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    enqueued_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    finished_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'kind': self.kind,
+            'params': self.params,
+            'input_hash': self.input_hash,
+            'status': self.status,
+            'attempts': self.attempts,
+            'worker': self.worker,
+            'result': self.result,
+            'error': self.error,
+            'enqueued_at': self.enqueued_at,
+            'finished_at': self.finished_at
+        }
+
+
+@dataclass
+class Artifact:
+    """An output file pushed back by a worker."""
+    job_id: str
+    name: str     # path relative to the output root
+    data: bytes
+    digest: str = ''
+
+    def __post_init__(self):
+        self.digest = self.digest or hashlib.sha256(self.data).hexdigest()
+
+
+# =============================================================================
+# BROKERS
+# =============================================================================
+
+class Broker(ABC):
+    """Queue backend interface."""
+
+    @abstractmethod
+    def enqueue(self, job: Job) -> bool:
+        """Add or refresh a job; False if an identical job is already queued or done."""
+        pass
+
+    @abstractmethod
+    def claim(self, worker: str, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+              kinds: Optional[List[str]] = None) -> Optional[Job]:
+        """Lease the next runnable job to worker (None when there is none)."""
+        pass
+
+    @abstractmethod
+    def heartbeat(self, job_id: str, worker: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        """Extend worker's lease; False if the lease was lost."""
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, worker: str, result: Dict[str, Any],
+                 artifacts: Optional[List[Artifact]] = None) -> bool:
+        """Store a job's result and artifacts; False if worker no longer holds it."""
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, worker: str, error: str) -> Optional[str]:
+        """
+        Record a failed attempt (requeued while attempts remain).
+
+        Returns:
+            The job's new status (PENDING or FAILED), or None if worker
+            no longer holds it
+        """
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]:
+        """A job by id (None if unknown)."""
+        pass
+
+    @abstractmethod
+    def jobs(self, status: Optional[str] = None) -> List[Job]:
+        """Every job (with status), in claim order."""
+        pass
+
+    @abstractmethod
+    def artifacts(self, job_id: Optional[str] = None, kind: Optional[str] = None) -> List[Artifact]:
+        """Artifacts of one job, or of every job (of kind)."""
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        """Job counts by status."""
+        counts = {PENDING: 0, RUNNING: 0, COMPLETED: 0, FAILED: 0}
+        for job in self.jobs():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
+
+    def collect_artifacts(
+        self,
+        output_dir: Union[str, Path],
+        job_id: Optional[str] = None,
+        kind: Optional[str] = None
+    ) -> List[Path]:
+        """
+        Write artifacts under output_dir (atomically); returns the paths.
+
+        Artifact names are relative to the folder their handler writes
+        to, so collect each job kind into that kind's folder.
+        """
+        root = Path(output_dir).resolve()
+        written = []
+        for artifact in self.artifacts(job_id, kind):
+            path = (root / artifact.name).resolve()
+            if root not in path.parents:
+                raise ValueError(f"Artifact path escapes the output folder: {artifact.name}")
+            written.append(atomic_write_bytes(path, artifact.data))
+        return written
+
+
+_JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS queue_jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT,
+    params BLOB,
+    input_hash TEXT,
+    priority INTEGER,
+    status TEXT,
+    attempts INTEGER,
+    max_attempts INTEGER,
+    worker TEXT,
+    lease_expires REAL,
+    result BLOB,
+    error TEXT,
+    enqueued_at TEXT,
+    finished_at TEXT
+);
+CREATE TABLE IF NOT EXISTS queue_artifacts (
+    job_id TEXT,
+    name TEXT,
+    digest TEXT,
+    data BLOB,
+    PRIMARY KEY (job_id, name)
+);
+CREATE INDEX IF NOT EXISTS queue_jobs_runnable ON queue_jobs (status, priority, enqueued_at)
+"""
+
+_JOB_COLUMNS = ('job_id', 'kind', 'params', 'input_hash', 'priority', 'status', 'attempts',
+                'max_attempts', 'worker', 'lease_expires', 'result', 'error',
+                'enqueued_at', 'finished_at')
+
+
+class SQLiteBroker(Broker):
+    """
+    Jobs and artifacts in SQLite (WAL) tables.
+
+    Claims run in BEGIN IMMEDIATE transactions, so concurrent workers in
+    any number of processes never receive the same job.
+    """
+
+    def __init__(self, store: Union[StateStore, str, Path], clock: Callable[[], float] = time.time):
+        """
+        Args:
+            store: StateStore to share or a database path
+            clock: Wall clock for leases (shared across machines)
+        """
+        self.store = store if isinstance(store, StateStore) else StateStore(store)
+        self._clock = clock
+        with self.store.transaction() as conn:
+            for statement in filter(None, (s.strip() for s in _JOB_SCHEMA.split(';'))):
+                conn.execute(statement)
+
+    @staticmethod
+    def _encode(payload: Any) -> sqlite3.Binary:
+        return sqlite3.Binary(encode(payload, serializer=PAYLOAD_FORMAT))
+
+    @staticmethod
+    def _job(row: tuple) -> Job:
+        values = dict(zip(_JOB_COLUMNS, row))
+        values['params'] = decode(values['params'], default={}, accept=[PAYLOAD_FORMAT])
+        values['result'] = decode(values['result'], accept=[PAYLOAD_FORMAT])
+        return Job(**values)
+
+    def enqueue(self, job: Job) -> bool:
+        with self.store.transaction() as conn:
+            row = conn.execute(
+                "SELECT input_hash, status FROM queue_jobs WHERE job_id = ?", (job.job_id,)
+            ).fetchone()
+            if row is not None and row[0] == job.input_hash and row[1] != FAILED:
+                return False
+            conn.execute("DELETE FROM queue_artifacts WHERE job_id = ?", (job.job_id,))
+            conn.execute(
+                f"INSERT OR REPLACE INTO queue_jobs ({', '.join(_JOB_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_JOB_COLUMNS))})",
+                (job.job_id, job.kind, self._encode(job.params), job.input_hash, job.priority,
+                 PENDING, 0, job.max_attempts, None, None, None, None, job.enqueued_at, None)
+            )
+        return True
+
+    def claim(self, worker: str, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+              kinds: Optional[List[str]] = None) -> Optional[Job]:
+        now = self._clock()
+        kind_sql = f" AND kind IN ({', '.join('?' * len(kinds))})" if kinds else ""
+        with self.store.transaction() as conn:
+            # Leases that expired on the last attempt are not handed out again
+            conn.execute(
+                "UPDATE queue_jobs SET status = ?, lease_expires = NULL, finished_at = ?, "
+                "error = COALESCE(error, 'Lease expired after ' || attempts || ' attempts') "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (FAILED, datetime.now().isoformat(), RUNNING, now)
+            )
+            row = conn.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM queue_jobs "
+                f"WHERE (status = ? OR (status = ? AND lease_expires < ?)){kind_sql} "
+                "ORDER BY priority, enqueued_at, job_id LIMIT 1",
+                (PENDING, RUNNING, now, *(kinds or []))
+            ).fetchone()
+            if row is None:
+                return None
+            job = self._job(row)
+            job.status, job.worker = RUNNING, worker
+            job.attempts += 1
+            job.lease_expires = now + lease_seconds
+            conn.execute(
+                "UPDATE queue_jobs SET status = ?, worker = ?, attempts = ?, lease_expires = ? "
+                "WHERE job_id = ?",
+                (job.status, worker, job.attempts, job.lease_expires, job.job_id)
+            )
+        return job
+
+    def heartbeat(self, job_id: str, worker: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> bool:
+        with self.store.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE queue_jobs SET lease_expires = ? "
+                "WHERE job_id = ? AND worker = ? AND status = ?",
+                (self._clock() + lease_seconds, job_id, worker, RUNNING)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker: str, result: Dict[str, Any],
+                 artifacts: Optional[List[Artifact]] = None) -> bool:
+        with self.store.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE queue_jobs SET status = ?, result = ?, error = NULL, lease_expires = NULL, "
+                "finished_at = ? WHERE job_id = ? AND worker = ? AND status = ?",
+                (COMPLETED, self._encode(result), datetime.now().isoformat(), job_id, worker, RUNNING)
+            )
+            if cursor.rowcount != 1:
+                return False
+            conn.execute("DELETE FROM queue_artifacts WHERE job_id = ?", (job_id,))
+            conn.executemany(
+                "INSERT INTO queue_artifacts (job_id, name, digest, data) VALUES (?, ?, ?, ?)",
+                [(job_id, a.name, a.digest, a.data) for a in artifacts or []]
+            )
+        return True
+
+    def fail(self, job_id: str, worker: str, error: str) -> Optional[str]:
+        with self.store.transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM queue_jobs "
+                "WHERE job_id = ? AND worker = ? AND status = ?",
+                (job_id, worker, RUNNING)
+            ).fetchone()
+            if row is None:
+                return None
+            status = PENDING if row[0] < row[1] else FAILED
+            retry = status == PENDING
+            conn.execute(
+                "UPDATE queue_jobs SET status = ?, error = ?, worker = ?, lease_expires = NULL, "
+                "finished_at = ? WHERE job_id = ?",
+                (status, error, None if retry else worker,
+                 None if retry else datetime.now().isoformat(), job_id)
+            )
+        return status
+
+    def get(self, job_id: str) -> Optional[Job]:
+        row = self.store.connection().execute(
+            f"SELECT {', '.join(_JOB_COLUMNS)} FROM queue_jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return self._job(row) if row else None
+
+    def jobs(self, status: Optional[str] = None) -> List[Job]:
+        where, params = ("WHERE status = ?", (status,)) if status else ("", ())
+        rows = self.store.connection().execute(
+            f"SELECT {', '.join(_JOB_COLUMNS)} FROM queue_jobs {where} "
+            "ORDER BY priority, enqueued_at, job_id", params
+        ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def artifacts(self, job_id: Optional[str] = None, kind: Optional[str] = None) -> List[Artifact]:
+        clauses, params = [], []
+        if job_id:
+            clauses.append("a.job_id = ?")
+            params.append(job_id)
+        if kind:
+            clauses.append("j.kind = ?")
+            params.append(kind)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.store.connection().execute(
+            "SELECT a.job_id, a.name, a.data, a.digest FROM queue_artifacts a "
+            f"JOIN queue_jobs j ON j.job_id = a.job_id {where} ORDER BY a.job_id, a.name",
+            params
+        ).fetchall()
+        return [Artifact(job_id, name, bytes(data), digest) for job_id, name, data, digest in rows]
+
+
+# Broker scheme -> factory(location)
+_BROKERS: Dict[str, Callable[[str], Broker]] = {'sqlite': SQLiteBroker}
+
+
+def register_broker(scheme: str, factory: Callable[[str], Broker]) -> None:
+    """Make a broker backend available to open_broker as '<scheme>:<location>'."""
+    _BROKERS[scheme] = factory
+
+
+def open_broker(spec: Union[str, Path, Broker]) -> Broker:
+    """
+    Broker from '<scheme>:<location>' or '<scheme>://<location>'.
+
+    A bare path (or an unknown scheme, e.g. a Windows drive) opens a
+    SQLiteBroker on that file.
+    """
+    if isinstance(spec, Broker):
+        return spec
+    scheme, sep, location = str(spec).partition(':')
+    if not sep or scheme not in _BROKERS:
+        return SQLiteBroker(str(spec))
+    if location.startswith('//'):
+        location = location[2:]
+    return _BROKERS[scheme](location)
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+# A handler runs a job and returns (result, {artifact name: file path})
+JobHandler = Callable[[Job], Tuple[Dict[str, Any], Dict[str, Union[str, Path]]]]
+
+
+class Worker:
+    """Claims jobs from a broker and runs them with the handler for their kind."""
+
+    def __init__(
+        self,
+        broker: Broker,
+        handlers: Dict[str, JobHandler],
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ):
+        """
+        Args:
+            broker: Queue backend
+            handlers: Job kind -> handler; only these kinds are claimed
+            worker_id: Name in the queue (default: host-pid-random)
+            lease_seconds: Lease length; renewed every third of it
+        """
+        self.broker = broker
+        self.handlers = handlers
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.lease_seconds = lease_seconds
+
+    def run_one(self) -> Optional[Job]:
+        """Claim and run one job; returns it (None if the queue had none)."""
+        job = self.broker.claim(self.worker_id, self.lease_seconds, kinds=list(self.handlers))
+        if job is None:
+            return None
+
+        stop = threading.Event()
+
+        def renew() -> None:
+            while not stop.wait(self.lease_seconds / 3):
+                if not self.broker.heartbeat(job.job_id, self.worker_id, self.lease_seconds):
+                    return
+
+        heartbeat = threading.Thread(target=renew, name=f"lease-{job.job_id}", daemon=True)
+        heartbeat.start()
+        try:
+            result, files = self.handlers[job.kind](job)
+            artifacts = [Artifact(job.job_id, name, Path(path).read_bytes())
+                         for name, path in files.items()]
+        except Exception as e:
+            stop.set()
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = self.broker.fail(job.job_id, self.worker_id, job.error) or job.status
+            return job
+        stop.set()
+        if self.broker.complete(job.job_id, self.worker_id, result, artifacts):
+            job.status, job.result = COMPLETED, result
+        return job
+
+    def run(
+        self,
+        max_jobs: Optional[int] = None,
+        idle_timeout: float = 0.0,
+        poll_interval: float = 1.0
+    ) -> List[Job]:
+        """
+        Run jobs until the queue stays empty for idle_timeout seconds.
+
+        Returns:
+            The jobs this worker ran
+        """
+        ran: List[Job] = []
+        idle_since = time.monotonic()
+        while max_jobs is None or len(ran) < max_jobs:
+            job = self.run_one()
+            if job is not None:
+                ran.append(job)
+                idle_since = time.monotonic()
+                continue
+            if time.monotonic() - idle_since >= idle_timeout:
+                break
+            time.sleep(poll_interval)
+        return ran
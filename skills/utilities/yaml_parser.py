@@ -14,6 +14,8 @@ Usage:
 """
 
 import yaml
+
+from skills.utilities.atomic_write import atomic_write
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass, field
@@ -269,10 +271,7 @@ class YAMLParser:
             path = self.base_path / path
 
         try:
-            # Ensure parent directory exists
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(path, 'w', encoding='utf-8') as f:
+            with atomic_write(path) as f:
                 yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
 
             return True
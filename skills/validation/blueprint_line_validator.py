@@ -17,6 +17,8 @@ import sys
 import shutil
 from pathlib import Path
 
+from skills.utilities.atomic_write import atomic_write_text
+
 MAX_BODY_LINES = 8  # Per spec: maximum 8 non-empty lines in BODY section
 
 
@@ -130,8 +132,7 @@ def fix_blueprint(blueprint_path, dry_run=False):
     fixed_content = re.sub(slide_pattern, replace_body, content, flags=re.DOTALL)
 
     if not dry_run and fixes_made > 0:
-        with open(blueprint_path, 'w', encoding='utf-8') as f:
-            f.write(fixed_content)
+        atomic_write_text(blueprint_path, fixed_content)
 
     return fixes_made
 
@@ -10,13 +10,24 @@ Usage:
 
     validator = ConstraintValidator()
     result = validator.validate_slide(slide_content)
+
+    # Whole deck in columnar form: limits resolved once, violations as arrays
+    bulk = validator.validate_deck(DeckColumns.from_slides(slides))
+    bulk.invalid_slide_indices()
+    bulk.violations_for(3)      # ConstraintViolation objects, built on demand
 """
 
-import re
+from array import array
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 
+from skills.utilities.regex_registry import compile_pattern
+
+
+_MARKER_RE = compile_pattern(r'\[[^\]]+\]')
+
 
 @dataclass
 class ConstraintViolation:
@@ -50,6 +61,236 @@ class BatchValidationResult:
     summary: Dict = field(default_factory=dict)
 
 
+# =============================================================================
+# BULK (COLUMNAR) VALIDATION
+# =============================================================================
+
+# Code tables for the columnar violation arrays
+VIOLATION_FIELDS = (
+    'title', 'body', 'tip', 'presenter_notes',
+    'table_columns', 'table_rows', 'flowchart_steps', 'decision_tree_nodes',
+)
+VIOLATION_TYPES = ('line_limit', 'char_limit', 'word_limit', 'element_count')
+
+_FIELD_CODES = {name: code for code, name in enumerate(VIOLATION_FIELDS)}
+_TYPE_CODES = {name: code for code, name in enumerate(VIOLATION_TYPES)}
+
+_FIELD_LABELS = {'title': 'Title', 'body': 'Body', 'tip': 'Tip'}
+_ELEMENT_LABELS = {
+    'table_columns': ('Table', 'columns'),
+    'table_rows': ('Table', 'rows'),
+    'flowchart_steps': ('Flowchart', 'steps'),
+    'decision_tree_nodes': ('Decision tree', 'nodes'),
+}
+
+_EMPTY_TIPS = ('none', 'n/a', '')
+
+
+def _violation_message(field_name: str, constraint_type: str, actual: int,
+                       max_allowed: int, line_number: Optional[int]) -> str:
+    """Rebuild the message the per-field validators attach to a violation."""
+    if constraint_type == 'word_limit':
+        return f"Presenter notes has {actual} words (max {max_allowed})"
+    if constraint_type == 'element_count':
+        noun, unit = _ELEMENT_LABELS[field_name]
+        return f"{noun} has {actual} {unit} (max {max_allowed})"
+    label = _FIELD_LABELS[field_name]
+    if constraint_type == 'line_limit':
+        return f"{label} has {actual} lines (max {max_allowed})"
+    return f"{label} line {line_number} has {actual} chars (max {max_allowed})"
+
+
+@dataclass
+class DeckColumns:
+    """
+    A deck in columnar form: one list per field, index i is slide i.
+
+    visuals and slide_types are optional; visuals[i] is a
+    (visual_type, visual_data) pair or None.
+    """
+    slide_ids: List[str]
+    headers: List[str]
+    bodies: List[str]
+    tips: List[str]
+    notes: List[str]
+    visuals: Optional[List[Optional[Tuple[str, Dict]]]] = None
+    slide_types: Optional[List[str]] = None
+
+    def __post_init__(self):
+        size = len(self.slide_ids)
+        columns = [self.headers, self.bodies, self.tips, self.notes]
+        columns += [c for c in (self.visuals, self.slide_types) if c is not None]
+        if any(len(column) != size for column in columns):
+            raise ValueError("DeckColumns columns must all have one entry per slide")
+
+    def __len__(self) -> int:
+        return len(self.slide_ids)
+
+    @classmethod
+    def from_slides(cls, slides: Sequence[Dict]) -> 'DeckColumns':
+        """
+        Build columns from slide dictionaries (same keys as validate_slide).
+
+        Args:
+            slides: Slide dictionaries with title/header, body, tip, notes
+
+        Returns:
+            DeckColumns for the deck
+        """
+        slide_ids, headers, bodies, tips, notes, visuals, slide_types = [], [], [], [], [], [], []
+        for i, slide in enumerate(slides):
+            slide_ids.append(str(slide.get('number', slide.get('id', i + 1))))
+            headers.append(slide.get('title') or slide.get('header', ''))
+            bodies.append(slide.get('body', ''))
+            tips.append(slide.get('tip', ''))
+            notes.append(slide.get('notes') or slide.get('presenter_notes', ''))
+            if slide.get('visual_type') and slide.get('visual_data'):
+                visuals.append((slide['visual_type'], slide['visual_data']))
+            else:
+                visuals.append(None)
+            slide_types.append(slide.get('slide_type', 'content'))
+        return cls(slide_ids, headers, bodies, tips, notes, visuals, slide_types)
+
+
+@dataclass(frozen=True)
+class ResolvedLimits:
+    """Character/line/word limits looked up once per deck."""
+    title_chars: int
+    title_lines: int
+    body_chars: int
+    body_lines: int
+    tip_chars: int
+    tip_lines: int
+    notes_words: int
+
+
+@dataclass
+class BulkValidationResult:
+    """
+    Deck validation result stored as parallel arrays.
+
+    Row k of the violation arrays is one violation: the slide index, field and
+    constraint type codes (see VIOLATION_FIELDS / VIOLATION_TYPES), actual and
+    allowed values, and the 1-based line number (0 when not line-specific).
+    Rows are ordered by slide. ConstraintViolation / SlideValidationResult
+    objects are only built when asked for.
+    """
+    slide_ids: List[str]
+    limits: ResolvedLimits
+    slide_index: array = field(default_factory=lambda: array('i'))
+    field_code: array = field(default_factory=lambda: array('b'))
+    type_code: array = field(default_factory=lambda: array('b'))
+    actual: array = field(default_factory=lambda: array('i'))
+    max_allowed: array = field(default_factory=lambda: array('i'))
+    line_number: array = field(default_factory=lambda: array('i'))
+    # Per-slide stats columns (same values as SlideValidationResult.stats)
+    title_lines: array = field(default_factory=lambda: array('i'))
+    body_lines: array = field(default_factory=lambda: array('i'))
+    tip_lines: array = field(default_factory=lambda: array('i'))
+    notes_words: array = field(default_factory=lambda: array('i'))
+    _slide_results: Optional[List[SlideValidationResult]] = field(default=None, repr=False)
+
+    def add(self, slide: int, field_code: int, type_code: int,
+            actual: int, max_allowed: int, line_number: int = 0) -> None:
+        """Append one violation row."""
+        self.slide_index.append(slide)
+        self.field_code.append(field_code)
+        self.type_code.append(type_code)
+        self.actual.append(actual)
+        self.max_allowed.append(max_allowed)
+        self.line_number.append(line_number)
+
+    @property
+    def total_slides(self) -> int:
+        return len(self.slide_ids)
+
+    @property
+    def total_violations(self) -> int:
+        return len(self.slide_index)
+
+    def invalid_slide_indices(self) -> List[int]:
+        """Indices of slides with at least one violation, ascending."""
+        return sorted(set(self.slide_index))
+
+    @property
+    def valid_slides(self) -> int:
+        return self.total_slides - len(set(self.slide_index))
+
+    @property
+    def invalid_slides(self) -> int:
+        return len(set(self.slide_index))
+
+    def is_valid(self, slide: int) -> bool:
+        """True if slide index has no violations."""
+        return bisect_left(self.slide_index, slide) == bisect_right(self.slide_index, slide)
+
+    @property
+    def summary(self) -> Dict:
+        """Violation counts by field and by constraint type."""
+        by_field: Dict[str, int] = {}
+        by_type: Dict[str, int] = {}
+        for fcode, tcode in zip(self.field_code, self.type_code):
+            fname = VIOLATION_FIELDS[fcode]
+            tname = VIOLATION_TYPES[tcode]
+            by_field[fname] = by_field.get(fname, 0) + 1
+            by_type[tname] = by_type.get(tname, 0) + 1
+        return {'violations_by_field': by_field, 'violations_by_type': by_type}
+
+    def violation(self, row: int) -> ConstraintViolation:
+        """Materialize violation row as a ConstraintViolation."""
+        fname = VIOLATION_FIELDS[self.field_code[row]]
+        tname = VIOLATION_TYPES[self.type_code[row]]
+        line = self.line_number[row] or None
+        return ConstraintViolation(
+            field=fname,
+            constraint_type=tname,
+            actual_value=self.actual[row],
+            max_allowed=self.max_allowed[row],
+            line_number=line,
+            message=_violation_message(fname, tname, self.actual[row], self.max_allowed[row], line)
+        )
+
+    def violations_for(self, slide: int) -> List[ConstraintViolation]:
+        """Materialize the violations of one slide (by index)."""
+        start = bisect_left(self.slide_index, slide)
+        end = bisect_right(self.slide_index, slide)
+        return [self.violation(row) for row in range(start, end)]
+
+    def slide_result(self, slide: int) -> SlideValidationResult:
+        """Materialize one slide in the validate_slide() result form."""
+        violations = self.violations_for(slide)
+        return SlideValidationResult(
+            slide_id=self.slide_ids[slide],
+            is_valid=len(violations) == 0,
+            violations=violations,
+            warnings=[],
+            stats={
+                'title_lines': self.title_lines[slide],
+                'body_lines': self.body_lines[slide],
+                'tip_lines': self.tip_lines[slide],
+                'notes_words': self.notes_words[slide]
+            }
+        )
+
+    @property
+    def slide_results(self) -> List[SlideValidationResult]:
+        """All per-slide results, materialized on first access."""
+        if self._slide_results is None:
+            self._slide_results = [self.slide_result(i) for i in range(self.total_slides)]
+        return self._slide_results
+
+    def to_batch_result(self) -> BatchValidationResult:
+        """Materialize the validate_slides() result form."""
+        return BatchValidationResult(
+            total_slides=self.total_slides,
+            valid_slides=self.valid_slides,
+            invalid_slides=self.invalid_slides,
+            total_violations=self.total_violations,
+            slide_results=self.slide_results,
+            summary=self.summary
+        )
+
+
 class ConstraintValidator:
     """Validate content against character and line constraints."""
 
@@ -105,6 +346,28 @@ class ConstraintValidator:
         field_constraints = char_limits.get(field, {})
         return field_constraints.get(constraint_key)
 
+    def resolve_limits(self) -> ResolvedLimits:
+        """
+        Look up every text limit once (config value, else DEFAULT_CONSTRAINTS).
+
+        Returns:
+            ResolvedLimits used by validate_deck
+        """
+        char_limits = self.constraints.get('character_limits', {})
+
+        def limit(field_name: str, key: str) -> int:
+            return char_limits.get(field_name, {}).get(key, self.DEFAULT_CONSTRAINTS[field_name][key])
+
+        return ResolvedLimits(
+            title_chars=limit('title', 'chars_per_line'),
+            title_lines=limit('title', 'max_lines'),
+            body_chars=limit('body', 'chars_per_line'),
+            body_lines=limit('body', 'max_lines'),
+            tip_chars=limit('tip', 'chars_per_line'),
+            tip_lines=limit('tip', 'max_lines'),
+            notes_words=limit('presenter_notes', 'max_words')
+        )
+
     def count_lines(self, text: str) -> int:
         """Count non-empty lines in text."""
         if not text:
@@ -123,7 +386,7 @@ class ConstraintValidator:
         if not text:
             return 0
         # Remove markers
-        cleaned = re.sub(r'\[[^\]]+\]', '', text)
+        cleaned = _MARKER_RE.sub('', text)
         return len(cleaned.split())
 
     def validate_title(
@@ -451,45 +714,72 @@ class ConstraintValidator:
         Returns:
             BatchValidationResult
         """
-        results = []
-        valid_count = 0
-        total_violations = 0
+        return self.validate_deck(DeckColumns.from_slides(slides)).to_batch_result()
 
-        for i, slide in enumerate(slides):
-            slide_id = slide.get('number', slide.get('id', i + 1))
-            result = self.validate_slide(slide, str(slide_id))
-            results.append(result)
-
-            if result.is_valid:
-                valid_count += 1
-            total_violations += len(result.violations)
-
-        # Build summary
-        summary = {
-            'violations_by_field': {},
-            'violations_by_type': {}
-        }
+    def validate_deck(
+        self,
+        deck: Union[DeckColumns, List[Dict]]
+    ) -> BulkValidationResult:
+        """
+        Validate a whole deck in one pass over its columns.
 
-        for result in results:
-            for violation in result.violations:
-                # Count by field
-                field = violation.field
-                summary['violations_by_field'][field] = \
-                    summary['violations_by_field'].get(field, 0) + 1
+        Same checks as validate_slide, but limits are resolved once and each
+        violation is appended as a row of integer arrays instead of an object.
 
-                # Count by type
-                vtype = violation.constraint_type
-                summary['violations_by_type'][vtype] = \
-                    summary['violations_by_type'].get(vtype, 0) + 1
+        Args:
+            deck: DeckColumns (or slide dictionaries, converted once)
 
-        return BatchValidationResult(
-            total_slides=len(slides),
-            valid_slides=valid_count,
-            invalid_slides=len(slides) - valid_count,
-            total_violations=total_violations,
-            slide_results=results,
-            summary=summary
-        )
+        Returns:
+            BulkValidationResult
+        """
+        if not isinstance(deck, DeckColumns):
+            deck = DeckColumns.from_slides(deck)
+
+        limits = self.resolve_limits()
+        result = BulkValidationResult(slide_ids=list(deck.slide_ids), limits=limits)
+        add = result.add
+        line_limit = _TYPE_CODES['line_limit']
+        char_limit = _TYPE_CODES['char_limit']
+        word_limit = _TYPE_CODES['word_limit']
+
+        def scan(slide: int, text: str, fcode: int, max_chars: int, max_lines: int) -> None:
+            lines = text.split('\n')
+            line_count = sum(1 for line in lines if line.strip())
+            if line_count > max_lines:
+                add(slide, fcode, line_limit, line_count, max_lines)
+            for number, line in enumerate(lines, 1):
+                if len(line) > max_chars:
+                    add(slide, fcode, char_limit, len(line), max_chars, number)
+
+        for i in range(len(deck)):
+            title = deck.headers[i] or ''
+            body = deck.bodies[i] or ''
+            tip = deck.tips[i] or ''
+            notes = deck.notes[i] or ''
+
+            if title:
+                scan(i, title, _FIELD_CODES['title'], limits.title_chars, limits.title_lines)
+            if body:
+                scan(i, body, _FIELD_CODES['body'], limits.body_chars, limits.body_lines)
+            if tip.strip().lower() not in _EMPTY_TIPS:
+                scan(i, tip, _FIELD_CODES['tip'], limits.tip_chars, limits.tip_lines)
+
+            word_count = self.count_words(notes)
+            if word_count > limits.notes_words:
+                add(i, _FIELD_CODES['presenter_notes'], word_limit, word_count, limits.notes_words)
+
+            if deck.visuals is not None and deck.visuals[i]:
+                visual_type, visual_data = deck.visuals[i]
+                for v in self.validate_visual_content(visual_type, visual_data, deck.slide_ids[i]):
+                    add(i, _FIELD_CODES[v.field], _TYPE_CODES[v.constraint_type],
+                        v.actual_value, v.max_allowed, v.line_number or 0)
+
+            result.title_lines.append(self.count_lines(title))
+            result.body_lines.append(self.count_lines(body))
+            result.tip_lines.append(self.count_lines(tip))
+            result.notes_words.append(word_count)
+
+        return result
 
     def format_report(self, result: Union[SlideValidationResult, BatchValidationResult]) -> str:
         """Format validation result as report."""
@@ -22,13 +22,20 @@ NCLEX Tip Template Shape Mappings (Jan 2026):
 - TextBox 20: NCLEX TIP label (static)
 - TextBox 24: NCLEX tip content (dedicated shape)
 - TextBox 30: Footer
+
+Whole sections can be checked in columnar form with validate_section_bulk(),
+which keeps per-check outcomes as arrays and only builds SlideValidation
+objects for the slides a caller asks about.
 """
 
-from typing import Dict, List, Any, Optional
+from array import array
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 
+from skills.validation.constraint_validator import DeckColumns
+
 
 class ValidationStatus(Enum):
     PASS = "PASS"
@@ -108,6 +115,7 @@ TEMPLATE_POPULATION_CHECKLIST = {
         "name": "Body Text Complete",
         "description": "Body text should not contain truncation markers",
         "requirement": "R3",
+        "severity": "WARN"
         # No character limit - PowerPoint handles word wrapping
     },
 
@@ -142,7 +150,9 @@ TEMPLATE_POPULATION_CHECKLIST = {
         "name": "Presenter Notes Duration",
         "description": "Presenter notes must not exceed 180 seconds speaking time",
         "requirement": "R6",
-        "max_value": 180
+        "max_value": 180,
+        "words_per_minute": 135,
+        "severity": "WARN"
     },
 
     # Marker Requirements (R14)
@@ -200,6 +210,134 @@ TEMPLATE_POPULATION_CHECKLIST = {
 }
 
 
+# =============================================================================
+# RULES - limits and measurements shared by the per-slide checks and
+# validate_section_bulk()
+# =============================================================================
+
+HEADER_MAX_CHARS = TEMPLATE_POPULATION_CHECKLIST["R1.1"]["max_value"]
+HEADER_MAX_LINES = TEMPLATE_POPULATION_CHECKLIST["R1.2"]["max_value"]
+BODY_MAX_LINES = TEMPLATE_POPULATION_CHECKLIST["R2.1"]["max_value"]
+NCLEX_TIP_MAX_CHARS = TEMPLATE_POPULATION_CHECKLIST["R4.1"]["max_value"]
+NOTES_MIN_WORDS = TEMPLATE_POPULATION_CHECKLIST["R6.1"]["targets"]
+NOTES_DEFAULT_MIN_WORDS = NOTES_MIN_WORDS["content"]
+NOTES_MAX_WORDS = TEMPLATE_POPULATION_CHECKLIST["R6.2"]["max_value"]
+NOTES_MAX_SECONDS = TEMPLATE_POPULATION_CHECKLIST["R6.3"]["max_value"]
+NOTES_WORDS_PER_MINUTE = TEMPLATE_POPULATION_CHECKLIST["R6.3"]["words_per_minute"]
+PAUSE_MIN_MARKERS = TEMPLATE_POPULATION_CHECKLIST["R14.1"]["min_value"]
+EMPHASIS_MIN_MARKERS = TEMPLATE_POPULATION_CHECKLIST["R14.2"]["min_value"]
+EMPHASIS_SLIDE_TYPES = TEMPLATE_POPULATION_CHECKLIST["R14.2"]["applies_to"]
+BODY_REQUIRED_SLIDE_TYPES = TEMPLATE_POPULATION_CHECKLIST["C1.2"]["applies_to"]
+EXPECTED_TEMPLATE = TEMPLATE_POPULATION_CHECKLIST["T1.1"]["expected_value"]
+
+# Status of a failed check (WARN for advisory checks)
+CHECK_SEVERITY = {
+    check_id: ValidationStatus[spec.get("severity", "FAIL")]
+    for check_id, spec in TEMPLATE_POPULATION_CHECKLIST.items()
+}
+
+
+def _rule_header_chars(header: str) -> Tuple[Any, Any, bool]:
+    """(longest header line, limit, ok)."""
+    longest = max(len(line) for line in header.split('\n'))
+    return longest, HEADER_MAX_CHARS, longest <= HEADER_MAX_CHARS
+
+
+def _rule_header_lines(header: str) -> Tuple[Any, Any, bool]:
+    """(header lines, limit, ok)."""
+    line_count = len(header.split('\n'))
+    return line_count, HEADER_MAX_LINES, line_count <= HEADER_MAX_LINES
+
+
+def _rule_body_lines(body: str) -> Tuple[Any, Any, bool]:
+    """(non-blank body lines, limit, ok)."""
+    line_count = sum(1 for line in body.split('\n') if line.strip())
+    return line_count, BODY_MAX_LINES, line_count <= BODY_MAX_LINES
+
+
+def _rule_body_complete(body: str) -> Tuple[Any, Any, bool]:
+    """(truncation marker found, expected, ok)."""
+    truncated = "..." in body or "\u2026" in body  # ... or …
+    return truncated, False, not truncated
+
+
+def _rule_nclex_tip_chars(tip: str) -> Tuple[Any, Any, bool]:
+    """(tip characters, limit, ok)."""
+    return len(tip), NCLEX_TIP_MAX_CHARS, len(tip) <= NCLEX_TIP_MAX_CHARS
+
+
+def _rule_notes_min_words(word_count: int, slide_type: str) -> Tuple[Any, Any, bool]:
+    """(notes words, minimum for the slide type, ok)."""
+    min_words = NOTES_MIN_WORDS.get(slide_type, NOTES_DEFAULT_MIN_WORDS)
+    return word_count, min_words, word_count >= min_words
+
+
+def _rule_notes_max_words(word_count: int) -> Tuple[Any, Any, bool]:
+    """(notes words, limit, ok)."""
+    return word_count, NOTES_MAX_WORDS, word_count <= NOTES_MAX_WORDS
+
+
+def _rule_notes_duration(word_count: int) -> Tuple[Any, Any, bool]:
+    """(speaking seconds, limit, ok)."""
+    seconds = int((word_count / NOTES_WORDS_PER_MINUTE) * 60)
+    return seconds, NOTES_MAX_SECONDS, seconds <= NOTES_MAX_SECONDS
+
+
+def _rule_pause_markers(notes: str) -> Tuple[Any, Any, bool]:
+    """([PAUSE] markers, minimum, ok)."""
+    count = notes.count("[PAUSE]")
+    return count, PAUSE_MIN_MARKERS, count >= PAUSE_MIN_MARKERS
+
+
+def _rule_emphasis_markers(notes: str) -> Tuple[Any, Any, bool]:
+    """([EMPHASIS markers, minimum, ok)."""
+    count = notes.count("[EMPHASIS")
+    return count, EMPHASIS_MIN_MARKERS, count >= EMPHASIS_MIN_MARKERS
+
+
+def _rule_template(template_name: str) -> Tuple[Any, Any, bool]:
+    """(template name, expected template, ok)."""
+    return template_name, EXPECTED_TEMPLATE, "nclex_tip" in template_name.lower()
+
+
+def _rule_present(text: str) -> Tuple[Any, Any, bool]:
+    """(has text, expected, ok)."""
+    present = bool(text.strip())
+    return present, True, present
+
+
+def _slide_rules(
+    header: str,
+    body: str,
+    tip: str,
+    notes: str,
+    slide_type: str,
+    template_name: str
+) -> List[Tuple[str, Tuple[Any, Any, bool]]]:
+    """(check_id, (actual, expected, ok)) for each check that applies, in CHECK_IDS order."""
+    word_count = len(notes.split())
+    rules = [
+        ("R1.1", _rule_header_chars(header)),
+        ("R1.2", _rule_header_lines(header)),
+        ("R2.1", _rule_body_lines(body)),
+        ("R3.1", _rule_body_complete(body)),
+        ("R4.1", _rule_nclex_tip_chars(tip)),
+        ("R6.1", _rule_notes_min_words(word_count, slide_type)),
+        ("R6.2", _rule_notes_max_words(word_count)),
+        ("R6.3", _rule_notes_duration(word_count)),
+        ("R14.1", _rule_pause_markers(notes)),
+    ]
+    if slide_type in EMPHASIS_SLIDE_TYPES:
+        rules.append(("R14.2", _rule_emphasis_markers(notes)))
+    rules.append(("T1.1", _rule_template(template_name)))
+    rules.append(("C1.1", _rule_present(header)))
+    if slide_type in BODY_REQUIRED_SLIDE_TYPES:
+        rules.append(("C1.2", _rule_present(body)))
+    rules.append(("C1.3", _rule_present(tip)))
+    rules.append(("C1.4", _rule_present(notes)))
+    return rules
+
+
 # =============================================================================
 # VALIDATION FUNCTIONS
 # =============================================================================
@@ -248,7 +386,7 @@ def validate_slide(
 
     # R14: Marker validation
     validation.checks.append(_check_pause_markers(presenter_notes))
-    if slide_type in ['content', 'answer']:
+    if slide_type in EMPHASIS_SLIDE_TYPES:
         validation.checks.append(_check_emphasis_markers(presenter_notes))
 
     # Template validation
@@ -256,7 +394,7 @@ def validate_slide(
 
     # Content presence validation
     validation.checks.append(_check_header_present(header))
-    if slide_type in ['content', 'summary']:
+    if slide_type in BODY_REQUIRED_SLIDE_TYPES:
         validation.checks.append(_check_body_present(body))
     validation.checks.append(_check_nclex_tip_present(nclex_tip))
     validation.checks.append(_check_notes_present(presenter_notes))
@@ -278,20 +416,18 @@ def _check_header_chars(header: str) -> ChecklistItem:
     check = ChecklistItem(
         id="R1.1",
         name="Header Character Limit",
-        description="Header text must not exceed 36 characters per line",
+        description=f"Header text must not exceed {HEADER_MAX_CHARS} characters per line",
         requirement="R1"
     )
-    lines = header.split('\n')
-    max_line_length = max(len(line) for line in lines) if lines else 0
+    max_line_length, check.expected_value, ok = _rule_header_chars(header)
     check.actual_value = max_line_length
-    check.expected_value = 36
 
-    if max_line_length <= 36:
+    if ok:
         check.status = ValidationStatus.PASS
         check.message = f"Header line length OK ({max_line_length} chars)"
     else:
-        check.status = ValidationStatus.FAIL
-        check.message = f"Header line too long ({max_line_length} > 36 chars)"
+        check.status = CHECK_SEVERITY[check.id]
+        check.message = f"Header line too long ({max_line_length} > {HEADER_MAX_CHARS} chars)"
 
     return check
 
@@ -304,15 +440,14 @@ def _check_header_lines(header: str) -> ChecklistItem:
         description="Header must be a single line only",
         requirement="R1"
     )
-    line_count = len(header.split('\n'))
+    line_count, check.expected_value, ok = _rule_header_lines(header)
     check.actual_value = line_count
-    check.expected_value = 1
 
-    if line_count == 1:
+    if ok:
         check.status = ValidationStatus.PASS
         check.message = "Header is single line (OK)"
     else:
-        check.status = ValidationStatus.FAIL
+        check.status = CHECK_SEVERITY[check.id]
         check.message = f"Header must be single line ({line_count} lines found)"
 
     return check
@@ -323,20 +458,18 @@ def _check_body_lines(body: str) -> ChecklistItem:
     check = ChecklistItem(
         id="R2.1",
         name="Body Line Limit",
-        description="Body text must not exceed 12 lines",
+        description=f"Body text must not exceed {BODY_MAX_LINES} lines",
         requirement="R2"
     )
-    lines = [l for l in body.split('\n') if l.strip()]
-    line_count = len(lines)
+    line_count, check.expected_value, ok = _rule_body_lines(body)
     check.actual_value = line_count
-    check.expected_value = 12
 
-    if line_count <= 12:
+    if ok:
         check.status = ValidationStatus.PASS
         check.message = f"Body line count OK ({line_count} lines)"
     else:
-        check.status = ValidationStatus.FAIL
-        check.message = f"Body has too many lines ({line_count} > 12)"
+        check.status = CHECK_SEVERITY[check.id]
+        check.message = f"Body has too many lines ({line_count} > {BODY_MAX_LINES})"
 
     return check
 
@@ -355,15 +488,15 @@ def _check_body_chars(body: str) -> ChecklistItem:
     )
 
     # Check for truncation markers
-    has_ellipsis = "..." in body or "\u2026" in body  # ... or …
-    check.actual_value = "No truncation" if not has_ellipsis else "Truncation detected"
+    _, _, ok = _rule_body_complete(body)
+    check.actual_value = "No truncation" if ok else "Truncation detected"
     check.expected_value = "No truncation"
 
-    if not has_ellipsis:
+    if ok:
         check.status = ValidationStatus.PASS
         check.message = "Body text is complete (no truncation markers)"
     else:
-        check.status = ValidationStatus.WARN
+        check.status = CHECK_SEVERITY[check.id]
         check.message = "Body may contain truncated content (ellipsis found)"
 
     return check
@@ -374,19 +507,18 @@ def _check_nclex_tip_chars(tip: str) -> ChecklistItem:
     check = ChecklistItem(
         id="R4.1",
         name="NCLEX Tip Character Limit",
-        description="NCLEX tip must not exceed 132 characters",
+        description=f"NCLEX tip must not exceed {NCLEX_TIP_MAX_CHARS} characters",
         requirement="R4"
     )
-    char_count = len(tip)
+    char_count, check.expected_value, ok = _rule_nclex_tip_chars(tip)
     check.actual_value = char_count
-    check.expected_value = 132
 
-    if char_count <= 132:
+    if ok:
         check.status = ValidationStatus.PASS
         check.message = f"NCLEX tip length OK ({char_count} chars)"
     else:
-        check.status = ValidationStatus.FAIL
-        check.message = f"NCLEX tip too long ({char_count} > 132 chars)"
+        check.status = CHECK_SEVERITY[check.id]
+        check.message = f"NCLEX tip too long ({char_count} > {NCLEX_TIP_MAX_CHARS} chars)"
 
     return check
 
@@ -399,23 +531,15 @@ def _check_notes_min_words(notes: str, slide_type: str) -> ChecklistItem:
         description="Presenter notes must meet minimum word count",
         requirement="R6"
     )
-    word_count = len(notes.split())
-    minimums = {
-        "title": 200,
-        "content": 250,
-        "summary": 250,
-        "vignette": 150,
-        "answer": 250
-    }
-    min_words = minimums.get(slide_type, 250)
+    word_count, min_words, ok = _rule_notes_min_words(len(notes.split()), slide_type)
     check.actual_value = word_count
     check.expected_value = min_words
 
-    if word_count >= min_words:
+    if ok:
         check.status = ValidationStatus.PASS
         check.message = f"Word count OK ({word_count} >= {min_words})"
     else:
-        check.status = ValidationStatus.FAIL
+        check.status = CHECK_SEVERITY[check.id]
         check.message = f"Word count too low ({word_count} < {min_words})"
 
     return check
@@ -426,19 +550,18 @@ def _check_notes_max_words(notes: str) -> ChecklistItem:
     check = ChecklistItem(
         id="R6.2",
         name="Presenter Notes Maximum Words",
-        description="Presenter notes must not exceed 450 words",
+        description=f"Presenter notes must not exceed {NOTES_MAX_WORDS} words",
         requirement="R6"
     )
-    word_count = len(notes.split())
+    word_count, check.expected_value, ok = _rule_notes_max_words(len(notes.split()))
     check.actual_value = word_count
-    check.expected_value = 450
 
-    if word_count <= 450:
+    if ok:
         check.status = ValidationStatus.PASS
-        check.message = f"Word count OK ({word_count} <= 450)"
+        check.message = f"Word count OK ({word_count} <= {NOTES_MAX_WORDS})"
     else:
-        check.status = ValidationStatus.FAIL
-        check.message = f"Word count too high ({word_count} > 450)"
+        check.status = CHECK_SEVERITY[check.id]
+        check.message = f"Word count too high ({word_count} > {NOTES_MAX_WORDS})"
 
     return check
 
@@ -448,20 +571,18 @@ def _check_notes_duration(notes: str) -> ChecklistItem:
     check = ChecklistItem(
         id="R6.3",
         name="Presenter Notes Duration",
-        description="Presenter notes must not exceed 180 seconds",
+        description=f"Presenter notes must not exceed {NOTES_MAX_SECONDS} seconds",
         requirement="R6"
     )
-    word_count = len(notes.split())
-    duration_seconds = int((word_count / 135) * 60)  # ~135 WPM
+    duration_seconds, check.expected_value, ok = _rule_notes_duration(len(notes.split()))
     check.actual_value = duration_seconds
-    check.expected_value = 180
 
-    if duration_seconds <= 180:
+    if ok:
         check.status = ValidationStatus.PASS
-        check.message = f"Duration OK ({duration_seconds}s <= 180s)"
+        check.message = f"Duration OK ({duration_seconds}s <= {NOTES_MAX_SECONDS}s)"
     else:
-        check.status = ValidationStatus.WARN
-        check.message = f"Duration may be long ({duration_seconds}s > 180s)"
+        check.status = CHECK_SEVERITY[check.id]
+        check.message = f"Duration may be long ({duration_seconds}s > {NOTES_MAX_SECONDS}s)"
 
     return check
 
@@ -471,19 +592,18 @@ def _check_pause_markers(notes: str) -> ChecklistItem:
     check = ChecklistItem(
         id="R14.1",
         name="PAUSE Marker Minimum",
-        description="Must contain at least 2 [PAUSE] markers",
+        description=f"Must contain at least {PAUSE_MIN_MARKERS} [PAUSE] markers",
         requirement="R14"
     )
-    pause_count = notes.count("[PAUSE]")
+    pause_count, check.expected_value, ok = _rule_pause_markers(notes)
     check.actual_value = pause_count
-    check.expected_value = 2
 
-    if pause_count >= 2:
+    if ok:
         check.status = ValidationStatus.PASS
-        check.message = f"PAUSE markers OK ({pause_count} >= 2)"
+        check.message = f"PAUSE markers OK ({pause_count} >= {PAUSE_MIN_MARKERS})"
     else:
-        check.status = ValidationStatus.FAIL
-        check.message = f"Insufficient PAUSE markers ({pause_count} < 2)"
+        check.status = CHECK_SEVERITY[check.id]
+        check.message = f"Insufficient PAUSE markers ({pause_count} < {PAUSE_MIN_MARKERS})"
 
     return check
 
@@ -493,19 +613,18 @@ def _check_emphasis_markers(notes: str) -> ChecklistItem:
     check = ChecklistItem(
         id="R14.2",
         name="EMPHASIS Marker Minimum",
-        description="Content slides must have at least 1 [EMPHASIS] marker",
+        description=f"Content slides must have at least {EMPHASIS_MIN_MARKERS} [EMPHASIS] marker",
         requirement="R14"
     )
-    emphasis_count = notes.count("[EMPHASIS")
+    emphasis_count, check.expected_value, ok = _rule_emphasis_markers(notes)
     check.actual_value = emphasis_count
-    check.expected_value = 1
 
-    if emphasis_count >= 1:
+    if ok:
         check.status = ValidationStatus.PASS
-        check.message = f"EMPHASIS markers OK ({emphasis_count} >= 1)"
+        check.message = f"EMPHASIS markers OK ({emphasis_count} >= {EMPHASIS_MIN_MARKERS})"
     else:
-        check.status = ValidationStatus.FAIL
-        check.message = f"Missing EMPHASIS marker ({emphasis_count} < 1)"
+        check.status = CHECK_SEVERITY[check.id]
+        check.message = f"Missing EMPHASIS marker ({emphasis_count} < {EMPHASIS_MIN_MARKERS})"
 
     return check
 
@@ -518,19 +637,32 @@ def _check_template_used(template_name: str) -> ChecklistItem:
         description="Slide must use NCLEX tip template",
         requirement="Template"
     )
-    check.actual_value = template_name
-    check.expected_value = "template_nclex_tip.pptx"
+    check.actual_value, check.expected_value, ok = _rule_template(template_name)
 
-    if "nclex_tip" in template_name.lower():
+    if ok:
         check.status = ValidationStatus.PASS
         check.message = "NCLEX tip template in use"
     else:
-        check.status = ValidationStatus.FAIL
+        check.status = CHECK_SEVERITY[check.id]
         check.message = f"Wrong template: {template_name}"
 
     return check
 
 
+def _check_present(check: ChecklistItem, text: str, label: str, missing: str) -> ChecklistItem:
+    """Fill a presence check for text."""
+    check.actual_value, check.expected_value, ok = _rule_present(text)
+
+    if ok:
+        check.status = ValidationStatus.PASS
+        check.message = f"{label} present"
+    else:
+        check.status = CHECK_SEVERITY[check.id]
+        check.message = f"{label} {missing}"
+
+    return check
+
+
 def _check_header_present(header: str) -> ChecklistItem:
     """Check that header is present."""
     check = ChecklistItem(
@@ -539,17 +671,7 @@ def _check_header_present(header: str) -> ChecklistItem:
         description="Slide must have header text",
         requirement="Content"
     )
-    check.actual_value = bool(header.strip())
-    check.expected_value = True
-
-    if header.strip():
-        check.status = ValidationStatus.PASS
-        check.message = "Header present"
-    else:
-        check.status = ValidationStatus.FAIL
-        check.message = "Header missing"
-
-    return check
+    return _check_present(check, header, "Header", "missing")
 
 
 def _check_body_present(body: str) -> ChecklistItem:
@@ -560,17 +682,7 @@ def _check_body_present(body: str) -> ChecklistItem:
         description="Content slides must have body text",
         requirement="Content"
     )
-    check.actual_value = bool(body.strip())
-    check.expected_value = True
-
-    if body.strip():
-        check.status = ValidationStatus.PASS
-        check.message = "Body present"
-    else:
-        check.status = ValidationStatus.FAIL
-        check.message = "Body missing"
-
-    return check
+    return _check_present(check, body, "Body", "missing")
 
 
 def _check_nclex_tip_present(tip: str) -> ChecklistItem:
@@ -581,17 +693,7 @@ def _check_nclex_tip_present(tip: str) -> ChecklistItem:
         description="Slide should have NCLEX tip",
         requirement="Content"
     )
-    check.actual_value = bool(tip.strip())
-    check.expected_value = True
-
-    if tip.strip():
-        check.status = ValidationStatus.PASS
-        check.message = "NCLEX tip present"
-    else:
-        check.status = ValidationStatus.WARN
-        check.message = "NCLEX tip missing (recommended)"
-
-    return check
+    return _check_present(check, tip, "NCLEX tip", "missing (recommended)")
 
 
 def _check_notes_present(notes: str) -> ChecklistItem:
@@ -602,17 +704,7 @@ def _check_notes_present(notes: str) -> ChecklistItem:
         description="Slide must have presenter notes",
         requirement="Content"
     )
-    check.actual_value = bool(notes.strip())
-    check.expected_value = True
-
-    if notes.strip():
-        check.status = ValidationStatus.PASS
-        check.message = "Presenter notes present"
-    else:
-        check.status = ValidationStatus.FAIL
-        check.message = "Presenter notes missing"
-
-    return check
+    return _check_present(check, notes, "Presenter notes", "missing")
 
 
 # =============================================================================
@@ -667,6 +759,165 @@ def validate_section(
     return report
 
 
+# =============================================================================
+# BULK SECTION VALIDATION
+# =============================================================================
+
+# Check ids in validate_slide() order; rows of BulkSectionValidation refer to
+# them by index
+CHECK_IDS = (
+    "R1.1", "R1.2", "R2.1", "R3.1", "R4.1", "R6.1", "R6.2", "R6.3",
+    "R14.1", "R14.2", "T1.1", "C1.1", "C1.2", "C1.3", "C1.4",
+)
+_CHECK_CODES = {check_id: code for code, check_id in enumerate(CHECK_IDS)}
+_STATUS_CODES = (ValidationStatus.FAIL, ValidationStatus.WARN)
+
+
+@dataclass
+class BulkSectionValidation:
+    """
+    validate_section() result as parallel arrays.
+
+    passed/failed/warnings hold per-slide counts. Each non-passing check is
+    one row of (slide_index, check_code, status_code), where check_code
+    indexes CHECK_IDS and status_code indexes (FAIL, WARN).
+    """
+    section_name: str
+    template_used: str
+    deck: DeckColumns
+    slide_numbers: List[Any]
+    passed: array = field(default_factory=lambda: array('i'))
+    failed: array = field(default_factory=lambda: array('i'))
+    warnings: array = field(default_factory=lambda: array('i'))
+    slide_index: array = field(default_factory=lambda: array('i'))
+    check_code: array = field(default_factory=lambda: array('b'))
+    status_code: array = field(default_factory=lambda: array('b'))
+    summary: Dict[str, Any] = field(default_factory=dict)
+
+    def issues(self) -> List[Dict[str, Any]]:
+        """Non-passing checks as small dicts (no ChecklistItem objects)."""
+        return [
+            {
+                "slide_number": self.slide_numbers[slide],
+                "check_id": CHECK_IDS[check],
+                "status": _STATUS_CODES[status].value
+            }
+            for slide, check, status in zip(self.slide_index, self.check_code, self.status_code)
+        ]
+
+    def slide_validation(self, index: int) -> SlideValidation:
+        """Materialize one slide as validate_slide() would return it."""
+        slide = {
+            'slide_number': self.slide_numbers[index],
+            'header': self.deck.headers[index],
+            'body': self.deck.bodies[index],
+            'nclex_tip': self.deck.tips[index],
+            'presenter_notes': self.deck.notes[index],
+        }
+        slide_type = self.deck.slide_types[index] if self.deck.slide_types else 'content'
+        return validate_slide(slide, slide_type, self.template_used)
+
+    def to_report(self) -> ValidationReport:
+        """Materialize the full validate_section() report."""
+        return ValidationReport(
+            section_name=self.section_name,
+            template_used=self.template_used,
+            slides=[self.slide_validation(i) for i in range(len(self.deck))],
+            summary=dict(self.summary)
+        )
+
+
+def section_columns(slides: List[Dict[str, Any]]) -> DeckColumns:
+    """Build DeckColumns from template-population slide dictionaries."""
+    return DeckColumns(
+        slide_ids=[str(slide.get('slide_number', 0)) for slide in slides],
+        headers=[slide.get('header', '') for slide in slides],
+        bodies=[slide.get('body', '') for slide in slides],
+        tips=[slide.get('nclex_tip', '') for slide in slides],
+        notes=[slide.get('presenter_notes', '') for slide in slides],
+        slide_types=[slide.get('slide_type', 'content') for slide in slides]
+    )
+
+
+def validate_section_bulk(
+    slides: Union[DeckColumns, List[Dict[str, Any]]],
+    section_name: str,
+    template_name: str = "template_nclex_tip.pptx"
+) -> BulkSectionValidation:
+    """
+    Validate all slides in a section without per-check objects.
+
+    Runs the same checks as validate_slide() and produces the same summary
+    as validate_section().
+
+    Args:
+        slides: Slide dictionaries, or DeckColumns (slide_ids used as numbers)
+        section_name: Name of the section
+        template_name: Template being used
+
+    Returns:
+        BulkSectionValidation
+    """
+    if isinstance(slides, DeckColumns):
+        deck = slides
+        slide_numbers = [int(sid) if sid.isdigit() else sid for sid in deck.slide_ids]
+    else:
+        deck = section_columns(slides)
+        slide_numbers = [slide.get('slide_number', 0) for slide in slides]
+
+    result = BulkSectionValidation(
+        section_name=section_name,
+        template_used=template_name,
+        deck=deck,
+        slide_numbers=slide_numbers
+    )
+    fail = _STATUS_CODES.index(ValidationStatus.FAIL)
+    status_codes = {
+        check_id: _STATUS_CODES.index(severity) for check_id, severity in CHECK_SEVERITY.items()
+    }
+
+    for i in range(len(deck)):
+        slide_type = (deck.slide_types[i] if deck.slide_types else 'content').lower()
+        rules = _slide_rules(
+            deck.headers[i], deck.bodies[i], deck.tips[i], deck.notes[i],
+            slide_type, template_name
+        )
+
+        passed = failed = warned = 0
+        for check_id, (_, _, ok) in rules:
+            if ok:
+                passed += 1
+                continue
+            status = status_codes[check_id]
+            result.slide_index.append(i)
+            result.check_code.append(_CHECK_CODES[check_id])
+            result.status_code.append(status)
+            if status == fail:
+                failed += 1
+            else:
+                warned += 1
+
+        result.passed.append(passed)
+        result.failed.append(failed)
+        result.warnings.append(warned)
+
+    total_passed = sum(result.passed)
+    total_failed = sum(result.failed)
+    total_warnings = sum(result.warnings)
+    total_checks = total_passed + total_failed + total_warnings
+    result.summary = {
+        "total_slides": len(deck),
+        "total_checks": total_checks,
+        "passed": total_passed,
+        "failed": total_failed,
+        "warnings": total_warnings,
+        "pass_rate": round(total_passed / total_checks * 100, 1) if total_checks > 0 else 0,
+        "status": "PASS" if total_failed == 0 else "FAIL"
+    }
+
+    return result
+
+
 def generate_checklist_report(report: ValidationReport) -> str:
     """
     Generate a human-readable checklist report.
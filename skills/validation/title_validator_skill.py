@@ -13,8 +13,9 @@ Constraints:
 Created: 2026-01-06
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from array import array
+from typing import Dict, List, Any, Optional, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -222,6 +223,82 @@ def validate_title(
     }
 
 
+@dataclass
+class TitleBulkResult:
+    """
+    Title checks for a whole deck as parallel arrays.
+
+    Only the counts needed to decide validity are computed per title;
+    details(i) builds the full validate_title() result on demand.
+    """
+    titles: List[Optional[str]]
+    slide_numbers: Optional[List[Any]] = None
+    slide_types: Optional[List[Any]] = None
+    line_count: array = field(default_factory=lambda: array('i'))
+    max_line_chars: array = field(default_factory=lambda: array('i'))
+    total_chars: array = field(default_factory=lambda: array('i'))
+    invalid_indices: List[int] = field(default_factory=list)
+
+    @property
+    def valid_count(self) -> int:
+        return len(self.titles) - len(self.invalid_indices)
+
+    def details(self, index: int) -> Dict[str, Any]:
+        """Full validate_title() result for one title."""
+        return validate_title(
+            title=self.titles[index],
+            slide_number=self.slide_numbers[index] if self.slide_numbers else None,
+            slide_type=self.slide_types[index] if self.slide_types else None
+        )
+
+
+def validate_titles_bulk(
+    titles: Sequence[Optional[str]],
+    slide_numbers: Optional[Sequence[Any]] = None,
+    slide_types: Optional[Sequence[Any]] = None
+) -> TitleBulkResult:
+    """
+    Validate a column of titles without building per-title results.
+
+    Validity matches validate_title(): empty titles, lines over
+    MAX_CHARS_PER_LINE, more than MAX_LINES lines and truncation markers are
+    errors; the total-length warning does not affect validity.
+
+    Args:
+        titles: One title per slide
+        slide_numbers: Optional slide references (used by details())
+        slide_types: Optional slide types (used by details())
+
+    Returns:
+        TitleBulkResult
+    """
+    result = TitleBulkResult(
+        titles=list(titles),
+        slide_numbers=list(slide_numbers) if slide_numbers is not None else None,
+        slide_types=list(slide_types) if slide_types is not None else None
+    )
+
+    for index, title in enumerate(result.titles):
+        if not title:
+            result.line_count.append(0)
+            result.max_line_chars.append(0)
+            result.total_chars.append(0)
+            result.invalid_indices.append(index)
+            continue
+
+        lengths = [len(line) for line in title.split('\n')]
+        longest = max(lengths)
+        result.line_count.append(len(lengths))
+        result.max_line_chars.append(longest)
+        result.total_chars.append(sum(lengths))
+
+        if (longest > MAX_CHARS_PER_LINE or len(lengths) > MAX_LINES
+                or "..." in title or "…" in title):
+            result.invalid_indices.append(index)
+
+    return result
+
+
 def validate_blueprint_titles(blueprint: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate all slide titles in a blueprint.
@@ -238,33 +315,30 @@ def validate_blueprint_titles(blueprint: Dict[str, Any]) -> Dict[str, Any]:
             "valid": False
         }
 
+    slides = blueprint['slides']
+    bulk = validate_titles_bulk(
+        [slide.get('header', '') for slide in slides],
+        slide_numbers=[slide.get('slide_number') for slide in slides],
+        slide_types=[slide.get('slide_type') for slide in slides]
+    )
+
     results = {
-        "total_slides": len(blueprint['slides']),
-        "valid_count": 0,
-        "invalid_count": 0,
+        "total_slides": len(slides),
+        "valid_count": bulk.valid_count,
+        "invalid_count": len(bulk.invalid_indices),
         "violations": [],
-        "all_valid": True
+        "all_valid": not bulk.invalid_indices
     }
 
-    for slide in blueprint['slides']:
-        title = slide.get('header', '')
-        validation = validate_title(
-            title=title,
-            slide_number=slide.get('slide_number'),
-            slide_type=slide.get('slide_type')
-        )
-
-        if validation['valid']:
-            results['valid_count'] += 1
-        else:
-            results['invalid_count'] += 1
-            results['all_valid'] = False
-            results['violations'].append({
-                "slide_number": slide.get('slide_number'),
-                "title": title,
-                "issues": validation['violations'],
-                "hints": validation['revision_hints']
-            })
+    # Full results (violations + hints) only for the titles that failed
+    for index in bulk.invalid_indices:
+        validation = bulk.details(index)
+        results['violations'].append({
+            "slide_number": bulk.slide_numbers[index],
+            "title": bulk.titles[index],
+            "issues": validation['violations'],
+            "hints": validation['revision_hints']
+        })
 
     results['pass_rate'] = (
         results['valid_count'] / results['total_slides'] * 100
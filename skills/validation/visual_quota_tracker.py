@@ -4,11 +4,12 @@ Tracks and validates visual aid quota compliance.
 
 Usage:
     from skills.validation.visual_quota_tracker import (
-        VisualQuotaTracker, check_quota, get_quota_requirements
+        VisualQuotaTracker, check_quota, get_quota_requirements,
+        get_selection_bounds
     )
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -65,6 +66,10 @@ class VisualQuotaTracker:
         """Get quota requirements for this section's slide count."""
         return get_quota_requirements(self.total_slides)
 
+    def get_selection_bounds(self) -> Tuple[int, int]:
+        """Get (minimum, maximum) visuals a selection may use."""
+        return get_selection_bounds(self.total_slides)
+
     def check_status(self) -> QuotaStatus:
         """Check current quota status."""
         return check_quota(self.total_slides, self.visual_count)
@@ -128,6 +133,34 @@ def get_quota_requirements(slide_count: int) -> Dict[str, int]:
         return {'minimum': 5, 'target_min': 8, 'target_max': 10, 'maximum': 15}
 
 
+def get_selection_bounds(
+    slide_count: int,
+    min_visuals: Optional[int] = None,
+    max_visuals: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Get the (minimum, maximum) visual count a selection should aim for.
+
+    The maximum is the quota maximum capped at MAX_VISUAL_PERCENTAGE of the
+    slides; the minimum never exceeds the maximum.
+
+    Args:
+        slide_count: Total number of slides
+        min_visuals: Override the quota minimum
+        max_visuals: Override the maximum
+
+    Returns:
+        Tuple of (minimum, maximum)
+    """
+    quota = get_quota_requirements(slide_count)
+    minimum = quota['minimum'] if min_visuals is None else min_visuals
+    if max_visuals is None:
+        maximum = min(quota['maximum'], int(slide_count * MAX_VISUAL_PERCENTAGE))
+    else:
+        maximum = max_visuals
+    return min(minimum, maximum), maximum
+
+
 def check_quota(slide_count: int, visual_count: int) -> QuotaStatus:
     """
     Check if visual count meets quota for slide count.
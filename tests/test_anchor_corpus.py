@@ -0,0 +1,154 @@
+"""
+Unit tests for the shared anchor preprocessing pass.
+
+Tests cover:
+- Keyword hits match `keyword in text` / `keyword in title` for registered
+  and unregistered vocabularies
+- Vocabularies registered after an anchor was scanned
+- Analyzers give the same results with and without a shared corpus
+- The compiled domain keyword index against the per-domain keyword loop
+"""
+
+import dataclasses
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import skills.generation.anchor_corpus as corpus_module
+from skills.generation.anchor_corpus import AnchorCorpus, prepare_anchor, register_vocabulary
+from skills.generation.dependency_mapper import DependencyMapper
+from skills.generation.domain_classifier import DomainClassifier, DomainKeywordIndex
+from skills.generation.outline_builder import OutlineBuilder
+from skills.generation.priority_ranker import PriorityRanker
+
+
+VOCABULARY = [
+    'mi', 'iv', 'assessment', 'vital signs', 'half-life', 'self-harm',
+    'c-section', 'signs', 'cardiac arrest', '-', 'x ray',
+]
+
+
+def _anchors(count=60, seed=11):
+    rng = random.Random(seed)
+    words = VOCABULARY + ['administration', 'Cardiac', 'arrest', 'Half', 'life', 'x', 'ray', 'care']
+    return [
+        {
+            'id': f'a{i}',
+            'title': ' '.join(rng.choice(words) for _ in range(rng.randint(0, 4))).title(),
+            'full_text': ' '.join(rng.choice(words) for _ in range(rng.randint(0, 20))),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Isolated vocabulary registry for the test."""
+    monkeypatch.setattr(corpus_module, '_vocabularies', {})
+    monkeypatch.setattr(corpus_module, '_combined', None)
+    return corpus_module._vocabularies
+
+
+@pytest.mark.parametrize("registered", [True, False])
+def test_hits_match_substring_semantics(registry, registered):
+    if registered:
+        register_vocabulary('test.vocab', VOCABULARY)
+
+    for prepared in AnchorCorpus.from_anchors(_anchors()):
+        assert prepared.matched('test.vocab', VOCABULARY) == \
+            {kw for kw in VOCABULARY if kw in prepared.text}
+        assert prepared.matched('test.vocab', VOCABULARY, 'title') == \
+            {kw for kw in VOCABULARY if kw in prepared.title}
+        assert prepared.matched_in_order('test.vocab', VOCABULARY) == \
+            [kw for kw in VOCABULARY if kw in prepared.text]
+
+
+def test_vocabulary_registered_after_scan(registry):
+    register_vocabulary('test.first', ['assessment'])
+    prepared = prepare_anchor({'title': 'Vital Signs', 'full_text': 'assessment of care'})
+
+    assert prepared.matched('test.first', ['assessment']) == {'assessment'}
+    register_vocabulary('test.later', ['vital signs', 'care'])
+    assert prepared.matched('test.later', ['vital signs', 'care']) == {'vital signs', 'care'}
+    assert prepared.matched('test.later', ['vital signs', 'care'], 'title') == {'vital signs'}
+
+
+def test_tokens_are_interned():
+    corpus = AnchorCorpus.from_anchors([
+        {'title': 'Wound Care', 'full_text': 'care plan'},
+        {'title': 'Care Basics', 'full_text': ''},
+    ])
+    first = [w for w in corpus[0].words if w == 'care']
+    second = [w for w in corpus[1].words if w == 'care']
+    assert first[0] is first[1] is second[0]
+    assert corpus[0].title_words == ('wound', 'care')
+    assert corpus[1].content_word_count == 0
+
+
+def test_corpus_must_cover_anchors():
+    anchors = _anchors(5)
+    with pytest.raises(ValueError):
+        AnchorCorpus.ensure(anchors, AnchorCorpus.from_anchors(anchors[:3]))
+
+
+def test_analyzers_accept_shared_corpus():
+    anchors = _anchors(80, seed=5)
+    corpus = AnchorCorpus.from_anchors(anchors)
+
+    def plain(result):
+        data = dataclasses.asdict(result)
+        data.pop('outline_id', None)
+        data.get('metadata', {}).pop('created', None)
+        return data
+
+    assert plain(DomainClassifier().classify_anchors(anchors, corpus=corpus)) == \
+        plain(DomainClassifier().classify_anchors(anchors))
+    assert plain(DependencyMapper().map_dependencies(anchors, corpus=corpus)) == \
+        plain(DependencyMapper().map_dependencies(anchors))
+    assert plain(OutlineBuilder().build_outline(anchors, corpus=corpus)) == \
+        plain(OutlineBuilder().build_outline(anchors))
+
+    with_corpus = PriorityRanker().rank_anchors(anchors, corpus=corpus)
+    without = PriorityRanker().rank_anchors(anchors)
+    assert [(r.anchor_id, r.priority_score, r.client_needs_category) for r in with_corpus.rankings] == \
+        [(r.anchor_id, r.priority_score, r.client_needs_category) for r in without.rankings]
+
+
+def test_domain_index_matches_keyword_loop(registry):
+    domains = {
+        'first': {'keywords': ['signs', 'vital signs', 'iv', 'signs']},
+        'second': {'keywords': ['iv', 'half-life', 'care']},
+    }
+    index = DomainKeywordIndex(domains, 'test.domains')
+
+    for prepared in AnchorCorpus.from_anchors(_anchors()):
+        expected = {}
+        for key, info in domains.items():
+            expected[key] = []
+            for keyword in info['keywords']:
+                if keyword in prepared.text:
+                    expected[key].append(keyword)
+                    if keyword in prepared.title:
+                        expected[key].append(keyword)
+        assert index.domain_matches(prepared) == expected
+
+
+def test_classify_anchors_shares_scoring():
+    anchors = [
+        {'id': 'a1', 'title': 'Insulin Dosage', 'full_text': 'diabetes medication'},
+        {'id': 'a2', 'title': 'Insulin Dosage', 'full_text': 'diabetes medication'},
+        {'id': 'a3', 'title': 'Untitled', 'full_text': ''},
+    ]
+    result = DomainClassifier().classify_anchors(anchors)
+    first, second, empty = result.classifications
+
+    assert (first.anchor_id, second.anchor_id) == ('a1', 'a2')
+    assert first.primary_domain == 'pharmacology'
+    assert first.matched_keywords == second.matched_keywords
+    assert first.matched_keywords is not second.matched_keywords
+    assert empty.primary_domain == 'fundamentals' and empty.confidence == 0.3
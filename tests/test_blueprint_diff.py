@@ -0,0 +1,106 @@
+"""
+Unit tests for blueprint versions and per-slide diffs.
+
+Tests cover:
+- Records shared between versions; only changed slides re-frozen
+- Added / removed / modified diffs and replaying them onto the base
+- Locked slides passed back unchanged skip digesting
+- SmartRetryController recording iteration diffs and unlocking changed slides
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.utilities import blueprint_diff
+from skills.utilities.blueprint_diff import BlueprintVersion, freeze, thaw
+from skills.utilities.smart_retry_controller import SmartRetryController
+
+
+def make_slides(count=10):
+    return [
+        {'slide_number': i, 'header': f'Slide {i}', 'body': [f'Point {i}'], 'notes': {'pause': 2}}
+        for i in range(1, count + 1)
+    ]
+
+
+def test_freeze_thaw_round_trip():
+    slide = make_slides(1)[0]
+    frozen = freeze(slide)
+    with pytest.raises(TypeError):
+        frozen['header'] = 'x'
+    assert thaw(frozen) == slide
+
+
+def test_only_changed_slides_get_new_records():
+    slides = make_slides()
+    base, diffs = BlueprintVersion.from_slides(slides)
+    assert [d.change for d in diffs] == ['added'] * 10
+
+    slides = make_slides()
+    slides[2]['body'] = ['Rewritten']
+    del slides[9]
+    slides.append({'slide_number': 11, 'header': 'New'})
+    version, diffs = BlueprintVersion.from_slides(slides, previous=base)
+
+    assert [(d.slide_number, d.change) for d in diffs] == [(3, 'modified'), (11, 'added'), (10, 'removed')]
+    assert diffs[0].fields == ('body',)
+    assert diffs[0].to_dict()['before_digest'] == base.records[3].digest
+    assert version.shared_with(base) == 8
+    assert base.apply(diffs) == version
+    assert version.to_slides() == slides
+
+
+def test_trusted_slides_skip_digest(monkeypatch):
+    slides = make_slides()
+    base, _ = BlueprintVersion.from_slides(slides)
+
+    digested = []
+    original = blueprint_diff.slide_digest
+    monkeypatch.setattr(blueprint_diff, 'slide_digest', lambda s: digested.append(s['slide_number']) or original(s))
+    version, diffs = BlueprintVersion.from_slides(slides, previous=base, trusted=range(1, 9))
+
+    assert diffs == []
+    assert digested == [9, 10]
+    assert version.shared_with(base) == 10
+
+
+def test_retry_controller_records_diffs(tmp_path):
+    class Executor:
+        def __init__(self):
+            self.calls = 0
+
+        def __call__(self, input_data):
+            self.calls += 1
+            if self.calls == 1:
+                return {'slides': make_slides(), 'score': 70}
+            slides = input_data['previous_output']['slides']
+            fixed = [dict(s, body=['Fixed']) if s['slide_number'] in (2, 4) else s for s in slides]
+            return {'slides': fixed, 'score': 70 + 15 * (self.calls - 1)}
+
+    def validate(output):
+        score = output['score']
+        failing = [] if score >= 90 else [2, 4]
+        return score, {
+            'category_scores': {'char_limits': {'raw_score': score - 10, 'failing_slides': failing}}
+        }
+
+    controller = SmartRetryController(output_dir=str(tmp_path))
+    result = controller.execute_with_retry(
+        step=8, execute_fn=Executor(), validate_fn=validate,
+        initial_input={'blueprint': {}}, max_iterations=3
+    )
+
+    context = result.context
+    assert result.success and result.iterations_used == 3
+    assert context.iterations[0].slide_diffs == []
+    assert [d.slide_number for d in context.iterations[1].slide_diffs] == [2, 4]
+    assert context.iterations[2].slide_diffs == []
+    assert context.locked_slides == set(range(1, 11))
+    assert context.version_at(3) == context.current_version.detached()
+    assert context.version_at(1).records[2].content['body'] == ('Point 2',)
+    assert context.to_dict()['iterations'][1]['slide_diffs'][0]['fields'] == ['body']
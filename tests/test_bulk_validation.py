@@ -0,0 +1,156 @@
+"""
+Tests for columnar (whole-deck) constraint validation.
+
+Tests cover:
+- ConstraintValidator.validate_deck parity with validate_slide
+- Lazy materialization of violations and slide results
+- Bulk title, text-limit and template-population checks match the
+  per-slide validators
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.validation.constraint_validator import (
+    ConstraintValidator,
+    DeckColumns,
+    VIOLATION_FIELDS,
+)
+from skills.validation.title_validator_skill import (
+    validate_title,
+    validate_titles_bulk,
+    validate_blueprint_titles,
+)
+from skills.validation.template_population_validator import (
+    validate_section,
+    validate_section_bulk,
+)
+from skills.enforcement.text_limits_enforcer import (
+    validate_all_text_limits,
+    validate_text_limits_bulk,
+)
+
+
+GOOD_NOTES = "word " * 260 + "[PAUSE] the stage [PAUSE] [EMPHASIS: blocking]"
+
+SLIDES = [
+    {
+        'number': 1,
+        'title': 'Stage Directions',
+        'body': 'Upstage\nDownstage\nStage left',
+        'tip': 'Directions are from the actor',
+        'notes': GOOD_NOTES,
+    },
+    {
+        'number': 2,
+        'title': 'A title that is far too long for the slide header box',
+        'body': '\n'.join(f'Line {i}' for i in range(12)) + '\n' + 'x' * 80,
+        'tip': 'None',
+        'notes': 'word ' * 500,
+        'visual_type': 'flowchart',
+        'visual_data': {'steps': list(range(9))},
+    },
+    {
+        'id': 'closing',
+        'header': 'Wrap Up',
+        'body': '',
+        'tip': 't' * 70,
+        'presenter_notes': '',
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return ConstraintValidator()
+
+
+class TestValidateDeck:
+    """Columnar deck validation in ConstraintValidator."""
+
+    def test_matches_validate_slide(self, validator):
+        bulk = validator.validate_deck(DeckColumns.from_slides(SLIDES))
+        expected = [
+            validator.validate_slide(slide, str(slide.get('number', slide.get('id', i + 1))))
+            for i, slide in enumerate(SLIDES)
+        ]
+        assert bulk.slide_results == expected
+
+    def test_violations_are_compact_arrays(self, validator):
+        bulk = validator.validate_deck(SLIDES)
+        assert bulk.invalid_slide_indices() == [1, 2]
+        assert bulk.is_valid(0)
+        assert list(bulk.slide_index) == sorted(bulk.slide_index)
+        assert {VIOLATION_FIELDS[c] for c in bulk.field_code} >= {'title', 'body', 'flowchart_steps'}
+        assert bulk._slide_results is None  # nothing materialized yet
+
+    def test_violations_for_builds_objects_on_demand(self, validator):
+        bulk = validator.validate_deck(SLIDES)
+        tip_violations = bulk.violations_for(2)
+        assert [v.field for v in tip_violations] == ['tip']
+        assert tip_violations[0].line_number == 1
+        assert tip_violations[0].message == "Tip line 1 has 70 chars (max 66)"
+
+    def test_validate_slides_uses_bulk_path(self, validator):
+        batch = validator.validate_slides(SLIDES)
+        assert batch.total_slides == 3
+        assert batch.valid_slides == 1
+        assert batch.summary['violations_by_field']['presenter_notes'] == 1
+
+    def test_columns_must_align(self):
+        with pytest.raises(ValueError):
+            DeckColumns(['1', '2'], ['a'], ['b', 'c'], ['', ''], ['', ''])
+
+
+class TestBulkCheckers:
+    """Bulk variants agree with the per-slide validators."""
+
+    HEADERS = ['Blocking', 'A' * 40, 'One\nTwo', '', 'Ending...', 'B' * 36]
+    BODIES = ['a', 'line\n' * 13, 'cut off...', '', 'x', 'y\n' * 12]
+
+    def test_titles(self):
+        bulk = validate_titles_bulk(self.HEADERS)
+        expected = [i for i, t in enumerate(self.HEADERS) if not validate_title(t)['valid']]
+        assert bulk.invalid_indices == expected
+        assert bulk.details(1)['violations'] == validate_title(self.HEADERS[1])['violations']
+
+    def test_blueprint_titles_only_reports_invalid(self):
+        blueprint = {'slides': [{'slide_number': i + 1, 'header': h} for i, h in enumerate(self.HEADERS)]}
+        result = validate_blueprint_titles(blueprint)
+        assert result['invalid_count'] == len(validate_titles_bulk(self.HEADERS).invalid_indices)
+        assert [v['slide_number'] for v in result['violations']] == [2, 3, 4, 5]
+
+    def test_text_limits(self):
+        bulk = validate_text_limits_bulk(self.HEADERS, self.BODIES)
+        expected = [
+            i for i in range(len(self.HEADERS))
+            if not validate_all_text_limits({'header': self.HEADERS[i], 'body': self.BODIES[i]})['valid']
+        ]
+        assert bulk.invalid_indices == expected
+        assert bulk.truncation_warnings == [2]
+
+    def test_template_population_section(self):
+        slides = [
+            {'slide_number': i + 1, 'header': h, 'body': b, 'nclex_tip': 'Tip',
+             'presenter_notes': GOOD_NOTES if i % 2 else '', 'slide_type': 'content'}
+            for i, (h, b) in enumerate(zip(self.HEADERS, self.BODIES))
+        ]
+        report = validate_section(slides, "Unit 1")
+        bulk = validate_section_bulk(slides, "Unit 1")
+        assert bulk.summary == report.summary
+        assert bulk.to_report().slides == report.slides
+
+    def test_template_population_limits_are_shared(self, monkeypatch):
+        import skills.validation.template_population_validator as tpv
+
+        monkeypatch.setattr(tpv, 'HEADER_MAX_CHARS', 40)
+        slides = [{'slide_number': 1, 'header': 'A' * 40, 'body': 'b', 'nclex_tip': 'Tip',
+                   'presenter_notes': GOOD_NOTES, 'slide_type': 'content'}]
+        report = validate_section(slides, "Unit 1")
+        bulk = validate_section_bulk(slides, "Unit 1")
+        assert bulk.summary == report.summary
+        assert 'R1.1' not in [issue['check_id'] for issue in bulk.issues()]
@@ -0,0 +1,113 @@
+"""
+Unit tests for matrix-based cluster detection.
+
+Tests cover:
+- KeywordMatrix interning and legacy dict views
+- Mean pairwise Jaccard (NumPy blocks and bitset fallback) against a set-based reference
+- detect_clusters with a shared, precomputed matrix
+- PhaseAnalyzer phases with a shared AnchorCorpus
+"""
+
+import random
+import string
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import skills.generation.cluster_detector as cluster_module
+from skills.generation.cluster_detector import ClusterDetector, KeywordMatrix
+from skills.generation.anchor_corpus import AnchorCorpus
+from skills.generation.phase_analyzer import PhaseAnalyzer
+
+
+def _anchors(count=120, seed=7):
+    rng = random.Random(seed)
+    vocab = [''.join(rng.choices(string.ascii_lowercase, k=6)) for _ in range(200)]
+    vocab += ['assessment', 'medication', 'wound', 'cardiac']
+    return [
+        {
+            'id': f'a{i}',
+            'title': ' '.join(rng.sample(vocab[-4:], 2)).title(),
+            'full_text': ' '.join(rng.sample(vocab, rng.randint(0, 25))),
+        }
+        for i in range(count)
+    ]
+
+
+def _reference_cohesion(keyword_sets):
+    total, comparisons = 0.0, 0
+    for i in range(len(keyword_sets)):
+        for j in range(i + 1, len(keyword_sets)):
+            a, b = keyword_sets[i], keyword_sets[j]
+            if a and b:
+                total += len(a & b) / len(a | b)
+                comparisons += 1
+    return total / comparisons if comparisons else 0
+
+
+def test_matrix_views_match_extraction():
+    anchors = _anchors(20)
+    matrix = KeywordMatrix.from_anchors(anchors)
+    sets = matrix.keyword_sets()
+
+    assert list(sets) == [a['id'] for a in anchors]
+    for anchor in anchors:
+        assert sets[anchor['id']] == set(KeywordMatrix.extract_keywords(anchor))
+    for keyword, ids in matrix.keyword_index().items():
+        assert all(keyword in sets[aid] for aid in ids)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_mean_jaccard_matches_reference(monkeypatch, use_numpy):
+    if use_numpy and not cluster_module.NUMPY_AVAILABLE:
+        pytest.skip("NumPy not installed")
+    monkeypatch.setattr(cluster_module, 'NUMPY_AVAILABLE', use_numpy)
+    monkeypatch.setattr(cluster_module, 'JACCARD_BLOCK_ROWS', 16)
+
+    matrix = KeywordMatrix.from_anchors(_anchors())
+    rows = list(range(matrix.n_anchors))
+    expected = _reference_cohesion([matrix.keywords_of(r) for r in rows])
+
+    assert matrix.mean_jaccard(rows) == pytest.approx(expected)
+    assert matrix.mean_jaccard(rows[:1]) == 1.0
+
+
+def test_detect_clusters_with_shared_matrix():
+    anchors = _anchors()
+    matrix = KeywordMatrix.from_anchors(anchors)
+    detector = ClusterDetector()
+
+    first = detector.detect_clusters(anchors)
+    second = detector.detect_clusters(anchors, keyword_matrix=matrix)
+
+    assert [(c.theme, c.anchor_ids) for c in first.clusters] == \
+        [(c.theme, c.anchor_ids) for c in second.clusters]
+    clustered = [aid for c in first.clusters for aid in c.anchor_ids]
+    assert len(clustered) == len(set(clustered))
+    assert set(clustered) | set(first.unclustered_anchors) == {a['id'] for a in anchors}
+
+    cluster = first.clusters[0]
+    sets = matrix.keyword_sets()
+    assert cluster.cohesion_score == pytest.approx(
+        _reference_cohesion([sets[aid] for aid in cluster.anchor_ids])
+    )
+
+
+def test_phases_share_corpus():
+    anchors = [
+        {'id': 'a1', 'title': 'Introduction to Assessment', 'full_text': 'Overview'},
+        {'id': 'a2', 'title': 'Assessment Management', 'full_text': 'Managing care'},
+        {'id': 'a3', 'title': 'Advanced Cardiac Care', 'full_text': 'Complex care'},
+    ]
+    analyzer = PhaseAnalyzer()
+    corpus = AnchorCorpus.from_anchors(anchors)
+
+    assert analyzer.phase1_content_survey(anchors, corpus=corpus).data == \
+        analyzer.phase1_content_survey(anchors).data
+    assert analyzer.phase3_relationship_mapping(anchors, {}, corpus=corpus).data == \
+        analyzer.phase3_relationship_mapping(anchors, {}).data
+    assert analyzer._find_common_theme([a['title'] for a in anchors]) == 'Assessment'
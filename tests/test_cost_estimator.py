@@ -0,0 +1,166 @@
+"""
+Unit tests for the cost estimator.
+
+Tests cover:
+- Input sizes, linear and contention fits and schedule replay
+- Recording items, agents and concurrency from pipeline events
+- Batch estimates and worker-count recommendations
+- Estimating without creating a missing history
+- TheaterPipeline estimates from its own recorded runs
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from skills.utilities.cost_estimator import (
+    AGENT, ITEM, RUNNER_THEATER, CostEstimator, InputSize, TimingRecorder, WorkItem,
+    DEFAULT_CONTENTION, fit_contended, fit_linear, lesson_sizes, simulate_schedule
+)
+from skills.utilities.event_bus import (
+    AGENT_FINISHED, RUN_FINISHED, RUN_STARTED, EventBus
+)
+
+
+def test_sizes_fit_and_schedule():
+    lesson = {'content_points': ['Theater began as ritual', {'point': 'Thespis', 'expanded': ['First actor']}]}
+    size = lesson_sizes(lesson)
+    assert size == InputSize(content_points=2, notes_words=7)
+    assert size.units == pytest.approx(2.07)
+
+    fit = fit_linear([(2, 5.0), (4, 9.0), (6, 13.0)])
+    assert (fit.intercept, fit.rate) == pytest.approx((1.0, 2.0))
+    assert fit_linear([(5, 10.0)]).predict(10) == pytest.approx(20.0)
+
+    assert simulate_schedule([4, 1, 1, 1, 1], 2) == 4
+    assert simulate_schedule([1, 1, 1, 4], 2) == 5    # submission order is kept
+    assert simulate_schedule([], 3) == 0
+    # Two items at once each run 1.5x slower; the last one runs alone
+    assert simulate_schedule([10, 10, 10], 2, contention=0.5) == pytest.approx(25.0)
+
+    # 4 at once took 2.5x as long: 0.5 slowdown per extra item
+    fit = fit_contended([(2, 1, 20.0), (4, 1, 40.0), (2, 4, 50.0), (4, 4, 100.0)])
+    assert fit.contention == pytest.approx(0.5)
+    assert fit.predict(3, workers=3) == pytest.approx(60.0)
+    assert fit_contended([(2, 1, 20.0), (4, 1, 40.0)]).contention == DEFAULT_CONTENTION
+
+
+def test_recorder_records_items_and_agents(tmp_path):
+    recorder = TimingRecorder(tmp_path / 'timings.db', RUNNER_THEATER)
+    bus = EventBus([recorder])
+    sizes = {'content_points': 4, 'slides': 0, 'notes_words': 200}
+
+    bus.emit(RUN_STARTED, unit=1, day=1)
+    bus.emit(AGENT_FINISHED, unit=1, day=1, agent='unit_planner', status='completed', duration_seconds=2.0)
+    bus.emit(RUN_FINISHED, unit=1, day=1, status='SUCCESS', sizes=sizes, duration_seconds=5.0)
+
+    bus.emit(RUN_STARTED, unit=1, day=2)     # dry run: nothing recorded
+    bus.emit(AGENT_FINISHED, unit=1, day=2, agent='unit_planner', status='completed', duration_seconds=1.0)
+    bus.emit(RUN_FINISHED, unit=1, day=2, status='SUCCESS', dry_run=True, sizes=sizes, duration_seconds=1.0)
+
+    bus.emit(RUN_STARTED, unit=1, day=3)     # resumed: agents only
+    bus.emit(AGENT_FINISHED, unit=1, day=3, agent='unit_planner', replayed=True, duration_seconds=0.0)
+    bus.emit(AGENT_FINISHED, unit=1, day=3, agent='timing_validator', status='completed', duration_seconds=3.0)
+    bus.emit(RUN_FINISHED, unit=1, day=3, status='SUCCESS', sizes=sizes, duration_seconds=3.0)
+
+    rows = recorder.store.connection().execute(
+        "SELECT kind, name, seconds, content_points, notes_words FROM run_timings ORDER BY rowid"
+    ).fetchall()
+    assert rows == [
+        (AGENT, 'unit_planner', 2.0, 4, 200),
+        (ITEM, '', 5.0, 4, 200),
+        (AGENT, 'timing_validator', 3.0, 4, 200),
+    ]
+
+
+def test_recorder_records_concurrency(tmp_path):
+    recorder = TimingRecorder(tmp_path / 'timings.db', RUNNER_THEATER)
+    bus = EventBus([recorder])
+    sizes = {'content_points': 4}
+
+    bus.emit(RUN_STARTED, unit=1, day=1)
+    bus.emit(RUN_STARTED, unit=1, day=2)
+    bus.emit(RUN_FINISHED, unit=1, day=1, status='SUCCESS', sizes=sizes, duration_seconds=5.0)
+    bus.emit(RUN_FINISHED, unit=1, day=2, status='SUCCESS', sizes=sizes, duration_seconds=5.0)
+    bus.emit(RUN_STARTED, unit=1, day=3)
+    bus.emit(RUN_FINISHED, unit=1, day=3, status='SUCCESS', sizes=sizes, duration_seconds=3.0)
+
+    rows = recorder.store.connection().execute(
+        "SELECT workers FROM run_timings ORDER BY rowid"
+    ).fetchall()
+    assert rows == [(2,), (2,), (1,)]
+
+
+def test_estimate_and_recommend_workers(tmp_path):
+    recorder = TimingRecorder(tmp_path / 'timings.db', RUNNER_THEATER)
+    for points, seconds in [(2, 20.0), (4, 40.0)]:
+        recorder.record([(ITEM, '', seconds)], InputSize(content_points=points))
+    recorder.store.connection().execute("UPDATE run_timings SET baseline_mb = 100, peak_mb = 150")
+
+    estimator = CostEstimator(recorder.store)
+    items = [WorkItem(f'day {d}', InputSize(content_points=3)) for d in range(1, 9)]
+    estimate = estimator.estimate(RUNNER_THEATER, items, workers=4)
+    # Contention is unmeasured: two rounds of 30s days, 1.3x slower 4 at once
+    assert estimate.wall_seconds == pytest.approx(78.0)
+    assert estimate.serial_seconds == pytest.approx(240.0)
+    assert estimate.peak_mb == pytest.approx(300.0)
+    assert estimate.coverage == 1.0
+
+    assert estimator.recommend_workers(RUNNER_THEATER, items, max_workers=8) == 8
+    # 50 MB per day: 4 days at once fits in 300 MB, 5 do not
+    assert estimator.recommend_workers(RUNNER_THEATER, items, max_workers=8, memory_limit_mb=300) == 4
+    # 3 items: a 4th worker gains nothing
+    assert estimator.recommend_workers(RUNNER_THEATER, items[:3], max_workers=8) == 3
+
+    empty = CostEstimator(tmp_path / 'empty.db')
+    assert empty.estimate(RUNNER_THEATER, items, workers=2).wall_seconds is None
+    assert empty.recommend_workers(RUNNER_THEATER, items, max_workers=4) is None
+    assert not (tmp_path / 'empty.db').exists()
+
+
+def test_recommendation_follows_measured_contention(tmp_path):
+    recorder = TimingRecorder(tmp_path / 'timings.db', RUNNER_THEATER)
+    recorder.record([(ITEM, '', 30.0)], InputSize(content_points=3), workers=1)
+    # Two days at once took 2.2x as long each: running them together loses
+    recorder.record([(ITEM, '', 66.0)] * 2, InputSize(content_points=3), workers=2)
+
+    estimator = CostEstimator(recorder.store)
+    items = [WorkItem(f'day {d}', InputSize(content_points=3)) for d in range(1, 9)]
+    assert estimator.item_fit(RUNNER_THEATER).contention == pytest.approx(1.2)
+    assert estimator.recommend_workers(RUNNER_THEATER, items, max_workers=8) == 1
+
+
+def test_agent_fits_cover_items_without_history(tmp_path):
+    recorder = TimingRecorder(tmp_path / 'timings.db', RUNNER_THEATER)
+    recorder.record([(AGENT, 'a', 1.0), (AGENT, 'b', 2.0)], InputSize(content_points=4))
+    seconds, basis = CostEstimator(recorder.store).predict_item(
+        RUNNER_THEATER, WorkItem('day 1', InputSize(content_points=2))
+    )
+    assert basis == 'agents'
+    assert seconds == pytest.approx(1.5)
+
+
+def test_pipeline_estimates_from_recorded_runs(tmp_path, monkeypatch):
+    from run_theater_pipeline import TheaterPipeline
+
+    monkeypatch.setenv('THEATER_PIPELINE_TIMINGS_DB', str(tmp_path / 'timings.db'))
+    bus = EventBus([TimingRecorder(tmp_path / 'timings.db', RUNNER_THEATER)])
+    pipeline = TheaterPipeline(output_dir=tmp_path / 'out', events=bus)
+    assert pipeline.estimate_batch(1, [1]).wall_seconds is None
+
+    logging.disable(logging.INFO)
+    try:
+        assert pipeline.run(1, 1)['status'] == 'SUCCESS'
+    finally:
+        logging.disable(logging.NOTSET)
+
+    estimate = pipeline.estimate_batch(1, list(range(1, 21)), workers=2)
+    assert estimate.items == 1                  # only day 1 has input
+    assert estimate.coverage == 1.0
+    assert estimate.wall_seconds > 0
+    assert estimate.per_item[0]['name'] == 'unit 1 day 1'
@@ -0,0 +1,80 @@
+"""
+Unit tests for the dependency graph engine.
+
+Tests cover:
+- FIFO Kahn order on acyclic graphs (the DependencyMapper's classic order)
+- Tarjan SCC cycle reporting with a concrete cycle path
+- Cycle members placed as a group where their dependencies allow
+- Priority tie-breaking
+- DependencyMapper surfacing cycles instead of appending them silently
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.generation.dependency_graph import DependencyGraph
+from skills.generation.dependency_mapper import Dependency, DependencyMapper
+
+
+def test_acyclic_fifo_order():
+    graph = DependencyGraph(
+        ['a', 'b', 'c', 'd', 'e'],
+        [('a', 'c'), ('b', 'c'), ('a', 'd'), ('d', 'e'), ('x', 'a')]
+    )
+    result = graph.topological_order()
+
+    assert result.order == ['a', 'b', 'd', 'c', 'e']
+    assert result.is_acyclic
+    assert graph.skipped_edges == 1
+    assert list(graph.successors(0)) == [2, 3]
+
+
+def test_cycles_reported_and_grouped():
+    # root -> (p <-> q <-> r) -> tail, plus a self-loop on s
+    graph = DependencyGraph(
+        ['tail', 'r', 'q', 'p', 'root', 's'],
+        [('root', 'p'), ('p', 'q'), ('q', 'r'), ('r', 'p'), ('q', 'p'),
+         ('r', 'tail'), ('s', 's')]
+    )
+    result = graph.topological_order()
+
+    assert [c.anchor_ids for c in result.cycles] == [['r', 'q', 'p'], ['s']]
+    assert result.cycles[0].path == ['r', 'p', 'q']
+    assert result.cycles[1].path == ['s']
+    # s only depends on itself, so it is ready alongside root
+    assert result.order == ['root', 's', 'r', 'q', 'p', 'tail']
+
+
+def test_priority_tie_breaking():
+    graph = DependencyGraph(['a', 'b', 'c', 'd'], [('a', 'd'), ('b', 'd')])
+    rank = {'a': 3, 'b': 1, 'c': 2, 'd': 0}
+
+    assert graph.topological_order().order == ['a', 'b', 'c', 'd']
+    assert graph.topological_order(priority=rank.get).order == ['b', 'c', 'a', 'd']
+
+
+def test_mapper_reports_cycles():
+    anchors = [
+        {'id': 'a1', 'title': 'Wound Assessment', 'full_text': 'Wound care interventions'},
+        {'id': 'a2', 'title': 'Wound Treatment', 'full_text': 'Assessment and treatment'},
+        {'id': 'a3', 'title': 'Introduction', 'full_text': 'Overview'},
+    ]
+    result = DependencyMapper().map_dependencies(anchors)
+
+    assert sorted(result.suggested_order) == ['a1', 'a2', 'a3']
+    assert result.metrics['cycle_count'] == len(result.cycles) == 1
+    assert result.cycles[0].anchor_ids == ['a1', 'a2']
+    assert result.suggested_order == ['a3', 'a1', 'a2']
+    assert 'Cycles (1)' in DependencyMapper().format_report(result)
+
+
+def test_terminal_anchors_in_anchor_order():
+    mapper = DependencyMapper()
+    anchors = [{'id': f'a{i}'} for i in range(4)]
+    deps = [Dependency('a2', 'a0', 'prerequisite', 'suggested')]
+
+    assert mapper._identify_terminal_anchors(anchors, deps) == ['a0', 'a1', 'a3']
+    assert mapper._calculate_suggested_order(anchors, deps) == ['a1', 'a2', 'a3', 'a0']
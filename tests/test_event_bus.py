@@ -0,0 +1,118 @@
+"""
+Unit tests for the progress event bus.
+
+Tests cover:
+- No-op emission without sinks
+- Spans, file sizes and JSON-lines output
+- Throughput/ETA progress fields
+- SSE streaming with Last-Event-ID replay
+- Events emitted by a pipeline run
+"""
+
+import json
+import logging
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from skills.utilities.event_bus import CallbackSink, EventBus, JsonlSink, Progress, SSESink
+
+
+def test_bus_without_sinks_is_noop(tmp_path):
+    bus = EventBus()
+    assert bus.emit('phase_started', phase='validation') is None
+    with bus.span('phase') as finished:
+        finished['status'] = 'completed'
+    assert bus.file_written(tmp_path / 'missing.md') is None
+
+
+def test_span_and_jsonl(tmp_path):
+    seen = []
+    bus = EventBus([JsonlSink(tmp_path / 'events.jsonl'), CallbackSink(seen.append, kinds=['file_written'])])
+    target = tmp_path / 'lesson_plan.md'
+    target.write_text('x' * 42)
+
+    with bus.span('phase', phase='assembly', day=3) as finished:
+        bus.file_written(target, day=3)
+        finished['status'] = 'completed'
+    with pytest.raises(ValueError):
+        with bus.span('phase', phase='validation'):
+            raise ValueError('gate crashed')
+    bus.close()
+
+    events = [json.loads(line) for line in (tmp_path / 'events.jsonl').read_text().splitlines()]
+    assert [e['kind'] for e in events] == [
+        'phase_started', 'file_written', 'phase_finished', 'phase_started', 'phase_finished'
+    ]
+    assert [e['seq'] for e in events] == [1, 2, 3, 4, 5]
+    assert events[1]['bytes'] == 42
+    assert events[2]['status'] == 'completed' and events[2]['duration_seconds'] >= 0
+    assert events[4]['status'] == 'error' and events[4]['error'] == 'gate crashed'
+    assert [e.kind for e in seen] == ['file_written']
+
+
+def test_progress_eta():
+    progress = Progress(total=20, started=time.monotonic() - 60)
+    fields = progress.advance(5)
+    assert fields['completed'] == 5 and fields['total'] == 20
+    assert fields['per_minute'] == pytest.approx(5, rel=0.01)
+    assert fields['eta_seconds'] == pytest.approx(180, rel=0.01)
+
+
+def _read_events(response, count):
+    events, data = [], {}
+    while len(events) < count:
+        line = response.readline().decode('utf-8').rstrip('\n')
+        if line.startswith('id: '):
+            data['id'] = int(line[4:])
+        elif line.startswith('data: '):
+            data['data'] = json.loads(line[6:])
+        elif line == '' and data:
+            events.append(data)
+            data = {}
+    return events
+
+
+def test_sse_stream_and_replay():
+    sink = SSESink(port=0)
+    bus = EventBus([sink])
+    try:
+        bus.emit('run_started', day=1)
+        response = urllib.request.urlopen(sink.url, timeout=5)
+        bus.emit('agent_finished', agent='timing_validator')
+        assert _read_events(response, 1)[0]['data']['agent'] == 'timing_validator'
+        response.close()
+
+        bus.emit('run_finished', day=1)
+        request = urllib.request.Request(sink.url, headers={'Last-Event-ID': '1'})
+        replayed = _read_events(urllib.request.urlopen(request, timeout=5), 2)
+        assert [e['id'] for e in replayed] == [2, 3]
+        assert replayed[1]['data']['kind'] == 'run_finished'
+    finally:
+        bus.close()
+
+
+def test_pipeline_emits_events(tmp_path):
+    from run_theater_pipeline import TheaterPipeline
+
+    seen = []
+    pipeline = TheaterPipeline(output_dir=tmp_path, events=EventBus([CallbackSink(seen.append)]))
+    logging.disable(logging.INFO)
+    try:
+        result = pipeline.run(1, 1)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    kinds = [e.kind for e in seen]
+    assert kinds[0] == 'run_started' and kinds[-1] == 'run_finished'
+    assert kinds.count('phase_started') == kinds.count('phase_finished') == 4
+    assert 'agent_finished' in kinds
+    written = [e.fields for e in seen if e.kind == 'file_written']
+    assert written and all(f['bytes'] > 0 and f['day'] == 1 for f in written)
+    assert seen[-1].fields['status'] == result['status']
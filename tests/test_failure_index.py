@@ -0,0 +1,169 @@
+"""
+Unit tests for the persistent failure index and ErrorRecovery's use of it.
+
+Tests cover:
+- Signatures ignoring numbers, quoted values and paths in messages
+- Recovery outcomes aggregated per action and surviving a reopen
+- Classifications reused for recurring failures
+- get_strategy preferring the fastest successful action
+- Ranking by expected time to recovery, failed attempts included
+- handle() running the chosen action and recording nothing itself
+- The retry controller recording outcomes when it re-validates
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.utilities.error_recovery import ErrorRecovery, ErrorType, RecoveryAction
+from skills.utilities.failure_index import FailureIndex, failure_signature
+from skills.utilities.smart_retry_controller import SmartRetryController
+from skills.utilities.state_store import StateStore
+
+
+def test_signature_normalises_message():
+    a = failure_signature('ValueError', 7, 'char_limit', "Slide 4 body exceeds 120 chars in 'Act I'")
+    b = failure_signature('ValueError', 7, 'char_limit', "Slide 9 body exceeds 87 chars in 'Finale'")
+    c = failure_signature('ValueError', 8, 'char_limit', "Slide 9 body exceeds 87 chars in 'Finale'")
+    assert a == b and a.key == b.key
+    assert a.key != c.key
+    assert failure_signature('OSError', message='cannot open outputs/day_3/blueprint.json').message \
+        == 'cannot open <path>'
+
+
+def test_outcomes_persist_and_aggregate(tmp_path):
+    db = tmp_path / 'state.db'
+    signature = failure_signature('CONSTRAINT_VIOLATION', 7, 'char_limit', 'too long')
+    index = FailureIndex(db)
+    index.record_outcome(signature, 'APPLY_FALLBACK', True, 2.0)
+    index.record_outcome(signature, 'APPLY_FALLBACK', False, 5.0)
+    index.record_outcome(signature, 'APPLY_FALLBACK', True, 1.0)
+    index.record_outcome(signature, 'RETRY_FROM_STEP', True, 30.0)
+
+    reopened = FailureIndex(db)
+    stats = {s.action: s for s in reopened.action_stats(signature)}
+    assert stats['APPLY_FALLBACK'].attempts == 3
+    assert stats['APPLY_FALLBACK'].successes == 2
+    assert stats['APPLY_FALLBACK'].mean_seconds == 1.5
+    assert stats['APPLY_FALLBACK'].best_seconds == 1.0
+    assert reopened.best_action(signature).action == 'APPLY_FALLBACK'
+
+    report = reopened.report()
+    assert report[0]['occurrences'] == 4
+    assert report[0]['best_action'] == 'APPLY_FALLBACK'
+
+
+def test_ranking_counts_failed_attempts(tmp_path):
+    signature = failure_signature('CONSTRAINT_VIOLATION', 7, 'char_limit', 'too long')
+    index = FailureIndex(tmp_path / 'state.db')
+    index.record_outcome(signature, 'APPLY_FALLBACK', True, 0.1)
+    for _ in range(19):
+        index.record_outcome(signature, 'APPLY_FALLBACK', False, 0.1)
+    for _ in range(20):
+        index.record_outcome(signature, 'RETRY_FROM_STEP', True, 0.5)
+
+    stats = {s.action: s for s in index.action_stats(signature)}
+    assert stats['APPLY_FALLBACK'].total_seconds == pytest.approx(2.0)
+    assert stats['APPLY_FALLBACK'].expected_seconds == pytest.approx(2.0)
+    assert stats['RETRY_FROM_STEP'].expected_seconds == pytest.approx(0.5)
+    assert index.best_action(signature).action == 'RETRY_FROM_STEP'
+
+
+def test_index_without_total_seconds_is_migrated(tmp_path):
+    db = tmp_path / 'state.db'
+    signature = failure_signature('CONSTRAINT_VIOLATION', 7, 'char_limit', 'too long')
+    store = StateStore(db)
+    with store.transaction() as conn:
+        conn.execute(
+            "CREATE TABLE recovery_outcomes (signature TEXT, action TEXT, attempts INTEGER, "
+            "successes INTEGER, success_seconds REAL, best_seconds REAL, last_used TEXT, "
+            "PRIMARY KEY (signature, action))"
+        )
+        conn.execute(
+            "INSERT INTO recovery_outcomes VALUES (?, 'APPLY_FALLBACK', 1, 1, 1.0, 1.0, '')",
+            (signature.key,)
+        )
+    store.close()
+
+    index = FailureIndex(db)
+    index.record_outcome(signature, 'APPLY_FALLBACK', False, 3.0)
+    stats = index.action_stats(signature)[0]
+    assert stats.total_seconds == pytest.approx(4.0)
+    assert stats.expected_seconds == pytest.approx(4.0)
+
+
+def test_classification_memoized(tmp_path, monkeypatch):
+    index = FailureIndex(tmp_path / 'state.db')
+    recovery = ErrorRecovery(failure_index=index)
+    assert recovery.classify_error(ValueError('Visual quota not met (2 of 3)'), step=9) \
+        == ErrorType.QUOTA_NOT_MET
+
+    calls = []
+    monkeypatch.setattr(ErrorRecovery, '_match_error', staticmethod(lambda e: calls.append(e)))
+    fresh = ErrorRecovery(failure_index=FailureIndex(tmp_path / 'state.db'))
+    assert fresh.classify_error(ValueError('Visual quota not met (1 of 3)'), step=9) \
+        == ErrorType.QUOTA_NOT_MET
+    assert calls == []
+    assert index.report()[0]['occurrences'] == 2
+
+
+def test_strategy_prefers_fastest_successful_action(tmp_path):
+    recovery = ErrorRecovery(failure_index=FailureIndex(tmp_path / 'state.db'))
+    context = {'step': 7, 'violation_type': 'char_limit', 'slide_number': 3}
+    assert recovery.get_strategy(ErrorType.CONSTRAINT_VIOLATION, context).action \
+        == RecoveryAction.APPLY_FALLBACK
+
+    result = recovery.handle(ErrorType.CONSTRAINT_VIOLATION, context)
+    assert recovery.failure_index.action_stats(result.signature) == []
+    recovery.record_outcome(result, success=False, duration_seconds=12.0)
+    signature = result.signature
+    recovery.failure_index.record_outcome(signature, 'RETRY_FROM_STEP', True, 4.0)
+    recovery.failure_index.record_outcome(signature, 'REGENERATE_VISUAL_SPEC', True, 9.0)
+
+    strategy = recovery.get_strategy(ErrorType.CONSTRAINT_VIOLATION, context)
+    assert strategy.action == RecoveryAction.RETRY_FROM_STEP
+    assert strategy.parameters['history']['mean_seconds'] == 4.0
+    assert strategy.fallback_action == RecoveryAction.APPLY_FALLBACK
+
+    # Another slide with the same rule is the same failure
+    other = dict(context, slide_number=11)
+    assert recovery.get_strategy(ErrorType.CONSTRAINT_VIOLATION, other).action \
+        == RecoveryAction.RETRY_FROM_STEP
+    assert ErrorRecovery().get_strategy(ErrorType.CONSTRAINT_VIOLATION, context).action \
+        == RecoveryAction.APPLY_FALLBACK
+
+
+def test_handle_runs_chosen_action(tmp_path):
+    recovery = ErrorRecovery(failure_index=FailureIndex(tmp_path / 'state.db'))
+    context = {'step': 7, 'violation_type': 'char_limit', 'slide_number': 3}
+    assert recovery.handle(ErrorType.CONSTRAINT_VIOLATION, context).action_taken \
+        == RecoveryAction.APPLY_FALLBACK
+
+    signature = recovery.signature_for('CONSTRAINT_VIOLATION', 7, context)
+    recovery.failure_index.record_outcome(signature, 'RETRY_FROM_STEP', True, 4.0)
+    result = recovery.handle(ErrorType.CONSTRAINT_VIOLATION, context)
+    assert result.action_taken == RecoveryAction.RETRY_FROM_STEP
+    assert result.next_step == 7
+
+
+def test_retry_controller_records_revalidated_outcomes(tmp_path):
+    index = FailureIndex(tmp_path / 'state.db')
+    controller = SmartRetryController(
+        error_recovery=ErrorRecovery(failure_index=index), output_dir=str(tmp_path)
+    )
+    scores = iter([70.0, 75.0, 95.0])
+
+    def validate(output):
+        return next(scores), {'category_scores': {'char_limit': {'raw_score': 60}}}
+
+    result = controller.execute_with_retry(
+        step=8, execute_fn=lambda data: {'slides': [{'slide_number': 1}]},
+        validate_fn=validate, initial_input={}, max_iterations=3
+    )
+    assert result.success
+    stats = index.action_stats(controller.error_recovery.recovery_history[0].signature)
+    assert [(s.action, s.attempts, s.successes) for s in stats] == [('RETRY_FROM_STEP', 2, 1)]
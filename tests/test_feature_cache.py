@@ -0,0 +1,150 @@
+"""
+Unit tests for the content-addressed feature cache.
+
+Tests cover:
+- Cached entry points return the same results as the uncached functions
+- Hits return fresh copies; keys follow content and position, not identity
+- LRU bound, disabling, and the on-disk tier shared across cache instances
+- Entries are JSON; only listed types are rebuilt and other results stay uncached
+"""
+
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.utilities.feature_cache import (
+    FeatureCache,
+    UncacheableResult,
+    cached_analysis,
+    decode_result,
+    encode_result,
+    configure_feature_cache,
+    get_feature_cache,
+)
+from skills.generation.content_structure_analyzer import (
+    analyze_slide_content,
+    analyze_structure,
+    suggest_visual_type,
+)
+from skills.generation.visual_pattern_matcher import VisualType, score_visual_opportunity_multifactor
+from skills.generation.ml_visual_recommender import extract_features
+
+
+SLIDE = {
+    'slide_number': 3,
+    'header': 'Greek vs Roman Theater',
+    'body': '- Greek: masks, chorus\n- Roman: spectacle\n- Compared to Greek drama, Roman plays favored farce',
+    'slide_type': 'Content',
+}
+
+
+@pytest.fixture
+def cache():
+    """Fresh in-memory cache for each test; default cache restored afterwards."""
+    yield configure_feature_cache()
+    configure_feature_cache()
+
+
+def test_cached_results_match_uncached(cache):
+    for _ in range(2):
+        assert analyze_structure(SLIDE['body']) == analyze_structure.uncached(SLIDE['body'])
+        assert suggest_visual_type(SLIDE['body']) == suggest_visual_type.uncached(SLIDE['body'])
+        assert analyze_slide_content(SLIDE) == analyze_slide_content.uncached(SLIDE)
+        assert (score_visual_opportunity_multifactor(SLIDE, 3, 12)
+                == score_visual_opportunity_multifactor.uncached(SLIDE, 3, 12))
+        assert extract_features(SLIDE, 3, 12) == extract_features.uncached(SLIDE, 3, 12)
+    assert cache.stats()['hits'] > 0
+
+
+def test_hit_returns_fresh_copy(cache):
+    first = analyze_slide_content(SLIDE)
+    first['analysis'].clear()
+
+    second = analyze_slide_content(dict(SLIDE))
+    assert second['analysis']
+    assert cache.hits == 1
+
+
+def test_key_includes_position(cache):
+    first = extract_features(SLIDE, 1, 12)
+    misses = cache.misses
+    last = extract_features(SLIDE, 6, 12)
+    assert cache.misses == misses + 1  # analyze_structure(body) is a hit
+    assert first.slide_position_score != last.slide_position_score
+
+    misses = cache.misses
+    extract_features(dict(SLIDE, slide_number=99), 6, 12)
+    assert cache.misses == misses
+
+
+def test_lru_bound():
+    small = FeatureCache(max_entries=2)
+    for key in ('a', 'b', 'c'):
+        small.put(key, key.encode())
+    assert small.get('a') is None
+    assert small.get('c') == b'c'
+    assert small.stats()['entries'] == 2
+
+
+def test_disabled_cache_bypasses():
+    disabled = configure_feature_cache(max_entries=0)
+    try:
+        analyze_structure(SLIDE['body'])
+        analyze_structure(SLIDE['body'])
+        assert disabled.stats()['entries'] == 0
+        assert disabled.hits == disabled.misses == 0
+    finally:
+        configure_feature_cache()
+
+
+def test_disk_tier_shared_between_instances(tmp_path):
+    try:
+        configure_feature_cache(disk_dir=tmp_path)
+        expected = extract_features(SLIDE, 3, 12)
+        assert list(tmp_path.glob('*/*.json'))
+
+        fresh = configure_feature_cache(disk_dir=tmp_path)
+        assert extract_features(SLIDE, 3, 12) == expected
+        assert fresh.disk_hits == 1
+
+        fresh.clear(disk=True)
+        assert not list(tmp_path.glob('*/*.json'))
+    finally:
+        configure_feature_cache()
+    assert get_feature_cache().disk_dir is None
+
+
+def test_entries_are_json_with_listed_types_only(tmp_path):
+    try:
+        configure_feature_cache(disk_dir=tmp_path)
+        result = suggest_visual_type(SLIDE['body'])
+        assert isinstance(result['primary_suggestion'], VisualType)
+        for path in tmp_path.glob('*/*.json'):
+            json.loads(path.read_text())
+
+        blob = encode_result({'pair': (1, 'a'), 7: VisualType.TABLE}, {'VisualType': VisualType})
+        assert decode_result(blob, {'VisualType': VisualType}) == {'pair': (1, 'a'), 7: VisualType.TABLE}
+        with pytest.raises(UncacheableResult):
+            decode_result(blob, {})
+        with pytest.raises(UncacheableResult):
+            encode_result(VisualType.TABLE, {})
+    finally:
+        configure_feature_cache()
+
+
+def test_unlisted_result_types_are_not_cached(cache):
+    calls = []
+
+    @cached_analysis('test_unlisted', key=lambda x: (x,))
+    def make_set(x):
+        calls.append(x)
+        return {x}
+
+    assert make_set(1) == {1}
+    assert make_set(1) == {1}
+    assert calls == [1, 1]
+    assert cache.stats()['entries'] == 0
@@ -8,9 +8,15 @@ Tests cover:
 - Confidence calibration
 - Training data generation
 - Integration with existing visual_pattern_matcher
+- Section-level recommend_deck and quota-aware selection
+- recommend_deck as the default part-2 selection engine
+- Versioned model artifacts (.npz / .json) and staleness checks
 """
 
+import contextlib
+import io
 import unittest
+import unittest.mock
 import sys
 import os
 import tempfile
@@ -29,9 +35,20 @@ from skills.generation.ml_visual_recommender import (
     train_from_samples,
     ensemble_predict,
     initialize_with_patterns,
-    generate_training_data_from_patterns
+    generate_training_data_from_patterns,
+    features_to_matrix,
+    load_or_train_pattern_model
 )
-from skills.generation.visual_pattern_matcher import VisualType
+import skills.generation.ml_visual_recommender as ml_module
+import skills.generation.visual_model_store as store_module
+from skills.generation.visual_pattern_matcher import VisualType, rank_slides_for_visuals
+from skills.generation.content_structure_analyzer import analyze_structure, suggest_visual_type
+
+try:
+    import pptx
+    PPTX_AVAILABLE = True
+except ImportError:
+    PPTX_AVAILABLE = False
 
 
 class TestSlideFeatures(unittest.TestCase):
@@ -253,7 +270,7 @@ class TestNaiveBayesClassifier(unittest.TestCase):
         """Test model serialization."""
         self.classifier.fit(self.examples)
 
-        with tempfile.NamedTemporaryFile(suffix='.pkl', delete=False) as f:
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
             temp_path = f.name
 
         try:
@@ -275,6 +292,54 @@ class TestNaiveBayesClassifier(unittest.TestCase):
         finally:
             os.unlink(temp_path)
 
+    def _reference_proba(self, features):
+        """Per-feature loop from the original implementation."""
+        import math
+        log_probs = {}
+        for c in self.classifier.classes:
+            log_prob = math.log(self.classifier.class_priors[c])
+            for val, mean, std in zip(features.to_vector(),
+                                      self.classifier.feature_means[c],
+                                      self.classifier.feature_stds[c]):
+                z = (val - mean) / std
+                log_prob -= 0.5 * z * z + math.log(std)
+            log_probs[c] = log_prob
+        max_log = max(log_probs.values())
+        exps = {c: math.exp(lp - max_log) for c, lp in log_probs.items()}
+        total = sum(exps.values())
+        return {c: p / total for c, p in exps.items()}
+
+    def test_batch_matches_single_slide(self):
+        """Test predict_proba_batch rows equal per-slide predict_proba."""
+        self.classifier.fit(generate_training_data_from_patterns())
+        features = [ex.features for ex in generate_training_data_from_patterns()]
+        batch = self.classifier.predict_proba_batch(features_to_matrix(features))
+
+        self.assertEqual(len(batch), len(features))
+        for row, feat in zip(batch, features):
+            expected = self._reference_proba(feat)
+            for c, p in self.classifier.proba_row_to_dict(row).items():
+                self.assertAlmostEqual(p, expected[c], places=9)
+
+    def test_pure_python_fallback_matches(self):
+        """Test the list-based path gives the same predictions without NumPy."""
+        self.classifier.fit(self.examples)
+        probe = [SlideFeatures(keyword_table=0.5), SlideFeatures(step_count=4)]
+        expected = self.classifier.predict_batch(probe)
+
+        saved = ml_module.NUMPY_AVAILABLE
+        ml_module.NUMPY_AVAILABLE = False
+        try:
+            fallback = NaiveBayesVisualClassifier()
+            fallback.fit(self.examples)
+            actual = fallback.predict_batch(probe)
+        finally:
+            ml_module.NUMPY_AVAILABLE = saved
+
+        self.assertEqual([t for t, _ in actual], [t for t, _ in expected])
+        for (_, a), (_, b) in zip(actual, expected):
+            self.assertAlmostEqual(a, b, places=9)
+
 
 class TestMLVisualRecommender(unittest.TestCase):
     """Tests for the main MLVisualRecommender class."""
@@ -568,5 +633,193 @@ class TestIntegrationWithPatternMatcher(unittest.TestCase):
         self.assertLessEqual(rec['confidence'], 1.0)
 
 
+class TestRecommendDeck(unittest.TestCase):
+    """Tests for the section-level recommend_deck API."""
+
+    BODIES = [
+        '- Greek: masks, chorus\n- Roman: spectacle\n- Compared to Greek drama, Roman plays favored farce',
+        '1. Read the scene\n2. Mark entrances\n3. Next, set levels\n4. Finally, run cues',
+        'Classification of stages:\n- Proscenium\n  - Thrust\n  - Arena',
+        '- 1545: first troupe contract\n- 1570s: tours to France\n- 1750: Goldoni scripts the form',
+        'Warm up your voice before rehearsal.',
+    ]
+
+    def setUp(self):
+        self.recommender = MLVisualRecommender()
+        self.recommender.train(generate_training_data_from_patterns())
+        self.slides = [
+            {'slide_number': i + 1, 'header': f'Slide {i + 1}',
+             'body': self.BODIES[i % len(self.BODIES)], 'slide_type': 'Content'}
+            for i in range(15)
+        ]
+
+    def test_matches_per_slide_recommend(self):
+        deck = self.recommender.recommend_deck(self.slides)
+        total = len(self.slides)
+        for slide, rec in zip(self.slides, deck.recommendations):
+            single = self.recommender.recommend(slide, slide['slide_number'], total)
+            self.assertEqual(rec['recommended_type'], single['recommended_type'])
+            self.assertAlmostEqual(rec['confidence'], single['confidence'], places=3)
+            self.assertEqual(rec['rule_prediction'], single['rule_prediction'])
+
+    def test_ranked_matches_rank_slides_for_visuals(self):
+        deck = self.recommender.recommend_deck(self.slides)
+        expected = rank_slides_for_visuals(self.slides)
+        self.assertEqual([n for n, _ in deck.ranked], [n for n, _ in expected])
+
+    def test_quota_respected(self):
+        deck = self.recommender.recommend_deck(self.slides)
+        self.assertLessEqual(len(deck.selected), deck.quota['maximum'])
+        self.assertLessEqual(deck.quota['maximum'], int(len(self.slides) * 0.4))
+        self.assertTrue(deck.quota['meets_minimum'])
+        self.assertEqual(deck.selected, sorted(deck.selected))
+
+        capped = self.recommender.recommend_deck(self.slides, max_visuals=1)
+        self.assertEqual(len(capped.selected), 1)
+
+    def test_quota_overrides(self):
+        deck = MLVisualRecommender().recommend_deck(self.slides, min_visuals=12, max_visuals=12)
+        self.assertEqual(len(deck.selected), 12)
+        self.assertTrue(deck.quota['meets_minimum'])
+        for number in deck.selected:
+            self.assertTrue(deck.recommendation_for(number)['selected'])
+
+    def test_lead_in_continues_variety(self):
+        deck = self.recommender.recommend_deck(self.slides)
+        first = deck.recommendation_for(deck.selected[0])['recommended_type']
+
+        continued = self.recommender.recommend_deck(self.slides, lead_in=[first, first])
+        self.assertNotEqual(continued.recommendation_for(continued.selected[0])['recommended_type'], first)
+        self.assertEqual(continued.quota['variety_violations'], 0)
+
+    @unittest.skipUnless(PPTX_AVAILABLE, "python-pptx not installed")
+    def test_part2_analysis_defaults_to_recommend_deck(self):
+        from pipeline_part2_enhancement import analyze_and_identify_slides as part2
+
+        prs = pptx.Presentation()
+        for slide in self.slides:
+            pptx_slide = prs.slides.add_slide(prs.slide_layouts[1])
+            pptx_slide.shapes.title.text = slide['header']
+            pptx_slide.placeholders[1].text_frame.text = slide['body']
+            # A third shape, so detect_sections does not read it as a section intro
+            pptx_slide.shapes.add_textbox(0, 0, 914400, 457200).text_frame.text = 'Theater history'
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = str(Path(tmpdir) / 'deck.pptx')
+            prs.save(path)
+            with unittest.mock.patch.object(ml_module, 'get_recommender', return_value=self.recommender), \
+                    unittest.mock.patch.object(self.recommender, 'recommend_deck',
+                                               wraps=self.recommender.recommend_deck) as recommend_deck, \
+                    contextlib.redirect_stdout(io.StringIO()):
+                selected, _ = part2.analyze_powerpoint_for_graphic_organizers(path)
+
+        recommend_deck.assert_called()
+        self.assertTrue(selected)
+        self.assertTrue(all('selected_by' in item for item in selected))
+
+    def test_shared_structure_matches_direct_suggestion(self):
+        for body in self.BODIES:
+            shared = suggest_visual_type(body, structure=analyze_structure(body))
+            self.assertEqual(shared, suggest_visual_type(body))
+
+
+class TestModelArtifacts(unittest.TestCase):
+    """Tests for persisted, versioned model artifacts."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmpdir.name)
+        self.trained = MLVisualRecommender()
+        self.trained.train(generate_training_data_from_patterns())
+        self.features = generate_training_data_from_patterns()[0].features
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _assert_same_predictions(self, recommender):
+        expected = self.trained.model.predict_proba(self.features)
+        actual = recommender.model.predict_proba(self.features)
+        for c in expected:
+            self.assertAlmostEqual(expected[c], actual[c], places=9)
+
+    @unittest.skipUnless(ml_module.NUMPY_AVAILABLE, "NumPy not installed")
+    def test_npz_round_trip(self):
+        path = self.dir / 'model.npz'
+        self.trained.save_model(str(path))
+
+        loaded = MLVisualRecommender()
+        self.assertTrue(loaded.load_model(str(path)))
+        self._assert_same_predictions(loaded)
+        self.assertEqual(loaded.training_stats, self.trained.training_stats)
+
+    def test_json_round_trip(self):
+        path = self.dir / 'model.json'
+        self.trained.save_model(str(path))
+
+        loaded = MLVisualRecommender()
+        self.assertTrue(loaded.load_model(str(path)))
+        self._assert_same_predictions(loaded)
+
+    def test_other_suffixes_rejected(self):
+        path = self.dir / 'model.pkl'
+        with self.assertRaises(ValueError):
+            self.trained.save_model(str(path))
+        with self.assertRaises(ValueError):
+            MLVisualRecommender().load_model(str(path))
+        self.assertFalse(path.exists())
+
+    def test_training_hash_mismatch_is_a_miss(self):
+        path = self.dir / 'model.json'
+        self.trained.save_artifact(path, training_hash='old')
+
+        loaded = MLVisualRecommender()
+        self.assertFalse(loaded.load_artifact(path, training_hash='new'))
+        self.assertFalse(loaded.model.is_trained)
+
+    def test_feature_schema_mismatch_is_a_miss(self):
+        path = self.dir / 'model.json'
+        self.trained.save_artifact(path)
+
+        with unittest.mock.patch.object(ml_module, 'FEATURE_EXTRACTION_VERSION', 999):
+            self.assertFalse(MLVisualRecommender().load_artifact(path))
+
+    def test_corrupt_artifact_is_a_miss(self):
+        for name in ('model.npz', 'model.json'):
+            path = self.dir / name
+            path.write_bytes(b'not an artifact')
+            self.assertIsNone(store_module.read_artifact(path))
+            self.assertFalse(MLVisualRecommender().load_artifact(path))
+
+    def test_load_or_train_reuses_artifact(self):
+        path = self.dir / 'pattern_model.json'
+        first = load_or_train_pattern_model(MLVisualRecommender(), path)
+        self.assertTrue(path.exists())
+
+        with unittest.mock.patch.object(MLVisualRecommender, 'train') as train, \
+                unittest.mock.patch.object(ml_module, 'generate_training_data_from_patterns') as generate:
+            recommender = MLVisualRecommender()
+            stats = load_or_train_pattern_model(recommender, path)
+            train.assert_not_called()
+            generate.assert_not_called()
+        self.assertEqual(stats, first)
+        self.assertTrue(recommender.model.is_trained)
+
+    def test_load_or_train_retrains_when_stale(self):
+        path = self.dir / 'pattern_model.json'
+        self.trained.save_artifact(path, training_hash='stale')
+
+        recommender = MLVisualRecommender()
+        load_or_train_pattern_model(recommender, path)
+        header = store_module.read_metadata(path)
+        self.assertEqual(header['training_hash'], ml_module.pattern_training_hash())
+
+    def test_training_hash_follows_feature_version(self):
+        current = ml_module.pattern_training_hash()
+        self.assertEqual(ml_module.pattern_training_hash(), current)
+
+        with unittest.mock.patch.object(ml_module, 'FEATURE_EXTRACTION_VERSION',
+                                        ml_module.FEATURE_EXTRACTION_VERSION + 1):
+            self.assertNotEqual(ml_module.pattern_training_hash(), current)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
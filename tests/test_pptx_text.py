@@ -0,0 +1,84 @@
+"""
+Unit tests for zip/XML slide text extraction.
+
+Tests cover:
+- Shape text, inherited placeholder positions and notes match python-pptx
+- Extraction cached by file content digest, not path
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.utilities.feature_cache import configure_feature_cache
+from skills.utilities.pptx_text import extract_deck_text, read_deck_text
+
+pptx = pytest.importorskip("pptx")
+
+
+@pytest.fixture
+def deck(tmp_path):
+    from pptx.util import Inches
+    prs = pptx.Presentation()
+
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "Greek vs Roman Theater"
+    body = slide.placeholders[1].text_frame
+    body.text = "Masks and chorus"
+    body.add_paragraph().text = "Spectacle\vand farce"
+    slide.shapes.add_textbox(Inches(1), Inches(6.8), Inches(4), Inches(0.5)).text_frame.text = "Copyright"
+    slide.notes_slide.notes_text_frame.text = "Ask which form the class prefers."
+
+    prs.slides.add_slide(prs.slide_layouts[6])  # blank, no notes
+
+    path = tmp_path / "deck.pptx"
+    prs.save(str(path))
+    return path
+
+
+@pytest.fixture
+def cache():
+    """Fresh in-memory cache for each test; default cache restored afterwards."""
+    yield configure_feature_cache()
+    configure_feature_cache()
+
+
+def test_matches_python_pptx(deck):
+    prs = pptx.Presentation(str(deck))
+    extracted = extract_deck_text(deck)
+
+    assert len(extracted.slides) == len(prs.slides)
+    for slide, text in zip(prs.slides, extracted.slides):
+        expected = [
+            (s.text, s.left, s.top, s.width, s.height)
+            for s in slide.shapes if s.has_text_frame
+        ]
+        assert [(s.text, s.left, s.top, s.width, s.height) for s in text.shapes] == expected
+        assert text.has_notes_slide == slide.has_notes_slide
+        if slide.has_notes_slide:
+            assert text.notes == slide.notes_slide.notes_text_frame.text
+
+    first = extracted.slides[0]
+    assert first.content[1] == "Masks and chorus\nSpectacle\vand farce"
+    assert first.shapes[0].placeholder_type == 'title'
+    assert extracted.slides[1].notes == ""
+
+
+def test_cached_by_digest(deck, cache, tmp_path):
+    copy = tmp_path / "copy.pptx"
+    shutil.copy(deck, copy)
+
+    first = read_deck_text(deck)
+    second = read_deck_text(copy)
+
+    assert cache.stats()['hits'] == 1
+    assert second.path == str(copy)
+    assert second.digest == first.digest
+    assert second.slides == first.slides
+    second.slides.clear()
+    assert read_deck_text(deck).slides == first.slides
@@ -0,0 +1,110 @@
+"""
+Tests for streaming presenter-notes validation.
+
+Tests cover:
+- validate_monologue_stream parity with validate_presentation_monologues
+- Only failing slides (with excerpts) are retained
+- Per-slide PPTX note streaming and incremental statistics
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.enforcement.monologue_validator import (
+    validate_presentation_monologues,
+    validate_monologue_stream,
+    count_monologue_words,
+)
+from agents.presenter_notes_extraction import (
+    PresenterNotesExtractorAgent,
+    NotesExtractionValidatorAgent,
+    PresentationNotesOrchestratorAgent,
+    PPTX_AVAILABLE,
+)
+
+
+GOOD_NOTES = (
+    "Today we explore how actors build a character from the text. [PAUSE] "
+    "[EMPHASIS: objective] Every choice starts with what the character wants. "
+    "Think about a moment when you wanted something badly and how your body changed. "
+    "[PAUSE] [CHECK] Turn to a partner and name one objective from the scene we read."
+)
+
+
+def _monologues():
+    notes = [GOOD_NOTES] * 16
+    notes[3] = "- TODO bullet"
+    return notes
+
+
+class TestValidateMonologueStream:
+    """Streaming validator matches the list-based validator."""
+
+    def test_parity_with_list_validator(self):
+        expected = validate_presentation_monologues(_monologues())
+        streamed = validate_monologue_stream(iter(_monologues()))
+
+        for key in ("valid", "slides_checked", "slides_passed", "slides_failed",
+                    "total_words", "total_markers", "issues", "warnings", "summary"):
+            assert streamed[key] == expected[key]
+
+    def test_keeps_only_failing_slides_with_excerpt(self):
+        result = validate_monologue_stream((m for m in _monologues()), excerpt_chars=5)
+        assert 4 in [r["slide_index"] for r in result["failed_slides"]]
+        assert all(len(r["excerpt"]) <= 8 for r in result["failed_slides"])
+        assert "slide_results" not in result
+
+    def test_word_count_excludes_markers(self):
+        assert count_monologue_words("One [PAUSE] two [EMPHASIS: x] three") == 3
+
+
+@pytest.mark.skipif(not PPTX_AVAILABLE, reason="python-pptx not installed")
+class TestNotesStreaming:
+    """Per-slide PPTX streaming and incremental statistics."""
+
+    @pytest.fixture
+    def deck(self, tmp_path):
+        from pptx import Presentation
+        prs = Presentation()
+        texts = [GOOD_NOTES, "Short note here.", ""]
+        for i, text in enumerate(texts, 1):
+            slide = prs.slides.add_slide(prs.slide_layouts[1])
+            slide.shapes.title.text = f"Slide Title {i}"
+            if text:
+                slide.notes_slide.notes_text_frame.text = text
+        path = tmp_path / "unit" / "deck.pptx"
+        path.parent.mkdir()
+        prs.save(str(path))
+        return path
+
+    def test_iter_slide_notes_is_lazy(self, deck):
+        records = PresenterNotesExtractorAgent().iter_slide_notes(deck)
+        first = next(records)
+        assert first.slide_number == 1
+        assert first.has_content
+
+    def test_stream_matches_materialized_validation(self, deck):
+        extractor = PresenterNotesExtractorAgent()
+        validator = NotesExtractionValidatorAgent()
+
+        extraction = extractor.execute({"pptx_path": str(deck)}).output
+        batch = validator.execute({"extraction_result": extraction}).output
+        streamed = validator.execute({
+            "slide_notes_stream": extractor.iter_slide_notes(deck),
+            "source_file": str(deck),
+        }).output
+
+        assert streamed["statistics"] == batch["statistics"]
+        assert streamed["warnings"] == batch["warnings"]
+        assert [e["slide_number"] for e in streamed["short_note_excerpts"]] == [2]
+
+    def test_validate_directory_streaming(self, deck):
+        report = PresentationNotesOrchestratorAgent().validate_directory_streaming(deck.parent.parent)
+        assert report["total_files"] == 1
+        assert report["statistics"]["total_slides"] == 3
+        assert report["statistics"]["slides_with_notes"] == 2
+        assert report["files"][0]["success"]
@@ -0,0 +1,117 @@
+"""
+Unit tests for the orchestrator retry scheduler.
+
+Tests cover:
+- Per-agent and per-gate retry budgets with exponential back-off
+- Agent calls abandoned at their timeout
+- A stalled day cancelled without holding up the rest of a batch
+- BaseOrchestrator retrying failing agents and escalating per gate
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.utilities.retry_scheduler import (
+    AgentTimeout, Deadline, DeadlineExceeded, RetryScheduler
+)
+from orchestrators.orchestrators import (
+    AgentContext, RetryStrategy, ValidationGateOrchestrator
+)
+
+
+def test_budgets_and_backoff():
+    scheduler = RetryScheduler.from_config(
+        {'settings': {'max_retries': 2, 'retry_delay_seconds': 1, 'max_retry_delay_seconds': 3}}
+    )
+    attempts = {}
+
+    decisions = [scheduler.record_failure(attempts, 'gate', 'timing_validator') for _ in range(3)]
+    assert [(d.retry, d.delay) for d in decisions] == [(True, 1), (True, 2), (False, 0.0)]
+    assert 'Max retries (2)' in decisions[-1].reason
+    assert scheduler.record_failure(attempts, 'gate', 'structure_validator').retry
+    assert not scheduler.record_failure(attempts, 'agent', 'warmup_generator').retry
+
+    short = Deadline(0.5, label='day 4')
+    assert not scheduler.record_failure({}, 'gate', 'timing_validator', short).retry
+    assert scheduler.delay_for(5) == 3
+
+
+def test_agent_call_times_out():
+    scheduler = RetryScheduler(agent_timeout=0.05)
+    release = threading.Event()
+
+    started = time.monotonic()
+    with pytest.raises(AgentTimeout):
+        scheduler.call(release.wait, 5, name='slow_agent')
+    assert time.monotonic() - started < 1
+    release.set()
+
+    assert scheduler.call(lambda x: x * 2, 21) == 42
+    expired = Deadline(0)
+    with pytest.raises(DeadlineExceeded):
+        scheduler.call(lambda: 1, deadline=expired)
+
+
+def test_stalled_day_does_not_stall_batch():
+    scheduler = RetryScheduler(day_timeout=0.3, max_workers=2)
+    release = threading.Event()
+
+    def run_day(day, deadline):
+        if day == 2:
+            release.wait(10)  # pathological day
+            return 'late'
+        if day == 3:
+            deadline.wait(0.05)  # back-off on its own thread
+        if day == 4:
+            raise ValueError('no input')
+        return f'day {day}'
+
+    started = time.monotonic()
+    outcomes = scheduler.run_batch([1, 2, 3, 4, 5], run_day)
+    release.set()
+
+    assert time.monotonic() - started < 2
+    assert [o.status for o in outcomes] == ['completed', 'timed_out', 'completed', 'failed', 'completed']
+    assert outcomes[4].result == 'day 5'
+    assert outcomes[3].error == 'no input'
+
+
+def test_batch_deadline_skips_unstarted_days():
+    scheduler = RetryScheduler(batch_timeout=0.2, max_workers=1)
+    outcomes = scheduler.run_batch([1, 2], lambda day, deadline: deadline.wait(5))
+    assert [o.status for o in outcomes] == ['timed_out', 'skipped']
+
+
+def test_orchestrator_budgets():
+    calls = []
+
+    def flaky(input_data, context):
+        calls.append(1)
+        if len(calls) < 2:
+            raise RuntimeError('transient')
+        return {'ok': True}
+
+    scheduler = RetryScheduler(agent_retries=1, gate_retries=1)
+    orch = ValidationGateOrchestrator(agents={'flaky': flaky}, scheduler=scheduler)
+    context = AgentContext(unit_number=1, unit_name='Greek Theater', day=1, topic='Chorus')
+
+    assert orch.execute_agent('flaky', context, {}) == (True, {'ok': True})
+    assert context.retry_attempts == {'agent:flaky': 1}
+
+    first = orch.handle_failure('timing_validator', {}, context, RetryStrategy.ADJUSTMENT_PASS)
+    other = orch.handle_failure('truncation_validator', {}, context, RetryStrategy.TARGETED_FIX)
+    second = orch.handle_failure('timing_validator', {}, context, RetryStrategy.ADJUSTMENT_PASS)
+    assert first['action'] == 'CONDENSE' and first['attempt'] == 1
+    assert other['action'] == 'FIX_SPECIFIC'
+    assert second['action'] == 'ESCALATE'
+
+    context.deadline = Deadline(0, label='day 1')
+    success, output = orch.execute_agent('flaky', context, {})
+    assert not success and output['timed_out']
@@ -0,0 +1,99 @@
+"""
+Unit tests for crash-safe output and resumable pipeline runs.
+
+Tests cover:
+- Atomic writes leaving the previous file intact when writing fails
+- Atomic writes keeping the target's mode, or the umask default for new files
+- Atomic document saves (python-pptx)
+- Run journal replaying completed agents and phases on --resume-from
+"""
+
+import logging
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.utilities.atomic_write import atomic_save, atomic_write, atomic_write_json
+from skills.utilities.state_store import StateStore
+
+import run_theater_pipeline
+from run_theater_pipeline import PHASE_ORDER, RESUME_AUTO, RunJournal, TheaterPipeline
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    target = tmp_path / 'report.json'
+    atomic_write_json(target, {'score': 1})
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(target) as f:
+            f.write('{"score": ')
+            raise RuntimeError('interrupted')
+
+    assert target.read_text() == '{"score": 1}'
+    assert [p.name for p in tmp_path.iterdir()] == ['report.json']
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="POSIX permission bits")
+def test_atomic_write_file_mode(tmp_path):
+    umask = os.umask(0)
+    os.umask(umask)
+    created = atomic_write_json(tmp_path / 'new.json', {})
+    assert stat.S_IMODE(created.stat().st_mode) == 0o666 & ~umask
+
+    existing = tmp_path / 'plan.md'
+    existing.write_text('old')
+    existing.chmod(0o640)
+    atomic_write_json(existing, {})
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o640
+
+
+def test_atomic_save_document(tmp_path):
+    pptx = pytest.importorskip('pptx')
+    prs = pptx.Presentation()
+    prs.slides.add_slide(prs.slide_layouts[6])
+
+    path = atomic_save(prs, tmp_path / 'day' / 'deck.pptx')
+    assert len(pptx.Presentation(str(path)).slides) == 1
+
+
+def test_journal_resume_from(tmp_path):
+    journal = RunJournal(StateStore(tmp_path / 'run_journal.db'), unit=1, day=3)
+    for phase in PHASE_ORDER[:3]:
+        journal.record(phase, {'phase': phase})
+
+    reopened = RunJournal(StateStore(tmp_path / 'run_journal.db'), unit=1, day=3)
+    assert reopened.start(RESUME_AUTO) == PHASE_ORDER[:3]
+    assert reopened.start('daily_generation') == ['unit_planning']
+    assert reopened.get('validation') is None
+    assert reopened.start() == []
+
+
+def test_pipeline_replays_journaled_agents(tmp_path, monkeypatch):
+    pipeline = TheaterPipeline(use_orchestrators=False, output_dir=tmp_path)
+    logging.disable(logging.INFO)
+    try:
+        first = pipeline.run(1, 1)
+
+        calls = []
+        original = run_theater_pipeline.OrchestratorManager.create_agent
+        monkeypatch.setattr(
+            run_theater_pipeline.OrchestratorManager, 'create_agent',
+            lambda self, name: calls.append(name) or original(self, name)
+        )
+        resumed = pipeline.run(1, 1, resume_from=RESUME_AUTO)
+        assert calls == []
+        rerun = pipeline.run(1, 1, resume_from='validation')
+    finally:
+        logging.disable(logging.NOTSET)
+
+    assert calls == ['truncation_validator', 'elaboration_validator',
+                     'timing_validator', 'structure_validator']
+    assert resumed['summary']['total_agents'] == first['summary']['total_agents']
+    assert [r['agent'] for r in resumed['results']] == [r['agent'] for r in first['results']]
+    assert rerun['summary']['total_agents'] == first['summary']['total_agents']
@@ -0,0 +1,148 @@
+"""
+Unit tests for the payload serializer.
+
+Tests cover:
+- Round trips through every available serializer, with normalisation
+- Schema tags and version checks for core payloads
+- Legacy JSON text, readable JSON export, and pickle only on request
+- StateStore payload columns written as framed blobs
+"""
+
+import json
+import sqlite3
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.utilities import serializer
+from skills.utilities.serializer import (
+    FRAME_MAGIC, available_serializers, decode, encode, export_json, get_serializer
+)
+from skills.utilities.smart_retry_controller import SmartRetryController
+from skills.utilities.state_store import StateStore
+
+
+class Status(Enum):
+    PASSED = "passed"
+
+
+@dataclass
+class Gate:
+    gate_name: str
+    status: Status
+    issues: tuple = ()
+
+
+PAYLOAD = {
+    'gates': [Gate('timing_validator', Status.PASSED, ({'slide': 3},))],
+    'generated': datetime(2025, 1, 2, 3, 4, 5),
+    'path': Path('production/Day_01'),
+    'locked': {3, 1, 2},
+    'scores': {7: 91.5},
+}
+PLAIN = {
+    'gates': [{'gate_name': 'timing_validator', 'status': 'passed', 'issues': [{'slide': 3}]}],
+    'generated': '2025-01-02T03:04:05',
+    'path': 'production/Day_01',
+    'locked': [1, 2, 3],
+    'scores': {'7': 91.5},
+}
+
+
+@pytest.mark.parametrize('name', ['pickle', 'msgpack'])
+def test_round_trip(name):
+    if name not in available_serializers():
+        pytest.skip(f'{name} not installed')
+    blob = encode(PAYLOAD, serializer=name)
+    assert blob.startswith(FRAME_MAGIC)
+    assert decode(blob, accept=[name]) == PLAIN
+
+
+def test_json_serializer_and_legacy_text():
+    blob = encode(PAYLOAD)
+    assert blob[len(FRAME_MAGIC)] == get_serializer('json').frame_id
+    assert decode(blob) == PLAIN
+    assert decode('{"a": [1, 2]}') == {'a': [1, 2]}
+    assert decode(b'[1]') == [1]
+    assert decode(None, default={}) == {}
+
+
+def test_schemas():
+    slides = [{'slide_number': '2', 'header': 'Chorus'}]
+    blob = encode(slides, schema='slides')
+    assert decode(blob, schema='slides') == [{'slide_number': 2, 'header': 'Chorus'}]
+
+    with pytest.raises(ValueError):
+        decode(blob, schema='validation')
+    with pytest.raises(ValueError):
+        encode({'not': 'slides'}, schema='slides')
+
+    future = get_serializer().dumps({'schema': 'slides', 'version': 99, 'data': []})
+    with pytest.raises(ValueError):
+        decode(FRAME_MAGIC + bytes([get_serializer().frame_id]) + future, schema='slides')
+
+
+def test_default_serializer_env(monkeypatch):
+    monkeypatch.setenv(serializer.SERIALIZER_ENV, 'json')
+    assert get_serializer().name == 'json'
+    for name in ('yaml', 'pickle'):
+        monkeypatch.setenv(serializer.SERIALIZER_ENV, name)
+        with pytest.raises(ValueError):
+            get_serializer()
+
+
+def test_pickle_frames_refused_unless_accepted():
+    class Exploit:
+        def __reduce__(self):
+            return (print, ('UNPICKLED-CODE-RAN',))
+
+    import pickle
+    blob = FRAME_MAGIC + bytes([get_serializer('pickle').frame_id]) + pickle.dumps(Exploit())
+    with pytest.raises(ValueError, match='Refusing pickle'):
+        decode(blob)
+    with pytest.raises(ValueError, match='Refusing'):
+        decode(encode(PAYLOAD), accept=['msgpack'])
+
+
+def test_export_json(tmp_path):
+    path = export_json(decode(encode(PAYLOAD)), tmp_path / 'results.json')
+    assert json.loads(path.read_text())['locked'] == [1, 2, 3]
+
+
+def test_state_store_payload_columns(tmp_path):
+    store = StateStore(tmp_path / 'state.db', serializer='pickle')
+    store.put_step(7, data={'slides': [{'slide_number': 1}]}, metadata={'section': 'Greek'})
+    raw = store.connection().execute("SELECT data FROM steps WHERE step = 7").fetchone()[0]
+    assert isinstance(raw, bytes) and raw.startswith(FRAME_MAGIC)
+
+    # Rows written as JSON text by earlier versions still load
+    store.connection().execute(
+        "INSERT INTO steps (step, timestamp, status, data, metadata) VALUES (?, ?, ?, ?, ?)",
+        (8, '2025-01-01T00:00:00', 'failed', '{"qa_score": 70}', '{}')
+    )
+    assert StateStore(tmp_path / 'state.db').get_step(8)['data'] == {'qa_score': 70}
+    assert store.get_step(7)['metadata'] == {'section': 'Greek'}
+
+    # Only a store configured for pickle reads pickle rows
+    with pytest.raises(ValueError):
+        StateStore(tmp_path / 'state.db').get_step(7)
+
+
+def test_binary_retry_log(tmp_path):
+    controller = SmartRetryController(output_dir=str(tmp_path), log_format='pickle')
+    result = controller.execute_with_retry(
+        step=8,
+        execute_fn=lambda _: {'slides': [{'slide_number': 1}]},
+        validate_fn=lambda output: (95, {}),
+        initial_input={}
+    )
+    assert result.success
+    [log] = tmp_path.glob('retry_step8_*.pickle')
+    assert decode(log.read_bytes(), accept=['pickle'])['summary']['final_score'] == 95
@@ -8,12 +8,12 @@ Tests cover:
 - Incremental scoring
 - Termination conditions
 - Slide locking
+- Slide-granular retry of failing slides
 """
 
 import pytest
 import sys
 import json
-import shutil
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
 
@@ -38,9 +38,9 @@ from skills.utilities.smart_retry_controller import (
 # =============================================================================
 
 @pytest.fixture
-def controller():
-    """Create a controller with test output directory."""
-    return SmartRetryController(output_dir="outputs/test_retry")
+def controller(tmp_path):
+    """Create a controller logging to a temporary directory."""
+    return SmartRetryController(output_dir=str(tmp_path))
 
 
 @pytest.fixture
@@ -52,13 +52,6 @@ def mock_slides():
     ]
 
 
-@pytest.fixture
-def cleanup():
-    """Cleanup test outputs after tests."""
-    yield
-    shutil.rmtree("outputs/test_retry", ignore_errors=True)
-
-
 # =============================================================================
 # MOCK FUNCTIONS FOR TESTING
 # =============================================================================
@@ -134,7 +127,7 @@ class FailingExecutor:
 class TestBasicRetryExecution:
     """Tests for basic retry execution flow."""
 
-    def test_successful_retry_reaches_target(self, controller, cleanup):
+    def test_successful_retry_reaches_target(self, controller):
         """Test that retry succeeds when score reaches target."""
         executor = MockExecutor(base_score=70, improvement=10)
 
@@ -151,7 +144,7 @@ class TestBasicRetryExecution:
         assert result.final_score >= 90.0
         assert result.termination_reason == TerminationReason.SUCCESS
 
-    def test_retry_respects_max_iterations(self, controller, cleanup):
+    def test_retry_respects_max_iterations(self, controller):
         """Test that retry stops at max iterations."""
         executor = MockExecutor(base_score=70, improvement=5)
 
@@ -168,7 +161,7 @@ class TestBasicRetryExecution:
         assert result.iterations_used == 3
         assert result.termination_reason == TerminationReason.MAX_ITERATIONS
 
-    def test_retry_stops_when_no_improvement(self, controller, cleanup):
+    def test_retry_stops_when_no_improvement(self, controller):
         """Test that retry stops when scores plateau."""
         executor = FailingExecutor(fixed_score=75)
 
@@ -184,7 +177,7 @@ class TestBasicRetryExecution:
         assert result.success is False
         assert result.termination_reason == TerminationReason.NO_IMPROVEMENT
 
-    def test_retry_returns_final_blueprint(self, controller, cleanup):
+    def test_retry_returns_final_blueprint(self, controller):
         """Test that final blueprint is returned."""
         executor = MockExecutor(base_score=85, improvement=10)
 
@@ -208,7 +201,7 @@ class TestBasicRetryExecution:
 class TestContextTracking:
     """Tests for retry context tracking."""
 
-    def test_context_tracks_iterations(self, controller, cleanup):
+    def test_context_tracks_iterations(self, controller):
         """Test that context tracks all iterations."""
         executor = MockExecutor(base_score=80, improvement=5)
 
@@ -224,7 +217,7 @@ class TestContextTracking:
         assert result.context is not None
         assert len(result.context.iterations) == result.iterations_used
 
-    def test_context_tracks_score_trajectory(self, controller, cleanup):
+    def test_context_tracks_score_trajectory(self, controller):
         """Test score trajectory tracking."""
         executor = MockExecutor(base_score=70, improvement=8)
 
@@ -243,7 +236,7 @@ class TestContextTracking:
         for i in range(1, len(trajectory)):
             assert trajectory[i] > trajectory[i-1]
 
-    def test_context_tracks_failing_categories(self, controller, cleanup):
+    def test_context_tracks_failing_categories(self, controller):
         """Test failing category tracking."""
         executor = MockExecutor(base_score=75, improvement=5)
 
@@ -258,7 +251,7 @@ class TestContextTracking:
 
         assert result.context.failing_categories is not None
 
-    def test_context_serialization(self, controller, cleanup):
+    def test_context_serialization(self, controller):
         """Test context can be serialized to dict."""
         executor = MockExecutor(base_score=85, improvement=10)
 
@@ -312,7 +305,7 @@ class TestStrategyDetermination:
 class TestSlideLocking:
     """Tests for slide locking functionality."""
 
-    def test_passing_slides_get_locked(self, controller, cleanup):
+    def test_passing_slides_get_locked(self, controller):
         """Test that passing slides are locked after iteration."""
         executor = MockExecutor(base_score=80, improvement=5)
 
@@ -328,7 +321,7 @@ class TestSlideLocking:
         # Should have some locked slides
         assert len(result.context.locked_slides) > 0
 
-    def test_locked_slides_persist_across_iterations(self, controller, cleanup):
+    def test_locked_slides_persist_across_iterations(self, controller):
         """Test that locked slides aren't unlocked."""
         executor = MockExecutor(base_score=75, improvement=8)
 
@@ -467,7 +460,7 @@ class TestCategoryGuidance:
 class TestTerminationConditions:
     """Tests for retry termination logic."""
 
-    def test_success_terminates_loop(self, controller, cleanup):
+    def test_success_terminates_loop(self, controller):
         """Test that hitting target score terminates successfully."""
         executor = MockExecutor(base_score=90, improvement=0)
 
@@ -483,7 +476,7 @@ class TestTerminationConditions:
         assert result.iterations_used == 1
         assert result.termination_reason == TerminationReason.SUCCESS
 
-    def test_improvement_rate_triggers_early_stop(self, controller, cleanup):
+    def test_improvement_rate_triggers_early_stop(self, controller):
         """Test that low improvement rate causes early termination."""
         # Executor that improves very slowly
         executor = MockExecutor(base_score=75, improvement=1)
@@ -508,7 +501,7 @@ class TestTerminationConditions:
 class TestRetryLogging:
     """Tests for retry log generation."""
 
-    def test_retry_log_created(self, controller, cleanup):
+    def test_retry_log_created(self, controller):
         """Test that retry log file is created."""
         executor = MockExecutor(base_score=85, improvement=5)
 
@@ -521,10 +514,10 @@ class TestRetryLogging:
             max_iterations=2
         )
 
-        log_files = list(Path("outputs/test_retry").glob("retry_step8_*.json"))
+        log_files = list(controller.output_dir.glob("retry_step8_*.json"))
         assert len(log_files) >= 1
 
-    def test_retry_log_contains_summary(self, controller, cleanup):
+    def test_retry_log_contains_summary(self, controller):
         """Test that retry log contains summary information."""
         executor = MockExecutor(base_score=85, improvement=5)
 
@@ -537,7 +530,7 @@ class TestRetryLogging:
             max_iterations=2
         )
 
-        log_files = list(Path("outputs/test_retry").glob("retry_step8_*.json"))
+        log_files = list(controller.output_dir.glob("retry_step8_*.json"))
         with open(log_files[0]) as f:
             log_data = json.load(f)
 
@@ -553,7 +546,7 @@ class TestRetryLogging:
 class TestCallbacks:
     """Tests for iteration callbacks."""
 
-    def test_callback_called_each_iteration(self, controller, cleanup):
+    def test_callback_called_each_iteration(self, controller):
         """Test that callback is called for each iteration."""
         executor = MockExecutor(base_score=70, improvement=10)
         iterations_seen = []
@@ -581,13 +574,13 @@ class TestCallbacks:
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
-    def test_create_retry_controller(self, cleanup):
+    def test_create_retry_controller(self, tmp_path):
         """Test controller factory function."""
-        controller = create_retry_controller("outputs/test_retry")
+        controller = create_retry_controller(str(tmp_path))
         assert controller is not None
         assert isinstance(controller, SmartRetryController)
 
-    def test_execute_step_with_retry(self, cleanup):
+    def test_execute_step_with_retry(self, tmp_path):
         """Test convenience execution function."""
         executor = MockExecutor(base_score=85, improvement=10)
 
@@ -597,11 +590,13 @@ class TestConvenienceFunctions:
             validate_fn=executor.validate,
             initial_input={},
             target_score=90.0,
-            max_iterations=2
+            max_iterations=2,
+            output_dir=str(tmp_path)
         )
 
         assert result is not None
         assert isinstance(result, RetryResult)
+        assert list(tmp_path.glob("retry_step8_*.json"))
 
 
 # =============================================================================
@@ -611,7 +606,7 @@ class TestConvenienceFunctions:
 class TestEdgeCases:
     """Tests for edge cases and error handling."""
 
-    def test_handles_exception_in_execute(self, controller, cleanup):
+    def test_handles_exception_in_execute(self, controller):
         """Test handling of exceptions during execution."""
         def failing_execute(input_data):
             raise ValueError("Test error")
@@ -632,7 +627,7 @@ class TestEdgeCases:
         assert result.termination_reason == TerminationReason.CRITICAL_ERROR
         assert "Test error" in result.error_message
 
-    def test_handles_empty_slides(self, controller, cleanup):
+    def test_handles_empty_slides(self, controller):
         """Test handling of empty slides list."""
         def empty_execute(input_data):
             return {'slides': [], 'base_score': 95}
@@ -651,7 +646,7 @@ class TestEdgeCases:
 
         assert result.success is True
 
-    def test_first_iteration_succeeds(self, controller, cleanup):
+    def test_first_iteration_succeeds(self, controller):
         """Test when first iteration already meets target."""
         executor = MockExecutor(base_score=95, improvement=0)
 
@@ -668,6 +663,103 @@ class TestEdgeCases:
         assert result.iterations_used == 1
 
 
+# =============================================================================
+# SLIDE-GRANULAR RETRY TESTS
+# =============================================================================
+
+class TestSlideGranularRetry:
+    """Tests for retrying only the failing slides."""
+
+    @staticmethod
+    def validate_slide(slide):
+        score = slide.get('quality', 95)
+        categories = [] if score >= 90 else ['char_limits']
+        return score, {'failing_categories': categories}
+
+    def test_only_failing_slides_regenerated(self, controller, mock_slides):
+        """Test that passing slides are never regenerated or revalidated."""
+        mock_slides[1]['quality'] = 60
+        mock_slides[6]['quality'] = 70
+        blueprint = {'title': 'Greek', 'slides': mock_slides}
+        regenerated = []
+
+        def regenerate(slide, slide_context):
+            regenerated.append((slide['slide_number'], slide_context['attempt']))
+            slide['quality'] += 15
+            return slide
+
+        result = controller.execute_slides_with_retry(
+            step=8,
+            blueprint=blueprint,
+            regenerate_fn=regenerate,
+            validate_slide_fn=self.validate_slide,
+            failing_slides=[2, 7],
+            max_iterations=3
+        )
+
+        assert result.success is True
+        assert result.termination_reason == TerminationReason.SUCCESS
+        assert sorted(regenerated) == [(2, 1), (2, 2), (7, 1), (7, 2)]
+        assert result.final_blueprint['slides'][1]['quality'] == 90
+        assert result.final_blueprint['slides'][0] is mock_slides[0]
+        assert mock_slides[1]['quality'] == 60
+        assert result.context.slide_convergence[2].scores == [60, 75, 90]
+        assert set(result.context.slide_convergence) == {2, 7}
+
+    def test_slide_errors_and_regressions_keep_best(self, controller, mock_slides):
+        """Test that a failed or worse regeneration keeps the previous slide."""
+        mock_slides[0]['quality'] = 80
+        mock_slides[2]['quality'] = 50
+
+        def regenerate(slide, slide_context):
+            if slide['slide_number'] == 1:
+                raise ValueError('model timeout')
+            slide['quality'] -= 10
+            return slide
+
+        result = controller.execute_slides_with_retry(
+            step=8,
+            blueprint={'slides': mock_slides},
+            regenerate_fn=regenerate,
+            validate_slide_fn=self.validate_slide,
+            max_iterations=3
+        )
+
+        assert result.success is False
+        assert result.termination_reason == TerminationReason.NO_IMPROVEMENT
+        assert result.iterations_used == 1
+        assert result.final_score == 50
+        assert result.context.slide_convergence[1].error == 'model timeout'
+        assert result.final_blueprint['slides'][2]['quality'] == 50
+        assert result.context.iterations[0].failing_slides == [1, 3]
+
+
+    def test_transient_error_is_retried(self, controller, mock_slides):
+        """Test that a regeneration that raises does not end the retry as a stall."""
+        mock_slides[3]['quality'] = 60
+        calls = []
+
+        def regenerate(slide, slide_context):
+            calls.append(slide_context['attempt'])
+            if len(calls) == 1:
+                raise TimeoutError('model timeout')
+            slide['quality'] = 95
+            return slide
+
+        result = controller.execute_slides_with_retry(
+            step=8,
+            blueprint={'slides': mock_slides},
+            regenerate_fn=regenerate,
+            validate_slide_fn=self.validate_slide,
+            max_iterations=3
+        )
+
+        assert result.success is True
+        assert result.termination_reason == TerminationReason.SUCCESS
+        assert result.iterations_used == 2
+        assert len(calls) == 2
+        assert result.context.slide_convergence[4].error is None
+
 # =============================================================================
 # RUN TESTS
 # =============================================================================
@@ -0,0 +1,97 @@
+"""
+Unit tests for the persistent standards cache.
+
+Tests cover:
+- Round trip of parsed standards and validation results
+- Automatic invalidation when a standards or config file changes
+- Cache entries stored as plain JSON; corrupt or pickled files are a miss
+- Singleton loading from the persistent cache
+"""
+
+import json
+import pickle
+import pytest
+import shutil
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.parsing.standards_parser import StandardsParser
+from skills.validation.standards_validator import StandardsValidator
+from skills.parsing.standards_cache import (
+    CACHE_DIR_ENV,
+    compute_cache_key,
+    load_cached_standards,
+    store_cached_standards,
+    clear_standards_cache,
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Copy standards/ and config/ into an isolated project root."""
+    shutil.copytree(PROJECT_ROOT / "standards", tmp_path / "standards")
+    shutil.copytree(PROJECT_ROOT / "config", tmp_path / "config")
+    return tmp_path
+
+
+def _build(base):
+    parsed = StandardsParser(str(base)).parse_all_standards()
+    validation = StandardsValidator(str(base)).validate_all_standards()
+    return parsed, validation
+
+
+def test_round_trip(project):
+    parsed, validation = _build(project)
+    assert store_cached_standards(parsed, validation, base_path=project) is not None
+
+    entry = load_cached_standards(base_path=project)
+    assert entry is not None
+    assert entry.parsed_standards == parsed
+    assert entry.validation_result == validation
+
+
+def test_invalidated_when_source_changes(project):
+    parsed, validation = _build(project)
+    store_cached_standards(parsed, validation, base_path=project)
+    key_before = compute_cache_key(project)
+
+    constraints = project / "config" / "constraints.yaml"
+    constraints.write_text(constraints.read_text() + "\n# edited\n")
+
+    assert compute_cache_key(project) != key_before
+    assert load_cached_standards(base_path=project) is None
+
+
+def test_corrupt_cache_is_a_miss(project):
+    parsed, validation = _build(project)
+    path = store_cached_standards(parsed, validation, base_path=project)
+    assert json.loads(path.read_text())['key'] == compute_cache_key(project)
+
+    path.write_bytes(b"not json")
+    assert load_cached_standards(base_path=project) is None
+    path.write_bytes(pickle.dumps({'key': compute_cache_key(project)}))
+    assert load_cached_standards(base_path=project) is None
+    clear_standards_cache(base_path=project)
+    assert not path.exists()
+
+
+def test_singleton_uses_persistent_cache(tmp_path, monkeypatch):
+    from skills.parsing.standards_loader_singleton import (
+        get_standards_loader,
+        reset_standards_cache,
+    )
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+
+    reset_standards_cache()
+    assert get_standards_loader().is_loaded_from_cache() is False
+
+    reset_standards_cache()
+    loader = get_standards_loader()
+    assert loader.is_loaded_from_cache() is True
+    assert loader.get_standards() is not None
+    reset_standards_cache()
@@ -0,0 +1,185 @@
+"""
+Unit tests for the SQLite state store.
+
+Tests cover:
+- StepStateManager state, retry contexts and locks surviving a restart
+- Checkpoints as in-database snapshots, plus legacy JSON files, and
+  the checkpoint retention limit
+- close() closing every thread's connection
+- Concurrent section updates from several connections without lost writes
+- pipeline_state.json layout round trip writing only changed rows, and
+  a hand-edited pipeline_state.json being re-imported
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.utilities.state_store import StateStore
+from skills.utilities.step_state_manager import StepStateManager
+from skills.utilities import pipeline_state_manager
+
+SECTION_STEPS = pipeline_state_manager.SECTION_STEPS
+
+
+def test_step_state_persists(tmp_path):
+    manager = StepStateManager(output_dir=str(tmp_path))
+    manager.save_state(step=7, state={'qa_score': 85}, metadata={'section': 'Greek'})
+    manager.set_retry_context(step=8, failing_categories=['anchor_coverage'])
+    manager.record_score(step=8, score=75)
+    manager.record_modification(step=8, slide_number=3, modification_type='trim',
+                                details={'chars': 12})
+    manager.mark_slides_locked([1, 2, 5])
+    manager.unlock_slides([2])
+
+    reopened = StepStateManager(output_dir=str(tmp_path))
+    assert reopened.load_state(7) == {'qa_score': 85}
+    assert reopened._states[7].metadata == {'section': 'Greek'}
+    ctx = reopened.get_retry_context(8)
+    assert ctx.iteration == 2
+    assert ctx.failing_categories == ['anchor_coverage']
+    assert ctx.previous_scores == [75]
+    assert ctx.modifications_made[0]['details'] == {'chars': 12}
+    assert reopened.get_locked_slides() == {1, 5}
+    assert not list(tmp_path.glob('*.json'))
+
+
+def test_checkpoints(tmp_path):
+    manager = StepStateManager(output_dir=str(tmp_path))
+    manager.save_state(step=7, state={'qa_score': 70})
+    manager.mark_slides_locked([4])
+    label = manager.create_checkpoint('before_retry')
+
+    manager.save_state(step=7, state={'qa_score': 95})
+    manager.record_score(step=7, score=95)
+    manager.unlock_slides()
+
+    assert manager.restore_checkpoint(label)
+    assert manager.load_state(7) == {'qa_score': 70}
+    assert manager.get_score_history(7) == []
+    assert StepStateManager(output_dir=str(tmp_path)).get_locked_slides() == {4}
+    assert not manager.restore_checkpoint('checkpoint_missing_0')
+
+
+def test_checkpoint_retention(tmp_path):
+    store = StateStore(tmp_path / 'state.db', max_checkpoints=2)
+    labels = []
+    for score in (70, 80, 90):
+        store.add_score(7, score)
+        labels.append(store.create_checkpoint('retry'))
+
+    assert [c['label'] for c in store.list_checkpoints()] == labels[1:]
+    assert not store.restore_checkpoint(labels[0])
+    assert store.connection().execute(
+        "SELECT COUNT(DISTINCT checkpoint_id) FROM checkpoint_scores"
+    ).fetchone() == (2,)
+    assert store.delete_checkpoint(labels[1])
+    assert store.restore_checkpoint(labels[2])
+
+
+def test_close_closes_every_thread_connection(tmp_path):
+    store = StateStore(tmp_path / 'state.db')
+    opened = []
+    thread = threading.Thread(target=lambda: opened.append(store.connection()))
+    thread.start()
+    thread.join()
+    main = store.connection()
+
+    store.close()
+    for conn in opened + [main]:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    assert store.connection() is not main
+    store.add_score(7, 80.0)
+    store.close()
+
+
+def test_legacy_files_imported_once(tmp_path):
+    legacy = {
+        'step_number': 6, 'timestamp': '2025-01-01T00:00:00', 'status': 'failed',
+        'data': {'slides': []}, 'metadata': {},
+        'retry_context': {'iteration': 2, 'previous_scores': [60.0], 'locked_slides': [3]}
+    }
+    (tmp_path / 'step_6_state.json').write_text(json.dumps(legacy))
+
+    manager = StepStateManager(output_dir=str(tmp_path))
+    assert manager.get_step_status(6) == 'failed'
+    assert manager.get_score_history(6) == [60.0]
+
+    manager.clear_all()
+    assert StepStateManager(output_dir=str(tmp_path)).get_step_status(6) is None
+
+
+def test_concurrent_section_updates(tmp_path):
+    path = tmp_path / 'pipeline_state.db'
+    sections = [f'Section_{i}' for i in range(8)]
+
+    def worker(section):
+        store = StateStore(path)
+        for step in SECTION_STEPS:
+            store.set_section_status(section, step, 'completed', default_steps=SECTION_STEPS)
+        store.close()
+
+    threads = [threading.Thread(target=worker, args=(s,)) for s in sections]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    state = StateStore(path).load_pipeline_state()
+    assert sorted(state['sections']) == sections
+    assert all(
+        status == 'completed' for steps in state['sections'].values() for status in steps.values()
+    )
+
+
+def test_pipeline_state_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_state_manager, 'STATE_FILE', tmp_path / 'pipeline_state.json')
+    monkeypatch.setattr(pipeline_state_manager, 'STATE_DB', tmp_path / 'pipeline_state.db')
+    monkeypatch.setattr(pipeline_state_manager, '_store', None)
+
+    pipeline_state_manager.add_section('Greek')
+    pipeline_state_manager.update_status('Greek', '7', 'completed')
+    state = pipeline_state_manager.load_state()
+    assert state['sections']['Greek']['step7_revision'] == 'completed'
+    assert list(state['sections']['Greek']) == SECTION_STEPS
+    assert state['global_steps']['step5_presentation_standards'] == 'reference_document'
+
+    store = pipeline_state_manager.get_store()
+    state['sections']['Greek']['step8_qa'] = 'in_progress'
+    assert store.save_pipeline_state(state) == 1
+    assert store.load_pipeline_state() == state
+
+    exported = pipeline_state_manager.export_state()
+    assert json.loads(exported.read_text()) == state
+
+
+def test_edited_pipeline_json_is_reimported(tmp_path, monkeypatch):
+    state_file = tmp_path / 'pipeline_state.json'
+    monkeypatch.setattr(pipeline_state_manager, 'STATE_FILE', state_file)
+    monkeypatch.setattr(pipeline_state_manager, 'STATE_DB', tmp_path / 'pipeline_state.db')
+    monkeypatch.setattr(pipeline_state_manager, '_store', None)
+
+    pipeline_state_manager.add_section('Greek')
+    exported = pipeline_state_manager.export_state()
+    pipeline_state_manager.update_status('Greek', '7', 'completed')
+    # The export is older than the database's changes: not re-imported
+    assert pipeline_state_manager.load_state()['sections']['Greek']['step7_revision'] == 'completed'
+
+    state = json.loads(exported.read_text())
+    state['sections']['Roman'] = {step: 'pending' for step in SECTION_STEPS}
+    state_file.write_text(json.dumps(state))
+    mtime = state_file.stat().st_mtime + 5
+    os.utime(state_file, (mtime, mtime))
+
+    reloaded = pipeline_state_manager.load_state()
+    assert sorted(reloaded['sections']) == ['Greek', 'Roman']
+    assert reloaded['sections']['Greek']['step7_revision'] == 'pending'
@@ -50,6 +50,12 @@ from skills.utilities import (
     ACTIVITY_STRUCTURE,
     REFLECTION_STRUCTURE,
     ACTIVITY_TYPE_TIMING,
+    # Keyword Matcher
+    KeywordMatcher,
+    get_matcher,
+    # Regex Registry
+    compile_pattern,
+    compile_patterns,
 )
 
 
@@ -473,6 +479,74 @@ class TestUtilityIntegration:
         assert reflection['total_minutes'] == 10
 
 
+# =============================================================================
+# KEYWORD MATCHER TESTS
+# =============================================================================
+
+class TestKeywordMatcher:
+    """Tests for the Aho-Corasick keyword matcher."""
+
+    def test_find_all_reports_positions(self):
+        """Test hits carry start/end offsets into the text."""
+        matcher = KeywordMatcher(["he", "she", "hers"])
+        hits = matcher.find_all("ushers")
+        assert {(h.start, h.end, h.keyword) for h in hits} == {
+            (1, 4, "she"), (2, 4, "he"), (2, 6, "hers")
+        }
+
+    def test_count_distinct_matches_substring_semantics(self):
+        """Test distinct count equals the old `kw in text` loop."""
+        keywords = ["example", "for instance", "such as", "ell", "imagine"]
+        text = "For instance, imagine a well-told example such as this example."
+        expected = sum(1 for kw in keywords if kw in text.lower())
+        assert get_matcher(keywords).count_distinct(text) == expected
+
+    def test_count_matches_str_count(self):
+        """Test occurrence counts equal str.count per keyword."""
+        keywords = ["like", "aa", "for example"]
+        text = "aaaa like like, for example, unlike"
+        counts = KeywordMatcher(keywords).count(text)
+        for kw in keywords:
+            assert counts[kw] == text.count(kw)
+
+    def test_whole_words(self):
+        """Test word-boundary mode rejects partial words."""
+        matcher = KeywordMatcher(["set", "stage left"], whole_words=True)
+        assert matcher.matched("Upset the set, exit stage left.") == {"set", "stage left"}
+        assert matcher.matched("settings and upstage lefty") == set()
+
+    def test_get_matcher_is_shared(self):
+        """Test one compiled matcher per vocabulary list."""
+        assert get_matcher(("a", "b")) is get_matcher(["a", "b"])
+        assert get_matcher(("a", "b")) is not get_matcher(("a", "b"), whole_words=True)
+
+    def test_empty_inputs(self):
+        """Test empty vocabulary and empty text."""
+        assert KeywordMatcher([]).find_all("anything") == []
+        assert KeywordMatcher(["x"]).find_all("") == []
+
+
+class TestRegexRegistry:
+    """Tests for the precompiled regex registry."""
+
+    def test_compile_pattern_is_shared(self):
+        """Test one compiled object per (pattern, flags)."""
+        import re
+        assert compile_pattern(r"\bstep\s*(\d+)") is compile_pattern(r"\bstep\s*(\d+)")
+        assert compile_pattern("x", re.IGNORECASE) is not compile_pattern("x")
+
+    def test_compile_patterns_preserves_order(self):
+        """Test tuple of compiled patterns in input order."""
+        compiled = compile_patterns([r"\d+", r"[a-z]+"])
+        assert [p.pattern for p in compiled] == [r"\d+", r"[a-z]+"]
+
+    def test_analyzer_results_unchanged(self):
+        """Test precompiled analyzer matches raw re on a sample slide."""
+        from skills.generation.content_structure_analyzer import count_bullet_points
+        body = "- Stage left\n- Stage right\n* Upstage\n1. Downstage"
+        assert count_bullet_points(body) == 4
+
+
 # =============================================================================
 # RUN TESTS
 # =============================================================================
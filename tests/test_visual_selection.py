@@ -0,0 +1,108 @@
+"""
+Unit tests for the quota-aware visual selection solver.
+
+Tests cover:
+- Optimal choice against brute-force enumeration
+- Fallback candidates only filling up to the minimum
+- Variety rule continuing from a lead-in and using runner-up types
+- Shared quota bounds from the visual quota tracker
+"""
+
+import itertools
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from skills.generation.visual_selection import VisualCandidate, select_visuals
+from skills.validation.visual_quota_tracker import VisualQuotaTracker, get_selection_bounds
+
+
+def _objective(candidates, ranks, minimum, maximum, max_run, lead_in):
+    """(minimum reached, -violations, primary score, fallback score) or None if infeasible."""
+    last = lead_in[-1] if lead_in else None
+    run = len(list(itertools.takewhile(lambda t: t == last, reversed(lead_in))))
+    count, violations, primary, fallback, used_fallback = 0, 0, 0.0, 0.0, False
+    for candidate, rank in zip(candidates, ranks):
+        if rank < 0:
+            continue
+        visual_type, score = candidate.options[rank]
+        count += 1
+        run = run + 1 if visual_type == last else 1
+        last = visual_type
+        violations += run > max_run
+        if candidate.fallback:
+            fallback += score
+            used_fallback = True
+        else:
+            primary += score
+    if count > maximum or (used_fallback and count > minimum):
+        return None
+    return (min(count, minimum), -violations, round(primary, 9), round(fallback, 9))
+
+
+def test_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(300):
+        types = ['TABLE', 'FLOWCHART', 'TIMELINE'][:rng.randint(1, 3)]
+        candidates = [
+            VisualCandidate(
+                i + 1,
+                [(rng.choice(types), rng.randint(1, 20)) for _ in range(rng.randint(1, 2))],
+                fallback=rng.random() < 0.3
+            )
+            for i in range(rng.randint(0, 6))
+        ]
+        maximum = rng.randint(0, len(candidates) + 1)
+        minimum = rng.randint(0, maximum)
+        max_run = rng.randint(1, 2)
+        lead_in = [rng.choice(types) for _ in range(rng.randint(0, 2))]
+
+        selection = select_visuals(candidates, minimum, maximum, max_run, lead_in)
+        ranks = {pick.slide_number: pick.option_rank for pick in selection.picks}
+        got = _objective(candidates, [ranks.get(c.slide_number, -1) for c in candidates],
+                         minimum, maximum, max_run, lead_in)
+        best = max(
+            value for value in (
+                _objective(candidates, choice, minimum, maximum, max_run, lead_in)
+                for choice in itertools.product(*[range(-1, len(c.options)) for c in candidates])
+            ) if value is not None
+        )
+        assert got == best
+        assert selection.variety_violations == -got[1]
+
+
+def test_fallback_only_fills_minimum():
+    candidates = [
+        VisualCandidate(1, [('TABLE', 0.9)]),
+        VisualCandidate(2, [('TIMELINE', 0.8)], fallback=True),
+        VisualCandidate(3, [('FLOWCHART', 0.7)], fallback=True),
+        VisualCandidate(4, [('HIERARCHY', 0.5)]),
+    ]
+
+    filled = select_visuals(candidates, minimum=3, maximum=4)
+    assert filled.slide_numbers == [1, 2, 4]
+    assert [p.selected_by for p in filled.picks] == ['score', 'fallback', 'score']
+    assert filled.quota_summary(10)['fallback_added'] == 1
+
+    assert select_visuals(candidates, minimum=1, maximum=4).slide_numbers == [1, 4]
+
+
+def test_variety_uses_runner_up_and_lead_in():
+    candidates = [VisualCandidate(i, [('TABLE', 10.0), ('FLOWCHART', 6.0)]) for i in range(1, 5)]
+
+    selection = select_visuals(candidates, minimum=0, maximum=4)
+    assert selection.visual_types == ['TABLE', 'TABLE', 'FLOWCHART', 'TABLE']
+    assert selection.variety_violations == 0
+
+    continued = select_visuals(candidates[:2], minimum=0, maximum=2, lead_in=['TABLE', 'TABLE'])
+    assert continued.visual_types == ['FLOWCHART', 'TABLE']
+
+
+def test_selection_bounds():
+    assert get_selection_bounds(15) == (2, 6)
+    assert get_selection_bounds(5) == (1, 2)
+    assert get_selection_bounds(15, min_visuals=12, max_visuals=3) == (3, 3)
+    assert VisualQuotaTracker('Section', 30).get_selection_bounds() == (4, 12)
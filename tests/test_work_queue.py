@@ -0,0 +1,164 @@
+"""
+Unit tests for the work queue.
+
+Tests cover:
+- Content-hash deduplication of enqueued jobs
+- Exclusive claims across concurrent workers
+- Lease expiry handing a job to another worker
+- Retries, failure and artifact collection
+- Running TheaterPipeline day jobs through a worker
+"""
+
+import logging
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from skills.utilities.state_store import StateStore
+from skills.utilities.work_queue import (
+    COMPLETED, FAILED, PENDING, Job, SQLiteBroker, Worker, content_hash, open_broker
+)
+
+
+def make_job(n, payload='v1'):
+    return Job(f'day:1:{n}', 'day', {'unit': 1, 'day': n}, content_hash(payload, n), priority=n)
+
+
+def test_enqueue_dedupes_by_input_hash(tmp_path):
+    broker = open_broker(f'sqlite:{tmp_path / "queue.db"}')
+    assert isinstance(broker, SQLiteBroker)
+    assert broker.enqueue(make_job(1))
+    assert not broker.enqueue(make_job(1))
+
+    job = broker.claim('w1')
+    assert broker.complete(job.job_id, 'w1', {'status': 'SUCCESS'})
+    assert not broker.enqueue(make_job(1))          # done, same inputs
+    assert broker.enqueue(make_job(1, payload='v2'))  # inputs changed
+    assert broker.get('day:1:1').status == PENDING
+
+
+def test_payloads_are_json_only(tmp_path):
+    import pickle
+    from skills.utilities.serializer import FRAME_MAGIC, get_serializer
+
+    broker = SQLiteBroker(StateStore(tmp_path / 'queue.db', serializer='pickle'))
+    broker.enqueue(make_job(1))
+    raw = broker.store.connection().execute("SELECT params FROM queue_jobs").fetchone()[0]
+    assert raw[len(FRAME_MAGIC)] == get_serializer('json').frame_id
+
+    class Exploit:
+        def __reduce__(self):
+            return (print, ('UNPICKLED-CODE-RAN',))
+
+    frame = FRAME_MAGIC + bytes([get_serializer('pickle').frame_id]) + pickle.dumps(Exploit())
+    broker.store.connection().execute("UPDATE queue_jobs SET params = ?", (frame,))
+    with pytest.raises(ValueError, match='Refusing pickle'):
+        broker.claim('w1')
+
+
+def test_concurrent_workers_claim_each_job_once(tmp_path):
+    db = tmp_path / 'queue.db'
+    broker = SQLiteBroker(db)
+    for n in range(1, 21):
+        broker.enqueue(make_job(n))
+
+    runs = []
+    lock = threading.Lock()
+
+    def handler(job):
+        with lock:
+            runs.append(job.params['day'])
+        return {'day': job.params['day']}, {}
+
+    workers = [Worker(SQLiteBroker(db), {'day': handler}, worker_id=f'w{i}') for i in range(4)]
+    threads = [threading.Thread(target=w.run) for w in workers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(runs) == list(range(1, 21))
+    assert broker.stats() == {'pending': 0, 'running': 0, 'completed': 20, 'failed': 0}
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    now = [1000.0]
+    broker = SQLiteBroker(tmp_path / 'queue.db', clock=lambda: now[0])
+    broker.enqueue(make_job(1))
+
+    assert broker.claim('crashed', lease_seconds=30).attempts == 1
+    assert broker.claim('w2', lease_seconds=30) is None
+    now[0] += 31
+    job = broker.claim('w2', lease_seconds=30)
+    assert job.worker == 'w2' and job.attempts == 2
+    assert not broker.complete(job.job_id, 'crashed', {'status': 'SUCCESS'})
+    assert broker.complete(job.job_id, 'w2', {'status': 'SUCCESS'})
+
+
+def test_job_that_kills_its_worker_is_failed_after_max_attempts(tmp_path):
+    now = [1000.0]
+    broker = SQLiteBroker(tmp_path / 'queue.db', clock=lambda: now[0])
+    broker.enqueue(Job('day:1:1', 'day', {'day': 1}, 'h1', max_attempts=2))
+
+    claims = []
+    for _ in range(5):
+        job = broker.claim(f'w{len(claims)}', lease_seconds=30)
+        if job is not None:
+            claims.append(job.attempts)
+        now[0] += 31          # the worker dies; its lease expires
+    assert claims == [1, 2]
+    failed = broker.get('day:1:1')
+    assert failed.status == FAILED
+    assert failed.error == 'Lease expired after 2 attempts'
+
+
+def test_retries_then_fails_and_collects_artifacts(tmp_path):
+    broker = SQLiteBroker(tmp_path / 'queue.db')
+    broker.enqueue(Job('day:1:1', 'day', {'day': 1}, 'h1', max_attempts=2))
+    broker.enqueue(Job('day:1:2', 'day', {'day': 2}, 'h2', priority=1))
+    output = tmp_path / 'work' / 'Day_02' / 'lesson_plan.md'
+    output.parent.mkdir(parents=True)
+    output.write_text('# Day 2')
+
+    def handler(job):
+        if job.params['day'] == 1:
+            raise ValueError('template missing')
+        return {'status': 'SUCCESS'}, {'Day_02/lesson_plan.md': output}
+
+    jobs = Worker(broker, {'day': handler}, worker_id='w1').run()
+    assert [j.job_id for j in jobs] == ['day:1:1', 'day:1:1', 'day:1:2']
+    assert [j.status for j in jobs] == [PENDING, FAILED, COMPLETED]
+    failed = broker.get('day:1:1')
+    assert failed.status == FAILED and failed.attempts == 2
+    assert failed.error == 'ValueError: template missing'
+    assert broker.get('day:1:2').status == COMPLETED
+
+    assert broker.collect_artifacts(tmp_path / 'collected', kind='section') == []
+    written = broker.collect_artifacts(tmp_path / 'collected', kind='day')
+    assert [p.read_text() for p in written] == ['# Day 2']
+    assert written[0] == tmp_path / 'collected' / 'Day_02' / 'lesson_plan.md'
+
+
+def test_pipeline_day_jobs(tmp_path):
+    from run_theater_pipeline import TheaterPipeline
+
+    broker = SQLiteBroker(tmp_path / 'queue.db')
+    coordinator = TheaterPipeline(output_dir=tmp_path / 'coordinator')
+    logging.disable(logging.INFO)
+    try:
+        assert coordinator.enqueue_days(broker, 1, [1, 2]) == ['day:1:1']
+        worker = TheaterPipeline(output_dir=tmp_path / 'worker')
+        jobs = Worker(broker, {'day': worker.run_day_job}).run()
+    finally:
+        logging.disable(logging.NOTSET)
+
+    assert [j.status for j in jobs] == [COMPLETED]
+    assert broker.get('day:1:1').result['status'] == 'SUCCESS'
+    written = broker.collect_artifacts(tmp_path / 'coordinator')
+    assert written and all(p.suffix == '.pptx' for p in written)
+    assert written[0].relative_to(tmp_path / 'coordinator').parts[0] == 'Unit_1_Greek_Theater'